@@ -73,6 +73,7 @@ from .constructors import (
 
 from .dataframe import (
     DataFrame as DataFrame,
+    DataFrameStream as DataFrameStream,
 )
 
 from .dbobject import (
@@ -121,6 +122,8 @@ from .future import (
 from .lob import (
     LOB as LOB,
     AsyncLOB as AsyncLOB,
+    LOBStream as LOBStream,
+    AsyncLOBStream as AsyncLOBStream,
 )
 
 from .pipeline import (
@@ -150,7 +153,9 @@ from .utils import (
     register_params_hook as register_params_hook,
     register_password_type as register_password_type,
     register_protocol as register_protocol,
+    register_round_trip_hook as register_round_trip_hook,
     unregister_params_hook as unregister_params_hook,
+    unregister_round_trip_hook as unregister_round_trip_hook,
 )
 
 from .var import (
@@ -1175,8 +1180,17 @@ from .aq import (  # noqa: E402
 
 from .connect_params import ConnectParams as ConnectParams  # noqa: E402
 
+from .pool_metrics import PoolMetrics as PoolMetrics  # noqa: E402
+
 from .pool_params import PoolParams as PoolParams  # noqa: E402
 
+from .json_view import (  # noqa: E402
+    JsonArrayView as JsonArrayView,
+    JsonObjectView as JsonObjectView,
+)
+
+from .row_block import RowBlock as RowBlock  # noqa: E402
+
 from . import builtin_hooks  # noqa: E402
 
 IntervalYM = collections.namedtuple("IntervalYM", ["years", "months"])
@@ -1210,10 +1224,13 @@ del (
     exceptions,  # noqa
     fetch_info,  # noqa
     future,  # noqa
+    json_view,  # noqa
     lob,  # noqa
     pipeline,  # noqa
     pool,  # noqa
+    pool_metrics,  # noqa
     pool_params,  # noqa
+    row_block,  # noqa
     sparse_vector,  # noqa
     soda,  # noqa
     subscr,  # noqa
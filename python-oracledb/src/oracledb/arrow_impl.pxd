@@ -128,6 +128,9 @@ cdef class ArrowArrayImpl:
     cdef int _extract_uint(self, const void* ptr, ArrowType arrow_type,
                            int64_t index, uint64_t* value) except -1
     cdef int _get_is_null(self, int64_t index, bint* is_null) except -1
+    cdef dict _get_numpy_matrix_interface(self, str typestr,
+                                          int64_t element_size)
+    cdef str _get_numpy_typestr(self, int64_t *item_size)
     cdef int _get_list_info(self, int64_t index, ArrowArray* arrow_array,
                             int64_t* offset, int64_t* num_elements) except -1
     cdef int append_bytes(self, void* ptr, int64_t num_bytes) except -1
@@ -141,6 +144,8 @@ cdef class ArrowArrayImpl:
                                   array.array indices,
                                   array.array values) except -1
     cdef int append_uint(self, uint64_t value) except -1
+    cdef int append_value(self, ArrowArrayImpl array,
+                          int64_t index) except -1
     cdef int append_vector(self, array.array value) except -1
     cdef int finish_building(self) except -1
     cdef int get_bool(self, int64_t index, bint* is_null,
@@ -148,6 +153,8 @@ cdef class ArrowArrayImpl:
     cdef int get_bytes(self, int64_t index, bint* is_null, char **ptr,
                        ssize_t *num_bytes) except -1
     cdef bytes get_decimal(self, int64_t index, bint* is_null)
+    cdef int get_decimal_text(self, int64_t index, bint* is_null, char* text,
+                              ssize_t max_size, ssize_t* size) except -1
     cdef int get_double(self, int64_t index, bint* is_null,
                         double* value) except -1
     cdef int get_float(self, int64_t index, bint* is_null,
@@ -168,3 +175,16 @@ cdef class DataFrameImpl:
     cdef:
         list schema_impls
         list arrays
+
+
+cdef class DataFrameStreamImpl:
+    cdef:
+        object data_frames
+        DataFrameImpl next_df_impl
+        list schema_impls
+        object last_exception
+        bytes last_error
+        bint consumed
+
+    cdef int get_next(self, ArrowArray* array) except -1
+    cdef int set_last_error(self, BaseException e) except -1
@@ -32,14 +32,15 @@
 
 cimport cpython
 
-from libc.errno cimport EINVAL, EOVERFLOW
+from libc.errno cimport EINVAL, EIO, EOVERFLOW
 from libc.stdint cimport uintptr_t
 from libc.string cimport memcpy, memset, strlen, strchr
 from cpython cimport array
 
 import array
+import sys
 
-from . import errors
+from . import errors, exceptions
 
 cdef array.array float_template = array.array('f')
 cdef array.array double_template = array.array('d')
@@ -52,6 +53,9 @@ if array.array("I").itemsize == 4:
 else:
     uint32_template = array.array("L")
 
+# byte order prefix used in the type strings of the NumPy array interface
+cdef str NUMPY_BYTE_ORDER = "<" if sys.byteorder == "little" else ">"
+
 include "impl/arrow/utils.pyx"
 include "impl/arrow/schema.pyx"
 include "impl/arrow/array.pyx"
@@ -261,6 +261,11 @@ cdef class DefaultsImpl:
         public str terminal
         public str osuser
         public str driver_name
+        public double dns_cache_ttl
+        public double dns_cache_negative_ttl
+        public bint adaptive_arraysize
+        public uint32_t adaptive_arraysize_max_bytes
+        public bint fetch_lazy_json
 
 cdef DefaultsImpl C_DEFAULTS
 
@@ -304,6 +309,9 @@ cdef class BatchLoadManager:
     )
 
 
+cdef class OsonFieldNamesCache
+
+
 cdef class Buffer:
     cdef:
         ssize_t _max_size, _size, _pos
@@ -316,6 +324,7 @@ cdef class Buffer:
                                       uint8_t max_length) except -1
     cdef const char_type* _get_raw(self, ssize_t num_bytes) except NULL
     cdef int _initialize(self, ssize_t max_size=*) except -1
+    cdef int _populate_from_bytearray(self, bytearray data) except -1
     cdef int _populate_from_bytes(self, bytes data) except -1
     cdef int _read_raw_bytes_and_length(self, const char_type **ptr,
                                         ssize_t *num_bytes) except -1
@@ -364,9 +373,15 @@ cdef class Buffer:
     cdef int write_interval_ds(self, object value) except -1
     cdef int write_interval_ym(self, object value) except -1
     cdef int write_oracle_date(self, object value, uint8_t length) except -1
+    cdef int write_oracle_date_from_epoch(self, int64_t days,
+                                          uint32_t seconds, uint32_t fsecond,
+                                          uint8_t length) except -1
     cdef int write_oracle_number(self, bytes num_bytes) except -1
+    cdef int write_oracle_number_text(self, const char_type *ptr,
+                                      ssize_t num_bytes) except -1
     cdef int write_oson(self, value, ssize_t max_fname_size,
-                        bint write_length=*) except -1
+                        bint write_length=*,
+                        OsonFieldNamesCache fnames_cache=*) except -1
     cdef int write_raw(self, const char_type *data, ssize_t length) except -1
     cdef int write_sb4(self, int32_t value) except -1
     cdef int write_str(self, str value) except -1
@@ -397,6 +412,8 @@ cdef class OsonDecoder(Buffer):
         list field_names
         uint8_t version
         bint relative_offsets
+        bint lazy
+        object lock
 
     cdef object _decode_container_node(self, uint8_t node_type)
     cdef object _decode_node(self)
@@ -409,7 +426,31 @@ cdef class OsonDecoder(Buffer):
     cdef list _get_short_field_names(self, uint32_t num_fields,
                                      ssize_t offsets_size,
                                      uint32_t field_names_seg_size)
-    cdef object decode(self, bytes data)
+    cdef object decode(self, bytes data, bint lazy=*)
+
+
+cdef class OsonContainerImpl:
+
+    cdef:
+        OsonDecoder decoder
+        uint8_t node_type
+        bint is_object
+        uint32_t num_children
+        uint32_t container_offset
+        ssize_t node_pos
+        ssize_t field_ids_pos
+        ssize_t offsets_pos
+        dict field_indexes
+        dict values
+
+    cdef str _get_field_name(self, uint32_t index)
+    cdef dict _get_field_indexes(self)
+    cdef object _get_value(self, uint32_t index)
+    @staticmethod
+    cdef object _create(OsonDecoder decoder, uint8_t node_type,
+                        bint is_object, uint32_t num_children,
+                        uint32_t container_offset, ssize_t field_ids_pos,
+                        ssize_t offsets_pos)
 
 
 cdef class OsonFieldName:
@@ -423,6 +464,7 @@ cdef class OsonFieldName:
         uint32_t field_id
 
     cdef int _calc_hash_id(self) except -1
+    cdef OsonFieldName copy(self)
     @staticmethod
     cdef OsonFieldName create(str name, ssize_t max_fname_size)
 
@@ -439,11 +481,23 @@ cdef class OsonFieldNamesSegment(GrowableBuffer):
     cdef int process_field_names(self, ssize_t field_id_offset) except -1
 
 
+cdef class OsonFieldNamesCache:
+
+    cdef:
+        ssize_t max_fname_size
+        dict field_names
+        dict segments
+
+    cdef OsonFieldName get_field_name(self, str name)
+    cdef int set_max_fname_size(self, ssize_t max_fname_size) except -1
+
+
 cdef class OsonEncoder(GrowableBuffer):
 
     cdef:
         OsonFieldNamesSegment short_fnames_seg
         OsonFieldNamesSegment long_fnames_seg
+        OsonFieldNamesCache fnames_cache
         uint32_t num_field_names
         ssize_t max_fname_size
         dict field_names_dict
@@ -454,7 +508,8 @@ cdef class OsonEncoder(GrowableBuffer):
     cdef int _examine_node(self, object value) except -1
     cdef int _write_extended_header(self) except -1
     cdef int _write_fnames_seg(self, OsonFieldNamesSegment seg) except -1
-    cdef int encode(self, object value, ssize_t max_fname_size) except -1
+    cdef int encode(self, object value, ssize_t max_fname_size,
+                    OsonFieldNamesCache fnames_cache=*) except -1
 
 
 cdef class VectorDecoder(Buffer):
@@ -520,7 +575,8 @@ cdef class ConnectParamsNode:
 
     cdef int _copy(self, ConnectParamsNode source) except -1
     cdef list _get_initial_connect_string_parts(self)
-    cdef int _set_active_children(self, list children) except -1
+    cdef int _set_active_children(self, list children,
+                                  dict addr_infos) except -1
 
 
 cdef class Address(ConnectParamsNode):
@@ -535,7 +591,7 @@ cdef class Address(ConnectParamsNode):
 
     cdef str build_connect_string(self)
     cdef int set_protocol(self, str value) except -1
-    cdef list resolve_host_name(self)
+    cdef list resolve_host_name(self, dict addr_infos=*)
 
 
 cdef class AddressList(ConnectParamsNode):
@@ -581,7 +637,7 @@ cdef class DescriptionList(ConnectParamsNode):
 
     cdef str build_connect_string(self)
     cdef list get_addresses(self)
-    cdef int set_active_children(self) except -1
+    cdef int set_active_children(self, dict addr_infos=*) except -1
 
 
 cdef class ConnectParamsImpl:
@@ -604,6 +660,7 @@ cdef class ConnectParamsImpl:
         public DescriptionList description_list
         uint64_t _external_handle
         public str debug_jdwp
+        public double parallel_connect_delay
         object access_token_callback
         object access_token_expires
         Description _default_description
@@ -665,6 +722,12 @@ cdef class PoolParamsImpl(ConnectParamsImpl):
         public bint soda_metadata_cache
         public int ping_interval
         public uint32_t ping_timeout
+        public uint32_t result_cache_size
+        public uint32_t result_cache_ttl
+        public bint shared_statement_cache
+        public list warmup_statements
+        public uint32_t creation_concurrency
+        public object metrics_callback
 
 
 cdef class BaseConnImpl:
@@ -681,6 +744,7 @@ cdef class BaseConnImpl:
         readonly tuple server_version
         readonly bint supports_bool
         ssize_t _oson_max_fname_size
+        OsonFieldNamesCache _oson_fnames_cache
         bint _allow_bind_str_to_lob
         bint _in_request
 
@@ -701,6 +765,53 @@ cdef class BasePoolImpl:
         ConnectParamsImpl connect_params
 
 
+cdef enum:
+    ROW_BLOCK_COLUMN_KIND_OBJECT = 0
+    ROW_BLOCK_COLUMN_KIND_DOUBLE = 1
+    ROW_BLOCK_COLUMN_KIND_INT64 = 2
+
+cdef enum:
+    ROW_BLOCK_VALUE_OBJECT = 0
+    ROW_BLOCK_VALUE_NULL = 1
+    ROW_BLOCK_VALUE_TYPED = 2
+
+
+cdef union RowBlockValue:
+    double as_double
+    int64_t as_int64
+
+
+cdef class RowBlockColumnImpl:
+    cdef:
+        readonly uint8_t kind
+        readonly uint32_t num_values
+        array.array _values
+        array.array _validity
+        list _objects
+
+    @staticmethod
+    cdef RowBlockColumnImpl _create(uint8_t kind)
+    cdef int _append_fixed_value(self, RowBlockValue *value) except -1
+    cdef int _append_validity(self, bint is_valid) except -1
+    cdef int _convert_to_objects(self) except -1
+    cdef int append_null(self) except -1
+    cdef int append_typed_value(self, uint8_t kind,
+                                RowBlockValue *value) except -1
+    cdef int append_value(self, object value) except -1
+    cdef object get_value(self, uint32_t index)
+
+
+cdef class RowBlockImpl:
+    cdef:
+        readonly list columns
+        readonly uint32_t num_rows
+        readonly object rowfactory
+
+    @staticmethod
+    cdef RowBlockImpl _create(list columns, uint32_t num_rows,
+                              object rowfactory)
+
+
 cdef class BaseCursorImpl:
     cdef:
         readonly str statement
@@ -728,6 +839,7 @@ cdef class BaseCursorImpl:
         uint32_t _buffer_index
         uint32_t _fetch_array_size
         bint _more_rows_to_fetch
+        bint _fetching_block
 
     cdef int _bind_values(self, object cursor, object type_handler,
                           object params, uint32_t num_rows, uint32_t row_num,
@@ -746,7 +858,10 @@ cdef class BaseCursorImpl:
                                        uses_metadata, ssize_t pos,
                                        OracleMetadata metadata)
     cdef object _create_row(self)
+    cdef tuple _create_row_tuple(self)
     cdef BaseVarImpl _create_var_impl(self, object conn)
+    cdef int _fetch_block_rows(self, list columns,
+                               uint32_t num_rows) except -1
     cdef int _fetch_rows(self, object cursor) except -1
     cdef BaseConnImpl _get_conn_impl(self)
     cdef object _get_input_type_handler(self)
@@ -1049,6 +1164,11 @@ cdef object convert_python_to_oracle_data(OracleMetadata metadata,
                                           object value)
 cdef int convert_vector_to_arrow(ArrowArrayImpl array_impl,
                                  object vector) except -1
+cdef uint8_t convert_oracle_data_to_row_block(uint8_t kind,
+                                              OracleMetadata metadata,
+                                              OracleData* data,
+                                              RowBlockValue* value)
+cdef uint8_t get_row_block_column_kind(BaseVarImpl var_impl)
 cdef cydatetime.datetime convert_date_to_python(OracleDataBuffer *buffer)
 cdef uint16_t decode_uint16be(const char_type *buf)
 cdef uint32_t decode_uint32be(const char_type *buf)
@@ -40,7 +40,7 @@ from libc.stdint cimport int8_t, int16_t, int32_t, int64_t
 from libc.stdint cimport uint8_t, uint16_t, uint32_t, uint64_t
 from libc.stdint cimport UINT8_MAX, UINT16_MAX, UINT32_MAX, UINT64_MAX
 from libc.stdlib cimport strtod, strtof, strtoll, strtoull
-from libc.string cimport memcpy
+from libc.string cimport memcpy, memset
 from cpython cimport array
 from cpython.conversion cimport PyOS_snprintf
 
@@ -80,7 +80,7 @@ from .arrow_impl cimport (
 )
 
 import array
-
+import asyncio
 import base64
 import collections
 import copy
@@ -89,6 +89,7 @@ import datetime
 import decimal
 import getpass
 import inspect
+import itertools
 import json
 import os
 import random
@@ -97,6 +98,7 @@ import socket
 import ssl
 import string
 import sys
+import threading
 import time
 import warnings
 
@@ -115,7 +117,9 @@ cdef type PY_TYPE_DB_OBJECT
 cdef type PY_TYPE_DECIMAL = decimal.Decimal
 cdef type PY_TYPE_DB_OBJECT_TYPE
 cdef type PY_TYPE_FETCHINFO
+cdef type PY_TYPE_JSON_ARRAY_VIEW
 cdef type PY_TYPE_JSON_ID
+cdef type PY_TYPE_JSON_OBJECT_VIEW
 cdef type PY_TYPE_INTERVAL_YM
 cdef type PY_TYPE_LOB
 cdef type PY_TYPE_MESSAGE
@@ -151,6 +155,9 @@ REGISTERED_PASSWORD_TYPES = {}
 # params hooks registered with the library
 REGISTERED_PARAMS_HOOKS = []
 
+# round trip hooks (and their sample rates) registered with the library
+REGISTERED_ROUND_TRIP_HOOKS = []
+
 include "impl/base/types.pyx"
 include "impl/base/constants.pxi"
 include "impl/base/decoders.pyx"
@@ -169,6 +176,7 @@ include "impl/base/pool_params.pyx"
 include "impl/base/connection.pyx"
 include "impl/base/pool.pyx"
 include "impl/base/cursor.pyx"
+include "impl/base/row_block.pyx"
 include "impl/base/var.pyx"
 include "impl/base/bind_var.pyx"
 include "impl/base/batch_load_manager.pyx"
@@ -108,6 +108,7 @@ class ConnectParams(metaclass=BaseMetaClass):
         thick_mode_dsn_passthrough: Optional[bool] = None,
         extra_auth_params: Optional[dict] = None,
         pool_name: Optional[str] = None,
+        parallel_connect_delay: Optional[float] = None,
         handle: Optional[int] = None,
     ):
         """
@@ -384,6 +385,15 @@ class ConnectParams(metaclass=BaseMetaClass):
           with Oracle Database 23.4, or higher
           (default: None)
 
+        - ``parallel_connect_delay``: the number of seconds to wait for a
+          connection to an address to be established (including the TLS
+          handshake for TCPS addresses) before a connection to the next address
+          in the same address list is also attempted. The first connection to
+          succeed is used and the others are closed. The default value of 0
+          attempts each address in turn. This value is only used in python-
+          oracledb Thin mode
+          (default: 0)
+
         - ``handle``: an integer representing a pointer to a valid service
           context handle. This value is only used in python-oracledb Thick
           mode. It should be used with extreme caution
@@ -441,7 +451,8 @@ class ConnectParams(metaclass=BaseMetaClass):
             f"use_sni={self.use_sni!r}, "
             f"thick_mode_dsn_passthrough={self.thick_mode_dsn_passthrough!r}, "
             f"extra_auth_params={self.extra_auth_params!r}, "
-            f"pool_name={self.pool_name!r}"
+            f"pool_name={self.pool_name!r}, "
+            f"parallel_connect_delay={self.parallel_connect_delay!r}"
             ")"
         )
 
@@ -641,6 +652,18 @@ class ConnectParams(metaclass=BaseMetaClass):
         """
         return self._impl.osuser
 
+    @property
+    def parallel_connect_delay(self) -> float:
+        """
+        The number of seconds to wait for a connection to an address to be
+        established (including the TLS handshake for TCPS addresses) before a
+        connection to the next address in the same address list is also
+        attempted. The first connection to succeed is used and the others are
+        closed. The default value of 0 attempts each address in turn. This
+        value is only used in python-oracledb Thin mode.
+        """
+        return self._impl.parallel_connect_delay
+
     @property
     @_flatten_value
     def pool_boundary(self) -> Union[list, str]:
@@ -1015,6 +1038,7 @@ class ConnectParams(metaclass=BaseMetaClass):
         thick_mode_dsn_passthrough: Optional[bool] = None,
         extra_auth_params: Optional[dict] = None,
         pool_name: Optional[str] = None,
+        parallel_connect_delay: Optional[float] = None,
         handle: Optional[int] = None,
     ):
         """
@@ -1232,6 +1256,14 @@ class ConnectParams(metaclass=BaseMetaClass):
         - ``pool_name``: the name of the DRCP pool when using multi-pool DRCP
           with Oracle Database 23.4, or higher
 
+        - ``parallel_connect_delay``: the number of seconds to wait for a
+          connection to an address to be established (including the TLS
+          handshake for TCPS addresses) before a connection to the next address
+          in the same address list is also attempted. The first connection to
+          succeed is used and the others are closed. The default value of 0
+          attempts each address in turn. This value is only used in python-
+          oracledb Thin mode
+
         - ``handle``: an integer representing a pointer to a valid service
           context handle. This value is only used in python-oracledb Thick
           mode. It should be used with extreme caution
@@ -36,7 +36,7 @@
 import collections
 import functools
 import ssl
-from typing import Any, Callable, Iterator, Type, Optional, Union
+from typing import Any, Callable, Iterable, Iterator, Type, Optional, Union
 
 import oracledb
 
@@ -48,7 +48,7 @@ from .base import BaseMetaClass
 from .base_impl import DB_TYPE_BLOB, DB_TYPE_CLOB, DB_TYPE_NCLOB, DbType
 from .connect_params import ConnectParams
 from .cursor import AsyncCursor, Cursor
-from .dataframe import DataFrame
+from .dataframe import DataFrame, DataFrameStream
 from .dbobject import DbObjectType, DbObject
 from .lob import AsyncLOB, LOB
 from .pipeline import Pipeline, PipelineOpResult
@@ -76,6 +76,24 @@ class BaseConnection(metaclass=BaseMetaClass):
             return f"<{cls_name} to externally identified user>"
         return f"<{cls_name} to {self.username}@{self.dsn}>"
 
+    def _get_lob_impls(self, lobs: Iterable, lob_class: Type) -> list:
+        """
+        Returns the implementation objects for the LOBs passed to
+        read_lobs(), verifying that each of them is of the correct type and
+        belongs to this connection.
+        """
+        impls = []
+        for lob in lobs:
+            if not isinstance(lob, lob_class):
+                errors._raise_err(
+                    errors.ERR_EXPECTING_LOB_SEQUENCE,
+                    lob_class_name=lob_class.__name__,
+                )
+            if lob._impl._conn_impl is not self._impl:
+                errors._raise_err(errors.ERR_LOB_DIFF_CONNECTION)
+            impls.append(lob._impl)
+        return impls
+
     def _verify_connected(self) -> None:
         """
         Verifies that the connection is connected to the database. If it is
@@ -1079,7 +1097,9 @@ class Connection(BaseConnection):
 
         The ``data`` parameter can be a list of sequences, a DataFrame, or a
         third-party DataFrame instance that supports the Apache Arrow PyCapsule
-        Interface.
+        Interface. It can also be any other iterable, such as a generator, that
+        returns sequences or data frames which all have the same schema. Only
+        ``batch_size`` rows are acquired from such an iterable at a time.
 
         The ``batch_size`` parameter is used to split large data sets into
         smaller pieces for sending to the database. It is the number of records
@@ -1199,6 +1219,102 @@ class Connection(BaseConnection):
         else:
             yield from cursor._impl.fetch_df_batches(cursor, batch_size=size)
 
+    def fetch_df_stream(
+        self,
+        statement: str,
+        parameters: Optional[Union[list, tuple, dict]] = None,
+        size: Optional[int] = None,
+        *,
+        fetch_decimals: Optional[bool] = None,
+        requested_schema: Optional[Any] = None,
+    ) -> DataFrameStream:
+        """
+        This returns a :ref:`DataFrameStream <oracledataframestreamobj>` object
+        that implements the Apache Arrow PyCapsule stream interface for the
+        SQL query ``statement``. Unlike :meth:`~Connection.fetch_df_all()`,
+        the rows are not fetched up front: the first ``size`` rows are fetched
+        when this method is called and each subsequent batch is fetched from
+        the database only when the consumer of the stream requests it. This
+        allows large results to be passed to libraries such as PyArrow or
+        Polars without holding the entire result in memory.
+
+        The ``parameters``, ``fetch_decimals`` and ``requested_schema``
+        parameters are used in the same way as for
+        :meth:`~Connection.fetch_df_batches()`. The ``size`` parameter
+        specifies the number of rows in each batch and defaults to
+        :attr:`oracledb.defaults.arraysize <Defaults.arraysize>`.
+
+        The stream can only be consumed once and the connection must remain
+        open until it has been consumed.
+        """
+        if size is None:
+            size = base_impl.DEFAULTS.arraysize
+        data_frames = self.fetch_df_batches(
+            statement,
+            parameters,
+            size,
+            fetch_decimals=fetch_decimals,
+            requested_schema=requested_schema,
+        )
+        return DataFrameStream._from_data_frames(data_frames)
+
+    def fetch_numpy(
+        self,
+        statement: str,
+        parameters: Optional[Union[list, tuple, dict]] = None,
+        arraysize: Optional[int] = None,
+    ) -> dict:
+        """
+        Fetches all rows of the SQL query ``statement``, returning the values
+        of each column in a NumPy array. A dictionary is returned which maps
+        each column name to a 2-tuple containing the NumPy array of values and
+        a NumPy array of booleans which are True where the value is null. Null
+        values are stored as zero in the array of values.
+
+        The values are decoded directly into typed buffers without creating a
+        Python object for each value, and the NumPy arrays share these buffers
+        without copying them. The arrays of values are read-only.
+
+        Columns of type ``NUMBER``, ``BINARY_FLOAT``, ``BINARY_DOUBLE``,
+        ``DATE`` and ``TIMESTAMP`` are supported. ``NUMBER`` columns with a
+        scale of zero and a precision of 18 or less are returned as 64-bit
+        integers and other ``NUMBER`` columns are returned as 64-bit floating
+        point values. ``DATE`` and ``TIMESTAMP`` columns are returned as
+        ``datetime64`` values. ``VECTOR`` columns are returned as
+        two-dimensional arrays with one vector in each row; all of the vectors
+        must have the same number of dimensions.
+
+        The ``parameters`` and ``arraysize`` parameters are used in the same
+        way as for :meth:`~Connection.fetch_df_all()`.
+
+        NumPy must be installed in order to use this method.
+        """
+        df = self.fetch_df_all(
+            statement, parameters, arraysize, fetch_decimals=False
+        )
+        return df._to_numpy()
+
+    def fetch_numpy_batches(
+        self,
+        statement: str,
+        parameters: Optional[Union[list, tuple, dict]] = None,
+        size: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """
+        This returns an iterator yielding the next ``size`` rows of the SQL
+        query ``statement`` in each iteration as a dictionary of NumPy arrays
+        in the same format as returned by :meth:`~Connection.fetch_numpy()`.
+
+        The ``parameters`` and ``size`` parameters are used in the same way as
+        for :meth:`~Connection.fetch_df_batches()`.
+
+        NumPy must be installed in order to use this method.
+        """
+        for df in self.fetch_df_batches(
+            statement, parameters, size, fetch_decimals=False
+        ):
+            yield df._to_numpy()
+
     def getSodaDatabase(self) -> SodaDatabase:
         """
         Returns a SodaDatabase object for Simple Oracle Document Access (SODA).
@@ -1266,6 +1382,22 @@ class Connection(BaseConnection):
         """
         return self.tpc_prepare()
 
+    def read_lobs(self, lobs: Iterable[LOB]) -> list[Union[str, bytes]]:
+        """
+        Reads all of the data in each of the LOBs and returns a list containing
+        a string (for CLOB and NCLOB type LOBs) or bytes (for BLOB and BFILE
+        type LOBs) for each LOB, in the same order as the LOBs were supplied.
+        The LOBs must have been created or fetched using this connection.
+
+        In python-oracledb Thin mode, when the database supports
+        :ref:`pipelining <pipelining>`, the requests to read all of the LOBs
+        are sent to the database without waiting for each response so that
+        only one :ref:`round-trip <roundtrips>` is required. Otherwise each LOB
+        is read in turn.
+        """
+        self._verify_connected()
+        return self._impl.read_lobs(self._get_lob_impls(lobs, LOB))
+
     def rollback(self) -> None:
         """
         Rolls back any pending transactions.
@@ -1273,6 +1405,37 @@ class Connection(BaseConnection):
         self._verify_connected()
         self._impl.rollback()
 
+    def run_pipeline(
+        self,
+        pipeline: Pipeline,
+        continue_on_error: bool = False,
+    ) -> list[PipelineOpResult]:
+        """
+        Runs all of the operations in the pipeline and returns a list of
+        PipelineOpResult, each entry corresponding to an operation executed in
+        the pipeline.
+
+        The ``continue_on_error`` parameter determines whether operations
+        should continue to run after an error has occurred. If this parameter
+        is set to *True*, then the :attr:`PipelineOpResult.error` attribute
+        will be populated with an :ref:`_Error <exchandling>` instance which
+        identifies the error that occurred. If this parameter is set to
+        *False*, then an exception will be raised as soon as an error is
+        detected and all subsequent operations will be terminated. The default
+        value is *False*.
+        """
+        self._verify_connected()
+        results = [op._create_result() for op in pipeline.operations]
+        if self._impl.supports_pipelining() and len(results) > 1:
+            self._impl.run_pipeline_with_pipelining(
+                self, results, continue_on_error
+            )
+        else:
+            self._impl.run_pipeline_without_pipelining(
+                self, results, continue_on_error
+            )
+        return results
+
     def shutdown(self, mode: int = 0) -> None:
         """
         Shuts down the database. In order to do this the connection must be
@@ -1760,6 +1923,7 @@ def connect(
     thick_mode_dsn_passthrough: Optional[bool] = None,
     extra_auth_params: Optional[dict] = None,
     pool_name: Optional[str] = None,
+    parallel_connect_delay: Optional[float] = None,
     handle: Optional[int] = None,
 ) -> Connection:
     """
@@ -2054,6 +2218,14 @@ def connect(
       Oracle Database 23.4, or higher
       (default: None)
 
+    - ``parallel_connect_delay``: the number of seconds to wait for a
+      connection to an address to be established (including the TLS handshake
+      for TCPS addresses) before a connection to the next address in the same
+      address list is also attempted. The first connection to succeed is used
+      and the others are closed. The default value of 0 attempts each address
+      in turn. This value is only used in python-oracledb Thin mode
+      (default: 0)
+
     - ``handle``: an integer representing a pointer to a valid service context
       handle. This value is only used in python-oracledb Thick mode. It should
       be used with extreme caution
@@ -2412,7 +2584,9 @@ class AsyncConnection(BaseConnection):
 
         The ``data`` parameter can be a list of sequences, a DataFrame, or a
         third-party DataFrame instance that supports the Apache Arrow PyCapsule
-        Interface.
+        Interface. It can also be any other iterable, such as a generator, that
+        returns sequences or data frames which all have the same schema. Only
+        ``batch_size`` rows are acquired from such an iterable at a time.
 
         The ``batch_size`` parameter is used to split large data sets into
         smaller pieces for sending to the database. It is the number of records
@@ -2530,6 +2704,64 @@ class AsyncConnection(BaseConnection):
             async for df in cursor._impl.fetch_df_batches(cursor, size):
                 yield df
 
+    async def fetch_numpy(
+        self,
+        statement: str,
+        parameters: Optional[Union[list, tuple, dict]] = None,
+        arraysize: Optional[int] = None,
+    ) -> dict:
+        """
+        Fetches all rows of the SQL query ``statement``, returning the values
+        of each column in a NumPy array. A dictionary is returned which maps
+        each column name to a 2-tuple containing the NumPy array of values and
+        a NumPy array of booleans which are True where the value is null. Null
+        values are stored as zero in the array of values.
+
+        The values are decoded directly into typed buffers without creating a
+        Python object for each value, and the NumPy arrays share these buffers
+        without copying them. The arrays of values are read-only.
+
+        Columns of type ``NUMBER``, ``BINARY_FLOAT``, ``BINARY_DOUBLE``,
+        ``DATE`` and ``TIMESTAMP`` are supported. ``NUMBER`` columns with a
+        scale of zero and a precision of 18 or less are returned as 64-bit
+        integers and other ``NUMBER`` columns are returned as 64-bit floating
+        point values. ``DATE`` and ``TIMESTAMP`` columns are returned as
+        ``datetime64`` values. ``VECTOR`` columns are returned as
+        two-dimensional arrays with one vector in each row; all of the vectors
+        must have the same number of dimensions.
+
+        The ``parameters`` and ``arraysize`` parameters are used in the same
+        way as for :meth:`~AsyncConnection.fetch_df_all()`.
+
+        NumPy must be installed in order to use this method.
+        """
+        df = await self.fetch_df_all(
+            statement, parameters, arraysize, fetch_decimals=False
+        )
+        return df._to_numpy()
+
+    async def fetch_numpy_batches(
+        self,
+        statement: str,
+        parameters: Optional[Union[list, tuple, dict]] = None,
+        size: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """
+        This returns an iterator yielding the next ``size`` rows of the SQL
+        query ``statement`` in each iteration as a dictionary of NumPy arrays
+        in the same format as returned by
+        :meth:`~AsyncConnection.fetch_numpy()`.
+
+        The ``parameters`` and ``size`` parameters are used in the same way as
+        for :meth:`~AsyncConnection.fetch_df_batches()`.
+
+        NumPy must be installed in order to use this method.
+        """
+        async for df in self.fetch_df_batches(
+            statement, parameters, size, fetch_decimals=False
+        ):
+            yield df._to_numpy()
+
     async def fetchmany(
         self,
         statement: str,
@@ -2623,6 +2855,24 @@ class AsyncConnection(BaseConnection):
         self._verify_connected()
         await self._impl.ping()
 
+    async def read_lobs(
+        self, lobs: Iterable[AsyncLOB]
+    ) -> list[Union[str, bytes]]:
+        """
+        Reads all of the data in each of the LOBs and returns a list containing
+        a string (for CLOB and NCLOB type LOBs) or bytes (for BLOB and BFILE
+        type LOBs) for each LOB, in the same order as the LOBs were supplied.
+        The LOBs must have been created or fetched using this connection.
+
+        In python-oracledb Thin mode, when the database supports
+        :ref:`pipelining <pipelining>`, the requests to read all of the LOBs
+        are sent to the database without waiting for each response so that
+        only one :ref:`round-trip <roundtrips>` is required. Otherwise each LOB
+        is read in turn.
+        """
+        self._verify_connected()
+        return await self._impl.read_lobs(self._get_lob_impls(lobs, AsyncLOB))
+
     async def resume_sessionless_transaction(
         self,
         transaction_id: Union[str, bytes],
@@ -3018,6 +3268,7 @@ def connect_async(
     thick_mode_dsn_passthrough: Optional[bool] = None,
     extra_auth_params: Optional[dict] = None,
     pool_name: Optional[str] = None,
+    parallel_connect_delay: Optional[float] = None,
     handle: Optional[int] = None,
 ) -> AsyncConnection:
     """
@@ -3312,6 +3563,14 @@ def connect_async(
       Oracle Database 23.4, or higher
       (default: None)
 
+    - ``parallel_connect_delay``: the number of seconds to wait for a
+      connection to an address to be established (including the TLS handshake
+      for TCPS addresses) before a connection to the next address in the same
+      address list is also attempted. The first connection to succeed is used
+      and the others are closed. The default value of 0 attempts each address
+      in turn. This value is only used in python-oracledb Thin mode
+      (default: 0)
+
     - ``handle``: an integer representing a pointer to a valid service context
       handle. This value is only used in python-oracledb Thick mode. It should
       be used with extreme caution
@@ -38,6 +38,7 @@ from .base import BaseMetaClass
 from .base_impl import DbType, DB_TYPE_OBJECT
 from .dbobject import DbObjectType
 from .fetch_info import FetchInfo
+from .row_block import RowBlock
 from .var import Var
 
 
@@ -125,6 +126,13 @@ class BaseCursor(metaclass=BaseMetaClass):
         statement = "".join(statement_parts)
         return (statement, bind_values)
 
+    def _get_column_names(self) -> list:
+        """
+        Internal method used for returning the names of the columns being
+        fetched.
+        """
+        return [metadata.name for metadata in self._impl.fetch_metadata]
+
     def _normalize_statement(self, statement: Optional[str]) -> Optional[str]:
         """
         Normalizes a statement by stripping leading and trailing spaces. If the
@@ -874,7 +882,13 @@ class Cursor(BaseCursor):
         parameter can also be a :ref:`DataFrame <oracledataframeobj>`, or a
         third-party data frame that supports the `Apache Arrow PyCapsule
         <https://arrow.apache.org/docs/
-        format/CDataInterface/PyCapsuleInterface.html>`__ Interface.
+        format/CDataInterface/PyCapsuleInterface.html>`__ Interface. Finally,
+        the ``parameters`` parameter can be any other iterable, such as a
+        generator, that returns tuples or dictionaries, or that returns data
+        frames which all have the same schema. In that case, only
+        ``batch_size`` rows are acquired from the iterable at a time, so the
+        amount of memory used depends on the batch size and not on the total
+        number of rows.
 
         In python-oracledb Thick mode, if the size of the buffers allocated for
         any of the parameters exceeds 2 GB, you will receive the error
@@ -956,6 +970,29 @@ class Cursor(BaseCursor):
             result.append(row)
         return result
 
+    def fetchblock(self, size: Optional[int] = None) -> RowBlock:
+        """
+        Fetches the next set of rows of a SELECT query result, returning them
+        as a :ref:`RowBlock <rowblockobj>` object which stores the values of
+        each column together instead of creating a tuple for each row. Rows
+        are only created if they are accessed individually. A block containing
+        no rows is returned if no more rows are available.
+
+        The number of rows to fetch is specified by the ``size`` parameter. If
+        it is not given, the cursor's :attr:`arraysize` attribute determines
+        the number of rows to be fetched. If the number of rows available to be
+        fetched is fewer than the amount requested, fewer rows will be
+        returned.
+
+        An exception is raised if the previous call to :meth:`execute()` did
+        not produce any result set or no call was issued yet.
+        """
+        self._verify_fetch()
+        if size is None:
+            size = self._impl.arraysize
+        impl = self._impl.fetch_block(self, size)
+        return RowBlock._from_impl(impl, self._get_column_names())
+
     def fetchmany(
         self, size: Optional[int] = None, numRows: Optional[int] = None
     ) -> list:
@@ -1228,7 +1265,13 @@ class AsyncCursor(BaseCursor):
         parameter can also be a :ref:`DataFrame <oracledataframeobj>`, or a
         third-party data frame that supports the `Apache Arrow PyCapsule
         <https://arrow.apache.org/docs/
-        format/CDataInterface/PyCapsuleInterface.html>`__ Interface.
+        format/CDataInterface/PyCapsuleInterface.html>`__ Interface. Finally,
+        the ``parameters`` parameter can be any other iterable, such as a
+        generator, that returns tuples or dictionaries, or that returns data
+        frames which all have the same schema. In that case, only
+        ``batch_size`` rows are acquired from the iterable at a time, so the
+        amount of memory used depends on the batch size and not on the total
+        number of rows.
 
         In python-oracledb Thick mode, if the size of the buffers allocated for
         any of the parameters exceeds 2 GB, you will receive the error
@@ -1302,6 +1345,29 @@ class AsyncCursor(BaseCursor):
             result.append(row)
         return result
 
+    async def fetchblock(self, size: Optional[int] = None) -> RowBlock:
+        """
+        Fetches the next set of rows of a SELECT query result, returning them
+        as a :ref:`RowBlock <rowblockobj>` object which stores the values of
+        each column together instead of creating a tuple for each row. Rows
+        are only created if they are accessed individually. A block containing
+        no rows is returned if no more rows are available.
+
+        The number of rows to fetch is specified by the ``size`` parameter. If
+        it is not given, the cursor's :attr:`arraysize` attribute determines
+        the number of rows to be fetched. If the number of rows available to be
+        fetched is fewer than the amount requested, fewer rows will be
+        returned.
+
+        An exception is raised if the previous call to :meth:`execute()` did
+        not produce any result set or no call was issued yet.
+        """
+        self._verify_fetch()
+        if size is None:
+            size = self._impl.arraysize
+        impl = await self._impl.fetch_block(self, size)
+        return RowBlock._from_impl(impl, self._get_column_names())
+
     async def fetchmany(self, size: Optional[int] = None) -> list:
         """
         Fetches the next set of rows of a SELECT query result, returning a list
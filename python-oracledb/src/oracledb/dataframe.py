@@ -30,7 +30,7 @@
 # -----------------------------------------------------------------------------
 
 from .arrow_array import ArrowArray
-from .arrow_impl import DataFrameImpl
+from .arrow_impl import DataFrameImpl, DataFrameStreamImpl
 from .base import BaseMetaClass
 from . import errors
 
@@ -41,6 +41,12 @@ class DataFrame(metaclass=BaseMetaClass):
     def __init__(self):
         errors._raise_err(errors.ERR_INTERNAL_CREATION_REQUIRED)
 
+    @classmethod
+    def _concat(cls, data_frames):
+        df = cls.__new__(cls)
+        df._initialize(DataFrameImpl.concat([d._impl for d in data_frames]))
+        return df
+
     @classmethod
     def _from_arrow(cls, obj):
         df = cls.__new__(cls)
@@ -63,6 +69,26 @@ class DataFrame(metaclass=BaseMetaClass):
         for array in self._arrays:
             self._arrays_by_name[array.name] = array
 
+    def _to_numpy(self) -> dict:
+        """
+        Returns a dictionary mapping each column name to a 2-tuple containing a
+        NumPy array of the column values and a NumPy array of booleans which
+        are True where the column value is null. The values share the memory
+        of the Arrow arrays and are read-only.
+        """
+        import numpy
+
+        result = {}
+        for array in self._arrays:
+            values = numpy.asarray(array._impl)
+            mask = array._impl.get_null_mask()
+            if mask is None:
+                mask = numpy.zeros(len(values), dtype=numpy.bool_)
+            else:
+                mask = numpy.frombuffer(mask, dtype=numpy.bool_)
+            result[array.name] = (values, mask)
+        return result
+
     def __arrow_c_stream__(self, requested_schema=None):
         """
         Returns the ArrowArrayStream PyCapsule which allows direct conversion
@@ -120,3 +146,26 @@ class DataFrame(metaclass=BaseMetaClass):
         Returns the number of rows in the data frame.
         """
         return len(self._arrays[0])
+
+
+class DataFrameStream(metaclass=BaseMetaClass):
+    _impl = None
+
+    def __init__(self):
+        errors._raise_err(errors.ERR_INTERNAL_CREATION_REQUIRED)
+
+    @classmethod
+    def _from_data_frames(cls, data_frames):
+        stream = cls.__new__(cls)
+        stream._impl = DataFrameStreamImpl.from_data_frames(data_frames)
+        return stream
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        """
+        Returns the ArrowArrayStream PyCapsule which allows direct conversion
+        to foreign data frames that support this interface. Each batch is
+        fetched only when the consumer requests it.
+        """
+        if requested_schema is not None:
+            raise NotImplementedError("requested_schema")
+        return self._impl.get_stream_capsule()
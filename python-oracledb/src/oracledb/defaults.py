@@ -325,5 +325,115 @@ class Defaults(metaclass=BaseMetaClass):
     def thick_mode_dsn_passthrough(self, value: str):
         self._impl.thick_mode_dsn_passthrough = value
 
+    @property
+    def dns_cache_ttl(self) -> float:
+        """
+        This read-write attribute specifies the number of seconds for which
+        the results of resolving a host name are cached by python-oracledb
+        Thin mode. The cache is shared by all connections and pools in the
+        process and avoids resolving the same host name each time a connection
+        is created. A value of *0* disables caching of successful lookups.
+
+        This attribute has an initial value of *0*.
+
+        This attribute is only used in python-oracledb Thin mode.
+        """
+        return self._impl.dns_cache_ttl
+
+    @dns_cache_ttl.setter
+    def dns_cache_ttl(self, value: float):
+        self._impl.dns_cache_ttl = value
+
+    @property
+    def dns_cache_negative_ttl(self) -> float:
+        """
+        This read-write attribute specifies the number of seconds for which a
+        failure to resolve a host name is cached by python-oracledb Thin mode.
+        While the failure is cached, connection attempts to that host name
+        fail immediately without resolving the host name again. A value of *0*
+        disables caching of failed lookups.
+
+        This attribute has an initial value of *0*.
+
+        This attribute is only used in python-oracledb Thin mode.
+        """
+        return self._impl.dns_cache_negative_ttl
+
+    @dns_cache_negative_ttl.setter
+    def dns_cache_negative_ttl(self, value: float):
+        self._impl.dns_cache_negative_ttl = value
+
+    @property
+    def adaptive_arraysize(self) -> bool:
+        """
+        This read-write attribute specifies whether python-oracledb Thin mode
+        adapts the number of rows fetched in each round-trip for each query.
+        When enabled, the average size of the row data and the time taken per
+        row by each round-trip are tracked for each statement in the statement
+        cache. The number of rows fetched is doubled after each round-trip
+        that returned a full batch while doing so reduces the time taken per
+        row, up to the number of rows that fit in
+        :attr:`Defaults.adaptive_arraysize_max_bytes`, and is reduced if the
+        rows fetched in one round-trip would exceed that size. The value of
+        :attr:`Cursor.arraysize` is used as the starting point for fetches and
+        continues to determine the number of rows returned by
+        :meth:`Cursor.fetchmany()`. The number of rows returned by the execute
+        round-trip is adapted in the same way, starting from the value of
+        :attr:`Cursor.prefetchrows`.
+
+        This attribute has an initial value of *False*.
+
+        This attribute is only used in python-oracledb Thin mode.
+        """
+        return self._impl.adaptive_arraysize
+
+    @adaptive_arraysize.setter
+    def adaptive_arraysize(self, value: bool):
+        self._impl.adaptive_arraysize = value
+
+    @property
+    def adaptive_arraysize_max_bytes(self) -> int:
+        """
+        This read-write attribute specifies the maximum number of bytes that
+        python-oracledb Thin mode aims to fetch in a single round-trip when
+        :attr:`Defaults.adaptive_arraysize` is enabled. It limits the memory
+        used for fetching statements with wide rows, such as those containing
+        LOBs.
+
+        This attribute has an initial value of *1048576*.
+
+        This attribute is only used in python-oracledb Thin mode.
+        """
+        return self._impl.adaptive_arraysize_max_bytes
+
+    @adaptive_arraysize_max_bytes.setter
+    def adaptive_arraysize_max_bytes(self, value: int):
+        self._impl.adaptive_arraysize_max_bytes = value
+
+    @property
+    def fetch_lazy_json(self) -> bool:
+        """
+        This read-write attribute specifies whether JSON objects and arrays
+        that are fetched in the OSON format are returned as read-only
+        :ref:`JsonObjectView <jsonobjectviewobj>` and :ref:`JsonArrayView
+        <jsonarrayviewobj>` objects instead of dictionaries and lists. The
+        values in these views are only decoded when they are accessed, which
+        reduces the cost of fetching large JSON documents when only a few of
+        their fields are used. The views are subclasses of ``dict`` and
+        ``tuple`` so they can be passed to ``json.dumps()`` and bound to JSON
+        columns.
+
+        In python-oracledb Thin mode this applies to all JSON values. In
+        Thick mode it only applies to columns stored in the OSON format that
+        are not of type JSON.
+
+        This attribute has an initial value of *False*.
+        """
+        return self._impl.fetch_lazy_json
+
+    @fetch_lazy_json.setter
+    def fetch_lazy_json(self, value: bool):
+        self._impl.fetch_lazy_json = value
+
 
 defaults = Defaults()
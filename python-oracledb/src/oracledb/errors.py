@@ -222,6 +222,7 @@ ERR_NOT_A_QUERY = 1003
 ERR_NO_STATEMENT_EXECUTED = 1004
 ERR_POOL_HAS_BUSY_CONNECTIONS = 1005
 ERR_CURSOR_NOT_OPEN = 1006
+ERR_LOB_STREAM_NOT_OPEN = 1007
 
 # error numbers that result in ProgrammingError
 ERR_MESSAGE_HAS_NO_PAYLOAD = 2000
@@ -293,6 +294,12 @@ ERR_EMPTY_STATEMENT = 2066
 ERR_WRONG_DIRECT_PATH_DATA_TYPE = 2067
 ERR_SCROLL_NOT_SUPPORTED = 2068
 ERR_WRONG_REQUESTED_SCHEMA_LENGTH = 2069
+ERR_DATA_FRAME_STREAM_CONSUMED = 2070
+ERR_DATA_FRAME_SCHEMA_MISMATCH = 2071
+ERR_INVALID_NUM_SPLITS = 2072
+ERR_EXPECTING_LOB_SEQUENCE = 2073
+ERR_LOB_DIFF_CONNECTION = 2074
+ERR_INVALID_SPLIT_BY = 2075
 
 # error numbers that result in NotSupportedError
 ERR_TIME_NOT_SUPPORTED = 3000
@@ -334,6 +341,9 @@ ERR_SESSIONLESS_INACTIVE = 3036
 ERR_UNSUPPORTED_ARROW_TYPE = 3037
 ERR_CANNOT_CONVERT_TO_ARROW_TYPE = 3038
 ERR_CANNOT_CONVERT_FROM_ARROW_TYPE = 3039
+ERR_NUMPY_UNSUPPORTED_ARROW_TYPE = 3040
+ERR_OPERATION_ONLY_SUPPORTED_ON_BINARY_LOB = 3041
+ERR_NUMPY_VECTOR_DIMENSIONS_DIFFER = 3042
 
 # error numbers that result in DatabaseError
 ERR_TNS_ENTRY_NOT_FOUND = 4000
@@ -640,6 +650,14 @@ ERR_MESSAGE_FORMATS = {
     ),
     ERR_CURSOR_HAS_BEEN_CLOSED: "cursor has been closed by the database",
     ERR_CURSOR_NOT_OPEN: "cursor is not open",
+    ERR_DATA_FRAME_SCHEMA_MISMATCH: (
+        "column {column_num} of data frame {df_num} has Arrow type "
+        '"{actual_type}" but the first data frame has Arrow type '
+        '"{expected_type}"'
+    ),
+    ERR_DATA_FRAME_STREAM_CONSUMED: (
+        "the data frame stream has already been consumed"
+    ),
     ERR_DBOBJECT_ATTR_MAX_SIZE_VIOLATED: (
         "attribute {attr_name} of type {type_name} exceeds its maximum size "
         "(actual: {actual_size}, maximum: {max_size})"
@@ -671,6 +689,9 @@ ERR_MESSAGE_FORMATS = {
     ERR_EXPECTING_LIST_FOR_ARRAY_VAR: (
         "expecting list when setting array variables"
     ),
+    ERR_EXPECTING_LOB_SEQUENCE: (
+        "expecting a sequence of {lob_class_name} objects"
+    ),
     ERR_EXPECTING_TYPE: "expected a type",
     ERR_EXPECTING_VAR: (
         "type handler should return None or the value returned by a call "
@@ -736,6 +757,9 @@ ERR_MESSAGE_FORMATS = {
         '"{name}" includes characters that are not allowed'
     ),
     ERR_INVALID_NUMBER: "invalid number",
+    ERR_INVALID_NUM_SPLITS: (
+        "number of splits must be an integer greater than zero"
+    ),
     ERR_INVALID_OBJECT_TYPE_NAME: 'invalid object type name: "{name}"',
     ERR_INVALID_OCI_ATTR_TYPE: "invalid OCI attribute type {attr_type}",
     ERR_INVALID_PASSWORD_TYPE: 'invalid password type "{password_type}"',
@@ -764,6 +788,9 @@ ERR_MESSAGE_FORMATS = {
         'SID "{sid}" is not registered with the listener at host "{host}" '
         "port {port}. (Similar to ORA-12505)"
     ),
+    ERR_INVALID_SPLIT_BY: (
+        'split_by must be the name of a column of the query: "{split_by}"'
+    ),
     ERR_INVALID_SSL_VERSION: 'invalid value for ssl_version: "{ssl_version}"',
     ERR_INVALID_TPC_BEGIN_FLAGS: "invalid flags for tpc_begin()",
     ERR_INVALID_TPC_END_FLAGS: "invalid flags for tpc_end()",
@@ -777,10 +804,14 @@ ERR_MESSAGE_FORMATS = {
     ERR_LISTENER_REFUSED_CONNECTION: (
         "Listener refused connection. (Similar to ORA-{error_code})"
     ),
+    ERR_LOB_DIFF_CONNECTION: (
+        "LOB was not created or fetched using this connection"
+    ),
     ERR_LOB_OF_WRONG_TYPE: (
         "LOB is of type {actual_type_name} but must be of type "
         "{expected_type_name}"
     ),
+    ERR_LOB_STREAM_NOT_OPEN: "LOB stream is not open",
     ERR_MESSAGE_HAS_NO_PAYLOAD: "message has no payload",
     ERR_MESSAGE_TYPE_UNKNOWN: (
         "internal error: unknown protocol message type {message_type} "
@@ -844,6 +875,14 @@ ERR_MESSAGE_FORMATS = {
     ERR_NUMBER_STRING_TOO_LONG: "invalid number: string too long",
     ERR_NUMBER_WITH_EMPTY_EXPONENT: "invalid number: empty exponent",
     ERR_NUMBER_WITH_INVALID_EXPONENT: "invalid number: invalid exponent",
+    ERR_NUMPY_UNSUPPORTED_ARROW_TYPE: (
+        'column "{name}" with Apache Arrow type "{arrow_type}" cannot be '
+        "fetched as a NumPy array"
+    ),
+    ERR_NUMPY_VECTOR_DIMENSIONS_DIFFER: (
+        'column "{name}" cannot be fetched as a NumPy array since its vectors '
+        "do not all have the same number of dimensions"
+    ),
     ERR_OBJECT_IS_NOT_A_COLLECTION: "object {name} is not a collection",
     ERR_OPERATION_NOT_SUPPORTED_ON_BFILE: (
         "operation is not supported on BFILE LOBs"
@@ -851,6 +890,9 @@ ERR_MESSAGE_FORMATS = {
     ERR_OPERATION_ONLY_SUPPORTED_ON_BFILE: (
         "operation is only supported on BFILE LOBs"
     ),
+    ERR_OPERATION_ONLY_SUPPORTED_ON_BINARY_LOB: (
+        "operation is only supported on BLOB and BFILE LOBs"
+    ),
     ERR_ORACLE_NUMBER_NO_REPR: (
         "value cannot be represented as an Oracle number"
     ),
@@ -988,17 +1030,18 @@ ERR_MESSAGE_FORMATS = {
         "expecting a list of two elements [type, numelems]"
     ),
     ERR_WRONG_DIRECT_PATH_DATA_TYPE: (
-        "expecting a list or an object implementing the Apache Arrow "
-        "PyCapsule interface __arrow_c_stream__()"
+        "expecting a list or other iterable, or an object implementing the "
+        "Apache Arrow PyCapsule interface __arrow_c_stream__()"
     ),
     ERR_WRONG_EXECUTE_PARAMETERS_TYPE: (
         "expecting a dictionary, list or tuple, or keyword args"
     ),
     ERR_WRONG_EXECUTEMANY_PARAMETERS_TYPE: (
-        '"parameters" argument should be a list of sequences or '
-        "dictionaries, or an integer specifying the number of "
-        "times to execute the statement, or an object implementing the Apache "
-        "Arrow PyCapsule interface __arrow_c_stream__()"
+        '"parameters" argument should be a list or other iterable of '
+        "sequences or dictionaries, or an integer specifying the number of "
+        "times to execute the statement, or an object (or an iterable of "
+        "objects) implementing the Apache Arrow PyCapsule interface "
+        "__arrow_c_stream__()"
     ),
     ERR_WRONG_NUMBER_OF_POSITIONAL_BINDS: (
         "{expected_num} positional bind values are required but "
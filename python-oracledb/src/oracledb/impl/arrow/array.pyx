@@ -40,6 +40,32 @@ cdef class ArrowArrayImpl:
                 ArrowArrayRelease(self.arrow_array)
             cpython.PyMem_Free(self.arrow_array)
 
+    @property
+    def __array_interface__(self):
+        """
+        Returns the NumPy array interface for the data buffer of the array.
+        This allows NumPy to create an array that shares the memory of the
+        Arrow array without copying it. Null values are stored as zero. Arrays
+        of vectors are returned as two-dimensional arrays containing one
+        vector in each row.
+        """
+        cdef:
+            int64_t length = self.arrow_array.length
+            const char *source_buf
+            int64_t item_size
+            str typestr
+        typestr = self._get_numpy_typestr(&item_size)
+        if self.schema_impl.arrow_type in (NANOARROW_TYPE_LIST,
+                                           NANOARROW_TYPE_FIXED_SIZE_LIST):
+            return self._get_numpy_matrix_interface(typestr, item_size)
+        if length == 0:
+            data = b""
+        else:
+            source_buf = <const char*> self.arrow_array.buffers[1]
+            data = (<uintptr_t> (source_buf + \
+                    self.arrow_array.offset * item_size), True)
+        return dict(version=3, shape=(length,), typestr=typestr, data=data)
+
     cdef int _extract_int(self, const void* ptr, ArrowType arrow_type,
                           int64_t index, int64_t* value) except -1:
         """
@@ -84,6 +110,146 @@ cdef class ArrowArrayImpl:
         else:
             is_null[0] = False
 
+    cdef dict _get_numpy_matrix_interface(self, str typestr,
+                                          int64_t element_size):
+        """
+        Returns the NumPy array interface for an array of vectors, which must
+        all have the same number of dimensions. The memory of the Arrow array
+        is shared if it does not contain any null values; otherwise, the
+        vectors are copied to a new buffer in which null rows are zero. The
+        offsets of the array and of its child array are taken into account so
+        that sliced arrays are handled correctly.
+        """
+        cdef:
+            int64_t i, row_index, num_elements, num_dimensions = -1
+            int64_t length = self.arrow_array.length
+            int64_t array_offset = self.arrow_array.offset
+            ArrowArray *child = self.arrow_array.children[0]
+            const uint8_t *bits = NULL
+            const int32_t *offsets = NULL
+            int64_t row_size, start
+            char *source_buf
+            char *dest_buf
+            bytearray dest
+            bint is_fixed
+
+        # determine the number of dimensions, which must be the same for all
+        # vectors in the array
+        is_fixed = \
+                self.schema_impl.arrow_type == NANOARROW_TYPE_FIXED_SIZE_LIST
+        if self.arrow_array.null_count != 0:
+            bits = <const uint8_t*> self.arrow_array.buffers[0]
+        if is_fixed:
+            num_dimensions = self.schema_impl.fixed_size
+        else:
+            offsets = <const int32_t*> self.arrow_array.buffers[1]
+            for i in range(length):
+                row_index = array_offset + i
+                if bits != NULL and not ArrowBitGet(bits, row_index):
+                    continue
+                num_elements = offsets[row_index + 1] - offsets[row_index]
+                if num_dimensions < 0:
+                    num_dimensions = num_elements
+                elif num_elements != num_dimensions:
+                    errors._raise_err(
+                        errors.ERR_NUMPY_VECTOR_DIMENSIONS_DIFFER,
+                        name=self.schema_impl.name
+                    )
+            if num_dimensions < 0:
+                num_dimensions = 0
+
+        # share the memory of the child array if possible; otherwise, copy
+        # each of the vectors into its row
+        row_size = num_dimensions * element_size
+        source_buf = (<char*> child.buffers[1]) + child.offset * element_size
+        if length == 0 or row_size == 0:
+            data = b""
+        elif bits == NULL:
+            if is_fixed:
+                start = array_offset * num_dimensions
+            else:
+                start = offsets[array_offset]
+            data = (<uintptr_t> (source_buf + start * element_size), True)
+        else:
+            data = dest = bytearray(length * row_size)
+            dest_buf = <char*> dest
+            for i in range(length):
+                row_index = array_offset + i
+                if not ArrowBitGet(bits, row_index):
+                    continue
+                if is_fixed:
+                    start = row_index * num_dimensions
+                else:
+                    start = offsets[row_index]
+                memcpy(dest_buf + i * row_size,
+                       source_buf + start * element_size, row_size)
+        return dict(version=3, shape=(length, num_dimensions),
+                    typestr=typestr, data=data)
+
+    cdef str _get_numpy_typestr(self, int64_t *item_size):
+        """
+        Returns the NumPy type string matching the Arrow type of the array and
+        the size of each item in bytes. For arrays of vectors, the type of the
+        vector elements is used. An exception is raised if the Arrow type does
+        not use a fixed size value that NumPy can use directly.
+        """
+        cdef:
+            ArrowType arrow_type = self.schema_impl.arrow_type
+            ArrowTimeUnit time_unit
+            str code
+        if arrow_type in (NANOARROW_TYPE_LIST,
+                          NANOARROW_TYPE_FIXED_SIZE_LIST):
+            arrow_type = self.schema_impl.child_arrow_type
+        if arrow_type == NANOARROW_TYPE_DOUBLE:
+            code = "f8"
+            item_size[0] = 8
+        elif arrow_type == NANOARROW_TYPE_FLOAT:
+            code = "f4"
+            item_size[0] = 4
+        elif arrow_type == NANOARROW_TYPE_INT64:
+            code = "i8"
+            item_size[0] = 8
+        elif arrow_type == NANOARROW_TYPE_INT32:
+            code = "i4"
+            item_size[0] = 4
+        elif arrow_type == NANOARROW_TYPE_INT16:
+            code = "i2"
+            item_size[0] = 2
+        elif arrow_type == NANOARROW_TYPE_INT8:
+            code = "i1"
+            item_size[0] = 1
+        elif arrow_type == NANOARROW_TYPE_UINT64:
+            code = "u8"
+            item_size[0] = 8
+        elif arrow_type == NANOARROW_TYPE_UINT32:
+            code = "u4"
+            item_size[0] = 4
+        elif arrow_type == NANOARROW_TYPE_UINT16:
+            code = "u2"
+            item_size[0] = 2
+        elif arrow_type == NANOARROW_TYPE_UINT8:
+            code = "u1"
+            item_size[0] = 1
+        elif arrow_type == NANOARROW_TYPE_DATE64:
+            code = "M8[ms]"
+            item_size[0] = 8
+        elif arrow_type == NANOARROW_TYPE_TIMESTAMP:
+            item_size[0] = 8
+            time_unit = self.schema_impl.time_unit
+            if time_unit == NANOARROW_TIME_UNIT_MILLI:
+                code = "M8[ms]"
+            elif time_unit == NANOARROW_TIME_UNIT_MICRO:
+                code = "M8[us]"
+            elif time_unit == NANOARROW_TIME_UNIT_NANO:
+                code = "M8[ns]"
+            else:
+                code = "M8[s]"
+        else:
+            errors._raise_err(errors.ERR_NUMPY_UNSUPPORTED_ARROW_TYPE,
+                              name=self.schema_impl.name,
+                              arrow_type=self.schema_impl.get_type_name())
+        return NUMPY_BYTE_ORDER + code
+
     cdef int _get_list_info(self, int64_t index, ArrowArray* arrow_array,
                             int64_t* offset, int64_t* num_elements) except -1:
         """
@@ -164,6 +330,22 @@ cdef class ArrowArrayImpl:
         """
         Appends the last value of the given array to this array.
         """
+        if array is None:
+            array = self
+        self.append_value(array, array.arrow_array.length - 1)
+
+    cdef int append_null(self) except -1:
+        """
+        Append a null value to the array.
+        """
+        _check_nanoarrow(ArrowArrayAppendNull(self.arrow_array, 1))
+
+    cdef int append_value(self, ArrowArrayImpl array,
+                          int64_t index) except -1:
+        """
+        Appends the value at the specified index of the given array to this
+        array. The given array must have the same schema as this array.
+        """
         cdef:
             int32_t start_offset, end_offset
             ArrowBuffer *offsets_buffer
@@ -176,13 +358,9 @@ cdef class ArrowArrayImpl:
             double *as_double
             float *as_float
             int8_t as_bool
-            int64_t index
             bint is_null
             uint8_t *ptr
             void* temp
-        if array is None:
-            array = self
-        index = array.arrow_array.length - 1
         array._get_is_null(index, &is_null)
         if is_null:
             self.append_null()
@@ -260,12 +438,15 @@ cdef class ArrowArrayImpl:
                 self.append_bytes(temp, end_offset - start_offset)
             finally:
                 cpython.PyMem_Free(temp)
-
-    cdef int append_null(self) except -1:
-        """
-        Append a null value to the array.
-        """
-        _check_nanoarrow(ArrowArrayAppendNull(self.arrow_array, 1))
+        elif array.schema_impl.arrow_type in (
+                NANOARROW_TYPE_FIXED_SIZE_LIST,
+                NANOARROW_TYPE_LIST
+        ):
+            self.append_vector(array.get_vector(index, &is_null))
+        elif array.schema_impl.arrow_type == NANOARROW_TYPE_STRUCT:
+            num_dimensions, indices, values = \
+                    array.get_sparse_vector(index, &is_null)
+            self.append_sparse_vector(num_dimensions, indices, values)
 
     cdef int append_uint(self, uint64_t value) except -1:
         """
@@ -402,6 +583,34 @@ cdef class ArrowArrayImpl:
             finally:
                 ArrowBufferReset(&buf)
 
+    cdef int get_decimal_text(self, int64_t index, bint* is_null, char* text,
+                              ssize_t max_size, ssize_t* size) except -1:
+        """
+        Places the text corresponding to the decimal value into the supplied
+        buffer, without creating a bytes object.
+        """
+        cdef:
+            ArrowDecimal decimal
+            ArrowBuffer buf
+            uint8_t *ptr
+        self._get_is_null(index, is_null)
+        if not is_null[0]:
+            ptr = <uint8_t*> self.arrow_array.buffers[1]
+            ArrowDecimalInit(&decimal, 128, self.schema_impl.precision,
+                             self.schema_impl.scale)
+            ArrowDecimalSetBytes(&decimal, ptr + index * 16)
+            ArrowBufferInit(&buf)
+            try:
+                _check_nanoarrow(ArrowDecimalAppendStringToBuffer(
+                    &decimal, &buf
+                ))
+                if buf.size_bytes > max_size:
+                    errors._raise_err(errors.ERR_NUMBER_STRING_TOO_LONG)
+                memcpy(text, buf.data, buf.size_bytes)
+                size[0] = buf.size_bytes
+            finally:
+                ArrowBufferReset(&buf)
+
     cdef int get_double(self, int64_t index, bint* is_null,
                         double* value) except -1:
         """
@@ -620,6 +829,27 @@ cdef class ArrowArrayImpl:
         """
         return self.arrow_array.null_count
 
+    def get_null_mask(self):
+        """
+        Internal method for getting an array containing one byte for each row
+        which is 1 if the row contains a null value and 0 if it does not. None
+        is returned if the array does not contain any null values.
+        """
+        cdef:
+            int64_t i, length = self.arrow_array.length
+            const uint8_t *bits
+            array.array mask
+            int64_t offset = self.arrow_array.offset
+            uint8_t *ptr
+        bits = <const uint8_t*> self.arrow_array.buffers[0]
+        if self.arrow_array.null_count == 0 or bits == NULL:
+            return None
+        mask = array.clone(uint8_template, length, False)
+        ptr = mask.data.as_uchars
+        for i in range(length):
+            ptr[i] = not ArrowBitGet(bits, offset + i)
+        return mask
+
     def get_num_rows(self):
         """
         Internal method for getting the number of rows in the array.
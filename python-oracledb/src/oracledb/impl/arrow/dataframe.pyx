@@ -44,6 +44,7 @@ cdef class DataFrameImpl:
             ArrowArray arrow_array
             DataFrameImpl df_impl
             ssize_t i
+            int code
 
         # initialization
         df_impl = DataFrameImpl.__new__(DataFrameImpl)
@@ -55,7 +56,9 @@ cdef class DataFrameImpl:
         )
 
         # populate list of schemas
-        _check_nanoarrow(arrow_stream.get_schema(arrow_stream, &arrow_schema))
+        code = arrow_stream.get_schema(arrow_stream, &arrow_schema)
+        if code != NANOARROW_OK:
+            _raise_stream_error(arrow_stream, code)
         for i in range(arrow_schema.n_children):
             schema_impl = ArrowSchemaImpl.__new__(ArrowSchemaImpl)
             schema_impl.populate_from_schema(arrow_schema.children[i])
@@ -63,7 +66,9 @@ cdef class DataFrameImpl:
 
         # populate list of arrays
         while True:
-            _check_nanoarrow(arrow_stream.get_next(arrow_stream, &arrow_array))
+            code = arrow_stream.get_next(arrow_stream, &arrow_array)
+            if code != NANOARROW_OK:
+                _raise_stream_error(arrow_stream, code)
             if arrow_array.release == NULL:
                 break
             for i in range(arrow_schema.n_children):
@@ -75,6 +80,39 @@ cdef class DataFrameImpl:
         ArrowArrayStreamRelease(arrow_stream)
         return df_impl
 
+    @classmethod
+    def concat(cls, list df_impls):
+        """
+        Returns a new data frame containing the rows of each of the given data
+        frames in turn. All of the data frames must have the same schema.
+        """
+        cdef:
+            ArrowArrayImpl array_impl, source_array_impl
+            DataFrameImpl df_impl, source_df_impl
+            ArrowSchemaImpl schema_impl
+            int64_t i, num_rows
+            ssize_t col_num
+        df_impl = DataFrameImpl.__new__(DataFrameImpl)
+        df_impl.schema_impls = (<DataFrameImpl> df_impls[0]).schema_impls
+        df_impl.arrays = []
+        for col_num, schema_impl in enumerate(df_impl.schema_impls):
+            num_rows = 0
+            for source_df_impl in df_impls:
+                source_array_impl = source_df_impl.arrays[col_num]
+                num_rows += source_array_impl.arrow_array.length
+            array_impl = ArrowArrayImpl.__new__(ArrowArrayImpl)
+            array_impl.populate_from_schema(schema_impl)
+            _check_nanoarrow(
+                ArrowArrayReserve(array_impl.arrow_array, num_rows)
+            )
+            for source_df_impl in df_impls:
+                source_array_impl = source_df_impl.arrays[col_num]
+                for i in range(source_array_impl.arrow_array.length):
+                    array_impl.append_value(source_array_impl, i)
+            array_impl.finish_building()
+            df_impl.arrays.append(array_impl)
+        return df_impl
+
     def get_arrays(self):
         """
         Internal method for getting the list of arrays associated with the data
@@ -88,10 +126,7 @@ cdef class DataFrameImpl:
         encapsulates the arrays found in the data frame.
         """
         cdef:
-            ArrowSchemaImpl schema_impl
-            ArrowArrayImpl array_impl
             ArrowArrayStream *stream
-            int64_t i, num_arrays
             ArrowSchema schema
             ArrowArray array
 
@@ -99,36 +134,18 @@ cdef class DataFrameImpl:
         stream = NULL
         array.release = NULL
         schema.release = NULL
-        num_arrays = <int64_t> len(self.arrays)
 
         try:
 
             # create schema/array encompassing all of the arrays
-            _check_nanoarrow(
-                ArrowSchemaInitFromType(&schema, NANOARROW_TYPE_STRUCT)
-            )
-            _check_nanoarrow(ArrowSchemaAllocateChildren(&schema, num_arrays))
-            _check_nanoarrow(
-                ArrowArrayInitFromType(&array, NANOARROW_TYPE_STRUCT)
-            )
-            _check_nanoarrow(ArrowArrayAllocateChildren(&array, num_arrays))
-            for i, schema_impl in enumerate(self.schema_impls):
-                array_impl = self.arrays[i]
-                array.length = array_impl.arrow_array.length
-                copy_arrow_array(
-                    array_impl, array_impl.arrow_array, array.children[i]
-                )
-                _check_nanoarrow(
-                    ArrowSchemaDeepCopy(
-                        schema_impl.arrow_schema, schema.children[i]
-                    )
-                )
+            _populate_struct_schema(self.schema_impls, &schema)
+            _populate_struct_array(self.arrays, &array)
 
             # create stream and populate it
             stream = <ArrowArrayStream*> \
                     cpython.PyMem_Calloc(1, sizeof(ArrowArrayStream))
             _check_nanoarrow(
-                ArrowBasicArrayStreamInit(stream, &schema, num_arrays)
+                ArrowBasicArrayStreamInit(stream, &schema, 1)
             )
             ArrowBasicArrayStreamSetArray(stream, 0, &array)
 
@@ -163,3 +180,184 @@ cdef void pycapsule_array_stream_deleter(object stream_capsule) noexcept:
     if stream.release != NULL:
         ArrowArrayStreamRelease(stream)
     cpython.PyMem_Free(stream)
+
+
+cdef class DataFrameStreamImpl:
+
+    @classmethod
+    def from_data_frames(cls, object data_frames):
+        """
+        Creates a stream which acquires the data frames from the given iterator
+        only when the consumer of the stream requests them. The first data
+        frame is acquired immediately in order to determine the schema.
+        """
+        cdef DataFrameStreamImpl stream_impl
+        stream_impl = DataFrameStreamImpl.__new__(DataFrameStreamImpl)
+        stream_impl.data_frames = iter(data_frames)
+        stream_impl.next_df_impl = next(stream_impl.data_frames)._impl
+        stream_impl.schema_impls = stream_impl.next_df_impl.schema_impls
+        return stream_impl
+
+    cdef int get_next(self, ArrowArray* array) except -1:
+        """
+        Populates the array with the next data frame from the iterator. If the
+        iterator is exhausted the array is marked as released, which signals
+        the end of the stream.
+        """
+        cdef DataFrameImpl df_impl = self.next_df_impl
+        if df_impl is not None:
+            self.next_df_impl = None
+        else:
+            df = next(self.data_frames, None)
+            if df is None:
+                self.data_frames = None
+                array.release = NULL
+                return 0
+            df_impl = df._impl
+        _populate_struct_array(df_impl.arrays, array)
+
+    cdef int set_last_error(self, BaseException e) except -1:
+        """
+        Retains the exception raised while the consumer of the stream was
+        being called back. The message returned to the consumer includes the
+        error code (for errors raised by the driver) or the exception type
+        (for other exceptions) so that the cause of the failure is not lost.
+        The exception itself is raised again if the stream is consumed by
+        DataFrameImpl.from_arrow().
+        """
+        cdef str message
+        if isinstance(e, exceptions.Error):
+            message = str(e)
+        else:
+            message = f"{type(e).__name__}: {e}"
+        self.last_exception = e
+        self.last_error = message.encode()
+
+    def get_stream_capsule(self):
+        """
+        Internal method for getting a PyCapsule pointer to a stream that calls
+        back into the stream implementation each time a batch is requested.
+        The stream can only be consumed once.
+        """
+        cdef ArrowArrayStream *stream
+        if self.consumed:
+            errors._raise_err(errors.ERR_DATA_FRAME_STREAM_CONSUMED)
+        self.consumed = True
+        stream = <ArrowArrayStream*> \
+                cpython.PyMem_Calloc(1, sizeof(ArrowArrayStream))
+        stream.get_schema = df_stream_get_schema
+        stream.get_next = df_stream_get_next
+        stream.get_last_error = df_stream_get_last_error
+        stream.release = df_stream_release
+        stream.private_data = <void*> self
+        cpython.Py_INCREF(self)
+        return cpython.PyCapsule_New(
+            stream,
+            "arrow_array_stream",
+            &pycapsule_array_stream_deleter
+        )
+
+
+cdef int _raise_stream_error(ArrowArrayStream *stream, int code) except -1:
+    """
+    Raises an exception for an error returned by the stream. If the stream was
+    created by a data frame stream, the exception originally raised while
+    populating the batch is raised again.
+    """
+    cdef DataFrameStreamImpl stream_impl
+    if stream.get_next == df_stream_get_next:
+        stream_impl = <DataFrameStreamImpl> stream.private_data
+        if stream_impl.last_exception is not None:
+            raise stream_impl.last_exception
+    _check_nanoarrow(code)
+
+
+cdef int _populate_struct_array(list arrays, ArrowArray *array) except -1:
+    """
+    Populates a struct array with the given arrays as its children. The arrays
+    are shallow copies which keep the original arrays alive.
+    """
+    cdef:
+        ArrowArrayImpl array_impl
+        int64_t i
+    _check_nanoarrow(ArrowArrayInitFromType(array, NANOARROW_TYPE_STRUCT))
+    _check_nanoarrow(ArrowArrayAllocateChildren(array, len(arrays)))
+    for i, array_impl in enumerate(arrays):
+        array.length = array_impl.arrow_array.length
+        copy_arrow_array(array_impl, array_impl.arrow_array, array.children[i])
+
+
+cdef int _populate_struct_schema(list schema_impls,
+                                 ArrowSchema *schema) except -1:
+    """
+    Populates a struct schema with copies of the given schemas as its
+    children.
+    """
+    cdef:
+        ArrowSchemaImpl schema_impl
+        int64_t i
+    _check_nanoarrow(ArrowSchemaInitFromType(schema, NANOARROW_TYPE_STRUCT))
+    _check_nanoarrow(ArrowSchemaAllocateChildren(schema, len(schema_impls)))
+    for i, schema_impl in enumerate(schema_impls):
+        _check_nanoarrow(
+            ArrowSchemaDeepCopy(schema_impl.arrow_schema, schema.children[i])
+        )
+
+
+cdef int df_stream_get_next(ArrowArrayStream *stream,
+                            ArrowArray *array) noexcept with gil:
+    """
+    Called by the consumer of a data frame stream to get the next batch.
+    """
+    cdef DataFrameStreamImpl stream_impl = \
+            <DataFrameStreamImpl> stream.private_data
+    array.release = NULL
+    try:
+        stream_impl.get_next(array)
+    except BaseException as e:
+        if array.release != NULL:
+            ArrowArrayRelease(array)
+        stream_impl.set_last_error(e)
+        return EIO
+    return 0
+
+
+cdef const char* df_stream_get_last_error(
+    ArrowArrayStream *stream
+) noexcept with gil:
+    """
+    Called by the consumer of a data frame stream to get the message of the
+    last error that took place.
+    """
+    cdef DataFrameStreamImpl stream_impl = \
+            <DataFrameStreamImpl> stream.private_data
+    if stream_impl.last_error is None:
+        return NULL
+    return stream_impl.last_error
+
+
+cdef int df_stream_get_schema(ArrowArrayStream *stream,
+                              ArrowSchema *schema) noexcept with gil:
+    """
+    Called by the consumer of a data frame stream to get the schema.
+    """
+    cdef DataFrameStreamImpl stream_impl = \
+            <DataFrameStreamImpl> stream.private_data
+    schema.release = NULL
+    try:
+        _populate_struct_schema(stream_impl.schema_impls, schema)
+    except BaseException as e:
+        if schema.release != NULL:
+            ArrowSchemaRelease(schema)
+        stream_impl.set_last_error(e)
+        return EIO
+    return 0
+
+
+cdef void df_stream_release(ArrowArrayStream *stream) noexcept with gil:
+    """
+    Called when the consumer of a data frame stream no longer requires it.
+    """
+    cpython.Py_DECREF(<DataFrameStreamImpl> stream.private_data)
+    stream.private_data = NULL
+    stream.release = NULL
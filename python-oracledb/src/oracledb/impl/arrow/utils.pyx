@@ -37,7 +37,9 @@ cdef extern from "nanoarrow.c":
     cdef struct ArrowArrayStream:
         int (*get_schema)(ArrowArrayStream *, ArrowSchema * out)
         int (*get_next)(ArrowArrayStream * stream, ArrowArray * out)
+        const char* (*get_last_error)(ArrowArrayStream*)
         void (*release)(ArrowArrayStream*)
+        void *private_data
 
     cdef struct ArrowBufferAllocator:
         void *private_data
@@ -92,6 +94,8 @@ cdef extern from "nanoarrow.c":
     ArrowErrorCode ArrowArrayAppendNull(ArrowArray* arrow_array, int64_t n)
     ArrowErrorCode ArrowArrayAppendUInt(ArrowArray * arrow_array, uint64_t n)
     ArrowBuffer* ArrowArrayBuffer(ArrowArray* arrow_array, int64_t i)
+    ArrowErrorCode ArrowBufferAppend(ArrowBuffer* buffer, const void* data,
+                                     int64_t size_bytes)
     ArrowErrorCode ArrowArrayFinishBuildingDefault(ArrowArray* arrow_array,
                                                    ArrowError* error)
     ArrowErrorCode ArrowArrayFinishElement(ArrowArray* arrow_array)
@@ -165,32 +169,37 @@ cdef int _check_nanoarrow(int code) except -1:
 
 
 
-cdef int append_double_array(ArrowArray *arrow_array,
-                             array.array value) except -1:
+cdef int _append_list_values(ArrowArray *arrow_array, array.array value,
+                             int64_t element_size) except -1:
     """
-    Appends an array of doubles to the Arrow array.
+    Appends the contents of the array as a single element of the Arrow list
+    array. The values are copied to the data buffer of the child array in one
+    operation since the child array never contains null values.
     """
     cdef:
         ArrowArray *child_array = arrow_array.children[0]
-        double *double_buf = value.data.as_doubles
-        Py_ssize_t i
-    for i in range(len(value)):
-        _check_nanoarrow(ArrowArrayAppendDouble(child_array, double_buf[i]))
+        int64_t num_elements = len(value)
+    _check_nanoarrow(ArrowBufferAppend(ArrowArrayBuffer(child_array, 1),
+                                       value.data.as_voidptr,
+                                       num_elements * element_size))
+    child_array.length += num_elements
     _check_nanoarrow(ArrowArrayFinishElement(arrow_array))
 
 
+cdef int append_double_array(ArrowArray *arrow_array,
+                             array.array value) except -1:
+    """
+    Appends an array of doubles to the Arrow array.
+    """
+    _append_list_values(arrow_array, value, sizeof(double))
+
+
 cdef int append_float_array(ArrowArray *arrow_array,
                             array.array value) except -1:
     """
     Appends an array of floats to the Arrow array.
     """
-    cdef:
-        ArrowArray *child_array = arrow_array.children[0]
-        float *float_buf = value.data.as_floats
-        Py_ssize_t i
-    for i in range(len(value)):
-        _check_nanoarrow(ArrowArrayAppendDouble(child_array, float_buf[i]))
-    _check_nanoarrow(ArrowArrayFinishElement(arrow_array))
+    _append_list_values(arrow_array, value, sizeof(float))
 
 
 cdef int append_int8_array(ArrowArray *arrow_array,
@@ -198,13 +207,7 @@ cdef int append_int8_array(ArrowArray *arrow_array,
     """
     Appends an array of signed one-byte integers to the Arrow array.
     """
-    cdef:
-        ArrowArray *child_array = arrow_array.children[0]
-        int8_t *int8_buf = value.data.as_schars
-        Py_ssize_t i
-    for i in range(len(value)):
-        _check_nanoarrow(ArrowArrayAppendInt(child_array, int8_buf[i]))
-    _check_nanoarrow(ArrowArrayFinishElement(arrow_array))
+    _append_list_values(arrow_array, value, sizeof(int8_t))
 
 
 cdef int append_uint8_array(ArrowArray *arrow_array,
@@ -212,13 +215,7 @@ cdef int append_uint8_array(ArrowArray *arrow_array,
     """
     Appends an array of unsigned one-byte integers to the Arrow array.
     """
-    cdef:
-        ArrowArray *child_array = arrow_array.children[0]
-        uint8_t *uint8_buf = value.data.as_uchars
-        Py_ssize_t i
-    for i in range(len(value)):
-        _check_nanoarrow(ArrowArrayAppendInt(child_array, uint8_buf[i]))
-    _check_nanoarrow(ArrowArrayFinishElement(arrow_array))
+    _append_list_values(arrow_array, value, sizeof(uint8_t))
 
 
 cdef int append_uint32_array(ArrowArray *arrow_array,
@@ -44,7 +44,9 @@ cdef class BatchLoadManager:
         """
         Creates a batch manager from the parameters and batch size.
         """
-        cdef DataFrameImpl df_impl
+        cdef:
+            DataFrameImpl df_impl
+            object iterator, value
 
         # batch size must be a positive integer
         if batch_size == 0:
@@ -70,6 +72,30 @@ cdef class BatchLoadManager:
             df_impl = DataFrameImpl.from_arrow_stream(parameters)
             return DataFrameBatchLoadManager.create(df_impl)
 
+        # if parameters are a two-dimensional object supporting the buffer
+        # protocol (such as a NumPy matrix) with vector elements, each row of
+        # the matrix is bound as a single vector
+        elif _is_buffer_matrix(parameters):
+            iterator = _iter_buffer_matrix_rows(parameters)
+            return IteratorBatchLoadManager.create(iterator)
+
+        # if parameters are any other iterable (such as a generator), the
+        # values are acquired from it one batch at a time; the first value
+        # determines whether the iterable returns rows or dataframes
+        elif hasattr(parameters, "__iter__") \
+                and not isinstance(parameters, (str, bytes, dict)):
+            iterator = iter(parameters)
+            for value in iterator:
+                break
+            else:
+                return FullDataBatchLoadManager.create([])
+            if isinstance(value, PY_TYPE_DATAFRAME) \
+                    or hasattr(value, "__arrow_c_stream__"):
+                df_impl = DataFrameBatchLoadManager._get_df_impl(value)
+                return DataFrameBatchLoadManager.create(df_impl, iterator)
+            iterator = itertools.chain((value,), iterator)
+            return IteratorBatchLoadManager.create(iterator)
+
         # the parameters are of an unknown type
         errors._raise_err(error_num)
 
@@ -179,6 +205,8 @@ cdef class DataFrameBatchLoadManager(BatchLoadManager):
         ssize_t num_cols
         int64_t chunk_length
         uint64_t num_rows_in_chunk
+        object df_iterator
+        ssize_t df_num
 
     cdef int _calculate_num_rows_in_chunk(self) except -1:
         """
@@ -192,6 +220,18 @@ cdef class DataFrameBatchLoadManager(BatchLoadManager):
         array_impl.get_length(&num_rows)
         self.num_rows_in_chunk = <uint64_t> num_rows
 
+    @staticmethod
+    cdef DataFrameImpl _get_df_impl(object value):
+        """
+        Returns the dataframe implementation for a value returned by an
+        iterator of dataframes.
+        """
+        if isinstance(value, PY_TYPE_DATAFRAME):
+            return value._impl
+        elif hasattr(value, "__arrow_c_stream__"):
+            return DataFrameImpl.from_arrow_stream(value)
+        errors._raise_err(errors.ERR_WRONG_EXECUTEMANY_PARAMETERS_TYPE)
+
     cdef list _get_arrow_arrays(self):
         """
         Returns the Arrow arrays containing the data for the current batch.
@@ -220,17 +260,59 @@ cdef class DataFrameBatchLoadManager(BatchLoadManager):
 
     cdef int _next_chunk(self) except -1:
         """
-        Goes to the next chunk in the list of chunks for the dataframe.
-        """
-        while self.chunk_num + 1 < self.num_chunks:
-            self.offset = 0
-            self.message_offset = 0
-            self.chunk_num += 1
-            self.chunk_index += self.num_cols
-            self._calculate_num_rows_in_chunk()
-            self._calculate_num_rows_in_batch(self.num_rows_in_chunk)
-            if self.num_rows > 0:
+        Goes to the next chunk in the list of chunks for the dataframe. Once
+        all of the chunks have been processed, the next dataframe is acquired
+        from the iterator, if one was supplied.
+        """
+        while True:
+            while self.chunk_num + 1 < self.num_chunks:
+                self.offset = 0
+                self.message_offset = 0
+                self.chunk_num += 1
+                self.chunk_index += self.num_cols
+                self._calculate_num_rows_in_chunk()
+                self._calculate_num_rows_in_batch(self.num_rows_in_chunk)
+                if self.num_rows > 0:
+                    return 0
+            if self.df_iterator is None:
+                return 0
+            for value in self.df_iterator:
                 break
+            else:
+                self.df_iterator = None
+                return 0
+            self._set_df_impl(DataFrameBatchLoadManager._get_df_impl(value))
+
+    cdef int _set_df_impl(self, DataFrameImpl df_impl) except -1:
+        """
+        Sets the dataframe acquired from the iterator as the source of data.
+        Its schema must match that of the first dataframe since the bind
+        variables have already been created from it.
+        """
+        cdef:
+            ArrowSchemaImpl schema_impl, expected_schema_impl
+            ssize_t i
+        self.df_num += 1
+        if len(df_impl.schema_impls) != self.num_cols:
+            errors._raise_err(
+                errors.ERR_WRONG_NUMBER_OF_POSITIONAL_BINDS,
+                expected_num=self.num_cols,
+                actual_num=len(df_impl.schema_impls)
+            )
+        for i, schema_impl in enumerate(df_impl.schema_impls):
+            expected_schema_impl = self.df_impl.schema_impls[i]
+            if schema_impl.arrow_type != expected_schema_impl.arrow_type:
+                errors._raise_err(
+                    errors.ERR_DATA_FRAME_SCHEMA_MISMATCH,
+                    column_num=i + 1,
+                    df_num=self.df_num,
+                    actual_type=schema_impl.get_type_name(),
+                    expected_type=expected_schema_impl.get_type_name()
+                )
+        self.df_impl = df_impl
+        self.num_chunks = len(df_impl.arrays) // self.num_cols
+        self.chunk_num = -1
+        self.chunk_index = -self.num_cols
 
     cdef int _setup_cursor(self) except -1:
         """
@@ -271,13 +353,17 @@ cdef class DataFrameBatchLoadManager(BatchLoadManager):
                 metadata._set_arrow_schema(schema_impl)
 
     @staticmethod
-    cdef BatchLoadManager create(DataFrameImpl df_impl):
+    cdef BatchLoadManager create(DataFrameImpl df_impl,
+                                 object df_iterator=None):
         """
-        Creates a batch load manager given a dataframe.
+        Creates a batch load manager given a dataframe and, optionally, an
+        iterator returning further dataframes with the same schema.
         """
         cdef DataFrameBatchLoadManager m
         m = DataFrameBatchLoadManager.__new__(DataFrameBatchLoadManager)
         m.df_impl = df_impl
+        m.df_iterator = df_iterator
+        m.df_num = 1
         m.num_cols = len(df_impl.schema_impls)
         m.num_chunks = len(df_impl.arrays) // m.num_cols
         if m.num_chunks > 0:
@@ -354,6 +440,79 @@ cdef class FullDataBatchLoadManager(BatchLoadManager):
         return m
 
 
+@cython.final
+cdef class IteratorBatchLoadManager(BatchLoadManager):
+    cdef:
+        object iterator
+        list rows
+        ssize_t num_cols
+
+    cdef list _get_all_rows(self):
+        """
+        Returns the set of rows associated with the batch load manager, if
+        applicable. Only the rows in the current batch are retained.
+        """
+        return self.rows
+
+    cdef int _next_batch(self) except -1:
+        """
+        Goes to the next batch of data by acquiring up to the batch size number
+        of rows from the iterator.
+        """
+        cdef:
+            bint defer_type_assignment = (self.batch_num == 0)
+            object row
+            ssize_t i
+        self.rows = list(itertools.islice(self.iterator, self.batch_size))
+        self.num_rows = <uint32_t> len(self.rows)
+        self.offset = 0
+        self.batch_num += 1
+        if self.num_cols >= 0:
+            for row in self.rows:
+                if len(row) != self.num_cols:
+                    errors._raise_err(
+                        errors.ERR_WRONG_NUMBER_OF_POSITIONAL_BINDS,
+                        expected_num=self.num_cols,
+                        actual_num=len(row)
+                    )
+        if self.cursor_impl is not None:
+            self.cursor_impl._reset_bind_vars(self.offset, self.num_rows)
+            for i in range(self.num_rows):
+                if i == self.num_rows - 1:
+                    defer_type_assignment = False
+                row = self.rows[i]
+                self.cursor_impl._bind_values(self.cursor, self.type_handler,
+                                              row, self.num_rows, i,
+                                              defer_type_assignment)
+
+    cdef int _setup_cursor(self) except -1:
+        """
+        Called after the manager has been populated and helps set up the cursor
+        if one is being used.
+        """
+        self.type_handler = self.cursor_impl._get_input_type_handler()
+
+    cdef int _verify_metadata(self, list column_metadata) except -1:
+        """
+        Called after the manager has been populated and helps verify the column
+        metadata is consistent with the data being loaded. Since the rows are
+        not available yet, the number of columns is retained and each row is
+        verified as it is acquired from the iterator.
+        """
+        self.num_cols = len(column_metadata)
+
+    @staticmethod
+    cdef BatchLoadManager create(object iterator):
+        """
+        Creates a batch load manager given an iterator returning rows.
+        """
+        cdef IteratorBatchLoadManager m
+        m = IteratorBatchLoadManager.__new__(IteratorBatchLoadManager)
+        m.iterator = iterator
+        m.num_cols = -1
+        return m
+
+
 @cython.final
 cdef class PrePopulatedBatchLoadManager(BatchLoadManager):
     cdef:
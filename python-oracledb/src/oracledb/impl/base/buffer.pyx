@@ -82,6 +82,16 @@ cdef class Buffer:
         self._data_view = self._data_obj
         self._data = <char_type*> self._data_obj
 
+    cdef int _populate_from_bytearray(self, bytearray data) except -1:
+        """
+        Initialize the buffer with the data in the specified byte array. The
+        byte array is referenced directly and is not copied.
+        """
+        self._max_size = self._size = len(data)
+        self._data_obj = data
+        self._data_view = self._data_obj
+        self._data = <char_type*> self._data_obj
+
     cdef int _populate_from_bytes(self, bytes data) except -1:
         """
         Initialize the buffer with the data in the specified byte string.
@@ -566,25 +576,55 @@ cdef class Buffer:
             encode_timestamp_tz(buf, value)
         self._write_raw_bytes_and_length(buf, length)
 
+    cdef int write_oracle_date_from_epoch(self, int64_t days,
+                                          uint32_t seconds, uint32_t fsecond,
+                                          uint8_t length) except -1:
+        """
+        Writes a date, given as the number of days since the epoch, the number
+        of seconds since midnight and the number of nanoseconds, to the buffer
+        in Oracle Date format.
+        """
+        cdef char_type buf[ORA_TYPE_SIZE_TIMESTAMP_TZ]
+        encode_date_from_epoch(buf, days, seconds)
+        if length > 7:
+            encode_uint32be(&buf[7], fsecond)
+            # the protocol requires that if the fractional seconds are zero
+            # that the value be transmitted as a date, not a timestamp!
+            if length == 11 and fsecond == 0:
+                length = 7
+            elif length == 13:
+                buf[11] = TZ_HOUR_OFFSET
+                buf[12] = TZ_MINUTE_OFFSET
+        self._write_raw_bytes_and_length(buf, length)
+
     cdef int write_oracle_number(self, bytes num_bytes) except -1:
         """
         Writes a number in UTF-8 encoded bytes in Oracle Number format to the
         buffer.
         """
+        self.write_oracle_number_text(num_bytes, len(num_bytes))
+
+    cdef int write_oracle_number_text(self, const char_type *ptr,
+                                      ssize_t num_bytes) except -1:
+        """
+        Writes a number given as UTF-8 encoded text in Oracle Number format to
+        the buffer.
+        """
         cdef:
             char_type buf[ORA_TYPE_SIZE_NUMBER]
             ssize_t buflen
-        encode_number(buf, &buflen, num_bytes)
+        encode_number(buf, &buflen, ptr, num_bytes)
         self._write_raw_bytes_and_length(buf, buflen)
 
     cdef int write_oson(self, value, ssize_t max_fname_size,
-                        bint write_length=True) except -1:
+                        bint write_length=True,
+                        OsonFieldNamesCache fnames_cache=None) except -1:
         """
         Encodes the given value to OSON and then writes that to the buffer.
         it.
         """
         cdef OsonEncoder encoder = OsonEncoder.__new__(OsonEncoder)
-        encoder.encode(value, max_fname_size)
+        encoder.encode(value, max_fname_size, fnames_cache)
         self._write_raw_bytes_and_length(encoder._data, encoder._pos)
 
     cdef int write_raw(self, const char_type *data, ssize_t length) except -1:
@@ -738,10 +778,9 @@ cdef class GrowableBuffer(Buffer):
         Reserves the requested amount of space in the buffer by moving the
         pointer forward, allocating more space if necessary.
         """
+        if self._pos + num_bytes > self._max_size:
+            self._write_more_data(self._max_size - self._pos, num_bytes)
         self._pos += num_bytes
-        if self._pos > self._size:
-            self._write_more_data(self._size - self._pos + num_bytes,
-                                  num_bytes)
 
     cdef int _write_more_data(self, ssize_t num_bytes_available,
                               ssize_t num_bytes_wanted) except -1:
@@ -36,6 +36,19 @@
 # and parsed.
 _tnsnames_files = {}
 
+# dictionary of host name resolution results, indexed by a 2-tuple containing
+# the host name and port; each entry is a 2-tuple containing the monotonic
+# time at which the host name was resolved and either the list returned by
+# socket.getaddrinfo() or the exception that it raised; entries are retained
+# for the number of seconds specified by defaults.dns_cache_ttl (or
+# defaults.dns_cache_negative_ttl for failed lookups); when the cache is full,
+# expired entries are removed and then the oldest entries are evicted so that
+# no more than MAX_HOST_NAME_CACHE_ENTRIES are kept
+cdef dict _host_name_cache = {}
+
+cdef enum:
+    MAX_HOST_NAME_CACHE_ENTRIES = 256
+
 # internal default values
 cdef str DEFAULT_PROTOCOL = "tcp"
 cdef uint32_t DEFAULT_PORT = 1521
@@ -44,6 +57,65 @@ cdef uint32_t DEFAULT_RETRY_DELAY = 1
 cdef uint32_t DEFAULT_SDU = 8192
 
 
+cdef bint _is_cached_addr_info_expired(tuple entry, double now):
+    """
+    Returns whether the cached results of resolving a host name have expired,
+    given the current monotonic time.
+    """
+    cdef double ttl
+    if isinstance(entry[1], BaseException):
+        ttl = C_DEFAULTS.dns_cache_negative_ttl
+    else:
+        ttl = C_DEFAULTS.dns_cache_ttl
+    return now - entry[0] >= ttl
+
+
+cdef int _cache_addr_info(tuple key, object addr_info) except -1:
+    """
+    Adds the results of resolving a host name to the cache, if the relevant
+    time to live is greater than zero. Exceptions are stored as copies so that
+    the cached exception does not retain the traceback of the original one.
+    """
+    cdef:
+        double ttl, now
+        tuple entry
+    if isinstance(addr_info, BaseException):
+        ttl = C_DEFAULTS.dns_cache_negative_ttl
+        addr_info = type(addr_info)(*addr_info.args)
+    else:
+        ttl = C_DEFAULTS.dns_cache_ttl
+    if ttl > 0:
+        now = time.monotonic()
+        _host_name_cache.pop(key, None)
+        if len(_host_name_cache) >= MAX_HOST_NAME_CACHE_ENTRIES:
+            for cached_key, entry in list(_host_name_cache.items()):
+                if _is_cached_addr_info_expired(entry, now):
+                    _host_name_cache.pop(cached_key, None)
+            while len(_host_name_cache) >= MAX_HOST_NAME_CACHE_ENTRIES:
+                _host_name_cache.pop(next(iter(_host_name_cache)), None)
+        _host_name_cache[key] = (now, addr_info)
+
+
+cdef object _get_cached_addr_info(tuple key):
+    """
+    Returns the cached results of resolving a host name or None if no results
+    are cached or the cached results have expired. A cached exception is
+    returned as a copy so that it can be raised by the caller.
+    """
+    cdef:
+        tuple entry = _host_name_cache.get(key)
+        object addr_info
+    if entry is None:
+        return None
+    if _is_cached_addr_info_expired(entry, time.monotonic()):
+        _host_name_cache.pop(key, None)
+        return None
+    addr_info = entry[1]
+    if isinstance(addr_info, BaseException):
+        return type(addr_info)(*addr_info.args)
+    return addr_info
+
+
 cdef class ConnectParamsImpl:
 
     def __init__(self):
@@ -106,6 +178,8 @@ cdef class ConnectParamsImpl:
         _set_obj_param(args, "extra_auth_params", self)
         _set_bool_param(args, "thick_mode_dsn_passthrough",
                         &self.thick_mode_dsn_passthrough)
+        _set_duration_param(args, "parallel_connect_delay",
+                            &self.parallel_connect_delay)
         self._set_access_token_param(args.get("access_token"))
 
         # set parameters found on Description instances
@@ -197,6 +271,7 @@ cdef class ConnectParamsImpl:
         self.extra_auth_params = other_params.extra_auth_params
         self.thick_mode_dsn_passthrough = \
                 other_params.thick_mode_dsn_passthrough
+        self.parallel_connect_delay = other_params.parallel_connect_delay
 
     cdef str _get_connect_string(self):
         """
@@ -616,7 +691,8 @@ cdef class ConnectParamsNode:
             parts.append("(SOURCE_ROUTE=ON)")
         return parts
 
-    cdef int _set_active_children(self, list children) except -1:
+    cdef int _set_active_children(self, list children,
+                                  dict addr_infos) except -1:
         """
         Set the active children to process when connecting to the database.
         This call is recursive and will set the active children of each of its
@@ -653,7 +729,7 @@ cdef class ConnectParamsNode:
 
         for child in children:
             if child.must_have_children:
-                child._set_active_children(child.children)
+                child._set_active_children(child.children, addr_infos)
 
 
 cdef class Address(ConnectParamsNode):
@@ -705,24 +781,41 @@ cdef class Address(ConnectParamsNode):
         address.set_from_args(args)
         return address
 
-    cdef list resolve_host_name(self):
+    cdef list resolve_host_name(self, dict addr_infos=None):
         """
         Resolve the host name associated with the address and store the IP
         address and family on the address. If multiple IP addresses are found,
         duplicate the address and return one address for each IP address. If a
         proxy is being used, ensure that the proxy performs name resolution
-        instead.
+        instead. Results that have already been determined (by the caller or
+        in the host name cache) are used when available.
         """
         cdef:
             list results = []
+            object addr_info = None
             Address address
+            tuple key
             object info
         if self.https_proxy is not None:
             self.ip_address = self.host
             return [self]
-        for info in socket.getaddrinfo(self.host, self.port,
-                                       proto=socket.IPPROTO_TCP,
-                                       type=socket.SOCK_STREAM):
+        key = (self.host, self.port)
+        if addr_infos is not None:
+            addr_info = addr_infos.get(key)
+        if addr_info is None:
+            addr_info = _get_cached_addr_info(key)
+        if addr_info is None:
+            try:
+                addr_info = socket.getaddrinfo(self.host, self.port,
+                                               proto=socket.IPPROTO_TCP,
+                                               type=socket.SOCK_STREAM)
+            except socket.gaierror as e:
+                _cache_addr_info(key, e)
+                raise
+            _cache_addr_info(key, addr_info)
+        if isinstance(addr_info, BaseException):
+            raise addr_info
+        for info in addr_info:
             address = self.copy()
             address.ip_family = info[0]
             address.ip_address = info[4][0]
@@ -761,7 +854,8 @@ cdef class AddressList(ConnectParamsNode):
     def __init__(self):
         ConnectParamsNode.__init__(self, True)
 
-    cdef int _set_active_children(self, list children) except -1:
+    cdef int _set_active_children(self, list children,
+                                  dict addr_infos) except -1:
         """
         Set the active children to process when connecting to the database.
         First, all names are resolved to IP addresses
@@ -772,9 +866,9 @@ cdef class AddressList(ConnectParamsNode):
         cdef:
             list addresses = []
             Address address
-        ConnectParamsNode._set_active_children(self, children)
+        ConnectParamsNode._set_active_children(self, children, addr_infos)
         for address in self.active_children:
-            addresses.extend(address.resolve_host_name())
+            addresses.extend(address.resolve_host_name(addr_infos))
         self.active_children = addresses
 
     cdef bint _uses_tcps(self):
@@ -1086,12 +1180,47 @@ cdef class DescriptionList(ConnectParamsNode):
                 for addr_list in desc.children \
                 for addr in addr_list.children]
 
-    cdef int set_active_children(self) except -1:
+    async def resolve_host_names_async(self):
+        """
+        Resolves the host names of all of the addresses without blocking the
+        event loop and returns a dictionary of the results (or the exceptions
+        raised), indexed by a 2-tuple containing the host name and port. This
+        dictionary is then passed to set_active_children(). Addresses that use
+        a proxy are skipped since the proxy performs name resolution.
+        """
+        cdef:
+            dict addr_infos = {}
+            object addr_info
+            Address address
+            object loop
+            tuple key
+        loop = asyncio.get_running_loop()
+        for address in self.get_addresses():
+            key = (address.host, address.port)
+            if address.https_proxy is not None or key in addr_infos:
+                continue
+            addr_info = _get_cached_addr_info(key)
+            if addr_info is None:
+                try:
+                    addr_info = await loop.getaddrinfo(
+                        address.host,
+                        address.port,
+                        proto=socket.IPPROTO_TCP,
+                        type=socket.SOCK_STREAM,
+                    )
+                except socket.gaierror as e:
+                    addr_info = e
+                _cache_addr_info(key, addr_info)
+            addr_infos[key] = addr_info
+        return addr_infos
+
+    cdef int set_active_children(self, dict addr_infos=None) except -1:
         """
         Sets the list of active children to process when connecting to the
-        database.
+        database. If the host names have already been resolved, the results
+        are passed through in order to avoid resolving them again.
         """
-        self._set_active_children(self.children)
+        self._set_active_children(self.children, addr_infos)
 
     def set_from_args(self, dict args):
         """
@@ -36,6 +36,7 @@ cdef class BaseConnImpl:
         self.username = params.user
         self.proxy_user = params.proxy_user
         self._oson_max_fname_size = 255
+        self._oson_fnames_cache = OsonFieldNamesCache()
 
     cdef object _check_value(self, OracleMetadata metadata, object value,
                              bint* is_ok):
@@ -48,6 +49,7 @@ cdef class BaseConnImpl:
         cdef:
             uint32_t db_type_num
             BaseLobImpl lob_impl
+            array.array vector
 
         # null values are always accepted
         if value is None:
@@ -153,6 +155,11 @@ cdef class BaseConnImpl:
                 return value
             elif isinstance(value, PY_TYPE_SPARSE_VECTOR):
                 return value
+            vector = _convert_buffer_to_vector(value)
+            if vector is not None:
+                if len(vector) == 0:
+                    errors._raise_err(errors.ERR_INVALID_VECTOR)
+                return vector
         elif db_type_num == DB_TYPE_NUM_INTERVAL_YM:
             if isinstance(value, PY_TYPE_INTERVAL_YM):
                 return value
@@ -181,6 +188,52 @@ cdef class BaseConnImpl:
                       uint32_t attr_type):
         errors._raise_not_supported("getting a connection OCI attribute")
 
+    def _run_pipeline_op_without_pipelining(
+        self, object conn, PipelineOpResultImpl result_impl
+    ):
+        """
+        Runs a pipeline operation without the use of pipelining.
+        """
+        cdef:
+            PipelineOpImpl op_impl = result_impl.operation
+            object cursor
+        if op_impl.op_type == PIPELINE_OP_TYPE_COMMIT:
+            conn.commit()
+            return
+        cursor = conn.cursor()
+        if op_impl.op_type == PIPELINE_OP_TYPE_CALL_FUNC:
+            result_impl.return_value = cursor.callfunc(
+                op_impl.name,
+                op_impl.return_type,
+                op_impl.parameters,
+                op_impl.keyword_parameters,
+            )
+        elif op_impl.op_type == PIPELINE_OP_TYPE_CALL_PROC:
+            cursor.callproc(
+                op_impl.name, op_impl.parameters, op_impl.keyword_parameters
+            )
+        elif op_impl.op_type == PIPELINE_OP_TYPE_EXECUTE:
+            cursor.execute(op_impl.statement, op_impl.parameters)
+        elif op_impl.op_type == PIPELINE_OP_TYPE_EXECUTE_MANY:
+            cursor.executemany(op_impl.statement, op_impl.parameters)
+        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_ALL:
+            cursor.execute(op_impl.statement, op_impl.parameters)
+            cursor.rowfactory = op_impl.rowfactory
+            result_impl.rows = cursor.fetchall()
+        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_MANY:
+            cursor.execute(op_impl.statement, op_impl.parameters)
+            cursor.rowfactory = op_impl.rowfactory
+            result_impl.rows = cursor.fetchmany(op_impl.num_rows)
+        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_ONE:
+            cursor.execute(op_impl.statement, op_impl.parameters)
+            cursor.rowfactory = op_impl.rowfactory
+            result_impl.rows = cursor.fetchmany(1)
+        else:
+            errors._raise_err(errors.ERR_UNSUPPORTED_PIPELINE_OPERATION,
+                              op_type=op_impl.op_type)
+        result_impl.warning = cursor.warning
+        result_impl.fetch_metadata = cursor._impl.fetch_metadata
+
     def _set_oci_attr(self, uint32_t handle_type, uint32_t attr_num,
                       uint32_t attr_type, object value):
         errors._raise_not_supported("setting a connection OCI attribute")
@@ -198,12 +251,22 @@ cdef class BaseConnImpl:
         cdef OsonDecoder decoder = OsonDecoder.__new__(OsonDecoder)
         return decoder.decode(data)
 
+    def decode_oson_lazy(self, bytes data):
+        """
+        Decode OSON encoded bytes and return the object encoded in them.
+        Objects and arrays are returned as views which decode their contents
+        only when accessed.
+        """
+        cdef OsonDecoder decoder = OsonDecoder.__new__(OsonDecoder)
+        return decoder.decode(data, True)
+
     def encode_oson(self, object value):
         """
         Return OSON encoded bytes encoded from the supplied object.
         """
         cdef OsonEncoder encoder = OsonEncoder.__new__(OsonEncoder)
-        encoder.encode(value, self._oson_max_fname_size)
+        encoder.encode(value, self._oson_max_fname_size,
+                       self._oson_fnames_cache)
         return encoder._data[:encoder._pos]
 
     def get_is_healthy(self):
@@ -316,9 +379,39 @@ cdef class BaseConnImpl:
     def ping(self):
         errors._raise_not_supported("pinging the database")
 
+    def read_lobs(self, list lob_impls):
+        """
+        Internal method for reading all of the data in each of the LOBs. Each
+        LOB is read in turn.
+        """
+        return [
+            lob_impl.read(1, max(lob_impl.get_max_amount(), 1))
+            for lob_impl in lob_impls
+        ]
+
     def rollback(self):
         errors._raise_not_supported("rolling back a transaction")
 
+    def run_pipeline_without_pipelining(
+        self, object conn, list results, bint continue_on_error
+    ):
+        """
+        Run the pipeline without pipelining when the database doesn't support
+        pipelining. Each operation is run in turn and must complete before the
+        next one is started.
+        """
+        cdef:
+            PipelineOpResultImpl result_impl
+            object result
+        for result in results:
+            result_impl = result._impl
+            try:
+                self._run_pipeline_op_without_pipelining(conn, result_impl)
+            except Exception as e:
+                if not continue_on_error:
+                    raise
+                result_impl._capture_err(e)
+
     def set_action(self, value):
         errors._raise_not_supported("setting the action")
 
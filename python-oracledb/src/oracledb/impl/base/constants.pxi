@@ -48,6 +48,11 @@ cdef enum:
     TNS_JSON_FLAG_IS_SCALAR = 0x10
     TNS_JSON_FLAG_SEC_FNAMES_SEG_UINT16 = 0x0100
 
+# limits on the number of entries retained by OSON field name caches
+cdef enum:
+    OSON_FNAMES_CACHE_MAX_NAMES = 4096
+    OSON_FNAMES_CACHE_MAX_SEGMENTS = 64
+
 # JSON data types
 cdef enum:
     TNS_JSON_TYPE_NULL = 0x30
@@ -216,7 +216,10 @@ cdef class BaseCursorImpl:
             conn_impl = self._get_conn_impl()
             var_impl.metadata.dbtype = DB_TYPE_LONG_RAW
             var_impl._fetch_metadata.dbtype = DB_TYPE_LONG_RAW
-            var_impl.outconverter = conn_impl.decode_oson
+            if C_DEFAULTS.fetch_lazy_json:
+                var_impl.outconverter = conn_impl.decode_oson_lazy
+            else:
+                var_impl.outconverter = conn_impl.decode_oson
         elif metadata.is_json and db_type_num != DB_TYPE_NUM_JSON:
             var_impl.outconverter = self._build_json_converter_fn()
         elif not self.fetch_lobs or self.fetching_arrow:
@@ -237,16 +240,30 @@ cdef class BaseCursorImpl:
         self.fetch_var_impls[pos] = var_impl
         return var_impl
 
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
     cdef object _create_row(self):
         """
         Internal method for creating a row from the fetched data.
         """
+        cdef object row = self._create_row_tuple()
+        if self.rowfactory is not None:
+            row = self.rowfactory(*row)
+        self._buffer_index += 1
+        self._buffer_rowcount -= 1
+        self.rowcount += 1
+        return row
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef tuple _create_row_tuple(self):
+        """
+        Internal method for creating a tuple containing the values of the
+        current row in the fetched data.
+        """
         cdef:
             Py_ssize_t i, num_vars
             BaseVarImpl var_impl
-            object row, value
+            object value
+            tuple row
         num_vars = cpython.PyList_GET_SIZE(self.fetch_var_impls)
         row = cpython.PyTuple_New(num_vars)
         for i in range(num_vars):
@@ -254,11 +271,6 @@ cdef class BaseCursorImpl:
             value = var_impl._get_scalar_value(self._buffer_index)
             cpython.Py_INCREF(value)
             cpython.PyTuple_SET_ITEM(row, i, value)
-        if self.rowfactory is not None:
-            row = self.rowfactory(*row)
-        self._buffer_index += 1
-        self._buffer_rowcount -= 1
-        self.rowcount += 1
         return row
 
     cdef BaseVarImpl _create_var_impl(self, object conn):
@@ -267,6 +279,29 @@ cdef class BaseCursorImpl:
         """
         raise NotImplementedError()
 
+    cdef int _fetch_block_rows(self, list columns,
+                               uint32_t num_rows) except -1:
+        """
+        Internal method for appending the values of the given number of rows
+        in the fetched data to the row block columns.
+        """
+        cdef:
+            RowBlockColumnImpl column
+            Py_ssize_t i, num_vars
+            BaseVarImpl var_impl
+            uint32_t j
+        num_vars = cpython.PyList_GET_SIZE(self.fetch_var_impls)
+        for i in range(num_vars):
+            var_impl = self.fetch_var_impls[i]
+            column = columns[i]
+            for j in range(num_rows):
+                column.append_value(
+                    var_impl._get_scalar_value(self._buffer_index + j)
+                )
+        self._buffer_index += num_rows
+        self._buffer_rowcount -= num_rows
+        self.rowcount += num_rows
+
     cdef int _fetch_rows(self, object cursor) except -1:
         """
         Internal method used for fetching rows from a cursor.
@@ -574,6 +609,35 @@ cdef class BaseCursorImpl:
         if self._buffer_rowcount > 0:
             return self._create_row()
 
+    def fetch_block(self, cursor, uint32_t size):
+        """
+        Internal method used for fetching up to the given number of rows from
+        a cursor as a column-oriented block.
+        """
+        cdef:
+            uint32_t num_rows, total_rows = 0
+            BaseVarImpl var_impl
+            list columns
+        columns = [
+            RowBlockColumnImpl._create(get_row_block_column_kind(var_impl))
+            for var_impl in self.fetch_var_impls
+        ]
+        while total_rows < size:
+            if self._buffer_rowcount == 0:
+                if not self._more_rows_to_fetch:
+                    break
+                self._fetching_block = True
+                try:
+                    self._fetch_rows(cursor)
+                finally:
+                    self._fetching_block = False
+                if self._buffer_rowcount == 0:
+                    break
+            num_rows = min(size - total_rows, self._buffer_rowcount)
+            self._fetch_block_rows(columns, num_rows)
+            total_rows += num_rows
+        return RowBlockImpl._create(columns, total_rows, self.rowfactory)
+
     def fetch_df_all(self, cursor):
         """
         Internal method used for fetching all data as DataFrame
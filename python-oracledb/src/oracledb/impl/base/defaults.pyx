@@ -50,6 +50,11 @@ cdef class DefaultsImpl:
             self.osuser = ""
         self.driver_name = None
         self.thick_mode_dsn_passthrough = True
+        self.dns_cache_ttl = 0
+        self.dns_cache_negative_ttl = 0
+        self.adaptive_arraysize = False
+        self.adaptive_arraysize_max_bytes = 1048576
+        self.fetch_lazy_json = False
 
 cdef DefaultsImpl C_DEFAULTS = DefaultsImpl()
 DEFAULTS = C_DEFAULTS
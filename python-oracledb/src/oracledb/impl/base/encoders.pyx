@@ -126,6 +126,35 @@ cdef inline void encode_date(char_type *buf, object value):
     buf[6] = <uint8_t> cydatetime.PyDateTime_DATE_GET_SECOND(value) + 1
 
 
+cdef int encode_date_from_epoch(char_type *buf, int64_t days,
+                                uint32_t seconds) except -1:
+    """
+    Encodes the number of days since the epoch (1970-01-01) and the number of
+    seconds since midnight in the format expected by the Oracle Database for
+    DATE, without creating an intermediate datetime.datetime object.
+    """
+    cdef int64_t era, day_of_era, year_of_era, day_of_year, year, month, mp
+    days += 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 -
+                   day_of_era // 146096) // 365
+    day_of_year = day_of_era - \
+            (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    mp = (5 * day_of_year + 2) // 153
+    month = mp + 3 if mp < 10 else mp - 9
+    year = year_of_era + era * 400 + (1 if month <= 2 else 0)
+    if year < 1 or year > 9999:
+        raise OverflowError("date value out of range")
+    buf[0] = <uint8_t> ((year // 100) + 100)
+    buf[1] = <uint8_t> ((year % 100) + 100)
+    buf[2] = <uint8_t> month
+    buf[3] = <uint8_t> (day_of_year - (153 * mp + 2) // 5 + 1)
+    buf[4] = <uint8_t> (seconds // 3600) + 1
+    buf[5] = <uint8_t> ((seconds // 60) % 60) + 1
+    buf[6] = <uint8_t> (seconds % 60) + 1
+
+
 cdef inline void encode_interval_ds(char_type *buf, object value):
     """
     Encodes a datetime.timedelta object in the format exepcted by the Oracle
@@ -155,31 +184,29 @@ cdef int encode_interval_ym(char_type *buf, object value) except -1:
     buf[4] = months + TNS_DURATION_OFFSET
 
 
-cdef int encode_number(char_type *buf, ssize_t *buflen, bytes value) except -1:
+cdef int encode_number(char_type *buf, ssize_t *buflen, const char_type *ptr,
+                       ssize_t value_length) except -1:
     """
-    Encodes bytes representing numeric data in the format exepcted by the
+    Encodes text representing numeric data in the format exepcted by the
     Oracle Database for NUMBER.
     """
     cdef:
         uint8_t num_digits = 0, digit, num_pairs, pair_num, digits_pos
         bint is_negative = False, prepend_zero = False
-        ssize_t value_length, exponent_pos, pos = 0
         uint8_t digits[NUMBER_AS_TEXT_CHARS]
         bint exponent_is_negative = False
+        ssize_t exponent_pos, pos = 0
         int16_t decimal_point_index
         int8_t exponent_on_wire
-        const char_type *ptr
         int16_t exponent
 
     # zero length string cannot be converted
-    value_length = len(value)
     if value_length == 0:
         errors._raise_err(errors.ERR_NUMBER_STRING_OF_ZERO_LENGTH)
     elif value_length > NUMBER_AS_TEXT_CHARS:
         errors._raise_err(errors.ERR_NUMBER_STRING_TOO_LONG)
 
     # check to see if number is negative (first character is '-')
-    ptr = value
     if ptr[0] == b'-':
         is_negative = True
         pos += 1
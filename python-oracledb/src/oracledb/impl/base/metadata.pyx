@@ -444,6 +444,8 @@ cdef class OracleMetadata:
             metadata.dbtype = DB_TYPE_VECTOR
         elif isinstance(value, PY_TYPE_INTERVAL_YM):
             metadata.dbtype = DB_TYPE_INTERVAL_YM
+        elif _is_buffer_vector(value):
+            metadata.dbtype = DB_TYPE_VECTOR
         else:
             errors._raise_err(errors.ERR_PYTHON_VALUE_NOT_SUPPORTED,
                               type_name=type(value).__name__)
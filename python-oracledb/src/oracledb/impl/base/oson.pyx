@@ -52,7 +52,6 @@ cdef class OsonDecoder(Buffer):
         container_offset = self._pos - self.tree_seg_pos - 1
         self._get_num_children(node_type, &num_children, &is_shared)
         if is_shared:
-            value = {}
             self._get_offset(node_type, &offset)
             offsets_pos = self._pos
             self.skip_to(self.tree_seg_pos + offset)
@@ -60,14 +59,22 @@ cdef class OsonDecoder(Buffer):
             self._get_num_children(temp8, &num_children, &is_shared)
             field_ids_pos = self._pos
         elif is_object:
-            value = {}
             field_ids_pos = self._pos
             offsets_pos = self._pos + self.field_id_length * num_children
         else:
-            value = [None] * num_children
             offsets_pos = self._pos
 
+        # when decoding lazily, the children are only decoded when accessed
+        if self.lazy:
+            return OsonContainerImpl._create(self, node_type, is_object,
+                                             num_children, container_offset,
+                                             field_ids_pos, offsets_pos)
+
         # process each of the children
+        if is_object:
+            value = {}
+        else:
+            value = [None] * num_children
         for i in range(num_children):
             if is_object:
                 self.skip_to(field_ids_pos)
@@ -318,9 +325,12 @@ cdef class OsonDecoder(Buffer):
         self.skip_to(final_pos)
         return field_names
 
-    cdef object decode(self, bytes data):
+    cdef object decode(self, bytes data, bint lazy=False):
         """
-        Returns a Python object corresponding to the encoded OSON bytes.
+        Returns a Python object corresponding to the encoded OSON bytes. If
+        the lazy flag is set, objects and arrays are returned as read-only
+        views which only decode their children when they are accessed. The
+        views share this decoder so access to it is serialized with a lock.
         """
         cdef:
             uint32_t short_field_names_seg_size, long_field_names_seg_size = 0
@@ -336,6 +346,9 @@ cdef class OsonDecoder(Buffer):
 
         # populate the buffer with the data
         self._populate_from_bytes(data)
+        self.lazy = lazy
+        if lazy:
+            self.lock = threading.Lock()
 
         # parse root header
         ptr = self._get_raw(3)
@@ -433,6 +446,121 @@ cdef class OsonDecoder(Buffer):
         return self._decode_node()
 
 
+@cython.final
+cdef class OsonContainerImpl:
+
+    cdef str _get_field_name(self, uint32_t index):
+        """
+        Returns the name of the field at the given index, using the field
+        names table of the decoder.
+        """
+        cdef:
+            OsonDecoder decoder = self.decoder
+            uint32_t temp32
+            uint16_t temp16
+            uint8_t temp8
+        decoder.skip_to(self.field_ids_pos + index * decoder.field_id_length)
+        if decoder.field_id_length == 1:
+            decoder.read_ub1(&temp8)
+            return decoder.field_names[temp8 - 1]
+        elif decoder.field_id_length == 2:
+            decoder.read_uint16be(&temp16)
+            return decoder.field_names[temp16 - 1]
+        decoder.read_uint32be(&temp32)
+        return decoder.field_names[temp32 - 1]
+
+    cdef dict _get_field_indexes(self):
+        """
+        Returns a dictionary mapping the names of the fields of an object to
+        the index of the field. Only the field ids are examined; none of the
+        values are decoded.
+        """
+        cdef uint32_t i
+        if self.field_indexes is None:
+            self.field_indexes = {}
+            for i in range(self.num_children):
+                self.field_indexes[self._get_field_name(i)] = i
+        return self.field_indexes
+
+    cdef object _get_value(self, uint32_t index):
+        """
+        Decodes and returns the value of the child at the given index. The
+        lock of the decoder is expected to be held, if applicable.
+        """
+        cdef:
+            OsonDecoder decoder = self.decoder
+            ssize_t offset_size
+            uint32_t offset
+        offset_size = 4 if self.node_type & 0x20 else 2
+        decoder.skip_to(self.offsets_pos + index * offset_size)
+        decoder._get_offset(self.node_type, &offset)
+        if decoder.relative_offsets:
+            offset += self.container_offset
+        decoder.skip_to(decoder.tree_seg_pos + offset)
+        return decoder._decode_node()
+
+    @staticmethod
+    cdef object _create(OsonDecoder decoder, uint8_t node_type,
+                        bint is_object, uint32_t num_children,
+                        uint32_t container_offset, ssize_t field_ids_pos,
+                        ssize_t offsets_pos):
+        """
+        Creates the implementation of a container and returns the view that
+        wraps it. Only the field names of an object are read; the elements of
+        an array are decoded immediately.
+        """
+        cdef:
+            OsonContainerImpl impl
+            uint32_t i
+            list values
+        impl = OsonContainerImpl.__new__(OsonContainerImpl)
+        impl.decoder = decoder
+        impl.node_type = node_type
+        impl.is_object = is_object
+        impl.num_children = num_children
+        impl.container_offset = container_offset
+        impl.field_ids_pos = field_ids_pos
+        impl.offsets_pos = offsets_pos
+        impl.node_pos = decoder.tree_seg_pos + container_offset
+        if is_object:
+            impl.values = {}
+            return PY_TYPE_JSON_OBJECT_VIEW._from_impl(
+                impl, list(impl._get_field_indexes())
+            )
+        values = [impl._get_value(i) for i in range(num_children)]
+        return PY_TYPE_JSON_ARRAY_VIEW._from_impl(impl, values)
+
+    def decode_all(self):
+        """
+        Decodes the container and all of its descendants and returns the
+        equivalent dictionary or list.
+        """
+        cdef OsonDecoder decoder = self.decoder
+        with decoder.lock:
+            decoder.lazy = False
+            try:
+                decoder.skip_to(self.node_pos)
+                return decoder._decode_node()
+            finally:
+                decoder.lazy = True
+
+    def get_field_value(self, str name):
+        """
+        Returns the value of the field of the object with the given name. It
+        is decoded the first time it is requested.
+        """
+        cdef uint32_t index
+        with self.decoder.lock:
+            index = self._get_field_indexes()[name]
+            try:
+                return self.values[index]
+            except KeyError:
+                pass
+            value = self._get_value(index)
+            self.values[index] = value
+            return value
+
+
 @cython.final
 cdef class OsonFieldName:
 
@@ -448,6 +576,19 @@ cdef class OsonFieldName:
         for i in range(self.name_bytes_len):
             self.hash_id = (self.hash_id ^ ptr[i]) * 16777619
 
+    cdef OsonFieldName copy(self):
+        """
+        Returns a copy of the field name which shares the encoded name and
+        hash id but has its own offset and field id.
+        """
+        cdef OsonFieldName field_name
+        field_name = OsonFieldName.__new__(OsonFieldName)
+        field_name.name = self.name
+        field_name.name_bytes = self.name_bytes
+        field_name.name_bytes_len = self.name_bytes_len
+        field_name.hash_id = self.hash_id
+        return field_name
+
     @staticmethod
     cdef OsonFieldName create(str name, ssize_t max_fname_size):
         """
@@ -512,6 +653,40 @@ cdef class OsonFieldNamesSegment(GrowableBuffer):
         self.num_field_names = <uint32_t> len(self.field_names)
 
 
+@cython.final
+cdef class OsonFieldNamesCache:
+
+    def __init__(self):
+        self.field_names = {}
+        self.segments = {}
+
+    cdef OsonFieldName get_field_name(self, str name):
+        """
+        Returns a new field name with the given name. The encoded name and its
+        hash id are retained so that they are only calculated the first time
+        the name is encountered.
+        """
+        cdef OsonFieldName field_name
+        field_name = self.field_names.get(name)
+        if field_name is None:
+            field_name = OsonFieldName.create(name, self.max_fname_size)
+            if len(self.field_names) >= OSON_FNAMES_CACHE_MAX_NAMES:
+                self.field_names.clear()
+            self.field_names[name] = field_name
+        return field_name.copy()
+
+    cdef int set_max_fname_size(self, ssize_t max_fname_size) except -1:
+        """
+        Sets the maximum size of field names that may be encoded. Any cached
+        field names are discarded if the size has changed since they were
+        validated against a different limit.
+        """
+        if max_fname_size != self.max_fname_size:
+            self.max_fname_size = max_fname_size
+            self.field_names.clear()
+            self.segments.clear()
+
+
 @cython.final
 cdef class OsonTreeSegment(GrowableBuffer):
 
@@ -550,7 +725,7 @@ cdef class OsonTreeSegment(GrowableBuffer):
             offset += sizeof(uint32_t)
             self.encode_node(element, encoder)
 
-    cdef int encode_object(self, dict value, OsonEncoder encoder) except -1:
+    cdef int encode_object(self, object value, OsonEncoder encoder) except -1:
         """
         Encode an object in the OSON tree segment.
         """
@@ -693,7 +868,10 @@ cdef class OsonEncoder(GrowableBuffer):
         Add a field with the given name.
         """
         cdef OsonFieldName field_name
-        field_name = OsonFieldName.create(name, self.max_fname_size)
+        if self.fnames_cache is not None:
+            field_name = self.fnames_cache.get_field_name(name)
+        else:
+            field_name = OsonFieldName.create(name, self.max_fname_size)
         self.field_names_dict[name] = field_name
         if field_name.name_bytes_len <= 255:
             self.short_fnames_seg.add_name(field_name)
@@ -706,6 +884,10 @@ cdef class OsonEncoder(GrowableBuffer):
         """
         Determine the flags to use for the OSON image.
         """
+        cdef:
+            tuple segments = None
+            object key = None
+            str name
 
         # if value is a simple scalar, nothing more needs to be done
         flags[0] = TNS_JSON_FLAG_INLINE_LEAF
@@ -714,19 +896,42 @@ cdef class OsonEncoder(GrowableBuffer):
             return 0
 
         # examine all values recursively to determine the unique set of field
-        # names and whether they need to be added to the long field names
-        # segment (> 255 bytes) or short field names segment (<= 255 bytes)
+        # names; if the same set of names was encoded previously, the field
+        # names segments built at that time are reused
         self.field_names_dict = {}
-        self.short_fnames_seg = OsonFieldNamesSegment.create()
         self._examine_node(value)
-
-        # perform processing of field names segments and determine the total
-        # number of unique field names in the value
-        if self.short_fnames_seg is not None:
+        if self.fnames_cache is not None:
+            key = frozenset(self.field_names_dict)
+            segments = self.fnames_cache.segments.get(key)
+        if segments is not None:
+            self.field_names_dict, self.short_fnames_seg, \
+                    self.long_fnames_seg = segments
+
+        # otherwise, each name is added to the long field names segment
+        # (> 255 bytes) or short field names segment (<= 255 bytes) and the
+        # segments are processed
+        else:
+            self.short_fnames_seg = OsonFieldNamesSegment.create()
+            for name in list(self.field_names_dict):
+                self._add_field_name(name)
             self.short_fnames_seg.process_field_names(0)
-            self.num_field_names += self.short_fnames_seg.num_field_names
+            if self.long_fnames_seg is not None:
+                self.long_fnames_seg.process_field_names(
+                    self.short_fnames_seg.num_field_names
+                )
+            if self.fnames_cache is not None:
+                if len(self.fnames_cache.segments) >= \
+                        OSON_FNAMES_CACHE_MAX_SEGMENTS:
+                    self.fnames_cache.segments.clear()
+                self.fnames_cache.segments[key] = (
+                    self.field_names_dict,
+                    self.short_fnames_seg,
+                    self.long_fnames_seg,
+                )
+
+        # determine the total number of unique field names in the value
+        self.num_field_names = self.short_fnames_seg.num_field_names
         if self.long_fnames_seg is not None:
-            self.long_fnames_seg.process_field_names(self.num_field_names)
             self.num_field_names += self.long_fnames_seg.num_field_names
 
         # determine remaining flags and field id size
@@ -755,9 +960,9 @@ cdef class OsonEncoder(GrowableBuffer):
             for child_value in value:
                 self._examine_node(child_value)
         elif isinstance(value, dict):
-            for key, child_value in (<dict> value).items():
+            for key, child_value in value.items():
                 if key not in self.field_names_dict:
-                    self._add_field_name(key)
+                    self.field_names_dict[key] = None
                 self._examine_node(child_value)
 
     cdef int _write_extended_header(self) except -1:
@@ -815,9 +1020,12 @@ cdef class OsonEncoder(GrowableBuffer):
         if seg._pos > 0:
             self.write_raw(seg._data, seg._pos)
 
-    cdef int encode(self, object value, ssize_t max_fname_size) except -1:
+    cdef int encode(self, object value, ssize_t max_fname_size,
+                    OsonFieldNamesCache fnames_cache=None) except -1:
         """
-        Encodes the given value to OSON.
+        Encodes the given value to OSON. If a field names cache is supplied,
+        the field names segments are shared with other values encoded using
+        the same cache that have the same set of field names.
         """
         cdef:
             OsonFieldName field_name
@@ -826,6 +1034,9 @@ cdef class OsonEncoder(GrowableBuffer):
 
         # determine the flags to use
         self.max_fname_size = max_fname_size
+        if fnames_cache is not None:
+            fnames_cache.set_max_fname_size(max_fname_size)
+            self.fnames_cache = fnames_cache
         self._determine_flags(value, &flags)
 
         # encode values into tree segment
@@ -140,12 +140,14 @@ EXTENDED_PARAM_NAMES = set([
     "machine",
     "mode",
     "osuser",
+    "parallel_connect_delay",
     "program",
     "stmtcachesize",
     "terminal",
     "use_tcp_fast_open",
 
     # PoolParams
+    "creation_concurrency",
     "getmode",
     "homogeneous",
     "increment",
@@ -155,6 +157,9 @@ EXTENDED_PARAM_NAMES = set([
     "min",
     "ping_interval",
     "ping_timeout",
+    "result_cache_size",
+    "result_cache_ttl",
+    "shared_statement_cache",
     "soda_metadata_cache",
     "timeout",
     "wait_timeout",
@@ -55,6 +55,9 @@ cdef class BasePoolImpl:
             "getting the maximum lifetime of a connection in a pool"
         )
 
+    def get_metrics(self):
+        errors._raise_not_supported("getting the metrics of a pool")
+
     def get_max_sessions_per_shard(self):
         errors._raise_not_supported(
             "getting the maximum sessions per shard in a pool"
@@ -86,6 +89,9 @@ cdef class BasePoolImpl:
     def get_wait_timeout(self):
         errors._raise_not_supported("getting the wait timeout for a pool")
 
+    def invalidate_result_cache(self, object table_names):
+        errors._raise_not_supported("invalidating the result cache of a pool")
+
     def reconfigure(self, uint32_t min, uint32_t max, uint32_t increment):
         errors._raise_not_supported("reconfiguring a pool")
 
@@ -40,6 +40,7 @@ cdef class PoolParamsImpl(ConnectParamsImpl):
         self.homogeneous = True
         self.ping_interval = 60
         self.ping_timeout = 5000
+        self.creation_concurrency = 1
 
     cdef int _copy(self, ConnectParamsImpl other_params) except -1:
         """
@@ -61,6 +62,12 @@ cdef class PoolParamsImpl(ConnectParamsImpl):
         self.soda_metadata_cache = pool_params.soda_metadata_cache
         self.ping_interval = pool_params.ping_interval
         self.ping_timeout = pool_params.ping_timeout
+        self.result_cache_size = pool_params.result_cache_size
+        self.result_cache_ttl = pool_params.result_cache_ttl
+        self.shared_statement_cache = pool_params.shared_statement_cache
+        self.warmup_statements = pool_params.warmup_statements
+        self.creation_concurrency = pool_params.creation_concurrency
+        self.metrics_callback = pool_params.metrics_callback
 
     def copy(self):
         """
@@ -93,6 +100,14 @@ cdef class PoolParamsImpl(ConnectParamsImpl):
         _set_bool_param(args, "soda_metadata_cache", &self.soda_metadata_cache)
         _set_int_param(args, "ping_interval", &self.ping_interval)
         _set_uint_param(args, "ping_timeout", &self.ping_timeout)
+        _set_uint_param(args, "result_cache_size", &self.result_cache_size)
+        _set_uint_param(args, "result_cache_ttl", &self.result_cache_ttl)
+        _set_bool_param(args, "shared_statement_cache",
+                        &self.shared_statement_cache)
+        _set_obj_param(args, "warmup_statements", self)
+        _set_uint_param(args, "creation_concurrency",
+                        &self.creation_concurrency)
+        _set_obj_param(args, "metrics_callback", self)
 
         # verify that max >= min
         if self.max < self.min:
@@ -0,0 +1,283 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#------------------------------------------------------------------------------
+
+#------------------------------------------------------------------------------
+# row_block.pyx
+#
+# Cython file defining the RowBlockImpl and RowBlockColumnImpl classes used for
+# holding a block of fetched rows in column-oriented form (embedded in
+# base_impl.pyx).
+#------------------------------------------------------------------------------
+
+cdef array.array row_block_double_template = array.array('d')
+cdef array.array row_block_int64_template = array.array('q')
+cdef array.array row_block_validity_template = array.array('B')
+
+
+cdef uint8_t convert_oracle_data_to_row_block(uint8_t kind,
+                                              OracleMetadata metadata,
+                                              OracleData* data,
+                                              RowBlockValue* value):
+    """
+    Converts the value stored in OracleData to the fixed width value stored
+    in a column of a row block. The state of the value is returned:
+    ROW_BLOCK_VALUE_OBJECT is returned if the value cannot be stored in the
+    fixed width column and must be converted to a Python object instead.
+    """
+    cdef:
+        OracleNumber *number = &data.buffer.as_number
+        uint8_t ora_type_num = metadata.dbtype._ora_type_num
+        char *end_ptr
+    if data.is_null:
+        return ROW_BLOCK_VALUE_NULL
+    if kind == ROW_BLOCK_COLUMN_KIND_DOUBLE:
+        if ora_type_num == ORA_TYPE_NUM_BINARY_DOUBLE:
+            value.as_double = data.buffer.as_double
+        elif ora_type_num == ORA_TYPE_NUM_BINARY_FLOAT:
+            value.as_double = data.buffer.as_float
+        elif number.is_max_negative_value:
+            value.as_double = -1.0e126
+        else:
+            value.as_double = strtod(<const char*> number.chars, NULL)
+        return ROW_BLOCK_VALUE_TYPED
+    elif kind == ROW_BLOCK_COLUMN_KIND_INT64 \
+            and number.is_integer and not number.is_max_negative_value:
+        errno.errno = 0
+        value.as_int64 = strtoll(<const char*> number.chars, &end_ptr, 10)
+        if errno.errno == 0 \
+                and end_ptr == <char*> &number.chars[number.num_chars]:
+            return ROW_BLOCK_VALUE_TYPED
+    return ROW_BLOCK_VALUE_OBJECT
+
+
+cdef uint8_t get_row_block_column_kind(BaseVarImpl var_impl):
+    """
+    Returns the kind of row block column that is used for the values fetched
+    by the variable. Values are stored in fixed width columns only when the
+    conversion to Python would create a float or an integer and no out
+    converter has been specified.
+    """
+    cdef:
+        uint8_t from_type_num, to_type_num, py_type_num
+    if var_impl.outconverter is not None or var_impl.bypass_decode \
+            or var_impl._fetch_metadata is None:
+        return ROW_BLOCK_COLUMN_KIND_OBJECT
+    from_type_num = var_impl._fetch_metadata.dbtype._ora_type_num
+    to_type_num = var_impl.metadata.dbtype._ora_type_num
+    py_type_num = var_impl.metadata._py_type_num
+    if py_type_num == PY_TYPE_NUM_FLOAT:
+        if from_type_num in (ORA_TYPE_NUM_NUMBER,
+                             ORA_TYPE_NUM_BINARY_DOUBLE,
+                             ORA_TYPE_NUM_BINARY_FLOAT) \
+                and to_type_num in (ORA_TYPE_NUM_NUMBER,
+                                    ORA_TYPE_NUM_BINARY_DOUBLE,
+                                    ORA_TYPE_NUM_BINARY_FLOAT):
+            return ROW_BLOCK_COLUMN_KIND_DOUBLE
+    elif py_type_num == PY_TYPE_NUM_INT:
+        if from_type_num == ORA_TYPE_NUM_NUMBER \
+                and to_type_num == ORA_TYPE_NUM_NUMBER:
+            return ROW_BLOCK_COLUMN_KIND_INT64
+    return ROW_BLOCK_COLUMN_KIND_OBJECT
+
+
+@cython.final
+cdef class RowBlockColumnImpl:
+
+    @staticmethod
+    cdef RowBlockColumnImpl _create(uint8_t kind):
+        """
+        Internal method for creating an empty column of the given kind. Values
+        of fixed width columns are stored in an array together with an array
+        indicating which values are not null; the validity array is only
+        created once a null value is appended. Values of other columns are
+        stored in a list.
+        """
+        cdef RowBlockColumnImpl impl = \
+                RowBlockColumnImpl.__new__(RowBlockColumnImpl)
+        impl.kind = kind
+        if kind == ROW_BLOCK_COLUMN_KIND_DOUBLE:
+            impl._values = array.copy(row_block_double_template)
+        elif kind == ROW_BLOCK_COLUMN_KIND_INT64:
+            impl._values = array.copy(row_block_int64_template)
+        else:
+            impl._objects = []
+        return impl
+
+    cdef int _append_validity(self, bint is_valid) except -1:
+        """
+        Internal method for recording whether the value being appended is
+        valid (not null). The validity array is created when the first null
+        value is appended.
+        """
+        if self._validity is None:
+            if is_valid:
+                return 0
+            self._validity = array.clone(row_block_validity_template,
+                                         self.num_values, False)
+            memset(self._validity.data.as_uchars, 1, self.num_values)
+        array.resize_smart(self._validity, self.num_values + 1)
+        self._validity.data.as_uchars[self.num_values] = is_valid
+
+    cdef int _append_fixed_value(self, RowBlockValue *value) except -1:
+        """
+        Internal method for appending a value to the array of fixed width
+        values.
+        """
+        array.resize_smart(self._values, self.num_values + 1)
+        (<RowBlockValue*> self._values.data.as_voidptr)[self.num_values] = \
+                value[0]
+        self.num_values += 1
+
+    cdef int _convert_to_objects(self) except -1:
+        """
+        Internal method for converting a fixed width column to a column of
+        Python objects. This is needed when a value is appended that cannot be
+        stored in the fixed width column, such as a value that is not an
+        integer in a column of integers.
+        """
+        cdef uint32_t i
+        self._objects = [self.get_value(i) for i in range(self.num_values)]
+        self._values = self._validity = None
+        self.kind = ROW_BLOCK_COLUMN_KIND_OBJECT
+
+    cdef int append_null(self) except -1:
+        """
+        Appends a null value to the column.
+        """
+        cdef RowBlockValue value
+        if self.kind == ROW_BLOCK_COLUMN_KIND_OBJECT:
+            self._objects.append(None)
+            self.num_values += 1
+        else:
+            value.as_int64 = 0
+            self._append_validity(False)
+            self._append_fixed_value(&value)
+
+    cdef int append_typed_value(self, uint8_t kind,
+                                RowBlockValue *value) except -1:
+        """
+        Appends a fixed width value of the given kind to the column. If the
+        column has been converted to a column of Python objects, the value is
+        appended as a Python object instead.
+        """
+        if self.kind == kind:
+            self._append_validity(True)
+            self._append_fixed_value(value)
+        elif kind == ROW_BLOCK_COLUMN_KIND_DOUBLE:
+            self.append_value(value.as_double)
+        else:
+            self.append_value(value.as_int64)
+
+    cdef int append_value(self, object value) except -1:
+        """
+        Appends a Python value to the column. If the value cannot be stored in
+        the fixed width column, the column is first converted to a column of
+        Python objects.
+        """
+        cdef RowBlockValue typed_value
+        if value is None:
+            return self.append_null()
+        elif self.kind == ROW_BLOCK_COLUMN_KIND_DOUBLE \
+                and type(value) is float:
+            typed_value.as_double = value
+            return self.append_typed_value(self.kind, &typed_value)
+        elif self.kind == ROW_BLOCK_COLUMN_KIND_INT64 and type(value) is int:
+            try:
+                typed_value.as_int64 = value
+            except OverflowError:
+                pass
+            else:
+                return self.append_typed_value(self.kind, &typed_value)
+        if self.kind != ROW_BLOCK_COLUMN_KIND_OBJECT:
+            self._convert_to_objects()
+        self._objects.append(value)
+        self.num_values += 1
+
+    cdef object get_value(self, uint32_t index):
+        """
+        Returns the value at the given index as a Python object.
+        """
+        cdef RowBlockValue *value
+        if self.kind == ROW_BLOCK_COLUMN_KIND_OBJECT:
+            return self._objects[index]
+        elif self._validity is not None \
+                and not self._validity.data.as_uchars[index]:
+            return None
+        value = &(<RowBlockValue*> self._values.data.as_voidptr)[index]
+        if self.kind == ROW_BLOCK_COLUMN_KIND_DOUBLE:
+            return value.as_double
+        return value.as_int64
+
+    def get_validity(self):
+        """
+        Internal method for returning the validity array of the column, or
+        None if none of the values are null.
+        """
+        return self._validity
+
+    def get_values(self):
+        """
+        Internal method for returning the values of the column.
+        """
+        if self.kind == ROW_BLOCK_COLUMN_KIND_OBJECT:
+            return self._objects
+        elif self.num_values == 0:
+            return []
+        return self._values
+
+
+@cython.final
+cdef class RowBlockImpl:
+
+    @staticmethod
+    cdef RowBlockImpl _create(list columns, uint32_t num_rows,
+                              object rowfactory):
+        """
+        Internal method for creating a row block from the columns populated
+        with the fetched values.
+        """
+        cdef RowBlockImpl impl = RowBlockImpl.__new__(RowBlockImpl)
+        impl.columns = columns
+        impl.num_rows = num_rows
+        impl.rowfactory = rowfactory
+        return impl
+
+    def get_row(self, uint32_t row_index):
+        """
+        Internal method for materializing the row at the given index.
+        """
+        cdef:
+            Py_ssize_t i, num_columns
+            RowBlockColumnImpl column
+            object row, value
+        num_columns = cpython.PyList_GET_SIZE(self.columns)
+        row = cpython.PyTuple_New(num_columns)
+        for i in range(num_columns):
+            column = <RowBlockColumnImpl> self.columns[i]
+            value = column.get_value(row_index)
+            cpython.Py_INCREF(value)
+            cpython.PyTuple_SET_ITEM(row, i, value)
+        if self.rowfactory is not None:
+            row = self.rowfactory(*row)
+        return row
@@ -229,7 +229,9 @@ def init_base_impl(package):
         PY_TYPE_DB_OBJECT_TYPE, \
         PY_TYPE_FETCHINFO, \
         PY_TYPE_INTERVAL_YM, \
+        PY_TYPE_JSON_ARRAY_VIEW, \
         PY_TYPE_JSON_ID, \
+        PY_TYPE_JSON_OBJECT_VIEW, \
         PY_TYPE_LOB, \
         PY_TYPE_MESSAGE, \
         PY_TYPE_MESSAGE_QUERY, \
@@ -256,7 +258,9 @@ def init_base_impl(package):
     PY_TYPE_DB_OBJECT_TYPE = <type> package.DbObjectType
     PY_TYPE_FETCHINFO = <type> package.FetchInfo
     PY_TYPE_INTERVAL_YM = <type> package.IntervalYM
+    PY_TYPE_JSON_ARRAY_VIEW = <type> package.JsonArrayView
     PY_TYPE_JSON_ID = <type> package.JsonId
+    PY_TYPE_JSON_OBJECT_VIEW = <type> package.JsonObjectView
     PY_TYPE_LOB = <type> package.LOB
     PY_TYPE_MESSAGE = <type> package.Message
     PY_TYPE_MESSAGE_QUERY = <type> package.MessageQuery
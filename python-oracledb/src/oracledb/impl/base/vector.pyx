@@ -34,6 +34,155 @@ cdef array.array double_template = array.array('d')
 cdef array.array int8_template = array.array('b')
 cdef array.array uint8_template = array.array('B')
 
+# byte order prefix of buffer format strings that matches the native byte order
+cdef char NATIVE_BYTE_ORDER_PREFIX = \
+        b'<' if sys.byteorder == "little" else b'>'
+
+
+cdef array.array _get_buffer_vector_template(cpython.Py_buffer *view,
+                                             int ndim=1):
+    """
+    Returns the array template matching the elements of the acquired buffer
+    view, which must have the given number of dimensions and contain 32-bit or
+    64-bit floating point numbers or 8-bit integers. A byte order prefix is
+    only accepted if it matches the native byte order. If the buffer cannot be
+    used for vectors, None is returned.
+    """
+    cdef:
+        const char *format
+        char type_code
+    if view.ndim != ndim:
+        return None
+    format = view.format
+    if format[0] == b'@' or format[0] == b'=' \
+            or format[0] == NATIVE_BYTE_ORDER_PREFIX:
+        format += 1
+    type_code = format[0]
+    if format[1] != 0:
+        return None
+    elif type_code == b'f' and view.itemsize == 4:
+        return float_template
+    elif type_code == b'd' and view.itemsize == 8:
+        return double_template
+    elif type_code == b'b' and view.itemsize == 1:
+        return int8_template
+    elif type_code == b'B' and view.itemsize == 1:
+        return uint8_template
+
+
+cdef bint _is_buffer_vector(object value) except -1:
+    """
+    Returns whether or not the object supports the buffer protocol and can be
+    converted to a vector by _convert_buffer_to_vector(). The elements of the
+    buffer are not copied.
+    """
+    cdef cpython.Py_buffer view
+    if isinstance(value, (bytes, bytearray, str)) \
+            or not cpython.PyObject_CheckBuffer(value):
+        return False
+    cpython.PyObject_GetBuffer(value, &view, cpython.PyBUF_RECORDS_RO)
+    try:
+        return _get_buffer_vector_template(&view) is not None
+    finally:
+        cpython.PyBuffer_Release(&view)
+
+
+cdef array.array _convert_buffer_to_vector(object value):
+    """
+    Returns an array containing a copy of the values of a one-dimensional
+    object supporting the buffer protocol, such as a NumPy array, whose
+    elements are 32-bit or 64-bit floating point numbers or 8-bit integers. If
+    the object cannot be used as a vector, None is returned.
+    """
+    cdef:
+        array.array result, template
+        cpython.Py_buffer view
+        char *source_buf
+        ssize_t i
+
+    # bytes, bytearray and str are not treated as vectors
+    if isinstance(value, (bytes, bytearray, str)) \
+            or not cpython.PyObject_CheckBuffer(value):
+        return None
+
+    # acquire the buffer and determine the type of its elements
+    cpython.PyObject_GetBuffer(value, &view, cpython.PyBUF_RECORDS_RO)
+    try:
+        template = _get_buffer_vector_template(&view)
+        if template is None:
+            return None
+        result = array.clone(template, view.shape[0], False)
+
+        # copy the elements, in one operation if they are contiguous
+        source_buf = <char*> view.buf
+        if view.strides[0] == view.itemsize:
+            memcpy(result.data.as_voidptr, source_buf, view.len)
+        else:
+            for i in range(view.shape[0]):
+                memcpy(result.data.as_chars + i * view.itemsize,
+                       source_buf + i * view.strides[0], view.itemsize)
+        return result
+    finally:
+        cpython.PyBuffer_Release(&view)
+
+
+cdef bint _is_buffer_matrix(object value) except -1:
+    """
+    Returns whether or not the object supports the buffer protocol and is a
+    two-dimensional matrix whose rows can be converted to vectors by
+    _convert_buffer_row_to_vector(). The elements of the buffer are not copied.
+    """
+    cdef cpython.Py_buffer view
+    if isinstance(value, (bytes, bytearray, str)) \
+            or not cpython.PyObject_CheckBuffer(value):
+        return False
+    cpython.PyObject_GetBuffer(value, &view, cpython.PyBUF_RECORDS_RO)
+    try:
+        return _get_buffer_vector_template(&view, 2) is not None
+    finally:
+        cpython.PyBuffer_Release(&view)
+
+
+cdef array.array _convert_buffer_row_to_vector(object value, ssize_t row_num):
+    """
+    Returns an array containing a copy of the values in the given row of a
+    two-dimensional object supporting the buffer protocol which has been
+    verified by _is_buffer_matrix().
+    """
+    cdef:
+        array.array result, template
+        cpython.Py_buffer view
+        char *source_buf
+        ssize_t i
+    cpython.PyObject_GetBuffer(value, &view, cpython.PyBUF_RECORDS_RO)
+    try:
+        template = _get_buffer_vector_template(&view, 2)
+        result = array.clone(template, view.shape[1], False)
+        source_buf = <char*> view.buf + row_num * view.strides[0]
+        if view.strides[1] == view.itemsize:
+            memcpy(result.data.as_voidptr, source_buf,
+                   view.shape[1] * view.itemsize)
+        else:
+            for i in range(view.shape[1]):
+                memcpy(result.data.as_chars + i * view.itemsize,
+                       source_buf + i * view.strides[1], view.itemsize)
+        return result
+    finally:
+        cpython.PyBuffer_Release(&view)
+
+
+def _iter_buffer_matrix_rows(object value):
+    """
+    Generator returning a row containing a single vector for each row of a
+    two-dimensional object supporting the buffer protocol which has been
+    verified by _is_buffer_matrix(). Each vector is copied only when it is
+    requested.
+    """
+    cdef ssize_t row_num
+    for row_num in range(len(memoryview(value))):
+        yield (_convert_buffer_row_to_vector(value, row_num),)
+
+
 @cython.final
 cdef class SparseVectorImpl:
 
@@ -63,6 +212,7 @@ cdef class VectorDecoder(Buffer):
             uint8_t element_size = 0
             int8_t *int8_buf = NULL
             float *float_buf = NULL
+            const char_type *ptr
             OracleDataBuffer buffer
             array.array result
             uint32_t i
@@ -85,18 +235,24 @@ cdef class VectorDecoder(Buffer):
             errors._raise_err(errors.ERR_VECTOR_FORMAT_NOT_SUPPORTED,
                               vector_format=vector_format)
 
-        # parse data
-        for i in range(num_elements):
-            if vector_format == VECTOR_FORMAT_FLOAT32:
-                decode_binary_float(self._get_raw(4), 4, &buffer)
+        # parse data; the values are stored contiguously so they are acquired
+        # from the buffer at once and integers are copied without conversion
+        if vector_format == VECTOR_FORMAT_FLOAT32:
+            ptr = self._get_raw(num_elements * 4)
+            for i in range(num_elements):
+                decode_binary_float(&ptr[i * 4], 4, &buffer)
                 float_buf[i] = buffer.as_float
-            elif vector_format == VECTOR_FORMAT_FLOAT64:
-                decode_binary_double(self._get_raw(8), 8, &buffer)
+        elif vector_format == VECTOR_FORMAT_FLOAT64:
+            ptr = self._get_raw(num_elements * 8)
+            for i in range(num_elements):
+                decode_binary_double(&ptr[i * 8], 8, &buffer)
                 double_buf[i] = buffer.as_double
-            elif vector_format == VECTOR_FORMAT_INT8:
-                self.read_sb1(&int8_buf[i])
-            else:
-                self.read_ub1(&uint8_buf[i])
+        elif vector_format == VECTOR_FORMAT_INT8:
+            ptr = self._get_raw(num_elements)
+            memcpy(int8_buf, ptr, num_elements)
+        else:
+            ptr = self._get_raw(num_elements)
+            memcpy(uint8_buf, ptr, num_elements)
 
         return result
 
@@ -164,20 +320,20 @@ cdef class VectorEncoder(GrowableBuffer):
             uint8_t *uint8_ptr = value.data.as_uchars
             float *float_ptr = value.data.as_floats
             int8_t *int8_ptr = value.data.as_schars
-            char_type buf[8]
+            ssize_t pos = self._pos
             uint32_t i
         if vector_format == VECTOR_FORMAT_INT8:
             self.write_raw(<char_type*> int8_ptr, num_elements)
         elif vector_format == VECTOR_FORMAT_BINARY:
             self.write_raw(<char_type*> uint8_ptr, num_elements // 8)
-        else:
+        elif vector_format == VECTOR_FORMAT_FLOAT32:
+            self._reserve_space(num_elements * 4)
+            for i in range(num_elements):
+                encode_binary_float(&self._data[pos + i * 4], float_ptr[i])
+        elif vector_format == VECTOR_FORMAT_FLOAT64:
+            self._reserve_space(num_elements * 8)
             for i in range(num_elements):
-                if vector_format == VECTOR_FORMAT_FLOAT32:
-                    encode_binary_float(buf, float_ptr[i])
-                    self.write_raw(buf, 4)
-                elif vector_format == VECTOR_FORMAT_FLOAT64:
-                    encode_binary_double(buf, double_ptr[i])
-                    self.write_raw(buf, 8)
+                encode_binary_double(&self._data[pos + i * 8], double_ptr[i])
 
     cdef uint8_t _get_vector_format(self, array.array value):
         """
@@ -131,6 +131,27 @@ cdef class ThickCursorImpl(BaseCursorImpl):
         if dpiStmt_define(self._handle, pos + 1, var_impl._handle) < 0:
             _raise_from_odpi()
 
+    cdef int _fetch_block_rows(self, list columns,
+                               uint32_t num_rows) except -1:
+        """
+        Internal method for appending the values of the given number of rows
+        in the fetched data to the row block columns. Fixed width numeric
+        values are read directly from the buffers supplied by ODPI-C.
+        """
+        cdef:
+            ThickVarImpl var_impl
+            Py_ssize_t i
+            uint8_t kind
+            uint32_t j
+        for i, var_impl in enumerate(self.fetch_var_impls):
+            kind = get_row_block_column_kind(var_impl)
+            for j in range(num_rows):
+                var_impl._append_row_block_value(columns[i], kind,
+                                                 self._buffer_index + j)
+        self._buffer_index += num_rows
+        self._buffer_rowcount -= num_rows
+        self.rowcount += num_rows
+
     cdef int _fetch_rows(self, object cursor) except -1:
         """
         Internal method for fetching rows from a cursor.
@@ -49,7 +49,7 @@ cdef class JsonBuffer:
         length[0] = buf.length
 
     cdef int _populate_array_node(self, dpiJsonNode *node,
-                                  list value) except -1:
+                                  object value) except -1:
         cdef:
             dpiJsonArray *array
             object child_value
@@ -66,7 +66,8 @@ cdef class JsonBuffer:
             array.elements[i].value = &array.elementValues[i]
             self._populate_node(&array.elements[i], child_value)
 
-    cdef int _populate_obj_node(self, dpiJsonNode *node, dict value) except -1:
+    cdef int _populate_obj_node(self, dpiJsonNode *node,
+                                object value) except -1:
         cdef:
             object child_key, child_value
             dpiJsonObject *obj
@@ -98,7 +99,7 @@ cdef class JsonBuffer:
         if value is None:
             node.oracleTypeNum = DPI_ORACLE_TYPE_NONE
             node.nativeTypeNum = DPI_NATIVE_TYPE_NULL
-        elif isinstance(value, list):
+        elif isinstance(value, (list, tuple)):
             self._populate_array_node(node, value)
         elif isinstance(value, dict):
             self._populate_obj_node(node, value)
@@ -31,6 +31,7 @@
 
 cdef class ThickLobImpl(BaseLobImpl):
     cdef:
+        readonly ThickConnImpl _conn_impl
         dpiLob *_handle
 
     @staticmethod
@@ -48,6 +49,7 @@ cdef class ThickLobImpl(BaseLobImpl):
                 _raise_from_odpi()
         elif dpiLob_addRef(handle) < 0:
             _raise_from_odpi()
+        impl._conn_impl = conn_impl
         impl._handle = handle
         return impl
 
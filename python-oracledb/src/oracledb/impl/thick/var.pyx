@@ -40,6 +40,50 @@ cdef class ThickVarImpl(BaseVarImpl):
         if self._handle != NULL:
             dpiVar_release(self._handle)
 
+    cdef int _append_row_block_value(self, RowBlockColumnImpl column,
+                                     uint8_t kind, uint32_t pos) except -1:
+        """
+        Appends the value at the given position to the row block column. Values
+        stored in columns of the given kind are read directly from the buffer
+        supplied by ODPI-C without creating a Python object.
+        """
+        cdef:
+            dpiData *data = &self._data[pos]
+            uint8_t state = ROW_BLOCK_VALUE_OBJECT
+            uint32_t native_type_num
+            OracleNumber *as_number
+            RowBlockValue value
+            OracleData ora_data
+            dpiBytes *as_bytes
+        if kind != ROW_BLOCK_COLUMN_KIND_OBJECT:
+            native_type_num = self.metadata.dbtype._native_num
+            if data.isNull:
+                state = ROW_BLOCK_VALUE_NULL
+            elif native_type_num == DPI_NATIVE_TYPE_DOUBLE:
+                value.as_double = data.value.asDouble
+                state = ROW_BLOCK_VALUE_TYPED
+            elif native_type_num == DPI_NATIVE_TYPE_FLOAT:
+                value.as_double = data.value.asFloat
+                state = ROW_BLOCK_VALUE_TYPED
+            elif native_type_num == DPI_NATIVE_TYPE_BYTES:
+                as_bytes = &data.value.asBytes
+                ora_data.is_null = False
+                as_number = &ora_data.buffer.as_number
+                as_number.is_max_negative_value = 0
+                as_number.is_integer = \
+                        memchr(as_bytes.ptr, b'.', as_bytes.length) == NULL
+                memcpy(as_number.chars, as_bytes.ptr, as_bytes.length)
+                as_number.chars[as_bytes.length] = 0
+                as_number.num_chars = as_bytes.length
+                state = convert_oracle_data_to_row_block(kind, self.metadata,
+                                                         &ora_data, &value)
+        if state == ROW_BLOCK_VALUE_TYPED:
+            column.append_typed_value(kind, &value)
+        elif state == ROW_BLOCK_VALUE_NULL:
+            column.append_null()
+        else:
+            column.append_value(self._get_scalar_value(pos))
+
     cdef int _bind(self, object conn, BaseCursorImpl cursor_impl,
                    uint32_t num_execs, object name, uint32_t pos) except -1:
         cdef:
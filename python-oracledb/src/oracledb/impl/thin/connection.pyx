@@ -60,6 +60,10 @@ cdef class BaseThinConnImpl(BaseConnImpl):
 
     cdef:
         StatementCache _statement_cache
+        ResultCache _result_cache
+        tuple _session_state_stmts
+        bint _session_state_unknown
+        SharedStatementCache _shared_statement_cache
         BaseProtocol _protocol
         uint32_t _session_id
         uint16_t _serial_num
@@ -129,6 +133,27 @@ cdef class BaseThinConnImpl(BaseConnImpl):
             self._dbobject_type_cache_num = 0
             remove_dbobject_type_cache(cache_num)
 
+    cdef int _update_session_state(self, Statement stmt) except -1:
+        """
+        Called when a statement is executed on a connection that uses a result
+        cache. ALTER SESSION statements are recorded since they can change the
+        results of queries (such as with NLS settings) and the recorded
+        statements form part of the key used for cached results. PL/SQL can
+        change the state of the session in ways that cannot be determined, so
+        results are no longer cached or shared for the session after it is
+        executed.
+        """
+        if stmt._is_plsql:
+            self._session_state_unknown = True
+        elif stmt._is_ddl and not self._session_state_unknown \
+                and re.search(r"\bALTER\s+SESSION\b", stmt._sql, re.I):
+            if len(self._session_state_stmts) \
+                    >= RESULT_CACHE_MAX_SESSION_STMTS:
+                self._session_state_unknown = True
+            elif not self._session_state_stmts \
+                    or self._session_state_stmts[-1] != stmt._sql:
+                self._session_state_stmts += (stmt._sql,)
+
     cdef BaseThinLobImpl _create_lob_impl(self, DbType dbtype,
                                           bytes locator=None):
         """
@@ -144,6 +169,38 @@ cdef class BaseThinConnImpl(BaseConnImpl):
         lob_impl._locator = locator
         return lob_impl
 
+    cdef list _create_lob_read_messages(self, list lob_impls,
+                                        list read_messages):
+        """
+        Creates the messages needed to read all of the data in each of the
+        LOBs and returns them. BFILE LOBs must be opened before they can be
+        read so no message is created for them and None is returned in their
+        place. The messages that were created are also appended to the
+        supplied list. If there is more than one of them and the database
+        supports pipelining, they are prepared to be sent in a pipeline.
+        """
+        cdef:
+            BaseThinLobImpl lob_impl
+            LobOpMessage message
+            uint64_t token_num
+            list messages = []
+        for lob_impl in lob_impls:
+            if lob_impl.dbtype._ora_type_num == ORA_TYPE_NUM_BFILE:
+                messages.append(None)
+                continue
+            message = lob_impl._create_read_message(
+                1, lob_impl.get_max_amount()
+            )
+            messages.append(message)
+            read_messages.append(message)
+        if len(read_messages) > 1 and self._protocol._caps.supports_pipelining:
+            token_num = 1
+            for message in read_messages:
+                message.in_pipeline = True
+                message.token_num = token_num
+                token_num += 1
+        return messages
+
     cdef Message _create_message(self, type typ):
         """
         Creates a message object that is used to send a request to the database
@@ -154,6 +211,110 @@ cdef class BaseThinConnImpl(BaseConnImpl):
         message._initialize(self)
         return message
 
+    cdef Message _create_message_for_pipeline_op(
+        self, object conn, PipelineOpImpl op_impl
+    ):
+        """
+        Creates a single message for a pipeline operation.
+        """
+        cdef:
+            BaseThinCursorImpl cursor_impl
+            MessageWithData message
+            uint32_t num_execs = 1
+            object cursor
+        if op_impl.op_type == PIPELINE_OP_TYPE_COMMIT:
+            return self._create_message(CommitMessage)
+        cursor = conn.cursor()
+        cursor_impl = <BaseThinCursorImpl> cursor._impl
+        if op_impl.op_type == PIPELINE_OP_TYPE_CALL_FUNC:
+            execute_args = cursor._call_get_execute_args(
+                op_impl.name,
+                op_impl.parameters,
+                op_impl.keyword_parameters,
+                cursor.var(op_impl.return_type)
+            )
+            cursor._prepare_for_execute(*execute_args)
+        elif op_impl.op_type == PIPELINE_OP_TYPE_CALL_PROC:
+            execute_args = cursor._call_get_execute_args(
+                op_impl.name,
+                op_impl.parameters,
+                op_impl.keyword_parameters
+            )
+            cursor._prepare_for_execute(*execute_args)
+        elif op_impl.op_type == PIPELINE_OP_TYPE_EXECUTE:
+            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
+        elif op_impl.op_type == PIPELINE_OP_TYPE_EXECUTE_MANY:
+            op_impl.batch_load_manager = cursor_impl._prepare_for_executemany(
+                cursor,
+                op_impl.statement,
+                op_impl.parameters,
+                2 ** 32 - 1
+            )
+            op_impl.num_execs = op_impl.batch_load_manager.num_rows
+            if not cursor_impl._statement.requires_single_execute():
+                num_execs = op_impl.num_execs
+        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_ONE:
+            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
+            cursor_impl.prefetchrows = 1
+            cursor_impl.arraysize = 1
+            cursor_impl.rowfactory = op_impl.rowfactory
+            cursor_impl.fetch_lobs = op_impl.fetch_lobs
+            cursor_impl.fetch_decimals = op_impl.fetch_decimals
+        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_MANY:
+            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
+            cursor_impl.prefetchrows = op_impl.num_rows
+            cursor_impl.arraysize = op_impl.num_rows
+            cursor_impl.rowfactory = op_impl.rowfactory
+            cursor_impl.fetch_lobs = op_impl.fetch_lobs
+            cursor_impl.fetch_decimals = op_impl.fetch_decimals
+        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_ALL:
+            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
+            cursor_impl.prefetchrows = op_impl.arraysize
+            cursor_impl.arraysize = op_impl.arraysize
+            cursor_impl.rowfactory = op_impl.rowfactory
+            cursor_impl.fetch_lobs = op_impl.fetch_lobs
+            cursor_impl.fetch_decimals = op_impl.fetch_decimals
+        else:
+            errors._raise_err(errors.ERR_UNSUPPORTED_PIPELINE_OPERATION,
+                              op_type=op_impl.op_type)
+        cursor_impl._preprocess_execute(conn)
+        message = cursor_impl._create_message(ExecuteMessage, cursor)
+        message.num_execs = num_execs
+        return message
+
+    cdef list _create_messages_for_pipeline(
+        self, object conn, list results, bint continue_on_error
+    ):
+        """
+        Creates a list of messages for the pipeline and returns them after they
+        have been submitted to the database for processing.
+        """
+        cdef:
+            PipelineOpResultImpl result_impl
+            PipelineOpImpl op_impl
+            uint64_t token_num
+            Message message
+            object result
+            list messages
+        messages = []
+        token_num = 1
+        for result in results:
+            result_impl = result._impl
+            op_impl = result_impl.operation
+            try:
+                message = self._create_message_for_pipeline_op(conn, op_impl)
+            except Exception as e:
+                if not continue_on_error:
+                    raise
+                result_impl._capture_err(e)
+                continue
+            message.pipeline_result_impl = result_impl
+            message.in_pipeline = True
+            message.token_num = token_num
+            token_num += 1
+            messages.append(message)
+        return messages
+
     cdef AuthMessage _create_change_password_message(self, str old_password,
                                                      str new_password):
         """
@@ -232,6 +393,7 @@ cdef class BaseThinConnImpl(BaseConnImpl):
         self._statement_cache = StatementCache.__new__(StatementCache)
         self._statement_cache.initialize(params.stmtcachesize,
                                          self._max_open_cursors)
+        self._statement_cache._shared_cache = self._shared_statement_cache
         self._dbobject_type_cache_num = create_new_dbobject_type_cache(self)
         self.invoke_session_callback = True
 
@@ -248,6 +410,30 @@ cdef class BaseThinConnImpl(BaseConnImpl):
         """
         self._statement_cache.return_statement(statement)
 
+    cdef int _send_messages_for_pipeline(
+        self, list messages, bint continue_on_error
+    ) except -1:
+        """
+        Sends the messages for the pipeline to the database for processing.
+        The packets are queued in a write batch which is sent once the end
+        pipeline message has been added to it.
+        """
+        cdef:
+            BaseProtocol protocol = self._protocol
+            Message message
+        protocol._transport.start_write_batch()
+        try:
+            for message in messages:
+                try:
+                    message.send(protocol._write_buf)
+                except Exception as e:
+                    if not continue_on_error:
+                        raise
+                    message.pipeline_result_impl._capture_err(e)
+        except:
+            protocol._transport.end_write_batch(send_packets=False)
+            raise
+
     cdef TransactionSwitchMessage _start_sessionless_transaction(
         self,
         bytes transaction_id,
@@ -376,6 +562,13 @@ cdef class BaseThinConnImpl(BaseConnImpl):
     def set_stmt_cache_size(self, uint32_t value):
         self._statement_cache.resize(value)
 
+    def supports_pipelining(self):
+        """
+        Returns whether the connection supports pipelining. This requires
+        Oracle Database version 23, and later.
+        """
+        return self._protocol._caps.supports_pipelining
+
 
 cdef class ThinConnImpl(BaseThinConnImpl):
 
@@ -390,30 +583,178 @@ cdef class ThinConnImpl(BaseThinConnImpl):
         cdef Protocol protocol = <Protocol> self._protocol
         protocol._close(self)
 
-    cdef int _connect_with_address(self, Address address,
-                                   Description description,
-                                   ConnectParamsImpl params,
-                                   str connect_string,
-                                   bint raise_exception) except -1:
+    cdef int _complete_pipeline_op(self, Message message) except -1:
+        """
+        Completes a particular pipeline operation.
+        """
+        cdef:
+            Protocol protocol = <Protocol> self._protocol
+            PipelineOpResultImpl result_impl = message.pipeline_result_impl
+            MessageWithData fetch_message, message_with_data
+            PipelineOpImpl op_impl = result_impl.operation
+            uint8_t op_type = op_impl.op_type
+            ThinCursorImpl cursor_impl
+            BatchLoadManager manager
+            BindVar bind_var
+
+        # all operations other than commit make use of a cursor
+        if op_type == PIPELINE_OP_TYPE_COMMIT:
+            return 0
+
+        # keep warning, if applicable
+        message_with_data = <MessageWithData> message
+        result_impl.warning = message_with_data.warning
+
+        # resend the message if that is required (for operations that fetch
+        # LOBS, for example)
+        cursor_impl = <ThinCursorImpl> message_with_data.cursor_impl
+        if message.resend:
+            with protocol._request_lock:
+                protocol._process_message(message)
+        message.postprocess()
+        if op_impl.op_type == PIPELINE_OP_TYPE_CALL_FUNC:
+            bind_var = <BindVar> cursor_impl.bind_vars[0]
+            result_impl.return_value = bind_var.var_impl.get_value(0)
+        elif op_type in (
+            PIPELINE_OP_TYPE_FETCH_ONE,
+            PIPELINE_OP_TYPE_FETCH_MANY,
+            PIPELINE_OP_TYPE_FETCH_ALL,
+        ):
+            result_impl.rows = []
+            while cursor_impl._buffer_rowcount > 0:
+                result_impl.rows.append(cursor_impl._create_row())
+        result_impl.fetch_metadata = cursor_impl.fetch_metadata
+
+        # for fetchall(), perform as many round trips as are required to
+        # complete the fetch
+        if op_type == PIPELINE_OP_TYPE_FETCH_ALL \
+                and cursor_impl._more_rows_to_fetch:
+            fetch_message = cursor_impl._create_message(
+                FetchMessage, message_with_data.cursor
+            )
+            while cursor_impl._more_rows_to_fetch:
+                protocol._process_single_message(fetch_message)
+                while cursor_impl._buffer_rowcount > 0:
+                    result_impl.rows.append(cursor_impl._create_row())
+
+        # for PL/SQL blocks that required a single execute, perform any
+        # remaining executes now
+        if op_type == PIPELINE_OP_TYPE_EXECUTE_MANY \
+                and message_with_data.num_execs < op_impl.num_execs:
+            with protocol._request_lock:
+                while op_impl.num_execs > 0:
+                    op_impl.num_execs -= 1
+                    message_with_data.offset += 1
+                    if not cursor_impl._statement.requires_single_execute():
+                        break
+                    protocol._process_message(message)
+                if op_impl.num_execs > 0:
+                    message_with_data.num_execs = op_impl.num_execs
+                    protocol._process_message(message)
+
+        # for executemany(), process any remaining batches, such as further
+        # chunks of a data frame or further data frames from an iterator
+        if op_type == PIPELINE_OP_TYPE_EXECUTE_MANY:
+            manager = op_impl.batch_load_manager
+            manager.next_batch()
+            with protocol._request_lock:
+                while manager.num_rows > 0:
+                    message_with_data.num_execs = manager.num_rows
+                    message_with_data.offset = manager.message_offset
+                    protocol._process_message(message)
+                    manager.next_batch()
+
+        # populate the metadata for any partial types observed during the
+        # execution of the pipeline
+        if message_with_data.type_cache is not None:
+            conn = message_with_data.cursor.connection
+            message_with_data.type_cache.populate_partial_types(conn)
+
+    cdef int _complete_pipeline_ops(self, list messages,
+                                    bint continue_on_error) except -1:
+        """
+        Completes any pipeline operations that have not actually completed.
+        This could be due to the fact that LOBs were fetched or a fetch all
+        operation has more rows to fetch.
+        """
+        cdef:
+            PipelineOpResultImpl result_impl
+            Message message
+        for message in messages:
+            result_impl = message.pipeline_result_impl
+            if result_impl.error is not None:
+                continue
+            try:
+                self._complete_pipeline_op(message)
+            except Exception as e:
+                if not continue_on_error:
+                    raise
+                result_impl._capture_err(e)
+
+    cdef object _connect_with_address(self, Address address,
+                                      Description description,
+                                      ConnectParamsImpl params,
+                                      str connect_string,
+                                      bint raise_exception,
+                                      object sock=None):
         """
         Internal method used for connecting with the given description and
-        address.
+        address. If the connection cannot be established and an exception is
+        not to be raised, the exception that occurred is returned instead.
         """
         cdef Protocol protocol = <Protocol> self._protocol
         try:
             protocol._connect_phase_one(self, params, description,
-                                        address, connect_string)
+                                        address, connect_string, sock)
         except (exceptions.DatabaseError, socket.gaierror, OSError) as e:
             if raise_exception:
                 errors._raise_err(errors.ERR_CONNECTION_FAILED, cause=e,
                                   connection_id=description.connection_id)
-            return 0
+            return e
         except Exception as e:
             errors._raise_err(errors.ERR_CONNECTION_FAILED, cause=e,
                               connection_id=description.connection_id)
         self._post_connect_phase_one(description, params)
         protocol._connect_phase_two(self, description, params)
 
+    cdef int _connect_with_address_list(self, AddressList address_list,
+                                        Description description,
+                                        ConnectParamsImpl params,
+                                        str connect_string,
+                                        bint raise_exception) except -1:
+        """
+        Internal method used for connecting with the given description and
+        one of the addresses in the address list. Connections to the addresses
+        (including the TLS handshake for TCPS addresses) are raced and the
+        connection is established using the first one that succeeds. If the
+        listener at that address does not accept the connection, the race is
+        repeated with the remaining addresses. If no connection can be
+        established, the first error that occurred is raised, if applicable.
+        """
+        cdef:
+            Protocol protocol = <Protocol> self._protocol
+            list addresses = list(address_list.active_children)
+            object sock, error, first_error = None
+            Address address
+        while addresses:
+            try:
+                sock, address = protocol._race_connect(params, description,
+                                                       addresses)
+            except OSError as e:
+                if first_error is None:
+                    first_error = e
+                break
+            addresses.remove(address)
+            error = self._connect_with_address(address, description, params,
+                                               connect_string, False, sock)
+            if not protocol._in_connect:
+                return 0
+            if first_error is None:
+                first_error = error
+        if raise_exception:
+            errors._raise_err(errors.ERR_CONNECTION_FAILED, cause=first_error,
+                              connection_id=description.connection_id)
+
     cdef int _connect_with_description(self, Description description,
                                        ConnectParamsImpl params,
                                        bint final_desc) except -1:
@@ -437,6 +778,16 @@ cdef class ThinConnImpl(BaseThinConnImpl):
                               feature="bequeath", driver_type="thick")
         for i in range(num_attempts):
             for j, address_list in enumerate(description.active_children):
+                if _use_parallel_connect(address_list, description, params):
+                    if final_desc:
+                        raise_exc = i == num_attempts - 1 \
+                                and j == num_lists - 1
+                    self._connect_with_address_list(address_list,
+                                                    description, params,
+                                                    connect_string, raise_exc)
+                    if not self._protocol._in_connect:
+                        return 0
+                    continue
                 num_addresses = len(address_list.active_children)
                 for k, address in enumerate(address_list.active_children):
                     if final_desc:
@@ -587,6 +938,46 @@ cdef class ThinConnImpl(BaseThinConnImpl):
         message = self._create_message(PingMessage)
         protocol._process_single_message(message)
 
+    def read_lobs(self, list lob_impls):
+        """
+        Internal method for reading all of the data in each of the LOBs. When
+        the database supports pipelining, the read requests are sent to the
+        database without waiting for the responses, which are then processed
+        as they arrive, so that only one round-trip is required. Call timeouts
+        are disabled while the pipeline is being processed for consistency
+        with run_pipeline_with_pipelining().
+        """
+        cdef:
+            Protocol protocol = <Protocol> self._protocol
+            Transport transport = protocol._transport
+            list messages, read_messages = []
+            BaseThinLobImpl lob_impl
+            LobOpMessage message
+            list values = []
+            ssize_t i
+        messages = self._create_lob_read_messages(lob_impls, read_messages)
+        if len(read_messages) > 1 and protocol._caps.supports_pipelining:
+            with protocol._request_lock:
+                protocol._read_buf.reset_packets()
+                self.pipeline_mode = TNS_PIPELINE_MODE_ABORT_ON_ERROR
+                transport.set_timeout(0)
+                try:
+                    self._send_messages_for_pipeline(read_messages, False)
+                    protocol.end_pipeline(self, read_messages, False)
+                finally:
+                    if transport._transport is not None:
+                        transport.set_timeout(self._call_timeout / 1000)
+        else:
+            for message in read_messages:
+                protocol._process_single_message(message)
+        for i, lob_impl in enumerate(lob_impls):
+            message = messages[i]
+            if message is None:
+                values.append(lob_impl.read(1, lob_impl.get_max_amount()))
+            else:
+                values.append(lob_impl._get_read_value(message))
+        return values
+
     def resume_sessionless_transaction(
         self,
         bytes transaction_id,
@@ -612,6 +1003,38 @@ cdef class ThinConnImpl(BaseThinConnImpl):
         message = self._create_message(RollbackMessage)
         protocol._process_single_message(message)
 
+    def run_pipeline_with_pipelining(
+        self, object conn, list results, bint continue_on_error
+    ):
+        """
+        Run the pipeline with pipelining when the database supports it. Call
+        timeouts are disabled while the pipeline is being processed for
+        consistency with asyncio.
+        """
+        cdef:
+            Protocol protocol = <Protocol> self._protocol
+            Transport transport = protocol._transport
+            list messages
+        messages = self._create_messages_for_pipeline(
+            conn, results, continue_on_error
+        )
+        if messages:
+            with protocol._request_lock:
+                protocol._read_buf.reset_packets()
+                if continue_on_error:
+                    self.pipeline_mode = TNS_PIPELINE_MODE_CONTINUE_ON_ERROR
+                else:
+                    self.pipeline_mode = TNS_PIPELINE_MODE_ABORT_ON_ERROR
+                transport.set_timeout(0)
+                try:
+                    self._send_messages_for_pipeline(messages,
+                                                     continue_on_error)
+                    protocol.end_pipeline(self, messages, continue_on_error)
+                finally:
+                    if transport._transport is not None:
+                        transport.set_timeout(self._call_timeout / 1000)
+            self._complete_pipeline_ops(messages, continue_on_error)
+
     def set_call_timeout(self, uint32_t value):
         self._protocol._transport.set_timeout(value / 1000)
         self._call_timeout = value
@@ -711,6 +1134,7 @@ cdef class AsyncThinConnImpl(BaseThinConnImpl):
             PipelineOpImpl op_impl = result_impl.operation
             uint8_t op_type = op_impl.op_type
             AsyncThinCursorImpl cursor_impl
+            BatchLoadManager manager
             BindVar bind_var
 
         # all operations other than commit make use of a cursor
@@ -768,6 +1192,17 @@ cdef class AsyncThinConnImpl(BaseThinConnImpl):
                 message_with_data.num_execs = op_impl.num_execs
                 await protocol._process_message(message)
 
+        # for executemany(), process any remaining batches, such as further
+        # chunks of a data frame or further data frames from an iterator
+        if op_type == PIPELINE_OP_TYPE_EXECUTE_MANY:
+            manager = op_impl.batch_load_manager
+            manager.next_batch()
+            while manager.num_rows > 0:
+                message_with_data.num_execs = manager.num_rows
+                message_with_data.offset = manager.message_offset
+                await protocol._process_message(message)
+                manager.next_batch()
+
         # populate the metadata for any partial types observed during the
         # execution of the pipeline
         if message_with_data.type_cache is not None:
@@ -800,28 +1235,72 @@ cdef class AsyncThinConnImpl(BaseThinConnImpl):
                                     Description description,
                                     ConnectParamsImpl params,
                                     str connect_string,
-                                    bint raise_exception):
+                                    bint raise_exception,
+                                    tuple transports=None):
         """
         Internal method used for connecting with the given description and
-        address.
+        address. If the connection cannot be established and an exception is
+        not to be raised, the exception that occurred is returned instead.
         """
         cdef:
             BaseAsyncProtocol protocol = <BaseAsyncProtocol> self._protocol
         try:
             await protocol._connect_phase_one(self, params, description,
-                                              address, connect_string)
+                                              address, connect_string,
+                                              transports)
         except (exceptions.DatabaseError, socket.gaierror,
                 ConnectionRefusedError) as e:
             if raise_exception:
                 errors._raise_err(errors.ERR_CONNECTION_FAILED, cause=e,
                                   connection_id=description.connection_id)
-            return 0
+            return e
         except Exception as e:
             errors._raise_err(errors.ERR_CONNECTION_FAILED, cause=e,
                               connection_id=description.connection_id)
         self._post_connect_phase_one(description, params)
         await self._protocol._connect_phase_two(self, description, params)
 
+    async def _connect_with_address_list(self, AddressList address_list,
+                                         Description description,
+                                         ConnectParamsImpl params,
+                                         str connect_string,
+                                         bint raise_exception):
+        """
+        Internal method used for connecting with the given description and
+        one of the addresses in the address list. Connections to the addresses
+        (including the TLS handshake for TCPS addresses) are raced and the
+        connection is established using the first one that succeeds. If the
+        listener at that address does not accept the connection, the race is
+        repeated with the remaining addresses. If no connection can be
+        established, the first error that occurred is raised, if applicable.
+        """
+        cdef:
+            BaseAsyncProtocol protocol = <BaseAsyncProtocol> self._protocol
+            list addresses = list(address_list.active_children)
+            object error, first_error = None
+            tuple transports
+            Address address
+        while addresses:
+            try:
+                transports, address = await protocol._race_connect(
+                    params, description, addresses
+                )
+            except OSError as e:
+                if first_error is None:
+                    first_error = e
+                break
+            addresses.remove(address)
+            error = await self._connect_with_address(address, description,
+                                                     params, connect_string,
+                                                     False, transports)
+            if not protocol._in_connect:
+                return 0
+            if first_error is None:
+                first_error = error
+        if raise_exception:
+            errors._raise_err(errors.ERR_CONNECTION_FAILED, cause=first_error,
+                              connection_id=description.connection_id)
+
     async def _connect_with_description(self, Description description,
                                         ConnectParamsImpl params,
                                         bint final_desc):
@@ -841,6 +1320,17 @@ cdef class AsyncThinConnImpl(BaseThinConnImpl):
         connect_string = _get_connect_data(description, self._connection_id, params)
         for i in range(num_attempts):
             for j, address_list in enumerate(description.active_children):
+                if _use_parallel_connect(address_list, description, params):
+                    if final_desc:
+                        raise_exc = i == num_attempts - 1 \
+                                and j == num_lists - 1
+                    await self._connect_with_address_list(address_list,
+                                                          description, params,
+                                                          connect_string,
+                                                          raise_exc)
+                    if not self._protocol._in_connect:
+                        return 0
+                    continue
                 num_addresses = len(address_list.active_children)
                 for k, address in enumerate(address_list.active_children):
                     if final_desc:
@@ -862,8 +1352,10 @@ cdef class AsyncThinConnImpl(BaseThinConnImpl):
             DescriptionList description_list = params.description_list
             ssize_t i, num_descriptions
             Description description
+            dict addr_infos
             bint final_desc
-        description_list.set_active_children()
+        addr_infos = await description_list.resolve_host_names_async()
+        description_list.set_active_children(addr_infos)
         num_descriptions = len(description_list.active_children)
         for i, description in enumerate(description_list.active_children):
             final_desc = (i == num_descriptions - 1)
@@ -872,109 +1364,6 @@ cdef class AsyncThinConnImpl(BaseThinConnImpl):
             if not self._protocol._in_connect:
                 break
 
-    cdef Message _create_message_for_pipeline_op(
-        self, object conn, PipelineOpImpl op_impl
-    ):
-        """
-        Creates a single message for a pipeline operation.
-        """
-        cdef:
-            AsyncThinCursorImpl cursor_impl
-            MessageWithData message
-            uint32_t num_execs = 1
-            object cursor
-        if op_impl.op_type == PIPELINE_OP_TYPE_COMMIT:
-            return self._create_message(CommitMessage)
-        cursor = conn.cursor()
-        cursor_impl = <AsyncThinCursorImpl> cursor._impl
-        if op_impl.op_type == PIPELINE_OP_TYPE_CALL_FUNC:
-            execute_args = cursor._call_get_execute_args(
-                op_impl.name,
-                op_impl.parameters,
-                op_impl.keyword_parameters,
-                cursor.var(op_impl.return_type)
-            )
-            cursor._prepare_for_execute(*execute_args)
-        elif op_impl.op_type == PIPELINE_OP_TYPE_CALL_PROC:
-            execute_args = cursor._call_get_execute_args(
-                op_impl.name,
-                op_impl.parameters,
-                op_impl.keyword_parameters
-            )
-            cursor._prepare_for_execute(*execute_args)
-        elif op_impl.op_type == PIPELINE_OP_TYPE_EXECUTE:
-            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
-        elif op_impl.op_type == PIPELINE_OP_TYPE_EXECUTE_MANY:
-            op_impl.batch_load_manager = cursor_impl._prepare_for_executemany(
-                cursor,
-                op_impl.statement,
-                op_impl.parameters,
-                2 ** 32 - 1
-            )
-            op_impl.num_execs = op_impl.batch_load_manager.num_rows
-            if not cursor_impl._statement.requires_single_execute():
-                num_execs = op_impl.num_execs
-        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_ONE:
-            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
-            cursor_impl.prefetchrows = 1
-            cursor_impl.arraysize = 1
-            cursor_impl.rowfactory = op_impl.rowfactory
-            cursor_impl.fetch_lobs = op_impl.fetch_lobs
-            cursor_impl.fetch_decimals = op_impl.fetch_decimals
-        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_MANY:
-            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
-            cursor_impl.prefetchrows = op_impl.num_rows
-            cursor_impl.arraysize = op_impl.num_rows
-            cursor_impl.rowfactory = op_impl.rowfactory
-            cursor_impl.fetch_lobs = op_impl.fetch_lobs
-            cursor_impl.fetch_decimals = op_impl.fetch_decimals
-        elif op_impl.op_type == PIPELINE_OP_TYPE_FETCH_ALL:
-            cursor._prepare_for_execute(op_impl.statement, op_impl.parameters)
-            cursor_impl.prefetchrows = op_impl.arraysize
-            cursor_impl.arraysize = op_impl.arraysize
-            cursor_impl.rowfactory = op_impl.rowfactory
-            cursor_impl.fetch_lobs = op_impl.fetch_lobs
-            cursor_impl.fetch_decimals = op_impl.fetch_decimals
-        else:
-            errors._raise_err(errors.ERR_UNSUPPORTED_PIPELINE_OPERATION,
-                              op_type=op_impl.op_type)
-        cursor_impl._preprocess_execute(conn)
-        message = cursor_impl._create_message(ExecuteMessage, cursor)
-        message.num_execs = num_execs
-        return message
-
-    cdef list _create_messages_for_pipeline(
-        self, object conn, list results, bint continue_on_error
-    ):
-        """
-        Creates a list of messages for the pipeline and returns them after they
-        have been submitted to the database for processing.
-        """
-        cdef:
-            PipelineOpResultImpl result_impl
-            PipelineOpImpl op_impl
-            uint64_t token_num
-            Message message
-            object result
-            list messages
-        messages = []
-        token_num = 1
-        for result in results:
-            result_impl = result._impl
-            op_impl = result_impl.operation
-            try:
-                message = self._create_message_for_pipeline_op(conn, op_impl)
-            except Exception as e:
-                if not continue_on_error:
-                    raise
-                result_impl._capture_err(e)
-                continue
-            message.pipeline_result_impl = result_impl
-            message.token_num = token_num
-            token_num += 1
-            messages.append(message)
-        return messages
-
     async def _run_pipeline_op_without_pipelining(
         self, object conn, PipelineOpResultImpl result_impl
     ):
@@ -1021,23 +1410,6 @@ cdef class AsyncThinConnImpl(BaseThinConnImpl):
         result_impl.warning = cursor.warning
         result_impl.fetch_metadata = cursor._impl.fetch_metadata
 
-    cdef int _send_messages_for_pipeline(
-        self, list messages, bint continue_on_error
-    ) except -1:
-        """
-        Sends the messages for the pipeline to the database for processing.
-        """
-        cdef:
-            BaseAsyncProtocol protocol = <BaseAsyncProtocol> self._protocol
-            Message message
-        for message in messages:
-            try:
-                message.send(protocol._write_buf)
-            except Exception as e:
-                if not continue_on_error:
-                    raise
-                message.pipeline_result_impl._capture_err(e)
-
     async def begin_sessionless_transaction(
         self,
         bytes transaction_id,
@@ -1160,6 +1532,40 @@ cdef class AsyncThinConnImpl(BaseThinConnImpl):
         message = self._create_message(PingMessage)
         await protocol._process_single_message(message)
 
+    async def read_lobs(self, list lob_impls):
+        """
+        Internal method for reading all of the data in each of the LOBs. When
+        the database supports pipelining, the read requests are sent to the
+        database without waiting for the responses, which are then processed
+        as they arrive, so that only one round-trip is required.
+        """
+        cdef:
+            BaseAsyncProtocol protocol = <BaseAsyncProtocol> self._protocol
+            list messages, read_messages = []
+            BaseThinLobImpl lob_impl
+            LobOpMessage message
+            list values = []
+            ssize_t i
+        messages = self._create_lob_read_messages(lob_impls, read_messages)
+        if len(read_messages) > 1 and protocol._caps.supports_pipelining:
+            async with protocol._request_lock:
+                protocol._read_buf.reset_packets()
+                self.pipeline_mode = TNS_PIPELINE_MODE_ABORT_ON_ERROR
+                self._send_messages_for_pipeline(read_messages, False)
+                await protocol.end_pipeline(self, read_messages, False)
+        else:
+            for message in read_messages:
+                await protocol._process_single_message(message)
+        for i, lob_impl in enumerate(lob_impls):
+            message = messages[i]
+            if message is None:
+                values.append(
+                    await lob_impl.read(1, lob_impl.get_max_amount())
+                )
+            else:
+                values.append(lob_impl._get_read_value(message))
+        return values
+
     async def resume_sessionless_transaction(
         self,
         bytes transaction_id,
@@ -1239,13 +1645,6 @@ cdef class AsyncThinConnImpl(BaseThinConnImpl):
     def set_call_timeout(self, uint32_t value):
         self._call_timeout = value
 
-    def supports_pipelining(self):
-        """
-        Returns whether the connection supports pipelining. Currently this is
-        only supported with asyncio and Oracle Database version 23, and later.
-        """
-        return self._protocol._caps.supports_pipelining
-
     async def suspend_sessionless_transaction(self):
         cdef:
             BaseAsyncProtocol protocol = <BaseAsyncProtocol> self._protocol
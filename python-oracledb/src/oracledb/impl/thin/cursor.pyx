@@ -29,6 +29,10 @@
 # thin_impl.pyx).
 #------------------------------------------------------------------------------
 
+# clock used to time round trips when adapting the number of rows fetched in
+# each round trip; it is a module attribute so that it can be replaced
+_adaptive_arraysize_clock = time.monotonic
+
 cdef class BaseThinCursorImpl(BaseCursorImpl):
 
     cdef:
@@ -42,6 +46,8 @@ cdef class BaseThinCursorImpl(BaseCursorImpl):
         uint32_t _num_columns
         uint32_t _last_row_index
         Rowid _lastrowid
+        ResultCacheEntry _result_cache_entry
+        uint64_t _result_cache_generation
 
     def __cinit__(self, conn_impl):
         self._conn_impl = conn_impl
@@ -51,6 +57,72 @@ cdef class BaseThinCursorImpl(BaseCursorImpl):
             self._conn_impl._return_statement(self._statement)
             self._statement = None
 
+    cdef object _check_result_cache(self, object cursor):
+        """
+        Checks the result cache of the pool from which the connection was
+        acquired, if one exists. If the results of the query being executed
+        are found in the cache they are made available for fetching and None
+        is returned. Otherwise, the key that should be used to cache the
+        results is returned, or None if the results cannot be cached. Only
+        queries that contain the RESULT_CACHE hint are cached.
+
+        The key includes the state of the session that can affect the results
+        of the query. Since the entry may have been created by a different
+        connection, the fetch variables are created from the metadata stored
+        in the entry; the fetch variables of the statement are restored on
+        the next execution.
+        """
+        cdef:
+            BaseThinConnImpl conn_impl = self._conn_impl
+            ResultCache cache = conn_impl._result_cache
+            Statement stmt = self._statement
+            OracleMetadata metadata
+            ResultCacheEntry entry
+            bint uses_metadata
+            BindVar bind_var
+            list bind_values
+            object key, value
+            ssize_t i
+        if self._result_cache_entry is not None:
+            self._result_cache_entry = None
+            self.fetch_metadata = stmt._fetch_metadata
+            self.fetch_vars = stmt._fetch_vars
+            self.fetch_var_impls = stmt._fetch_var_impls
+            self._num_columns = stmt._num_columns
+        if cache is None or not stmt._is_query or self.scrollable \
+                or self.fetching_arrow \
+                or conn_impl._session_state_unknown \
+                or conn_impl._protocol._txn_in_progress \
+                or self._get_output_type_handler(&uses_metadata) is not None \
+                or not re.search(RESULT_CACHE_HINT_REGEX, stmt._sql, re.I):
+            return None
+        bind_values = []
+        if self.bind_vars is not None:
+            for bind_var in self.bind_vars:
+                value = bind_var.var_impl._values[0]
+                if type(value) not in RESULT_CACHE_BIND_TYPES:
+                    return None
+                bind_values.append((type(value), value))
+        key = (stmt._sql, conn_impl.username, conn_impl.proxy_user,
+               conn_impl._current_schema, conn_impl._edition,
+               conn_impl._session_state_stmts, self.fetch_lobs,
+               self.fetch_decimals, tuple(bind_values))
+        entry = cache.get_entry(key)
+        if entry is None:
+            self._result_cache_generation = cache.get_generation()
+            return key
+        self._result_cache_entry = entry
+        self._num_columns = <uint32_t> len(entry.fetch_metadata)
+        self._init_fetch_vars(self._num_columns)
+        for i, metadata in enumerate(entry.fetch_metadata):
+            self._create_fetch_var(cursor.connection, cursor, None, False, i,
+                                   metadata)
+        self.rowcount = 0
+        self.warning = None
+        self._buffer_index = 0
+        self._buffer_rowcount = len(entry.rows)
+        self._more_rows_to_fetch = False
+
     cdef MessageWithData _create_message(self, type typ, object cursor):
         """
         Creates a message object that is used to send a request to the database
@@ -121,6 +193,62 @@ cdef class BaseThinCursorImpl(BaseCursorImpl):
         message.fetch_pos = <uint32_t> desired_row
         return message
 
+    cdef tuple _create_row_tuple(self):
+        """
+        Internal method for creating a tuple containing the values of the
+        current row. Rows for results found in the result cache are returned
+        directly from the cache entry; rows for results that are being cached
+        are added to the cache entry as they are created.
+        """
+        cdef:
+            ResultCacheEntry entry = self._result_cache_entry
+            tuple row
+        if entry is None:
+            return BaseCursorImpl._create_row_tuple(self)
+        elif entry.complete:
+            return entry.rows[self._buffer_index]
+        row = BaseCursorImpl._create_row_tuple(self)
+        entry.add_row(row)
+        if entry.size > self._conn_impl._result_cache._max_size:
+            self._result_cache_entry = None
+        elif self._buffer_rowcount == 1 and not self._more_rows_to_fetch:
+            self._conn_impl._result_cache.put_entry(entry)
+        return row
+
+    cdef int _fetch_block_rows(self, list columns,
+                               uint32_t num_rows) except -1:
+        """
+        Internal method for appending the values of the given number of rows
+        in the fetched data to the row block columns. Fixed width values that
+        were decoded directly into the typed buffers of the fetch variables
+        are copied without creating Python objects. When the result cache is
+        in use the rows are processed one at a time so that they can be
+        returned from or added to the cache entry.
+        """
+        cdef:
+            RowBlockColumnImpl column
+            ThinVarImpl var_impl
+            Py_ssize_t i
+            uint32_t j
+            tuple row
+        if self._result_cache_entry is not None:
+            for j in range(num_rows):
+                row = self._create_row_tuple()
+                for i in range(len(row)):
+                    (<RowBlockColumnImpl> columns[i]).append_value(row[i])
+                self._buffer_index += 1
+                self._buffer_rowcount -= 1
+                self.rowcount += 1
+            return 0
+        for i, var_impl in enumerate(self.fetch_var_impls):
+            column = columns[i]
+            for j in range(num_rows):
+                var_impl._append_row_block_value(column,
+                                                 self._buffer_index + j)
+        self._buffer_index += num_rows
+        self._buffer_rowcount -= num_rows
+        self.rowcount += num_rows
+
     cdef BaseVarImpl _create_var_impl(self, object conn):
         cdef ThinVarImpl var_impl
         var_impl = ThinVarImpl.__new__(ThinVarImpl)
@@ -207,6 +335,88 @@ cdef class BaseThinCursorImpl(BaseCursorImpl):
             self._buffer_max_row = self._buffer_min_row + self._buffer_rowcount
             self._buffer_index = 0
 
+    cdef uint32_t _adapt_array_size(self, uint32_t array_size,
+                                    uint64_t num_bytes, double elapsed_time,
+                                    double *time_per_row):
+        """
+        Returns the number of rows to request in the next round trip of the
+        same kind for the statement, given the number of rows requested by
+        the round trip that has just completed, the number of bytes of row
+        data it returned and the time it took. The number of rows is doubled
+        while the batch was full, more rows remain to be fetched and doing so
+        reduces the time taken per row; it never exceeds the number of rows
+        that fit in the configured number of bytes. The time taken per row is
+        updated in place.
+        """
+        cdef:
+            uint32_t max_array_size = array_size
+            Statement stmt = self._statement
+            double row_time, row_size
+        if self._buffer_rowcount == 0:
+            return array_size
+        row_size = <double> num_bytes / self._buffer_rowcount
+        row_time = elapsed_time / self._buffer_rowcount
+        if stmt._fetch_row_size == 0:
+            stmt._fetch_row_size = row_size
+        else:
+            stmt._fetch_row_size = (stmt._fetch_row_size + row_size) / 2
+        if stmt._fetch_row_size > 0:
+            max_array_size = <uint32_t> max(
+                1, min(C_DEFAULTS.adaptive_arraysize_max_bytes
+                       / stmt._fetch_row_size, 2 ** 32 - 1)
+            )
+        if array_size > max_array_size:
+            array_size = max_array_size
+        elif self._more_rows_to_fetch \
+                and self._buffer_rowcount >= array_size \
+                and (time_per_row[0] == 0
+                     or row_time < time_per_row[0] * 0.9):
+            array_size = min(array_size * 2, max_array_size)
+        time_per_row[0] = row_time
+        return array_size
+
+    cdef int _adapt_fetch_array_size(self, MessageWithData message,
+                                     double start_time) except -1:
+        """
+        Adapts the number of rows fetched in each fetch round trip for the
+        statement after a fetch has completed.
+        """
+        cdef Statement stmt = self._statement
+        stmt._adaptive_fetch_array_size = self._adapt_array_size(
+            self._fetch_array_size,
+            message.num_row_bytes,
+            _adaptive_arraysize_clock() - start_time,
+            &stmt._fetch_time_per_row
+        )
+
+    cdef int _adapt_prefetch_rows(self, ExecuteMessage message,
+                                  double start_time) except -1:
+        """
+        Adapts the number of rows fetched by the execute round trip for the
+        statement after an execute has completed. Nothing is done if that
+        round trip did not fetch any rows.
+        """
+        cdef Statement stmt = self._statement
+        if message.num_prefetch_rows == 0:
+            return 0
+        stmt._adaptive_prefetch_rows = self._adapt_array_size(
+            message.num_prefetch_rows,
+            message.num_row_bytes,
+            _adaptive_arraysize_clock() - start_time,
+            &stmt._prefetch_time_per_row
+        )
+
+    cdef uint32_t _get_fetch_array_size(self):
+        """
+        Returns the number of rows to fetch in each round trip. This is the
+        value of arraysize unless the fetch array size is being adapted for
+        the statement.
+        """
+        if self._uses_adaptive_fetch_array_size() \
+                and self._statement._adaptive_fetch_array_size > 0:
+            return self._statement._adaptive_fetch_array_size
+        return self.arraysize
+
     cdef int _set_fetch_array_size(self, uint32_t value):
         """
         Internal method for setting the fetch array size. This also ensures
@@ -225,6 +435,73 @@ cdef class BaseThinCursorImpl(BaseCursorImpl):
                 var_impl.num_elements = self._fetch_array_size
                 var_impl._values.extend([None] * num_vals)
 
+    cdef int _start_result_cache_entry(self, object key) except -1:
+        """
+        Called after a query has been executed and its results were not found
+        in the result cache. If the results can be cached, an entry is created
+        which is populated as the rows are fetched and stored in the cache
+        once all of the rows have been fetched. Columns containing values that
+        refer to the connection or that are mutable prevent caching, as do
+        queries that lock rows, queries of the data dictionary and queries
+        that reference functions which are not deterministic.
+        """
+        cdef:
+            OracleMetadata metadata
+            frozenset identifiers
+            str identifier
+        for metadata in self.fetch_metadata:
+            if metadata.dbtype._ora_type_num in (ORA_TYPE_NUM_BFILE,
+                                                 ORA_TYPE_NUM_BLOB,
+                                                 ORA_TYPE_NUM_CLOB,
+                                                 ORA_TYPE_NUM_CURSOR,
+                                                 ORA_TYPE_NUM_JSON,
+                                                 ORA_TYPE_NUM_OBJECT,
+                                                 ORA_TYPE_NUM_VECTOR):
+                return 0
+        if re.search(r"\bFOR\s+UPDATE\b", self._statement._sql, re.I):
+            return 0
+        identifiers = _get_result_cache_identifiers(self._statement._sql)
+        if not identifiers.isdisjoint(NON_DETERMINISTIC_IDENTIFIERS):
+            return 0
+        for identifier in identifiers:
+            if identifier.startswith(DICTIONARY_VIEW_PREFIXES):
+                return 0
+        self._result_cache_entry = \
+                self._conn_impl._result_cache.create_entry(
+                    key, list(self.fetch_metadata), identifiers,
+                    self._result_cache_generation
+                )
+        self._store_result_cache_entry()
+
+    cdef int _store_result_cache_entry(self) except -1:
+        """
+        Stores the entry being populated in the result cache if all of the
+        rows have been fetched and no rows remain in the buffer.
+        """
+        cdef ResultCacheEntry entry = self._result_cache_entry
+        if entry is not None and not entry.complete \
+                and self._buffer_rowcount == 0 \
+                and not self._more_rows_to_fetch:
+            self._conn_impl._result_cache.put_entry(entry)
+
+    cdef bint _uses_adaptive_prefetch_rows(self):
+        """
+        Returns whether the number of rows fetched by the execute round trip is
+        adapted for the statement. This is only the case for queries when the
+        fetch array size is also adapted and prefetching is enabled.
+        """
+        return self._statement._is_query and self.prefetchrows > 0 \
+                and self._uses_adaptive_fetch_array_size()
+
+    cdef bint _uses_adaptive_fetch_array_size(self):
+        """
+        Returns whether the fetch array size is adapted for the statement.
+        Scrollable cursors and fetches into data frames always use the
+        requested size.
+        """
+        return C_DEFAULTS.adaptive_arraysize and not self.scrollable \
+                and not self.fetching_arrow
+
     def get_array_dml_row_counts(self):
         if self._dmlrowcounts is None:
             errors._raise_err(errors.ERR_ARRAY_DML_ROW_COUNTS_NOT_ENABLED)
@@ -258,27 +535,47 @@ cdef class ThinCursorImpl(BaseThinCursorImpl):
         """
         cdef:
             Protocol protocol = <Protocol> self._conn_impl._protocol
+            bint adapt_fetch_array_size = False
             MessageWithData message
+            double start_time = 0
         if self._statement._sql is None or self.scrollable:
             message = self._create_execute_message(cursor)
         else:
             message = self._create_message(FetchMessage, cursor)
+            adapt_fetch_array_size = self._uses_adaptive_fetch_array_size()
+        if adapt_fetch_array_size:
+            start_time = _adaptive_arraysize_clock()
         protocol._process_single_message(message)
+        if adapt_fetch_array_size:
+            self._adapt_fetch_array_size(message, start_time)
         self._buffer_min_row = self.rowcount + 1
         self._buffer_max_row = self._buffer_min_row + self._buffer_rowcount
+        self._store_result_cache_entry()
 
     def execute(self, cursor):
         cdef:
             Protocol protocol = <Protocol> self._conn_impl._protocol
             object conn = cursor.connection
-            MessageWithData message
+            ExecuteMessage message
+            double start_time = 0
+            object key
         self._preprocess_execute(conn)
+        key = self._check_result_cache(cursor)
+        if self._result_cache_entry is not None:
+            return
         message = self._create_execute_message(cursor)
+        message.adapt_prefetch_rows = self._uses_adaptive_prefetch_rows()
+        if message.adapt_prefetch_rows:
+            start_time = _adaptive_arraysize_clock()
         protocol._process_single_message(message)
+        if message.adapt_prefetch_rows:
+            self._adapt_prefetch_rows(message, start_time)
         self.warning = message.warning
         if self._statement._is_query:
             if message.type_cache is not None:
                 message.type_cache.populate_partial_types(conn)
+            if key is not None:
+                self._start_result_cache_entry(key)
 
     def executemany(self, object cursor, uint32_t num_execs, bint batcherrors,
                     bint arraydmlrowcounts, uint32_t offset=0):
@@ -356,13 +653,24 @@ cdef class AsyncThinCursorImpl(BaseThinCursorImpl):
         """
         Internal method used for fetching rows from the database.
         """
-        cdef MessageWithData message
+        cdef:
+            bint adapt_fetch_array_size = False
+            BaseAsyncProtocol protocol
+            MessageWithData message
+            double start_time = 0
+        protocol = <BaseAsyncProtocol> self._conn_impl._protocol
         if self._statement._sql is None or self.scrollable:
             message = self._create_execute_message(cursor)
         else:
             message = self._create_message(FetchMessage, cursor)
-        await self._conn_impl._protocol._process_single_message(message)
+            adapt_fetch_array_size = self._uses_adaptive_fetch_array_size()
+        if adapt_fetch_array_size:
+            start_time = _adaptive_arraysize_clock()
+        await protocol._process_single_message(message)
+        if adapt_fetch_array_size:
+            self._adapt_fetch_array_size(message, start_time)
         self._buffer_min_row = self.rowcount + 1
+        self._store_result_cache_entry()
 
     async def _preprocess_execute_async(self, object conn):
         """
@@ -385,15 +693,27 @@ cdef class AsyncThinCursorImpl(BaseThinCursorImpl):
         cdef:
             object conn = cursor.connection
             BaseAsyncProtocol protocol
-            MessageWithData message
+            ExecuteMessage message
+            double start_time = 0
+            object key
         protocol = <BaseAsyncProtocol> self._conn_impl._protocol
         await self._preprocess_execute_async(conn)
+        key = self._check_result_cache(cursor)
+        if self._result_cache_entry is not None:
+            return
         message = self._create_execute_message(cursor)
+        message.adapt_prefetch_rows = self._uses_adaptive_prefetch_rows()
+        if message.adapt_prefetch_rows:
+            start_time = _adaptive_arraysize_clock()
         await protocol._process_single_message(message)
+        if message.adapt_prefetch_rows:
+            self._adapt_prefetch_rows(message, start_time)
         self.warning = message.warning
         if self._statement._is_query:
             if message.type_cache is not None:
                 await message.type_cache.populate_partial_types(conn)
+            if key is not None:
+                self._start_result_cache_entry(key)
 
     async def executemany(self, object cursor, uint32_t num_execs,
                           bint batcherrors, bint arraydmlrowcounts,
@@ -457,6 +777,35 @@ cdef class AsyncThinCursorImpl(BaseThinCursorImpl):
             if self._buffer_rowcount > 0:
                 yield self._finish_building_arrow_arrays()
 
+    async def fetch_block(self, cursor, uint32_t size):
+        """
+        Internal method used for fetching up to the given number of rows from
+        a cursor as a column-oriented block.
+        """
+        cdef:
+            uint32_t num_rows, total_rows = 0
+            BaseVarImpl var_impl
+            list columns
+        columns = [
+            RowBlockColumnImpl._create(get_row_block_column_kind(var_impl))
+            for var_impl in self.fetch_var_impls
+        ]
+        while total_rows < size:
+            if self._buffer_rowcount == 0:
+                if not self._more_rows_to_fetch:
+                    break
+                self._fetching_block = True
+                try:
+                    await self._fetch_rows_async(cursor)
+                finally:
+                    self._fetching_block = False
+                if self._buffer_rowcount == 0:
+                    break
+            num_rows = min(size - total_rows, self._buffer_rowcount)
+            self._fetch_block_rows(columns, num_rows)
+            total_rows += num_rows
+        return RowBlockImpl._create(columns, total_rows, self.rowfactory)
+
     async def fetch_next_row(self, cursor):
         """
         Internal method used for fetching the next row from a cursor.
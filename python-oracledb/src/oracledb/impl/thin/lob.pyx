@@ -32,7 +32,7 @@
 cdef class BaseThinLobImpl(BaseLobImpl):
 
     cdef:
-        BaseThinConnImpl _conn_impl
+        readonly BaseThinConnImpl _conn_impl
         bytes _locator
         bint _has_metadata
         uint64_t _size
@@ -206,6 +206,17 @@ cdef class BaseThinLobImpl(BaseLobImpl):
             return ENCODING_UTF16
         return ENCODING_UTF8
 
+    cdef object _get_read_value(self, LobOpMessage message):
+        """
+        Returns the value read from the LOB by the given read message.
+        """
+        if message.data is None:
+            if self.dbtype._ora_type_num in (ORA_TYPE_NUM_BLOB,
+                                             ORA_TYPE_NUM_BFILE):
+                return b""
+            return ""
+        return message.data
+
     def free_lob(self):
         """
         Internal method for closing a temp LOB during the next piggyback.
@@ -350,12 +361,7 @@ cdef class ThinLobImpl(BaseThinLobImpl):
         self._process_message(message)
         if should_close:
             self.close()
-        if message.data is None:
-            if self.dbtype._ora_type_num in (ORA_TYPE_NUM_BLOB,
-                                             ORA_TYPE_NUM_BFILE):
-                return b""
-            return ""
-        return message.data
+        return self._get_read_value(message)
 
     def trim(self, uint64_t new_size):
         """
@@ -465,12 +471,7 @@ cdef class AsyncThinLobImpl(BaseThinLobImpl):
         await self._process_message(message)
         if should_close:
             await self.close()
-        if message.data is None:
-            if self.dbtype._ora_type_num in (ORA_TYPE_NUM_BLOB,
-                                             ORA_TYPE_NUM_BFILE):
-                return b""
-            return ""
-        return message.data
+        return self._get_read_value(message)
 
     async def trim(self, uint64_t new_size):
         """
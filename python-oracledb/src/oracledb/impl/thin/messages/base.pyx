@@ -79,9 +79,12 @@ cdef class Message:
         uint32_t call_status
         uint16_t end_to_end_seq_num
         uint64_t token_num
+        uint32_t num_piggybacks_sent
+        uint32_t num_piggybacks_received
         bint end_of_response
         bint error_occurred
         bint flush_out_binds
+        bint in_pipeline
         bint resend
         bint retry
         object warning
@@ -395,6 +398,7 @@ cdef class Message:
             uint16_t num_elements, i, temp16
             uint32_t num_bytes, flags
             uint8_t opcode
+        self.num_piggybacks_received += 1
         buf.read_ub1(&opcode)
         if opcode == TNS_SERVER_PIGGYBACK_LTXID:
             self.conn_impl._ltxid = buf.read_bytes_with_length()
@@ -441,6 +445,8 @@ cdef class Message:
             if flags & TNS_SESSGET_SESSION_CHANGED:
                 if self.conn_impl._drcp_establish_session:
                     self.conn_impl._statement_cache.clear_open_cursors()
+                self.conn_impl._session_state_stmts = ()
+                self.conn_impl._session_state_unknown = False
             self.conn_impl._drcp_establish_session = False
             buf.read_ub4(&self.conn_impl._session_id)
             buf.read_ub2(&self.conn_impl._serial_num)
@@ -684,6 +690,7 @@ cdef class Message:
         """
         Writes the header for piggybacks for the specified function code.
         """
+        self.num_piggybacks_sent += 1
         buf.write_uint8(TNS_MSG_TYPE_PIGGYBACK)
         buf.write_uint8(code)
         buf.write_seq_num()
@@ -769,7 +776,7 @@ cdef class Message:
     cdef int send(self, WriteBuffer buf) except -1:
         buf.start_request(TNS_PACKET_TYPE_DATA)
         self._write_message(buf)
-        if self.pipeline_result_impl is not None:
+        if self.in_pipeline:
             buf._data_flags |= TNS_DATA_FLAGS_END_OF_REQUEST
         buf.end_request()
 
@@ -790,6 +797,7 @@ cdef class MessageWithData(Message):
         bint parse_only
         object cursor
         uint32_t offset
+        uint64_t num_row_bytes
 
     cdef int _adjust_metadata(self, ThinVarImpl prev_var_impl,
                               OracleMetadata metadata) except -1:
@@ -984,6 +992,11 @@ cdef class MessageWithData(Message):
         if cursor_impl.fetching_arrow:
             cursor_impl._create_arrow_arrays()
 
+        # prepare the typed buffers used when fetching rows into a row block
+        for var_impl in cursor_impl.fetch_var_impls:
+            var_impl._prepare_row_block_values(cursor_impl._fetching_block,
+                                               cursor_impl._last_row_index)
+
         # the list of output variables is equivalent to the fetch variables
         self.out_var_impls = cursor_impl.fetch_var_impls
 
@@ -1084,6 +1097,9 @@ cdef class MessageWithData(Message):
                 convert_oracle_data_to_arrow(
                     metadata, var_impl.metadata, &data, var_impl._arrow_array
                 )
+            elif self.in_fetch and var_impl._row_block_states is not None:
+                column_value = var_impl._set_row_block_value(pos, metadata,
+                                                             &data)
             else:
                 column_value = convert_oracle_data_to_python(
                     metadata, var_impl.metadata, &data,
@@ -1123,7 +1139,8 @@ cdef class MessageWithData(Message):
         if cursor_impl._num_columns > 0:
             buf.skip_ub1()
         type_handler = cursor_impl._get_output_type_handler(&uses_metadata)
-        conn = self.cursor.connection
+        if type_handler is not None:
+            conn = self.cursor.connection
         for i in range(cursor_impl._num_columns):
             metadata = self._process_metadata(buf)
             if prev_fetch_var_impls is not None \
@@ -1237,10 +1254,13 @@ cdef class MessageWithData(Message):
 
     cdef int _process_message(self, ReadBuffer buf,
                               uint8_t message_type) except -1:
+        cdef uint64_t num_bytes
         if message_type == TNS_MSG_TYPE_ROW_HEADER:
             self._process_row_header(buf)
         elif message_type == TNS_MSG_TYPE_ROW_DATA:
+            num_bytes = buf.get_num_bytes_read()
             self._process_row_data(buf)
+            self.num_row_bytes += buf.get_num_bytes_read() - num_bytes
         elif message_type == TNS_MSG_TYPE_FLUSH_OUT_BINDS:
             self.flush_out_binds = True
             self.end_of_response = True
@@ -1318,6 +1338,10 @@ cdef class MessageWithData(Message):
                 else:
                     value = var_impl._values[self.cursor_impl._last_row_index]
                 var_impl._values[self.row_index] = value
+                if var_impl._row_block_states is not None:
+                    var_impl._copy_row_block_value(
+                        self.cursor_impl._last_row_index, self.row_index
+                    )
             else:
                 value = self._process_column_data(buf, var_impl,
                                                   self.row_index)
@@ -1402,6 +1426,115 @@ cdef class MessageWithData(Message):
             if buf._caps.ttc_field_version >= TNS_CCAP_FIELD_VERSION_12_2:
                 buf.write_ub4(0)            # oaccolid
 
+    cdef int _write_arrow_bind_param(self, WriteBuffer buf,
+                                     OracleMetadata metadata,
+                                     ArrowArrayImpl array_impl,
+                                     uint32_t offset) except -1:
+        """
+        Writes a bind value stored in an Arrow array directly to the buffer,
+        without creating any intermediate Python objects. This is done for
+        numeric data being bound as NUMBER and for temporal data being bound as
+        DATE or TIMESTAMP; other data is either already transferred directly
+        from the Arrow buffers or requires conversion. Returns 1 if the value
+        was written and 0 if the generic conversion must be used instead.
+        """
+        cdef:
+            int64_t int_value, days, seconds, time_factor
+            uint8_t ora_type_num, length
+            ArrowType arrow_type
+            uint64_t uint_value
+            ssize_t text_len
+            uint32_t fsecond
+            double dbl_value
+            float flt_value
+            char *dbl_text
+            char text[64]
+            bint is_null
+        arrow_type = metadata._schema_impl.arrow_type
+        ora_type_num = metadata.dbtype._ora_type_num
+        if ora_type_num == ORA_TYPE_NUM_NUMBER \
+                or ora_type_num == ORA_TYPE_NUM_BINARY_INTEGER:
+            if arrow_type in (
+                NANOARROW_TYPE_INT8,
+                NANOARROW_TYPE_INT16,
+                NANOARROW_TYPE_INT32,
+                NANOARROW_TYPE_INT64,
+            ):
+                array_impl.get_int(arrow_type, offset, &is_null, &int_value)
+                if not is_null:
+                    text_len = PyOS_snprintf(text, sizeof(text), "%lld",
+                                             int_value)
+            elif arrow_type in (
+                NANOARROW_TYPE_UINT8,
+                NANOARROW_TYPE_UINT16,
+                NANOARROW_TYPE_UINT32,
+                NANOARROW_TYPE_UINT64,
+            ):
+                array_impl.get_uint(arrow_type, offset, &is_null, &uint_value)
+                if not is_null:
+                    text_len = PyOS_snprintf(text, sizeof(text), "%llu",
+                                             uint_value)
+            elif arrow_type == NANOARROW_TYPE_DECIMAL128:
+                array_impl.get_decimal_text(offset, &is_null, text,
+                                            sizeof(text), &text_len)
+            elif arrow_type in (NANOARROW_TYPE_DOUBLE, NANOARROW_TYPE_FLOAT):
+                if arrow_type == NANOARROW_TYPE_DOUBLE:
+                    array_impl.get_double(offset, &is_null, &dbl_value)
+                else:
+                    array_impl.get_float(offset, &is_null, &flt_value)
+                    dbl_value = flt_value
+                if not is_null:
+                    dbl_text = PyOS_double_to_string(dbl_value, b'r', 0, 0,
+                                                     NULL)
+                    try:
+                        buf.write_oracle_number_text(<char_type*> dbl_text,
+                                                     strlen(dbl_text))
+                    finally:
+                        PyMem_Free(dbl_text)
+                    return 1
+            else:
+                return 0
+            if is_null:
+                buf.write_uint8(0)
+            else:
+                buf.write_oracle_number_text(<char_type*> text, text_len)
+            return 1
+        elif ora_type_num == ORA_TYPE_NUM_DATE \
+                or ora_type_num == ORA_TYPE_NUM_TIMESTAMP \
+                or ora_type_num == ORA_TYPE_NUM_TIMESTAMP_TZ \
+                or ora_type_num == ORA_TYPE_NUM_TIMESTAMP_LTZ:
+            if arrow_type not in (
+                NANOARROW_TYPE_DATE32,
+                NANOARROW_TYPE_DATE64,
+                NANOARROW_TYPE_TIMESTAMP,
+            ):
+                return 0
+            array_impl.get_int(arrow_type, offset, &is_null, &int_value)
+            if is_null:
+                buf.write_uint8(0)
+                return 1
+            fsecond = 0
+            if arrow_type == NANOARROW_TYPE_DATE32:
+                days = int_value
+                seconds = 0
+            else:
+                time_factor = array_impl.schema_impl.time_factor
+                seconds = int_value // time_factor
+                int_value = int_value % time_factor
+                if time_factor == 1_000:
+                    fsecond = <uint32_t> (int_value * 1_000_000)
+                elif time_factor == 1_000_000:
+                    fsecond = <uint32_t> (int_value * 1_000)
+                elif time_factor == 1_000_000_000:
+                    fsecond = <uint32_t> ((int_value // 1_000) * 1_000)
+                days = seconds // (24 * 60 * 60)
+                seconds = seconds % (24 * 60 * 60)
+            length = metadata.dbtype._buffer_size_factor
+            buf.write_oracle_date_from_epoch(days, <uint32_t> seconds,
+                                             fsecond, length)
+            return 1
+        return 0
+
     cdef int _write_bind_params_column(self, WriteBuffer buf,
                                        ThinVarImpl var_impl,
                                        uint32_t offset) except -1:
@@ -1418,6 +1551,9 @@ cdef class MessageWithData(Message):
             object value
         metadata = var_impl.metadata
         if var_impl._arrow_array is not None:
+            if self._write_arrow_bind_param(buf, metadata,
+                                            var_impl._arrow_array, offset):
+                return 0
             value = convert_arrow_to_oracle_data(metadata, &data,
                                                  var_impl._arrow_array, offset)
         else:
@@ -1487,7 +1623,8 @@ cdef class MessageWithData(Message):
         elif ora_type_num == ORA_TYPE_NUM_OBJECT:
             buf.write_dbobject(value._impl)
         elif ora_type_num == ORA_TYPE_NUM_JSON:
-            buf.write_oson(value, self.conn_impl._oson_max_fname_size)
+            buf.write_oson(value, self.conn_impl._oson_max_fname_size, True,
+                           self.conn_impl._oson_fnames_cache)
         elif ora_type_num == ORA_TYPE_NUM_VECTOR:
             buf.write_vector(value)
         else:
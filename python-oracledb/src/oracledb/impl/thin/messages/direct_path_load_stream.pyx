@@ -226,7 +226,8 @@ cdef class PieceBuffer(Buffer):
         elif ora_type_num == ORA_TYPE_NUM_BOOLEAN:
             self.write_bool(data.buffer.as_bool)
         elif ora_type_num == ORA_TYPE_NUM_JSON:
-            self.write_oson(value, conn_impl._oson_max_fname_size)
+            self.write_oson(value, conn_impl._oson_max_fname_size, True,
+                            conn_impl._oson_fnames_cache)
         elif ora_type_num == ORA_TYPE_NUM_VECTOR:
             self.write_vector(value)
         else:
@@ -35,8 +35,21 @@ cdef class ExecuteMessage(MessageWithData):
     cdef:
         uint32_t fetch_orientation
         uint32_t fetch_pos
+        uint32_t num_prefetch_rows
+        bint adapt_prefetch_rows
         bint scroll_operation
 
+    cdef uint32_t _get_prefetch_rows(self):
+        """
+        Returns the number of rows to fetch in the execute round trip. This is
+        the value of prefetchrows unless the number of rows is being adapted
+        for the statement.
+        """
+        cdef Statement stmt = self.cursor_impl._statement
+        if self.adapt_prefetch_rows and stmt._adaptive_prefetch_rows > 0:
+            return stmt._adaptive_prefetch_rows
+        return self.cursor_impl.prefetchrows
+
     cdef _handle_sessionless_suspend(self):
         """
         Suspend the active sessionless transaction after execution of a
@@ -91,9 +104,10 @@ cdef class ExecuteMessage(MessageWithData):
                 options |= TNS_EXEC_OPTION_DESCRIBE
             else:
                 if stmt._cursor_id == 0 or stmt._requires_define:
-                    num_iters = self.cursor_impl.prefetchrows
+                    num_iters = self._get_prefetch_rows()
+                    self.num_prefetch_rows = num_iters
                 else:
-                    num_iters = self.cursor_impl.arraysize
+                    num_iters = self.cursor_impl._get_fetch_array_size()
                 self.cursor_impl._set_fetch_array_size(num_iters)
                 if num_iters > 0 and not stmt._no_prefetch:
                     options |= TNS_EXEC_OPTION_FETCH
@@ -222,7 +236,8 @@ cdef class ExecuteMessage(MessageWithData):
                       and not info._is_return_bind]
         if self.function_code == TNS_FUNC_REEXECUTE_AND_FETCH:
             options_1 |= TNS_EXEC_OPTION_EXECUTE
-            num_iters = self.cursor_impl.prefetchrows
+            num_iters = self._get_prefetch_rows()
+            self.num_prefetch_rows = num_iters
             self.cursor_impl._set_fetch_array_size(num_iters)
         else:
             if self.conn_impl.autocommit:
@@ -258,6 +273,9 @@ cdef class ExecuteMessage(MessageWithData):
         """
         cdef:
             Statement stmt = self.cursor_impl._statement
+        self.num_prefetch_rows = 0
+        if self.conn_impl._result_cache is not None and not self.parse_only:
+            self.conn_impl._update_session_state(stmt)
         if stmt._cursor_id == 0 or not stmt._executed \
                 or stmt._sql is None \
                 or stmt._no_prefetch \
@@ -40,7 +40,9 @@ cdef class FetchMessage(MessageWithData):
         self.function_code = TNS_FUNC_FETCH
 
     cdef int _write_message(self, WriteBuffer buf) except -1:
-        self.cursor_impl._set_fetch_array_size(self.cursor_impl.arraysize)
+        self.cursor_impl._set_fetch_array_size(
+            self.cursor_impl._get_fetch_array_size()
+        )
         self._write_function_code(buf)
         if self.cursor_impl._statement._cursor_id == 0:
             errors._raise_err(errors.ERR_CURSOR_HAS_BEEN_CLOSED)
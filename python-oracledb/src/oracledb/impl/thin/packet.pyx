@@ -53,7 +53,7 @@ cdef class Packet:
         uint32_t packet_size
         uint8_t packet_type
         uint8_t packet_flags
-        bytes buf
+        bytearray buf
 
     cdef inline bint has_end_of_response(self):
         """
@@ -63,7 +63,7 @@ cdef class Packet:
         cdef:
             uint16_t flags
             char *ptr
-        ptr = cpython.PyBytes_AS_STRING(self.buf)
+        ptr = <char*> self.buf
         flags = decode_uint16be(<const char_type*> &ptr[PACKET_HEADER_SIZE])
         if flags & TNS_DATA_FLAGS_END_OF_RESPONSE or flags & TNS_DATA_FLAGS_EOF:
             return True
@@ -197,6 +197,8 @@ cdef class ReadBuffer(Buffer):
 
     cdef:
         ssize_t _saved_packet_pos, _next_packet_pos, _saved_pos
+        ssize_t _packet_data_pos
+        uint64_t _num_bytes_read
         ChunkedBytesBuffer _chunked_bytes_buf
         const char_type _split_data[255]
         uint32_t _pending_error_num
@@ -334,7 +336,7 @@ cdef class ReadBuffer(Buffer):
             uint16_t control_type
             Buffer buf
         buf = Buffer.__new__(Buffer)
-        buf._populate_from_bytes(packet.buf)
+        buf._populate_from_bytearray(packet.buf)
         buf.skip_raw_bytes(8)               # skip packet header
         buf.read_uint16be(&control_type)
         if control_type == TNS_CONTROL_TYPE_RESET_OOB:
@@ -393,14 +395,16 @@ cdef class ReadBuffer(Buffer):
         Starts a packet. This prepares the current packet for processing.
         """
         cdef uint16_t data_flags
+        self._num_bytes_read += self._size - self._packet_data_pos
         self._current_packet = self._saved_packets[self._next_packet_pos]
         self._next_packet_pos += 1
-        self._populate_from_bytes(self._current_packet.buf)
+        self._populate_from_bytearray(self._current_packet.buf)
         self._pos = PACKET_HEADER_SIZE
         if self._current_packet.packet_type == TNS_PACKET_TYPE_DATA:
             self.read_uint16be(&data_flags)
             if data_flags == TNS_DATA_FLAGS_EOF:
                 self._pending_error_num = TNS_ERR_SESSION_SHUTDOWN
+        self._packet_data_pos = self._pos
 
     async def discard_pipeline_responses(self, ssize_t num_responses):
         """
@@ -417,6 +421,20 @@ cdef class ReadBuffer(Buffer):
             num_responses -= 1
         self.reset_packets()
 
+    cdef int discard_pipeline_responses_sync(self,
+                                             ssize_t num_responses) except -1:
+        """
+        Discards the specified number of responses after the pipeline has
+        encountered an exception (synchronously).
+        """
+        while num_responses > 0:
+            while True:
+                self.wait_for_packets_sync()
+                if self._current_packet.has_end_of_response():
+                    break
+            num_responses -= 1
+        self.reset_packets()
+
     cdef int notify_packet_received(self) except -1:
         """
         Notify the registered waiter that a packet has been received. This is
@@ -474,7 +492,7 @@ cdef class ReadBuffer(Buffer):
             data = self.read_bytes()
             self.read_bytes()           # LOB locator (unused)
             decoder = OsonDecoder.__new__(OsonDecoder)
-            return decoder.decode(data)
+            return decoder.decode(data, C_DEFAULTS.fetch_lazy_json)
 
     cdef object read_lob_with_length(self, BaseThinConnImpl conn_impl,
                                      DbType dbtype, object lob):
@@ -662,6 +680,15 @@ cdef class ReadBuffer(Buffer):
             if notify_waiter:
                 self._start_packet()
 
+    cdef inline uint64_t get_num_bytes_read(self):
+        """
+        Returns the number of bytes of data read from the packets that have
+        been processed. Packet headers are excluded so that the difference
+        between two calls gives the size of the data read in between, even if
+        that data spans multiple packets.
+        """
+        return self._num_bytes_read + self._pos - self._packet_data_pos
+
     cdef bint has_response(self):
         """
         Returns a boolean indicating if the list of saved packets contains all
@@ -696,7 +723,7 @@ cdef class ReadBuffer(Buffer):
         """
         if self._saved_packet_pos != self._next_packet_pos - 1:
             self._current_packet = self._saved_packets[self._saved_packet_pos]
-            self._populate_from_bytes(self._current_packet.buf)
+            self._populate_from_bytearray(self._current_packet.buf)
             self._next_packet_pos = self._saved_packet_pos + 1
         self._pos = self._saved_pos
 
@@ -942,13 +969,14 @@ cdef class WriteBuffer(Buffer):
         self.write_uint64be(0)              # unused
 
     cdef int write_oson(self, value, ssize_t max_fname_size,
-                        bint write_length=True) except -1:
+                        bint write_length=True,
+                        OsonFieldNamesCache fnames_cache=None) except -1:
         """
         Encodes the given value to OSON and then writes that to the buffer.
         it.
         """
         cdef OsonEncoder encoder = OsonEncoder.__new__(OsonEncoder)
-        encoder.encode(value, max_fname_size)
+        encoder.encode(value, max_fname_size, fnames_cache)
         self.write_qlocator(encoder._pos, write_length)
         self._write_raw_bytes_and_length(encoder._data, encoder._pos)
 
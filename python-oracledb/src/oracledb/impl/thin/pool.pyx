@@ -37,6 +37,7 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         list _busy_conn_impls
         list _conn_impls_to_drop
         list _requests
+        list _warmup_statements
         uint32_t _getmode
         uint32_t _stmt_cache_size
         uint32_t _timeout
@@ -44,6 +45,7 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         uint32_t _auth_mode
         uint32_t _open_count
         uint32_t _num_to_create
+        uint32_t _creation_concurrency
         int _ping_interval
         uint32_t _ping_timeout
         object _wait_timeout
@@ -52,6 +54,9 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         object _condition
         object _timeout_task
         object _ssl_session
+        ResultCache _result_cache
+        SharedStatementCache _shared_statement_cache
+        PoolMetricsImpl _metrics
         bint _force_get
         bint _open
 
@@ -72,6 +77,15 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         self._max_lifetime_session = params.max_lifetime_session
         self._ping_interval = params.ping_interval
         self._ping_timeout = params.ping_timeout
+        self._warmup_statements = params.warmup_statements
+        self._creation_concurrency = max(params.creation_concurrency, 1)
+        self._metrics = PoolMetricsImpl(params.metrics_callback)
+        if params.result_cache_size > 0:
+            self._result_cache = ResultCache(params.result_cache_size,
+                                             params.result_cache_ttl)
+        if params.shared_statement_cache and params.stmtcachesize > 0:
+            self._shared_statement_cache = \
+                    SharedStatementCache(params.stmtcachesize)
         self._free_new_conn_impls = []
         self._free_used_conn_impls = []
         self._busy_conn_impls = []
@@ -120,6 +134,7 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
             self._conn_impls_to_drop.extend(lst)
             for conn_impl in lst:
                 conn_impl._is_pooled = False
+                self._metrics.record_close(conn_impl, "pool_closed")
             lst.clear()
         self._notify_bg_task()
 
@@ -155,12 +170,15 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         request.waiting = True
         return request
 
-    cdef int _drop_conn_impl(self, BaseThinConnImpl conn_impl) except -1:
+    cdef int _drop_conn_impl(self, BaseThinConnImpl conn_impl,
+                             str reason) except -1:
         """
         Helper method which adds a connection to the list of connections to be
-        closed and notifies the background task.
+        closed and notifies the background task. The reason for dropping the
+        connection is recorded in the pool metrics.
         """
         conn_impl._is_pooled = False
+        self._metrics.record_close(conn_impl, reason)
         if conn_impl._protocol._transport is not None:
             self._conn_impls_to_drop.append(conn_impl)
             self._notify_bg_task()
@@ -210,8 +228,10 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         """
         cdef PooledConnRequest request
         if conn_impl is None:
-            self._num_to_create = 0
+            if self._num_to_create > 0:
+                self._num_to_create -= 1
         elif not self._open:
+            self._metrics.record_close(conn_impl, "pool_closed")
             conn_impl._protocol._disconnect()
         else:
             self._open_count += 1
@@ -237,6 +257,20 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
                 self._free_new_conn_impls.append(conn_impl)
             self._check_timeout()
 
+    cdef int _post_create_conn_impls(self, list conn_impls) except -1:
+        """
+        Called after a set of connections has been created without an
+        associated request. Each connection that could not be created reduces
+        the number of connections still to be created by one. If none of them
+        could be created, no further connections are created until a request
+        requires them.
+        """
+        cdef BaseThinConnImpl conn_impl
+        for conn_impl in conn_impls:
+            self._post_create_conn_impl(conn_impl)
+        if conn_impls.count(None) == len(conn_impls):
+            self._num_to_create = 0
+
     cdef int _post_process_request(self, PooledConnRequest request) except -1:
         """
         Called after the request has been processed. This removes the request
@@ -273,6 +307,9 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         else:
             conn_impl._cclass = self.connect_params._default_description.cclass
         conn_impl._is_pooled = True
+        conn_impl._result_cache = self._result_cache
+        conn_impl._session_state_stmts = ()
+        conn_impl._shared_statement_cache = self._shared_statement_cache
         conn_impl._time_created = time.monotonic()
         conn_impl._time_returned = conn_impl._time_created
 
@@ -305,15 +342,17 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         self._busy_conn_impls.remove(conn_impl)
         if not is_open:
             self._open_count -= 1
+            self._metrics.record_close(conn_impl, "unhealthy")
             self._ensure_min_connections()
         if conn_impl._is_pool_extra:
             conn_impl._is_pool_extra = False
             if is_open and self._open_count >= self.max:
                 if self._free_new_conn_impls and self._open_count == self.max:
-                    self._drop_conn_impl(self._free_new_conn_impls.pop(0))
+                    self._drop_conn_impl(self._free_new_conn_impls.pop(0),
+                                         "excess")
                 else:
                     self._open_count -= 1
-                    self._drop_conn_impl(conn_impl)
+                    self._drop_conn_impl(conn_impl, "excess")
                     is_open = False
         if is_open:
             conn_impl._time_returned = time.monotonic()
@@ -321,7 +360,7 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
                 tstamp = conn_impl._time_created + self._max_lifetime_session
                 if conn_impl._time_returned > tstamp:
                     self._open_count -= 1
-                    self._drop_conn_impl(conn_impl)
+                    self._drop_conn_impl(conn_impl, "max_lifetime")
                     is_open = False
         if is_open:
             for request in self._requests:
@@ -348,6 +387,7 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         with self._condition:
             self._requests.clear()
             self._close_all_connections()
+        self._metrics.notify_pending()
         self._bg_task.join()
 
     cdef int _start_timeout_task(self) except -1:
@@ -369,7 +409,7 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
             if current_time - conn_impl._time_returned < self._timeout:
                 break
             conn_impls_to_check.pop(0)
-            self._drop_conn_impl(conn_impl)
+            self._drop_conn_impl(conn_impl, "timeout")
             self._open_count -= 1
 
     def get_busy_count(self):
@@ -391,6 +431,13 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
         """
         return self._max_lifetime_session
 
+    def get_metrics(self):
+        """
+        Internal method for getting a snapshot of the metrics recorded by the
+        pool.
+        """
+        return self._metrics.copy(len(self._busy_conn_impls), self._open_count)
+
     def get_open_count(self):
         """
         Internal method for getting the number of connections in the pool.
@@ -423,6 +470,13 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
             return self._wait_timeout
         return 0
 
+    def invalidate_result_cache(self, object table_names):
+        """
+        Internal method for invalidating the results cached by the pool.
+        """
+        if self._result_cache is not None:
+            self._result_cache.invalidate(table_names)
+
     def return_connection(self, BaseThinConnImpl conn_impl, bint in_del=False):
         """
         Internal method for returning a connection to the pool.
@@ -436,6 +490,7 @@ cdef class BaseThinPoolImpl(BasePoolImpl):
                     if not in_del:
                         raise
                 self._return_connection_helper(conn_impl)
+        self._metrics.notify_pending()
 
     def set_getmode(self, uint32_t value):
         """
@@ -506,6 +561,7 @@ cdef class ThinPoolImpl(BaseThinPoolImpl):
             PooledConnRequest request = None
             ThinConnImpl conn_impl
             uint32_t num_to_create
+            list conn_impls
 
         # add to the list of pools that require closing
         pool_closer.add_pool(self)
@@ -513,6 +569,9 @@ cdef class ThinPoolImpl(BaseThinPoolImpl):
         # perform task until pool is closed
         while self._open or self._conn_impls_to_drop:
 
+            # report any metrics recorded while the pool lock was held
+            self._metrics.notify_pending()
+
             # check to see if there a request to process
             if request is None and self._open:
                 with self._condition:
@@ -528,12 +587,9 @@ cdef class ThinPoolImpl(BaseThinPoolImpl):
             with self._condition:
                 num_to_create = self._num_to_create
             if num_to_create > 0 and self._open:
-                try:
-                    conn_impl = self._create_conn_impl()
-                except:
-                    conn_impl = None
+                conn_impls = self._create_conn_impls(num_to_create)
                 with self._condition:
-                    self._post_create_conn_impl(conn_impl)
+                    self._post_create_conn_impls(conn_impls)
                     continue
 
             # check to see if there are any connections to drop
@@ -553,20 +609,72 @@ cdef class ThinPoolImpl(BaseThinPoolImpl):
         # stop the timeout task, if one is active
         if self._timeout_task is not None:
             self._timeout_task.cancel()
+        self._metrics.notify_pending()
 
         # remove from the list of pools that require closing
         pool_closer.remove_pool(self)
 
+    def _create_bg_conn_impl(self, list conn_impls):
+        """
+        Creates a connection for the pool without an associated request and
+        warms it up, if applicable. The connection is appended to the supplied
+        list or, if it cannot be created, None is appended instead.
+        """
+        cdef ThinConnImpl conn_impl = None
+        try:
+            conn_impl = self._create_conn_impl()
+            if self._warmup_statements:
+                self._warm_up_conn_impl(conn_impl)
+        except:
+            if conn_impl is not None:
+                conn_impl._protocol._disconnect()
+            conn_impl = None
+        conn_impls.append(conn_impl)
+
+    cdef list _create_conn_impls(self, uint32_t num_to_create):
+        """
+        Creates up to the specified number of connections for the pool and
+        returns a list of them (None for each connection that could not be
+        created). The number of connections created at the same time is
+        limited by the creation concurrency; when more than one connection is
+        being created, each is created in its own thread.
+        """
+        cdef:
+            list conn_impls = [], threads
+            uint32_t i
+        num_to_create = min(num_to_create, self._creation_concurrency)
+        if num_to_create == 1:
+            self._create_bg_conn_impl(conn_impls)
+        else:
+            threads = [
+                threading.Thread(target=self._create_bg_conn_impl,
+                                 args=(conn_impls,))
+                for i in range(num_to_create)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        return conn_impls
+
     cdef ThinConnImpl _create_conn_impl(self, ConnectParamsImpl params=None):
         """
         Create a single connection using the pool's information. This
         connection may be placed in the pool or may be returned directly (such
         as when the pool is full and POOL_GETMODE_FORCEGET is being used).
         """
-        cdef ThinConnImpl conn_impl
+        cdef:
+            ThinConnImpl conn_impl
+            double start_time
         conn_impl = ThinConnImpl(self.dsn, self.connect_params)
         self._pre_connect(conn_impl, params)
-        conn_impl.connect(self.connect_params)
+        start_time = time.monotonic()
+        try:
+            conn_impl.connect(self.connect_params)
+        except:
+            self._metrics.record_create(start_time, False)
+            raise
+        self._metrics.record_create(start_time, True)
         return conn_impl
 
     def _notify_bg_task(self):
@@ -580,20 +688,28 @@ cdef class ThinPoolImpl(BaseThinPoolImpl):
         """
         Processes a request.
         """
-        cdef BaseThinConnImpl conn_impl
+        cdef:
+            BaseThinConnImpl conn_impl
+            double start_time
         try:
             if request.requires_ping:
+                start_time = time.monotonic()
                 try:
                     request.conn_impl.set_call_timeout(self._ping_timeout)
                     request.conn_impl.ping()
                     request.conn_impl.set_call_timeout(0)
                 except exceptions.Error:
+                    self._metrics.record_ping(start_time, False)
+                    self._metrics.record_close(request.conn_impl,
+                                               "ping_failure")
                     request.conn_impl._protocol._disconnect()
                     request.conn_impl = None
+                else:
+                    self._metrics.record_ping(start_time, True)
             else:
                 conn_impl = self._create_conn_impl(request.params)
                 if request.conn_impl is not None:
-                    self._drop_conn_impl(request.conn_impl)
+                    self._drop_conn_impl(request.conn_impl, "replaced")
                 request.conn_impl = conn_impl
                 request.conn_impl._is_pool_extra = request.is_extra
         except Exception as e:
@@ -607,14 +723,44 @@ cdef class ThinPoolImpl(BaseThinPoolImpl):
         def handler():
             with self._condition:
                 self._process_timeout()
+            self._metrics.notify_pending()
         self._timeout_task = threading.Timer(self._timeout + 1, handler)
         self._timeout_task.start()
 
+    cdef int _warm_up_conn_impl(self, ThinConnImpl conn_impl) except -1:
+        """
+        Prepares and describes each of the warm-up statements using a newly
+        created connection so that the cursors are already open in the
+        connection's statement cache when it is first acquired. Errors are
+        ignored (and raised again when the application executes the statement)
+        unless the connection is no longer usable.
+        """
+        cdef:
+            Protocol protocol = <Protocol> conn_impl._protocol
+            ThinCursorImpl cursor_impl
+            ExecuteMessage message
+            str sql
+        for sql in self._warmup_statements:
+            cursor_impl = conn_impl.create_cursor_impl(False)
+            try:
+                cursor_impl._prepare(sql, None, True)
+                message = cursor_impl._create_message(ExecuteMessage, None)
+                message.parse_only = True
+                protocol._process_single_message(message)
+            except exceptions.Error:
+                if not protocol._get_is_healthy():
+                    raise
+            finally:
+                cursor_impl._close(False)
+
     def acquire(self, ConnectParamsImpl params):
         """
         Internal method for acquiring a connection from the pool.
         """
-        cdef PooledConnRequest request
+        cdef:
+            BaseThinConnImpl conn_impl
+            PooledConnRequest request
+            double start_time
 
         # if pool is closed, raise an exception
         if not self._open:
@@ -626,18 +772,28 @@ cdef class ThinPoolImpl(BaseThinPoolImpl):
 
         # wait until an acceptable connection is found
         request = self._create_request(params)
-        with self._condition:
-            try:
-                self._condition.wait_for(request.fulfill, self._wait_timeout)
-            except:
-                if not request.bg_processing:
-                    request.reject()
-                raise
-            finally:
-                request.waiting = False
-            if not request.completed:
-                errors._raise_err(errors.ERR_POOL_NO_CONNECTION_AVAILABLE)
-            return self._post_acquire(request.conn_impl)
+        start_time = self._metrics.record_acquire_start()
+        try:
+            with self._condition:
+                try:
+                    self._condition.wait_for(request.fulfill,
+                                             self._wait_timeout)
+                except:
+                    if not request.bg_processing:
+                        request.reject()
+                    raise
+                finally:
+                    request.waiting = False
+                if not request.completed:
+                    errors._raise_err(errors.ERR_POOL_NO_CONNECTION_AVAILABLE)
+                conn_impl = self._post_acquire(request.conn_impl)
+        except:
+            self._metrics.record_acquire_end(start_time, False)
+            self._metrics.notify_pending()
+            raise
+        self._metrics.record_acquire_end(start_time, True)
+        self._metrics.notify_pending()
+        return conn_impl
 
     def close(self, bint force):
         """
@@ -648,6 +804,7 @@ cdef class ThinPoolImpl(BaseThinPoolImpl):
         if self._open:
             with self._condition:
                 self._close_helper(force)
+            self._metrics.notify_pending()
             self._bg_task.join()
 
     def drop(self, ThinConnImpl conn_impl):
@@ -657,8 +814,9 @@ cdef class ThinPoolImpl(BaseThinPoolImpl):
         with self._condition:
             self._open_count -= 1
             self._busy_conn_impls.remove(conn_impl)
-            self._drop_conn_impl(conn_impl)
+            self._drop_conn_impl(conn_impl, "dropped")
             self._condition.notify()
+        self._metrics.notify_pending()
 
 
 cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
@@ -699,10 +857,14 @@ cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
             BaseThinConnImpl conn_impl
             list conn_impls_to_drop
             uint32_t num_to_create
+            list conn_impls
 
         # perform task until pool is closed
         while self._open or self._conn_impls_to_drop:
 
+            # report any metrics recorded while the pool lock was held
+            self._metrics.notify_pending()
+
             # check to see if there a request to process
             if request is None and self._open:
                 async with self._condition:
@@ -718,14 +880,9 @@ cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
             async with self._condition:
                 num_to_create = self._num_to_create
             if num_to_create > 0 and self._open:
-                try:
-                    conn_impl = await self._create_conn_impl()
-                except asyncio.CancelledError:
-                    raise
-                except:
-                    conn_impl = None
+                conn_impls = await self._create_conn_impls(num_to_create)
                 async with self._condition:
-                    self._post_create_conn_impl(conn_impl)
+                    self._post_create_conn_impls(conn_impls)
                     continue
 
             # check to see if there are any connections to drop
@@ -747,6 +904,41 @@ cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
         # stop the timeout task, if one is active
         if self._timeout_task is not None:
             self._timeout_task.cancel()
+        self._metrics.notify_pending()
+
+    async def _create_bg_conn_impl(self):
+        """
+        Creates a connection for the pool without an associated request and
+        warms it up, if applicable. If the connection cannot be created, None
+        is returned instead.
+        """
+        cdef AsyncThinConnImpl conn_impl = None
+        try:
+            conn_impl = await self._create_conn_impl()
+            if self._warmup_statements:
+                await self._warm_up_conn_impl(conn_impl)
+        except BaseException as e:
+            if conn_impl is not None:
+                conn_impl._protocol._disconnect()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            conn_impl = None
+        return conn_impl
+
+    async def _create_conn_impls(self, uint32_t num_to_create):
+        """
+        Creates up to the specified number of connections for the pool and
+        returns a list of them (None for each connection that could not be
+        created). The number of connections created at the same time is
+        limited by the creation concurrency.
+        """
+        cdef uint32_t i
+        num_to_create = min(num_to_create, self._creation_concurrency)
+        if num_to_create == 1:
+            return [await self._create_bg_conn_impl()]
+        return list(await asyncio.gather(
+            *[self._create_bg_conn_impl() for i in range(num_to_create)]
+        ))
 
     async def _create_conn_impl(self, ConnectParamsImpl params=None):
         """
@@ -754,10 +946,18 @@ cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
         connection may be placed in the pool or may be returned directly (such
         as when the pool is full and POOL_GETMODE_FORCEGET is being used).
         """
-        cdef AsyncThinConnImpl conn_impl
+        cdef:
+            AsyncThinConnImpl conn_impl
+            double start_time
         conn_impl = AsyncThinConnImpl(self.dsn, self.connect_params)
         self._pre_connect(conn_impl, params)
-        await conn_impl.connect(self.connect_params)
+        start_time = time.monotonic()
+        try:
+            await conn_impl.connect(self.connect_params)
+        except:
+            self._metrics.record_create(start_time, False)
+            raise
+        self._metrics.record_create(start_time, True)
         return conn_impl
 
     def _notify_bg_task(self):
@@ -774,20 +974,28 @@ cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
         """
         Processes a request.
         """
-        cdef BaseThinConnImpl conn_impl
+        cdef:
+            BaseThinConnImpl conn_impl
+            double start_time
         try:
             if request.requires_ping:
+                start_time = time.monotonic()
                 try:
                     request.conn_impl.set_call_timeout(self._ping_timeout)
                     await request.conn_impl.ping()
                     request.conn_impl.set_call_timeout(0)
                 except exceptions.Error:
+                    self._metrics.record_ping(start_time, False)
+                    self._metrics.record_close(request.conn_impl,
+                                               "ping_failure")
                     request.conn_impl._protocol._disconnect()
                     request.conn_impl = None
+                else:
+                    self._metrics.record_ping(start_time, True)
             else:
                 conn_impl = await self._create_conn_impl(request.params)
                 if request.conn_impl is not None:
-                    self._drop_conn_impl(request.conn_impl)
+                    self._drop_conn_impl(request.conn_impl, "replaced")
                 request.conn_impl = conn_impl
                 request.conn_impl._is_pool_extra = request.is_extra
         except Exception as e:
@@ -802,13 +1010,44 @@ cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
             await asyncio.sleep(self._timeout + 1)
             async with self._condition:
                 self._process_timeout()
+            self._metrics.notify_pending()
         self._timeout_task = asyncio.create_task(process_timeout())
 
+    async def _warm_up_conn_impl(self, AsyncThinConnImpl conn_impl):
+        """
+        Prepares and describes each of the warm-up statements using a newly
+        created connection so that the cursors are already open in the
+        connection's statement cache when it is first acquired. Errors are
+        ignored (and raised again when the application executes the statement)
+        unless the connection is no longer usable.
+        """
+        cdef:
+            BaseAsyncProtocol protocol = \
+                    <BaseAsyncProtocol> conn_impl._protocol
+            AsyncThinCursorImpl cursor_impl
+            ExecuteMessage message
+            str sql
+        for sql in self._warmup_statements:
+            cursor_impl = conn_impl.create_cursor_impl(False)
+            try:
+                cursor_impl._prepare(sql, None, True)
+                message = cursor_impl._create_message(ExecuteMessage, None)
+                message.parse_only = True
+                await protocol._process_single_message(message)
+            except exceptions.Error:
+                if not protocol._get_is_healthy():
+                    raise
+            finally:
+                cursor_impl._close(False)
+
     async def acquire(self, ConnectParamsImpl params):
         """
         Internal method for acquiring a connection from the pool.
         """
-        cdef PooledConnRequest request
+        cdef:
+            BaseThinConnImpl conn_impl
+            PooledConnRequest request
+            double start_time
 
         # if pool is closed, raise an exception
         if not self._open:
@@ -821,13 +1060,22 @@ cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
         # use the helper function to allow for a timeout since asyncio
         # condition variables do not have that capability directly
         request = self._create_request(params)
+        start_time = self._metrics.record_acquire_start()
         try:
-            await asyncio.wait_for(
-                self._acquire_helper(request), self._wait_timeout
-            )
-        except asyncio.TimeoutError:
-            errors._raise_err(errors.ERR_POOL_NO_CONNECTION_AVAILABLE)
-        return self._post_acquire(request.conn_impl)
+            try:
+                await asyncio.wait_for(
+                    self._acquire_helper(request), self._wait_timeout
+                )
+            except asyncio.TimeoutError:
+                errors._raise_err(errors.ERR_POOL_NO_CONNECTION_AVAILABLE)
+            conn_impl = self._post_acquire(request.conn_impl)
+        except:
+            self._metrics.record_acquire_end(start_time, False)
+            self._metrics.notify_pending()
+            raise
+        self._metrics.record_acquire_end(start_time, True)
+        self._metrics.notify_pending()
+        return conn_impl
 
     async def close(self, bint force):
         """
@@ -835,6 +1083,7 @@ cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
         """
         async with self._condition:
             self._close_helper(force)
+        self._metrics.notify_pending()
         await self._bg_task
 
     async def drop(self, AsyncThinConnImpl conn_impl):
@@ -844,8 +1093,9 @@ cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
         async with self._condition:
             self._open_count -= 1
             self._busy_conn_impls.remove(conn_impl)
-            self._drop_conn_impl(conn_impl)
+            self._drop_conn_impl(conn_impl, "dropped")
             self._condition.notify()
+        self._metrics.notify_pending()
 
     async def return_connection(self, AsyncThinConnImpl conn_impl,
                                 bint in_del=False):
@@ -861,6 +1111,7 @@ cdef class AsyncThinPoolImpl(BaseThinPoolImpl):
                 if not in_del:
                     raise
             self._return_connection_helper(conn_impl)
+        self._metrics.notify_pending()
 
 
 @cython.freelist(20)
@@ -901,14 +1152,14 @@ cdef class PooledConnRequest:
                 buf.check_control_packet()
         if buf._pending_error_num != 0:
             self.pool_impl._open_count -= 1
-            self.pool_impl._drop_conn_impl(conn_impl)
+            self.pool_impl._drop_conn_impl(conn_impl, "unhealthy")
             return 0
         elif self.pool_impl._max_lifetime_session > 0:
             min_create_time = \
                     time.monotonic() - self.pool_impl._max_lifetime_session
             if conn_impl._time_created < min_create_time:
                 self.pool_impl._open_count -= 1
-                self.pool_impl._drop_conn_impl(conn_impl)
+                self.pool_impl._drop_conn_impl(conn_impl, "max_lifetime")
                 return 0
         self.conn_impl = conn_impl
         if self.pool_impl._ping_interval == 0:
@@ -0,0 +1,240 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+# pool_metrics.pyx
+#
+# Cython file defining the classes used to record metrics about the use of a
+# connection pool (embedded in thin_impl.pyx).
+#------------------------------------------------------------------------------
+
+# upper bounds (in seconds) of the buckets used by the histograms that record
+# the time taken to acquire and create connections; an additional bucket holds
+# all values that exceed the last bound
+cdef tuple POOL_METRICS_BUCKET_BOUNDS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+cdef class PoolTimeHistogram:
+
+    cdef:
+        readonly uint64_t count
+        readonly double total
+        list counts
+
+    def __init__(self):
+        self.counts = [0] * (len(POOL_METRICS_BUCKET_BOUNDS) + 1)
+
+    cdef PoolTimeHistogram copy(self):
+        """
+        Returns a copy of the histogram.
+        """
+        cdef PoolTimeHistogram histogram
+        histogram = PoolTimeHistogram.__new__(PoolTimeHistogram)
+        histogram.count = self.count
+        histogram.total = self.total
+        histogram.counts = list(self.counts)
+        return histogram
+
+    cdef int record(self, double value) except -1:
+        """
+        Records a value in the histogram.
+        """
+        cdef:
+            ssize_t i, num_bounds = len(POOL_METRICS_BUCKET_BOUNDS)
+            double bound
+        for i in range(num_bounds):
+            bound = POOL_METRICS_BUCKET_BOUNDS[i]
+            if value <= bound:
+                break
+        else:
+            i = num_bounds
+        self.counts[i] += 1
+        self.count += 1
+        self.total += value
+
+    def get_buckets(self):
+        """
+        Returns a dictionary mapping the upper bound of each bucket to the
+        number of values recorded that are less than or equal to that bound.
+        The final bucket has an upper bound of infinity and includes all
+        values.
+        """
+        cdef:
+            dict buckets = {}
+            uint64_t total_count = 0
+            ssize_t i
+        for i, bound in enumerate(POOL_METRICS_BUCKET_BOUNDS + (math.inf,)):
+            total_count += self.counts[i]
+            buckets[bound] = total_count
+        return buckets
+
+
+cdef class PoolMetricsImpl:
+
+    cdef:
+        readonly uint64_t acquire_count
+        readonly uint64_t acquire_failure_count
+        readonly uint64_t create_count
+        readonly uint64_t create_failure_count
+        readonly uint64_t ping_count
+        readonly uint64_t ping_failure_count
+        readonly uint32_t waiting_count
+        readonly uint32_t max_waiting_count
+        readonly uint32_t busy_count
+        readonly uint32_t open_count
+        readonly PoolTimeHistogram acquire_wait_times
+        readonly PoolTimeHistogram create_times
+        readonly dict close_counts
+        list pending_events
+        object callback
+        object lock
+
+    def __init__(self, object callback):
+        self.acquire_wait_times = PoolTimeHistogram()
+        self.create_times = PoolTimeHistogram()
+        self.close_counts = {}
+        self.pending_events = []
+        self.callback = callback
+        self.lock = threading.Lock()
+
+    cdef int _notify(self, str name, double value,
+                     dict attributes) except -1:
+        """
+        Queues an event for the metrics callback, if one was supplied. Metrics
+        are frequently recorded while the pool lock is held so the callback is
+        only called later by notify_pending(). This must be called while
+        holding the metrics lock.
+        """
+        if self.callback is not None:
+            self.pending_events.append((name, value, attributes))
+
+    cdef PoolMetricsImpl copy(self, uint32_t busy_count, uint32_t open_count):
+        """
+        Returns a copy of the metrics recorded so far, along with the number of
+        connections that are busy and open in the pool.
+        """
+        cdef PoolMetricsImpl metrics
+        metrics = PoolMetricsImpl.__new__(PoolMetricsImpl)
+        metrics.busy_count = busy_count
+        metrics.open_count = open_count
+        with self.lock:
+            metrics.acquire_count = self.acquire_count
+            metrics.acquire_failure_count = self.acquire_failure_count
+            metrics.create_count = self.create_count
+            metrics.create_failure_count = self.create_failure_count
+            metrics.ping_count = self.ping_count
+            metrics.ping_failure_count = self.ping_failure_count
+            metrics.waiting_count = self.waiting_count
+            metrics.max_waiting_count = self.max_waiting_count
+            metrics.acquire_wait_times = self.acquire_wait_times.copy()
+            metrics.create_times = self.create_times.copy()
+            metrics.close_counts = dict(self.close_counts)
+        return metrics
+
+    cdef int notify_pending(self) except -1:
+        """
+        Calls the metrics callback for each of the events that have been queued
+        so far. This must be called without holding the pool lock. Any
+        exception raised by the callback is ignored so that it cannot interfere
+        with the operation of the pool.
+        """
+        cdef list events
+        if not self.pending_events:
+            return 0
+        with self.lock:
+            events = self.pending_events
+            self.pending_events = []
+        for name, value, attributes in events:
+            try:
+                self.callback(name, value, attributes)
+            except Exception:
+                pass
+
+    cdef int record_acquire_end(self, double start_time,
+                                bint success) except -1:
+        """
+        Records the end of an attempt to acquire a connection from the pool
+        which was started at the given time.
+        """
+        cdef double wait_time = time.monotonic() - start_time
+        with self.lock:
+            self.waiting_count -= 1
+            if success:
+                self.acquire_count += 1
+                self.acquire_wait_times.record(wait_time)
+            else:
+                self.acquire_failure_count += 1
+            self._notify("acquire", wait_time, dict(success=success))
+
+    cdef double record_acquire_start(self) except -1:
+        """
+        Records the start of an attempt to acquire a connection from the pool
+        and returns the time at which it started.
+        """
+        with self.lock:
+            self.waiting_count += 1
+            if self.waiting_count > self.max_waiting_count:
+                self.max_waiting_count = self.waiting_count
+        return time.monotonic()
+
+    cdef int record_close(self, BaseThinConnImpl conn_impl,
+                          str reason) except -1:
+        """
+        Records that a connection has been removed from the pool for the given
+        reason. The value passed to the callback is the age of the connection.
+        """
+        cdef double age = time.monotonic() - conn_impl._time_created
+        with self.lock:
+            self.close_counts[reason] = self.close_counts.get(reason, 0) + 1
+            self._notify("connection_closed", age, dict(reason=reason))
+
+    cdef int record_create(self, double start_time, bint success) except -1:
+        """
+        Records an attempt to create a connection for the pool which was
+        started at the given time.
+        """
+        cdef double elapsed_time = time.monotonic() - start_time
+        with self.lock:
+            if success:
+                self.create_count += 1
+                self.create_times.record(elapsed_time)
+            else:
+                self.create_failure_count += 1
+            self._notify("connection_created", elapsed_time,
+                         dict(success=success))
+
+    cdef int record_ping(self, double start_time, bint success) except -1:
+        """
+        Records a ping of a connection in the pool which was started at the
+        given time.
+        """
+        cdef double elapsed_time = time.monotonic() - start_time
+        with self.lock:
+            self.ping_count += 1
+            if not success:
+                self.ping_failure_count += 1
+            self._notify("ping", elapsed_time, dict(success=success))
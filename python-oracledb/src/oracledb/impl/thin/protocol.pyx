@@ -41,6 +41,7 @@ cdef class BaseProtocol:
         bint _txn_in_progress
         bint _break_in_progress
         object _request_lock
+        RoundTripInfo _round_trip
 
     def __init__(self):
         self._caps = Capabilities()
@@ -197,6 +198,7 @@ cdef class BaseProtocol:
         conn_impl._edition = auth_message.edition
         conn_impl.warning = auth_message.warning
         buf._pending_error_num = 0
+        self._transport.save_tls_session()
         self._in_connect = False
 
     cdef int _send_marker(self, WriteBuffer buf, uint8_t marker_type):
@@ -243,11 +245,14 @@ cdef class Protocol(BaseProtocol):
                                 ConnectParamsImpl params,
                                 Description description,
                                 Address address,
-                                str connect_string) except -1:
+                                str connect_string,
+                                object sock=None) except -1:
         """
         Method for performing the required steps for establishing a connection
         within the scope of a retry. If the listener refuses the connection, a
-        retry will be performed, if retry_count is set.
+        retry will be performed, if retry_count is set. If a socket is
+        supplied, it is already connected to the address and is used instead
+        of establishing a new TCP connection.
         """
         cdef:
             ConnectMessage connect_message = None
@@ -266,7 +271,7 @@ cdef class Protocol(BaseProtocol):
         host = address.ip_address
         port = address.port
         self._connect_tcp(params, description, address, host, port,
-                          connect_string)
+                          connect_string, sock)
 
         # send connect message and process response; this may request the
         # message to be resent multiple times; if a redirect packet is
@@ -372,17 +377,20 @@ cdef class Protocol(BaseProtocol):
 
     cdef int _connect_tcp(self, ConnectParamsImpl params,
                           Description description, Address address, str host,
-                          int port, str connect_string) except -1:
+                          int port, str connect_string,
+                          object sock=None) except -1:
         """
         Creates a socket on which to communicate using the provided parameters.
         If a proxy is configured, a connection to the proxy is established and
-        the target host and port is forwarded to the proxy.
+        the target host and port is forwarded to the proxy. If a socket is
+        supplied, it is already connected (with TLS negotiated for TCPS
+        addresses) and is used as is.
         """
         cdef:
             bint use_proxy = (address.https_proxy is not None)
             double timeout = description.tcp_connect_timeout
             bint use_tcps = (address.protocol == "tcps")
-            object connect_info, sock, data, reply, m
+            object connect_info, data, reply, m
 
         # establish connection to appropriate host/port
         if use_proxy:
@@ -394,12 +402,13 @@ cdef class Protocol(BaseProtocol):
             if not use_tcps and (params._token is not None
                     or params.access_token_callback is not None):
                 errors._raise_err(errors.ERR_ACCESS_TOKEN_REQUIRES_TCPS)
-        if not use_proxy and description.use_tcp_fast_open:
-            sock = socket.socket(address.ip_family, socket.SOCK_STREAM)
-            sock.sendto(connect_string.encode(), socket.MSG_FASTOPEN,
-                        connect_info)
-        else:
-            sock = socket.create_connection(connect_info, timeout)
+        if sock is None:
+            if not use_proxy and description.use_tcp_fast_open:
+                sock = socket.socket(address.ip_family, socket.SOCK_STREAM)
+                sock.sendto(connect_string.encode(), socket.MSG_FASTOPEN,
+                            connect_info)
+            else:
+                sock = socket.create_connection(connect_info, timeout)
 
         # complete connection through proxy, if applicable
         if use_proxy:
@@ -415,11 +424,16 @@ cdef class Protocol(BaseProtocol):
         self._transport.set_from_socket(sock, params, description, address)
 
         # for TCPS connections, OOB processing is not supported and TLS
-        # negotiation is required
+        # negotiation is required, unless the TLS handshake has already been
+        # performed on the supplied socket
         if use_tcps:
             self._caps.supports_oob = False
-            self._transport.create_ssl_context(params, description, address)
-            self._transport.negotiate_tls(sock, address, description)
+            if isinstance(sock, ssl.SSLSocket):
+                self._transport.complete_tls(address, description)
+            else:
+                self._transport.create_ssl_context(params, description,
+                                                   address)
+                self._transport.negotiate_tls(sock, address, description)
 
     cdef int _end_request(self, BaseThinConnImpl conn_impl) except -1:
         """
@@ -438,7 +452,14 @@ cdef class Protocol(BaseProtocol):
                 pass
 
     cdef int _process_message(self, Message message) except -1:
-        cdef uint32_t timeout = message.conn_impl._call_timeout
+        cdef:
+            uint32_t timeout = message.conn_impl._call_timeout
+            list hooks
+        if REGISTERED_ROUND_TRIP_HOOKS and self._round_trip is None \
+                and self._transport is not None:
+            hooks = _get_round_trip_hooks()
+            if hooks is not None:
+                return self._process_traced_message(message, hooks)
         try:
             self._read_buf.reset_packets()
             message.send(self._write_buf)
@@ -493,6 +514,24 @@ cdef class Protocol(BaseProtocol):
                 return self._process_message(message)
             message._check_and_raise_exception()
 
+    cdef int _process_traced_message(self, Message message,
+                                     list hooks) except -1:
+        """
+        Processes a message and then passes information about the round trip
+        to the given round trip hooks.
+        """
+        cdef RoundTripInfo round_trip
+        round_trip = RoundTripInfo._start(self._transport, message, hooks)
+        self._round_trip = round_trip
+        try:
+            self._process_message(message)
+        except BaseException as e:
+            round_trip.exception = e
+            raise
+        finally:
+            self._round_trip = None
+            round_trip._finish(message)
+
     cdef int _process_single_message(self, Message message) except -1:
         """
         Process a single message within a request.
@@ -504,6 +543,130 @@ cdef class Protocol(BaseProtocol):
                 self._process_message(message)
         message.postprocess()
 
+    cdef tuple _race_connect(self, ConnectParamsImpl params,
+                             Description description, list addresses):
+        """
+        Races connections to the given addresses and returns a 2-tuple
+        containing the first socket that is connected and the address to which
+        it is connected. For TCPS addresses, TLS is negotiated on each socket
+        as soon as its TCP connection is established and the socket is only
+        considered connected once the TLS handshake has completed. The attempts
+        are started in the order of the addresses; the next attempt is started
+        when the delay has passed without an earlier attempt succeeding or as
+        soon as an earlier attempt fails. Each attempt must complete within the
+        TCP connect timeout. All other attempts are closed once one of them
+        succeeds. If all of the attempts fail, the first error encountered is
+        raised.
+        """
+        cdef:
+            ssize_t next_ix = 0, num_addresses = len(addresses)
+            double delay = params.parallel_connect_delay
+            double timeout = description.tcp_connect_timeout
+            double now, next_start, wait_time, deadline
+            object selector, sock, key, events, first_error = None
+            dict deadlines = {}
+            Address address
+            int err
+
+        # the SSL context is shared by all of the attempts
+        for address in addresses:
+            if address.protocol == "tcps":
+                self._transport.create_ssl_context(params, description,
+                                                   address)
+                break
+
+        selector = selectors.DefaultSelector()
+        try:
+            next_start = time.monotonic()
+            while next_ix < num_addresses or deadlines:
+
+                # start the next attempt, if it is time to do so
+                now = time.monotonic()
+                if next_ix < num_addresses \
+                        and (now >= next_start or not deadlines):
+                    address = addresses[next_ix]
+                    next_ix += 1
+                    next_start = now + delay
+                    try:
+                        sock = socket.socket(address.ip_family,
+                                             socket.SOCK_STREAM)
+                    except OSError as e:
+                        if first_error is None:
+                            first_error = e
+                        next_start = now
+                        continue
+                    sock.setblocking(False)
+                    try:
+                        sock.connect((address.ip_address, address.port))
+                    except (BlockingIOError, InterruptedError):
+                        pass
+                    except OSError as e:
+                        sock.close()
+                        if first_error is None:
+                            first_error = e
+                        next_start = now
+                        continue
+                    selector.register(sock, selectors.EVENT_WRITE, address)
+                    deadlines[sock] = now + timeout
+
+                # wait for an attempt to make progress, for the next attempt to
+                # be started or for an attempt to time out
+                wait_time = min(deadlines.values()) - now
+                if next_ix < num_addresses:
+                    wait_time = min(wait_time, next_start - now)
+                for key, _ in selector.select(max(wait_time, 0)):
+                    sock = key.fileobj
+                    address = key.data
+                    selector.unregister(sock)
+                    deadline = deadlines.pop(sock)
+
+                    # once the TCP connection is established, TLS is
+                    # negotiated, if applicable; the handshake is resumed
+                    # whenever the socket is ready again
+                    try:
+                        if not isinstance(sock, ssl.SSLSocket):
+                            err = sock.getsockopt(socket.SOL_SOCKET,
+                                                  socket.SO_ERROR)
+                            if err != 0:
+                                raise OSError(err, os.strerror(err))
+                            if address.protocol == "tcps":
+                                sock = self._transport.wrap_socket(sock,
+                                                                   address)
+                        if isinstance(sock, ssl.SSLSocket):
+                            sock.do_handshake()
+                    except ssl.SSLWantReadError:
+                        events = selectors.EVENT_READ
+                    except ssl.SSLWantWriteError:
+                        events = selectors.EVENT_WRITE
+                    except OSError as e:
+                        sock.close()
+                        if first_error is None:
+                            first_error = e
+                        next_start = now
+                        continue
+                    else:
+                        sock.setblocking(True)
+                        return (sock, address)
+                    selector.register(sock, events, address)
+                    deadlines[sock] = deadline
+
+                # close any attempts that have timed out
+                now = time.monotonic()
+                for sock, deadline in list(deadlines.items()):
+                    if deadline <= now:
+                        selector.unregister(sock)
+                        del deadlines[sock]
+                        sock.close()
+                        if first_error is None:
+                            first_error = socket.timeout("timed out")
+                        next_start = now
+
+            raise first_error
+        finally:
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
+
     cdef int _receive_packet(self, Message message,
                              bint check_request_boundary=False) except -1:
         cdef:
@@ -570,6 +733,51 @@ cdef class Protocol(BaseProtocol):
                 if not in_del:
                     raise
 
+    cdef int end_pipeline(self, ThinConnImpl conn_impl, list messages,
+                          bint continue_on_error) except -1:
+        """
+        Called when all messages for the pipeline have been sent to the
+        database. An end pipeline message is sent to the database and then
+        the responses to all of the messages are processed.
+        """
+        cdef:
+            ssize_t num_responses_to_discard
+            ReadBuffer buf = self._read_buf
+            Message message, end_message
+        try:
+            end_message = conn_impl._create_message(EndPipelineMessage)
+            end_message.send(self._write_buf)
+        except:
+            self._transport.end_write_batch(send_packets=False)
+            raise
+        self._transport.end_write_batch()
+        buf._check_request_boundary = True
+        buf._in_pipeline = True
+        try:
+            num_responses_to_discard = len(messages) + 1
+            for message in messages:
+                try:
+                    buf.wait_for_packets_sync()
+                    message.preprocess()
+                    message.process(buf)
+                    num_responses_to_discard -= 1
+                    self._process_call_status(conn_impl, message.call_status)
+                    message._check_and_raise_exception()
+                except Exception as e:
+                    if not continue_on_error:
+                        raise
+                    message.pipeline_result_impl._capture_err(e)
+            self._receive_packet(end_message, check_request_boundary=True)
+            end_message.process(buf)
+            num_responses_to_discard = 0
+            end_message._check_and_raise_exception()
+        except:
+            buf.discard_pipeline_responses_sync(num_responses_to_discard)
+            raise
+        finally:
+            buf._check_request_boundary = False
+            buf._in_pipeline = False
+
 
 cdef class BaseAsyncProtocol(BaseProtocol):
 
@@ -599,11 +807,14 @@ cdef class BaseAsyncProtocol(BaseProtocol):
                                  ConnectParamsImpl params,
                                  Description description,
                                  Address address,
-                                 str connect_string):
+                                 str connect_string,
+                                 tuple transports=None):
         """
         Method for performing the required steps for establishing a connection
         within the scope of a retry. If the listener refuses the connection, a
-        retry will be performed, if retry_count is set.
+        retry will be performed, if retry_count is set. If transports are
+        supplied, they are already connected to the address and are used
+        instead of establishing a new TCP connection.
         """
         cdef:
             ConnectMessage connect_message = None
@@ -622,7 +833,7 @@ cdef class BaseAsyncProtocol(BaseProtocol):
         host = address.ip_address
         port = address.port
         orig_transport = await self._connect_tcp(params, description, address,
-                                                 host, port)
+                                                 host, port, transports)
 
         # send connect message and process response; this may request the
         # message to be resent multiple times; if a redirect packet is
@@ -727,17 +938,21 @@ cdef class BaseAsyncProtocol(BaseProtocol):
 
     async def _connect_tcp(self, ConnectParamsImpl params,
                            Description description, Address address, str host,
-                           int port):
+                           int port, tuple transports=None):
         """
         Creates a socket on which to communicate using the provided parameters.
         If a proxy is configured, a connection to the proxy is established and
-        the target host and port is forwarded to the proxy.
+        the target host and port is forwarded to the proxy. If transports are
+        supplied, they are a 2-tuple containing the transport that is already
+        connected (with TLS negotiated for TCPS addresses) and the underlying
+        TCP transport; these are used as is.
         """
         cdef:
             bint use_proxy = (address.https_proxy is not None)
             double timeout = description.tcp_connect_timeout
             bint use_tcps = (address.protocol == "tcps")
             object connect_info, data, reply, m
+            object transport, orig_transport
             str connect_host
             int connect_port
 
@@ -753,11 +968,15 @@ cdef class BaseAsyncProtocol(BaseProtocol):
             if not use_tcps and (params._token is not None
                     or params.access_token_callback is not None):
                 errors._raise_err(errors.ERR_ACCESS_TOKEN_REQUIRES_TCPS)
-        transport, protocol = await self._read_buf._loop.create_connection(
-            lambda: self,
-            connect_host,
-            connect_port
-        )
+        if transports is not None:
+            transport, orig_transport = transports
+            transport.set_protocol(self)
+        else:
+            transport, protocol = await self._read_buf._loop.create_connection(
+                lambda: self,
+                connect_host,
+                connect_port
+            )
 
         # complete connection through proxy, if applicable
         if use_proxy:
@@ -774,8 +993,12 @@ cdef class BaseAsyncProtocol(BaseProtocol):
         self._transport.set_from_socket(transport, params, description,
                                         address)
 
-        # negotiate TLS, if applicable
+        # negotiate TLS, if applicable, unless the TLS handshake has already
+        # been performed on the supplied transport
         if use_tcps:
+            if transports is not None:
+                self._transport.complete_tls(address, description)
+                return orig_transport
             self._transport.create_ssl_context(params, description, address)
             return await self._transport.negotiate_tls_async(self, address,
                                                              description)
@@ -803,6 +1026,12 @@ cdef class BaseAsyncProtocol(BaseProtocol):
         cdef:
             uint32_t timeout = message.conn_impl._call_timeout
             object timeout_obj = (timeout / 1000) or None
+            list hooks
+        if REGISTERED_ROUND_TRIP_HOOKS and self._round_trip is None \
+                and self._transport is not None:
+            hooks = _get_round_trip_hooks()
+            if hooks is not None:
+                return await self._process_traced_message(message, hooks)
         try:
             coroutine = self._process_message_helper(message)
             await asyncio.wait_for(coroutine, timeout_obj)
@@ -866,6 +1095,23 @@ cdef class BaseAsyncProtocol(BaseProtocol):
                 message.on_out_of_packets()
                 self._read_buf.restore_point()
 
+    async def _process_traced_message(self, Message message, list hooks):
+        """
+        Processes a message and then passes information about the round trip
+        to the given round trip hooks.
+        """
+        cdef RoundTripInfo round_trip
+        round_trip = RoundTripInfo._start(self._transport, message, hooks)
+        self._round_trip = round_trip
+        try:
+            await self._process_message(message)
+        except BaseException as e:
+            round_trip.exception = e
+            raise
+        finally:
+            self._round_trip = None
+            round_trip._finish(message)
+
     async def _process_single_message(self, Message message):
         """
         Process a single message within a request.
@@ -886,6 +1132,94 @@ cdef class BaseAsyncProtocol(BaseProtocol):
         self._break_in_progress = False
         errors._raise_err(errors.ERR_CALL_TIMEOUT_EXCEEDED, timeout=timeout)
 
+    async def _race_connect(self, ConnectParamsImpl params,
+                            Description description, list addresses):
+        """
+        Races connections to the given addresses and returns a 2-tuple
+        containing the transports of the first connection that is established
+        and the address to which it is connected. The transports are a 2-tuple
+        containing the transport to use and the underlying TCP transport. For
+        TCPS addresses, TLS is negotiated on each connection as soon as its TCP
+        connection is established and the connection is only considered
+        established once the TLS handshake has completed. The attempts are
+        started in the order of the addresses; the next attempt is started
+        when the delay has passed without an earlier attempt succeeding or as
+        soon as an earlier attempt fails. Each attempt must complete within the
+        TCP connect timeout. All other attempts are cancelled once one of them
+        succeeds. If all of the attempts fail, the first error encountered is
+        raised.
+        """
+        cdef:
+            ssize_t next_ix = 0, num_addresses = len(addresses)
+            double delay = params.parallel_connect_delay
+            double timeout = description.tcp_connect_timeout
+            object loop = self._read_buf._loop
+            object task, result = None, first_error = None
+            set pending = set(), done
+            Address address
+
+        async def set_up(Address address, object sock):
+            await loop.sock_connect(sock, (address.ip_address, address.port))
+            orig_transport, protocol = \
+                    await loop.create_connection(asyncio.Protocol, sock=sock)
+            transport = orig_transport
+            if address.protocol == "tcps":
+                try:
+                    transport = await self._transport.start_tls_async(
+                        loop, orig_transport, protocol, address
+                    )
+                except BaseException:
+                    orig_transport.close()
+                    raise
+            return ((transport, orig_transport), address)
+
+        async def connect(Address address):
+            sock = socket.socket(address.ip_family, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            try:
+                return await asyncio.wait_for(set_up(address, sock), timeout)
+            except asyncio.TimeoutError:
+                sock.close()
+                raise socket.timeout("timed out")
+            except BaseException:
+                sock.close()
+                raise
+
+        # the SSL context is shared by all of the attempts
+        for address in addresses:
+            if address.protocol == "tcps":
+                self._transport.create_ssl_context(params, description,
+                                                   address)
+                break
+
+        try:
+            while next_ix < num_addresses or pending:
+                if next_ix < num_addresses:
+                    address = addresses[next_ix]
+                    next_ix += 1
+                    pending.add(asyncio.ensure_future(connect(address)))
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=delay if next_ix < num_addresses else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        if first_error is None:
+                            first_error = task.exception()
+                    elif result is None:
+                        result = task.result()
+                    else:
+                        task.result()[0][0].close()
+                if result is not None:
+                    return result
+            raise first_error
+        finally:
+            for task in pending:
+                if not task.cancel() and not task.cancelled() \
+                        and task.exception() is None:
+                    task.result()[0][0].close()
+
     async def _receive_packet(self, Message message,
                               bint check_request_boundary=False,
                               bint in_pipeline=False):
@@ -1010,8 +1344,13 @@ cdef class BaseAsyncProtocol(BaseProtocol):
             ssize_t num_responses_to_discard
             ReadBuffer buf = self._read_buf
             Message message, end_message
-        end_message = conn_impl._create_message(EndPipelineMessage)
-        end_message.send(self._write_buf)
+        try:
+            end_message = conn_impl._create_message(EndPipelineMessage)
+            end_message.send(self._write_buf)
+        except:
+            self._transport.end_write_batch(send_packets=False)
+            raise
+        self._transport.end_write_batch()
         buf._check_request_boundary = True
         buf._in_pipeline = True
         try:
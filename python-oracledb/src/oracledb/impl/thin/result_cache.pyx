@@ -0,0 +1,271 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#------------------------------------------------------------------------------
+
+
+#------------------------------------------------------------------------------
+# result_cache.pyx
+#
+# Cython file defining the ResultCache class used to cache the results of
+# queries executed with connections acquired from a pool (embedded in
+# thin_impl.pyx).
+#------------------------------------------------------------------------------
+
+# regular expression used to find the identifiers referenced by a statement
+IDENTIFIER_REGEX = r'"[^"]+"|[A-Za-z][\w$#]*'
+
+# regular expression used to find the RESULT_CACHE hint which must be present
+# in a query for its results to be cached
+RESULT_CACHE_HINT_REGEX = r"/\*\+[^*]*?\bRESULT_CACHE\b"
+
+# identifiers of the functions and pseudocolumns that return a different value
+# each time they are evaluated; queries which reference them are not cached
+NON_DETERMINISTIC_IDENTIFIERS = frozenset([
+    "CURRENT_DATE",
+    "CURRENT_TIMESTAMP",
+    "CURRVAL",
+    "DBMS_RANDOM",
+    "LOCALTIMESTAMP",
+    "NEXTVAL",
+    "SYS_CONTEXT",
+    "SYS_GUID",
+    "SYSDATE",
+    "SYSTIMESTAMP",
+    "USERENV",
+])
+
+# prefixes of the data dictionary and dynamic performance views; queries which
+# reference them are not cached since their contents are changed by DDL and by
+# the database itself rather than by changes to tables
+DICTIONARY_VIEW_PREFIXES = ("ALL_", "CDB_", "DBA_", "GV$", "USER_", "V$")
+
+# maximum number of ALTER SESSION statements recorded for a session before its
+# state is considered unknown
+RESULT_CACHE_MAX_SESSION_STMTS = 32
+
+# maximum number of invalidated object names for which the generation of the
+# last invalidation is retained; once exceeded, the names are forgotten and any
+# results still being fetched are not stored in the cache
+RESULT_CACHE_MAX_INVALIDATED_NAMES = 1024
+
+# types of bind values which permit the results of a query to be cached
+RESULT_CACHE_BIND_TYPES = set([
+    bool,
+    bytes,
+    datetime.date,
+    datetime.datetime,
+    datetime.timedelta,
+    decimal.Decimal,
+    float,
+    int,
+    str,
+    type(None),
+])
+
+
+cdef class ResultCacheEntry:
+
+    cdef:
+        object key
+        list fetch_metadata
+        list rows
+        frozenset identifiers
+        uint64_t generation
+        uint64_t size
+        double expires
+        bint complete
+
+    cdef int add_row(self, tuple row) except -1:
+        """
+        Adds a row to the entry and updates the estimate of the amount of
+        memory consumed by the entry.
+        """
+        cdef object value
+        self.size += sys.getsizeof(row)
+        for value in row:
+            self.size += sys.getsizeof(value)
+        self.rows.append(row)
+
+
+cdef class ResultCache:
+
+    cdef:
+        object _entries
+        object _lock
+        dict _invalidated_generations
+        uint64_t _cleared_generation
+        uint64_t _generation
+        uint64_t _max_size
+        uint64_t _size
+        uint32_t _ttl
+
+    def __init__(self, uint64_t max_size, uint32_t ttl):
+        self._entries = collections.OrderedDict()
+        self._invalidated_generations = {}
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._ttl = ttl
+
+    cdef int _adjust_cache(self) except -1:
+        """
+        Adjust the cache so that the memory consumed by the cached entries does
+        not exceed the maximum size. The least recently used entries are
+        discarded first.
+        """
+        cdef ResultCacheEntry entry
+        while self._size > self._max_size:
+            entry = <ResultCacheEntry> self._entries.popitem(last=False)[1]
+            self._size -= entry.size
+
+    cdef int _remove_entry(self, ResultCacheEntry entry) except -1:
+        """
+        Removes the entry from the cache. The lock is expected to be held.
+        """
+        del self._entries[entry.key]
+        self._size -= entry.size
+
+    cdef bint _is_entry_invalidated(self, ResultCacheEntry entry):
+        """
+        Returns whether the cache or one of the objects referenced by the entry
+        was invalidated after the query that populated the entry was executed.
+        If the invalidated names were forgotten in the meantime, the entry is
+        also considered invalidated. The lock is expected to be held.
+        """
+        cdef str identifier
+        if entry.generation < self._cleared_generation:
+            return True
+        for identifier in entry.identifiers:
+            if self._invalidated_generations.get(identifier, 0) \
+                    > entry.generation:
+                return True
+        return False
+
+    cdef ResultCacheEntry create_entry(self, object key, list fetch_metadata,
+                                       frozenset identifiers,
+                                       uint64_t generation):
+        """
+        Creates an entry which will be populated with the rows fetched by a
+        cursor and then stored in the cache. If the entry grows larger than
+        the cache itself it is abandoned by the cursor. The identifiers found
+        in the statement are retained so that the entry can be invalidated
+        when one of the objects it references is changed. The generation is
+        the one returned by get_generation() before the query was executed.
+        """
+        cdef ResultCacheEntry entry
+        entry = ResultCacheEntry.__new__(ResultCacheEntry)
+        entry.key = key
+        entry.fetch_metadata = fetch_metadata
+        entry.rows = []
+        entry.size = sys.getsizeof(key[0])
+        entry.identifiers = identifiers
+        entry.generation = generation
+        return entry
+
+    cdef ResultCacheEntry get_entry(self, object key):
+        """
+        Returns the entry stored in the cache with the given key or None if no
+        such entry exists or the entry has expired.
+        """
+        cdef ResultCacheEntry entry
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires > 0 and time.monotonic() >= entry.expires:
+                    self._remove_entry(entry)
+                    return None
+                self._entries.move_to_end(key)
+            return entry
+
+    cdef uint64_t get_generation(self):
+        """
+        Returns the current generation of the cache. It is incremented each
+        time the cache is invalidated so that entries populated by queries
+        executed before the invalidation are not stored afterwards.
+        """
+        with self._lock:
+            return self._generation
+
+    cdef int invalidate(self, object table_names) except -1:
+        """
+        Removes entries from the cache. If table names are specified, only the
+        entries for statements whose text contains one of those names are
+        removed; otherwise, all entries are removed.
+        """
+        cdef:
+            ResultCacheEntry entry
+            set names
+            str name
+        with self._lock:
+            self._generation += 1
+            if table_names is None:
+                self._cleared_generation = self._generation
+                self._invalidated_generations.clear()
+                self._entries.clear()
+                self._size = 0
+                return 0
+            names = set()
+            for name in table_names:
+                names.add(name.rpartition(".")[2].strip('"').upper())
+            for name in names:
+                self._invalidated_generations[name] = self._generation
+            for entry in list(self._entries.values()):
+                if not names.isdisjoint(entry.identifiers):
+                    self._remove_entry(entry)
+            if len(self._invalidated_generations) \
+                    > RESULT_CACHE_MAX_INVALIDATED_NAMES:
+                self._cleared_generation = self._generation
+                self._invalidated_generations.clear()
+
+    cdef int put_entry(self, ResultCacheEntry entry) except -1:
+        """
+        Stores a fully populated entry in the cache, replacing any entry with
+        the same key that was stored in the meantime. The entry is discarded
+        if the cache was invalidated for any of the objects it references
+        while it was being populated.
+        """
+        cdef ResultCacheEntry existing_entry
+        entry.complete = True
+        if entry.size > self._max_size:
+            return 0
+        if self._ttl > 0:
+            entry.expires = time.monotonic() + self._ttl
+        with self._lock:
+            if self._is_entry_invalidated(entry):
+                return 0
+            existing_entry = self._entries.get(entry.key)
+            if existing_entry is not None:
+                self._remove_entry(existing_entry)
+            self._entries[entry.key] = entry
+            self._size += entry.size
+            self._adjust_cache()
+
+
+cdef frozenset _get_result_cache_identifiers(str sql):
+    """
+    Returns the set of identifiers found in the statement, normalized to upper
+    case without quotes, in the same way as the table names passed when
+    invalidating the cache.
+    """
+    return frozenset(
+        s.strip('"').upper() for s in re.findall(IDENTIFIER_REGEX, sql)
+    )
@@ -0,0 +1,161 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#------------------------------------------------------------------------------
+
+#------------------------------------------------------------------------------
+# round_trip.pyx
+#
+# Cython file defining the class used to report information about round trips
+# to the database to the hooks registered with
+# oracledb.register_round_trip_hook() (embedded in thin_impl.pyx).
+#------------------------------------------------------------------------------
+
+# characters used to encode the SQL id of a statement
+cdef str SQL_ID_CHARS = "0123456789abcdfghjkmnpqrstuvwxyz"
+
+
+cdef list _get_round_trip_hooks():
+    """
+    Returns the list of registered round trip hooks that have been selected to
+    receive information about the next round trip, based on their sample
+    rates. If no hooks have been selected, None is returned.
+    """
+    cdef:
+        list hooks = None
+        double sample_rate
+    for hook, sample_rate in REGISTERED_ROUND_TRIP_HOOKS:
+        if sample_rate >= 1 or random.random() < sample_rate:
+            if hooks is None:
+                hooks = []
+            hooks.append(hook)
+    return hooks
+
+
+cdef class RoundTripInfo:
+
+    cdef:
+        readonly str message_type
+        readonly str sql
+        readonly uint64_t bytes_sent
+        readonly uint64_t bytes_received
+        readonly uint64_t packets_sent
+        readonly uint64_t packets_received
+        readonly uint32_t piggybacks_sent
+        readonly uint32_t piggybacks_received
+        readonly double elapsed_time
+        readonly double server_time
+        readonly object exception
+        Transport _transport
+        double _start_time
+        list _hooks
+
+    @staticmethod
+    cdef RoundTripInfo _start(Transport transport, Message message,
+                              list hooks):
+        """
+        Starts recording information about the round trip (or round trips)
+        required to process the given message. The counters of the transport
+        are retained so that the differences can be calculated when the round
+        trip has finished.
+        """
+        cdef:
+            BaseThinCursorImpl cursor_impl
+            RoundTripInfo info
+        info = RoundTripInfo.__new__(RoundTripInfo)
+        info.message_type = type(message).__name__
+        if isinstance(message, MessageWithData):
+            cursor_impl = (<MessageWithData> message).cursor_impl
+            if cursor_impl is not None and cursor_impl._statement is not None:
+                info.sql = cursor_impl._statement._sql
+        info.bytes_sent = transport._num_bytes_sent
+        info.bytes_received = transport._num_bytes_received
+        info.packets_sent = transport._num_packets_sent
+        info.packets_received = transport._num_packets_received
+        info.piggybacks_sent = message.num_piggybacks_sent
+        info.piggybacks_received = message.num_piggybacks_received
+        info._transport = transport
+        info._hooks = hooks
+        transport._first_packet_time = 0
+        transport._last_send_time = 0
+        transport._trace_packets = True
+        info._start_time = time.monotonic()
+        return info
+
+    cdef int _finish(self, Message message) except -1:
+        """
+        Finishes recording information about the round trip and passes it to
+        each of the selected hooks. Exceptions raised by the hooks are ignored
+        so that they cannot interfere with the processing of the message.
+        """
+        cdef:
+            Transport transport = self._transport
+            double send_time
+        self.elapsed_time = time.monotonic() - self._start_time
+        transport._trace_packets = False
+        self.bytes_sent = transport._num_bytes_sent - self.bytes_sent
+        self.bytes_received = \
+                transport._num_bytes_received - self.bytes_received
+        self.packets_sent = transport._num_packets_sent - self.packets_sent
+        self.packets_received = \
+                transport._num_packets_received - self.packets_received
+        self.piggybacks_sent = \
+                message.num_piggybacks_sent - self.piggybacks_sent
+        self.piggybacks_received = \
+                message.num_piggybacks_received - self.piggybacks_received
+        if transport._first_packet_time > 0:
+            send_time = max(transport._last_send_time, self._start_time)
+            self.server_time = transport._first_packet_time - send_time
+        self._transport = None
+        for hook in self._hooks:
+            try:
+                hook(self)
+            except Exception:
+                pass
+
+    @property
+    def client_time(self):
+        """
+        Returns the time in seconds spent by the client encoding the message
+        and decoding the response, including the time spent waiting for any
+        response packets after the first.
+        """
+        return self.elapsed_time - self.server_time
+
+    @property
+    def sql_id(self):
+        """
+        Returns the SQL id calculated from the text of the statement, which
+        matches the SQL_ID column of views like V$SQL, or None if the message
+        does not execute a statement.
+        """
+        cdef:
+            uint64_t value
+            bytes digest
+        if self.sql is None:
+            return None
+        digest = hashlib.md5(self.sql.encode() + b"\0",
+                             usedforsecurity=False).digest()
+        value = (<uint64_t> int.from_bytes(digest[8:12], "little") << 32) \
+                | int.from_bytes(digest[12:16], "little")
+        return "".join(SQL_ID_CHARS[(value >> (5 * i)) & 31]
+                       for i in range(12, -1, -1))
@@ -308,6 +308,11 @@ cdef class Statement:
         bint _return_to_cache
         bint _is_nested
         bint _in_use
+        uint32_t _adaptive_fetch_array_size
+        uint32_t _adaptive_prefetch_rows
+        double _fetch_row_size
+        double _fetch_time_per_row
+        double _prefetch_time_per_row
 
     cdef Statement copy(self):
         cdef:
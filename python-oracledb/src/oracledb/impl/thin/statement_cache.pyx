@@ -26,7 +26,8 @@
 # statement_cache.pyx
 #
 # Cython file defining the StatementCache class used to manage cached
-# statements (embedded in thin_impl.pyx).
+# statements and the SharedStatementCache class used to share parsed
+# statements between the connections in a pool (embedded in thin_impl.pyx).
 #------------------------------------------------------------------------------
 
 cdef class StatementCache:
@@ -39,6 +40,7 @@ cdef class StatementCache:
         array.array _cursors_to_close
         ssize_t _num_cursors_to_close
         set _open_cursors
+        SharedStatementCache _shared_cache
 
     cdef int _add_cursor_to_close(self, Statement stmt) except -1:
         """
@@ -106,9 +108,12 @@ cdef class StatementCache:
             if sql is not None:
                 stmt = self._cached_statements.get(sql)
             if stmt is None:
-                stmt = Statement.__new__(Statement)
-                if sql is not None:
-                    stmt._prepare(sql)
+                if sql is not None and self._shared_cache is not None:
+                    stmt = self._shared_cache.get_statement(sql)
+                else:
+                    stmt = Statement.__new__(Statement)
+                    if sql is not None:
+                        stmt._prepare(sql)
                 if cache_statement and not stmt._is_ddl and self._max_size > 0:
                     stmt._return_to_cache = True
                     self._cached_statements[sql] = stmt
@@ -190,3 +195,38 @@ cdef class StatementCache:
             for i in range(self._num_cursors_to_close):
                 buf.write_ub4(cursor_ids[i])
             self._num_cursors_to_close = 0
+
+
+cdef class SharedStatementCache:
+
+    cdef:
+        object _templates
+        object _lock
+        uint32_t _max_size
+
+    def __init__(self, uint32_t max_size):
+        self._templates = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+
+    cdef Statement get_statement(self, str sql):
+        """
+        Returns a new statement for the given SQL. The statement is copied from
+        the parsed template stored in the cache, if one exists. Otherwise, the
+        SQL is parsed and the result is retained in the cache so that other
+        connections in the pool can avoid parsing it again.
+        """
+        cdef Statement template
+        with self._lock:
+            template = self._templates.get(sql)
+            if template is not None:
+                self._templates.move_to_end(sql)
+                return template.copy()
+        template = Statement.__new__(Statement)
+        template._prepare(sql)
+        if not template._is_ddl:
+            with self._lock:
+                self._templates[sql] = template
+                while len(self._templates) > self._max_size:
+                    self._templates.popitem(last=False)
+        return template.copy()
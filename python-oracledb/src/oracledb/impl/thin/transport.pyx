@@ -31,18 +31,89 @@
 
 cdef bint DEBUG_PACKETS = ("PYO_DEBUG_PACKETS" in os.environ)
 
+cdef enum:
+    MAX_WRITE_BATCH_SIZE = 1048576
+
+cdef enum:
+    MAX_SSL_CONTEXTS = 16
+
+# dictionary of SSL contexts created by the driver, indexed by a tuple
+# containing the wallet location, the modification time of the wallet file, a
+# salted digest of the wallet password and the TLS version; the contexts are
+# shared by all connections in order to avoid reading the wallet and
+# certificates each time a connection is established; contexts for an older
+# version of a wallet are discarded and no more than MAX_SSL_CONTEXTS are kept
+cdef dict _ssl_contexts = {}
+cdef bytes _ssl_context_salt = secrets.token_bytes(16)
+
+# TLS sessions that may be resumed, indexed by the SSL context used to
+# establish them; each value is a dictionary indexed by a tuple containing the
+# host name, the peer address and the SNI data
+_tls_sessions = weakref.WeakKeyDictionary()
+
+# TLS session to resume when negotiating TLS with asyncio; asyncio does not
+# provide a means of passing the session when it wraps the transport so it is
+# made available to the SSL context instead
+_async_tls_session = contextvars.ContextVar("async_tls_session", default=None)
+
+
+class _SSLContext(ssl.SSLContext):
+    """
+    SSL context created by the driver. When TLS is negotiated with asyncio,
+    the TLS session to resume (if any) is passed to the SSL object.
+    """
+
+    @classmethod
+    def create(cls):
+        """
+        Creates an SSL context with the same options, verification flags and
+        certificates as the context returned by ssl.create_default_context()
+        so that the security defaults of the running Python version apply.
+        """
+        default_context = ssl.create_default_context()
+        context = cls(ssl.PROTOCOL_TLS_CLIENT)
+        context.options = default_context.options
+        context.verify_mode = default_context.verify_mode
+        context.verify_flags = default_context.verify_flags
+        context.minimum_version = default_context.minimum_version
+        context.maximum_version = default_context.maximum_version
+        if default_context.keylog_filename is not None:
+            context.keylog_filename = default_context.keylog_filename
+        context.load_default_certs()
+        return context
+
+    def wrap_bio(self, incoming, outgoing, server_side=False,
+                 server_hostname=None, session=None):
+        if session is None:
+            session = _async_tls_session.get()
+        return super().wrap_bio(incoming, outgoing, server_side,
+                                server_hostname, session)
+
+
 cdef class Transport:
 
     cdef:
         object _transport
         object _ssl_context
         str _ssl_sni_data
+        tuple _tls_session_key
         uint32_t _transport_num
         ssize_t _max_packet_size
         uint32_t _op_num
-        bytes _partial_buf
+        bytearray _recv_buf
+        ssize_t _recv_start
+        ssize_t _recv_end
+        list _write_batch
+        ssize_t _write_batch_size
         bint _full_packet_size
         bint _is_async
+        uint64_t _num_bytes_sent
+        uint64_t _num_bytes_received
+        uint64_t _num_packets_sent
+        uint64_t _num_packets_received
+        double _first_packet_time
+        double _last_send_time
+        bint _trace_packets
 
     cdef str _calc_sni_data(self, Description description):
         """
@@ -129,13 +200,76 @@ cdef class Transport:
                                 Address address) except -1:
         """
         Creates the SSL context used for establishing TLS communications
-        between the database and the client.
+        between the database and the client. Unless a custom SSL context is
+        supplied, contexts are cached and reused for subsequent connections
+        with the same wallet and TLS version.
+        """
+        cdef:
+            str pem_file_name = None
+            object wallet_password = None
+            double wallet_mtime = 0
+            tuple key
+
+        # if a wallet is specified, either mTLS is being used or a set of
+        # certificates is being loaded to validate the server
+        if description.wallet_location is not None:
+            pem_file_name = os.path.join(description.wallet_location,
+                                         PEM_WALLET_FILE_NAME)
+            if not os.path.exists(pem_file_name):
+                errors._raise_err(errors.ERR_WALLET_FILE_MISSING,
+                                  name=pem_file_name)
+            wallet_mtime = os.path.getmtime(pem_file_name)
+            wallet_password = params._get_wallet_password()
+
+        # a custom SSL context is configured each time it is used; otherwise,
+        # a cached SSL context with the same configuration is used, if one
+        # exists
+        if params.ssl_context is not None:
+            self._ssl_context = params.ssl_context
+            self._configure_ssl_context(description, pem_file_name,
+                                        wallet_password)
+        else:
+            key = (description.wallet_location, wallet_mtime,
+                   self._get_wallet_password_digest(wallet_password),
+                   description.ssl_version)
+            self._ssl_context = _ssl_contexts.get(key)
+            if self._ssl_context is None:
+                self._ssl_context = _SSLContext.create()
+                self._configure_ssl_context(description, pem_file_name,
+                                            wallet_password)
+                self._cache_ssl_context(key)
+
+        # calculate the SNI data to send to the server, if applicable
+        if description.use_sni:
+            self._ssl_sni_data = self._calc_sni_data(description)
+        else:
+            self._ssl_sni_data = None
+
+    cdef int _cache_ssl_context(self, tuple key) except -1:
         """
+        Caches the SSL context so that it can be used by subsequent
+        connections with the same configuration. Contexts for the same wallet
+        location with a different modification time or password are discarded
+        since they refer to an older wallet, as are the oldest contexts when
+        the maximum number of cached contexts is reached.
+        """
+        cdef tuple other_key
+        for other_key in list(_ssl_contexts):
+            if other_key[0] == key[0] and other_key[3] == key[3]:
+                _ssl_contexts.pop(other_key, None)
+        while len(_ssl_contexts) >= MAX_SSL_CONTEXTS:
+            for other_key in _ssl_contexts:
+                break
+            _ssl_contexts.pop(other_key, None)
+        _ssl_contexts[key] = self._ssl_context
 
-        # start with a default SSL context, unless a custom one is supplied
-        self._ssl_context = params.ssl_context
-        if self._ssl_context is None:
-            self._ssl_context = ssl.create_default_context()
+    cdef int _configure_ssl_context(self, Description description,
+                                    str pem_file_name,
+                                    object wallet_password) except -1:
+        """
+        Configures the SSL context with the TLS version, certificates and
+        wallet required for the connection.
+        """
 
         # set the minimum and maximum versions of the TLS protocol
         if description.ssl_version is not None:
@@ -154,16 +288,9 @@ cdef class Transport:
                 macos_certs = certs.decode("utf-8")
             self._ssl_context.load_verify_locations(cadata=macos_certs)
 
-        # if a wallet is specified, either mTLS is being used or a set of
-        # certificates is being loaded to validate the server
-        if description.wallet_location is not None:
-            pem_file_name = os.path.join(description.wallet_location,
-                                         PEM_WALLET_FILE_NAME)
-            if not os.path.exists(pem_file_name):
-                errors._raise_err(errors.ERR_WALLET_FILE_MISSING,
-                                  name=pem_file_name)
+        # load the wallet, if one was specified
+        if pem_file_name is not None:
             self._ssl_context.load_verify_locations(pem_file_name)
-            wallet_password = params._get_wallet_password()
             try:
                 self._ssl_context.load_cert_chain(pem_file_name,
                                                   password=wallet_password)
@@ -175,41 +302,181 @@ cdef class Transport:
         # established
         self._ssl_context.check_hostname = False
 
-        # calculate the SNI data to send to the server, if applicable
-        if description.use_sni:
-            self._ssl_sni_data = self._calc_sni_data(description)
-        else:
-            self._ssl_sni_data = None
+    cdef bytes _get_wallet_password_digest(self, str wallet_password):
+        """
+        Returns a salted digest of the wallet password which is used in the
+        key of the SSL context cache instead of the password itself.
+        """
+        if wallet_password is not None:
+            return hashlib.sha256(
+                _ssl_context_salt + wallet_password.encode()
+            ).digest()
+
+    cdef object _get_tls_session(self, tuple key):
+        """
+        Returns the TLS session with the given key that may be resumed when
+        negotiating TLS or None if no such session is available.
+        """
+        cdef dict sessions = _tls_sessions.get(self._ssl_context)
+        if sessions is not None:
+            return sessions.get(key)
+
+    cdef tuple _get_tls_session_key(self, Address address, object peer):
+        """
+        Returns the key used to look up the TLS session that may be resumed
+        when negotiating TLS with the given address and peer.
+        """
+        return (address.host, peer, self._ssl_sni_data)
+
+    cdef int _reserve_recv_space(self, ssize_t num_bytes) except -1:
+        """
+        Ensures that the receive buffer has room for at least the specified
+        number of bytes after the data that has not yet been extracted into
+        packets. Any such data is first moved to the start of the buffer and
+        the buffer is only grown if that does not free up enough space.
+        """
+        cdef:
+            ssize_t num_bytes_used, new_size
+            bytearray new_buf
+            char_type *ptr
+        if self._recv_buf is None:
+            self._recv_buf = bytearray(max(num_bytes, self._max_packet_size))
+            return 0
+        if len(self._recv_buf) - self._recv_end >= num_bytes:
+            return 0
+        num_bytes_used = self._recv_end - self._recv_start
+        ptr = <char_type*> self._recv_buf
+        if len(self._recv_buf) - num_bytes_used < num_bytes:
+            new_size = max(len(self._recv_buf) * 2, num_bytes_used + num_bytes)
+            new_buf = bytearray(new_size)
+            memcpy(<char_type*> new_buf, &ptr[self._recv_start],
+                   num_bytes_used)
+            self._recv_buf = new_buf
+        elif num_bytes_used > 0:
+            memmove(ptr, &ptr[self._recv_start], num_bytes_used)
+        self._recv_start = 0
+        self._recv_end = num_bytes_used
+
+    cdef int _send_packets_sync(self, list packets) except -1:
+        """
+        Sends the packets synchronously. The database may start sending
+        responses before all of the packets have been sent (such as when a
+        large pipeline is being executed) and stop reading requests once its
+        own send buffer is full. To avoid a deadlock the socket is placed in
+        non-blocking mode and any data that arrives while the packets are being
+        sent is read into the receive buffer for later extraction. Data that
+        has already been decrypted and buffered by an SSL socket is read
+        before waiting for the socket to become ready.
+        """
+        cdef:
+            object sock = self._transport, timeout, selector
+            bint use_sendmsg, is_ssl, readable, writable
+            ssize_t num_bytes
+            int mask
+        timeout = sock.gettimeout()
+        is_ssl = isinstance(sock, ssl.SSLSocket)
+        use_sendmsg = not is_ssl and hasattr(sock, "sendmsg")
+        if not use_sendmsg:
+            packets = [b"".join(packets)]
+        selector = selectors.DefaultSelector()
+        selector.register(sock, selectors.EVENT_READ | selectors.EVENT_WRITE)
+        sock.settimeout(0)
+        try:
+            while packets:
+                if is_ssl and sock.pending() > 0:
+                    readable = writable = True
+                else:
+                    events = selector.select(timeout)
+                    if not events:
+                        raise TimeoutError()
+                    mask = events[0][1]
+                    readable = mask & selectors.EVENT_READ
+                    writable = mask & selectors.EVENT_WRITE
+                if readable:
+                    self._reserve_recv_space(self._max_packet_size)
+                    try:
+                        with memoryview(self._recv_buf)[self._recv_end:] \
+                                as view:
+                            num_bytes = sock.recv_into(view)
+                    except (BlockingIOError, ssl.SSLWantReadError,
+                            ssl.SSLWantWriteError):
+                        num_bytes = -1
+                    if num_bytes == 0:
+                        raise ConnectionResetError()
+                    elif num_bytes > 0:
+                        self._recv_end += num_bytes
+                if not writable:
+                    continue
+                try:
+                    if use_sendmsg:
+                        num_bytes = sock.sendmsg(packets)
+                    else:
+                        num_bytes = sock.send(packets[0])
+                except (BlockingIOError, ssl.SSLWantReadError,
+                        ssl.SSLWantWriteError):
+                    continue
+                while num_bytes > 0:
+                    if num_bytes < len(packets[0]):
+                        packets[0] = memoryview(packets[0])[num_bytes:]
+                        break
+                    num_bytes -= len(packets[0])
+                    packets.pop(0)
+        finally:
+            selector.close()
+            if sock.fileno() >= 0:
+                sock.settimeout(timeout)
+
+    cdef int _send_write_batch(self) except -1:
+        """
+        Sends all of the packets that have been queued in the write batch with
+        as few calls as possible. Gather I/O is used when the transport
+        supports it; otherwise, the packets are joined and sent in one call.
+        """
+        cdef list packets = self._write_batch
+        self._write_batch = []
+        self._write_batch_size = 0
+        if not packets:
+            return 0
+        try:
+            if self._is_async:
+                self._transport.writelines(packets)
+            else:
+                self._send_packets_sync(packets)
+        except OSError as e:
+            self.disconnect()
+            errors._raise_err(errors.ERR_CONNECTION_CLOSED, cause=e)
 
     cdef Packet extract_packet(self, bytes data=None):
         """
-        Extracts a packet from the data, if possible (after first appending it
-        to the partial buffer, if applicable). Any extra data not needed by the
-        packet is stored in the partial buffer for a later call to this
+        Extracts a packet from the receive buffer, if possible (after first
+        appending the data to it, if applicable). Any extra data not needed by
+        the packet remains in the receive buffer for a later call to this
         function.
         """
         cdef:
-            ssize_t size, packet_size
-            Packet packet
+            ssize_t size, packet_size, num_bytes
             char_type *ptr
+            Packet packet
 
-        # update the partial buffer with the new data
+        # append the new data to the receive buffer, if applicable
         if data is not None:
-            if self._partial_buf is None:
-                self._partial_buf = data
-            else:
-                self._partial_buf += data
-        size = 0 if self._partial_buf is None else len(self._partial_buf)
+            num_bytes = len(data)
+            self._reserve_recv_space(num_bytes)
+            ptr = <char_type*> self._recv_buf
+            memcpy(&ptr[self._recv_end], <char_type*> data, num_bytes)
+            self._recv_end += num_bytes
+        size = self._recv_end - self._recv_start
 
         # if enough bytes for the packet header, extract the packet size
         if size >= PACKET_HEADER_SIZE:
 
             # extract the packet size
-            ptr = <char_type*> self._partial_buf
+            ptr = <char_type*> self._recv_buf
+            ptr = &ptr[self._recv_start]
             if self._full_packet_size:
-                packet_size = decode_uint32be(ptr)
+                packet_size = decode_uint32be(<const char_type*> ptr)
             else:
-                packet_size = decode_uint16be(ptr)
+                packet_size = decode_uint16be(<const char_type*> ptr)
 
             # if enough bytes are available for the packet, return it
             if size >= packet_size:
@@ -218,20 +485,38 @@ cdef class Transport:
                 packet.packet_type = ptr[4]
                 packet.packet_flags = ptr[5]
 
-                # store the packet buffer and adjust the partial buffer, as
-                # needed
-                if size == packet_size:
-                    packet.buf = self._partial_buf
-                    self._partial_buf = None
-                else:
-                    packet.buf = self._partial_buf[:packet_size]
-                    self._partial_buf = self._partial_buf[packet_size:]
+                # copy the packet out of the receive buffer; the packet owns
+                # this copy so the receive buffer can be reused immediately
+                packet.buf = self._recv_buf[self._recv_start:
+                                            self._recv_start + packet_size]
+                self._recv_start += packet_size
+                if self._recv_start == self._recv_end:
+                    self._recv_start = self._recv_end = 0
+
+                # update statistics used by round trip hooks
+                self._num_bytes_received += packet_size
+                self._num_packets_received += 1
+                if self._trace_packets and self._first_packet_time == 0:
+                    self._first_packet_time = time.monotonic()
 
                 # display packet, if requested
                 if DEBUG_PACKETS:
                     self._print_packet("Receiving packet", packet.buf)
                 return packet
 
+    cdef int end_write_batch(self, bint send_packets=True) except -1:
+        """
+        Ends the write batch started by start_write_batch(). The packets that
+        are still queued are sent, unless requested otherwise (such as when
+        an exception occurs while the batch is being built).
+        """
+        try:
+            if send_packets:
+                self._send_write_batch()
+        finally:
+            self._write_batch = None
+            self._write_batch_size = 0
+
     cdef tuple get_host_info(self):
         """
         Return a 2-tuple supplying the host and port to which the transport is
@@ -244,6 +529,26 @@ cdef class Transport:
             sock = self._transport
         return sock.getpeername()[:2]
 
+    cdef int complete_tls(self, Address address,
+                          Description description) except -1:
+        """
+        Completes the negotiation of TLS once the TLS handshake has been
+        performed on the transport. The TLS session is saved so that it can be
+        resumed and the server distinguished name is checked, if applicable.
+        """
+        cdef object ssl_obj, peer
+        if self._is_async:
+            ssl_obj = self._transport.get_extra_info("ssl_object")
+            peer = self._transport.get_extra_info("peername")
+        else:
+            ssl_obj = self._transport
+            peer = ssl_obj.getpeername()
+        self._tls_session_key = self._get_tls_session_key(address, peer)
+        self.save_tls_session()
+        if description.ssl_server_dn_match:
+            check_server_dn(ssl_obj, description.ssl_server_cert_dn,
+                            address.host)
+
     cdef int has_data_ready(self, bint *data_ready) except -1:
         """
         Returns true if data is ready to be read on the transport.
@@ -257,14 +562,9 @@ cdef class Transport:
         """
         Negotiate TLS on the socket.
         """
-        if DEBUG_PACKETS:
-            self._print_output(self._get_debugging_header("Negotiate TLS"))
-        self._transport = self._ssl_context.wrap_socket(
-            sock, server_hostname=self._ssl_sni_data
-        )
-        if description.ssl_server_dn_match:
-            check_server_dn(self._transport, description.ssl_server_cert_dn,
-                            address.host)
+        self._transport = self.wrap_socket(sock, address)
+        self._transport.do_handshake()
+        self.complete_tls(address, description)
 
     cdef int renegotiate_tls(self, Address address,
                              Description description) except -1:
@@ -281,18 +581,11 @@ cdef class Transport:
         """
         Negotiate TLS on the socket asynchronously.
         """
-        if DEBUG_PACKETS:
-            self._print_output(self._get_debugging_header("Negotiate TLS"))
         orig_transport = self._transport
-        loop = protocol._read_buf._loop
-        self._transport = await loop.start_tls(
-            self._transport, protocol,
-            self._ssl_context,
-            server_hostname=self._ssl_sni_data
+        self._transport = await self.start_tls_async(
+            protocol._read_buf._loop, orig_transport, protocol, address
         )
-        if description.ssl_server_dn_match:
-            sock = self._transport.get_extra_info("ssl_object")
-            check_server_dn(sock, description.ssl_server_cert_dn, address.host)
+        self.complete_tls(address, description)
         return orig_transport
 
     cdef int send_oob_break(self) except -1:
@@ -331,30 +624,80 @@ cdef class Transport:
             sock.settimeout(None)
         self._transport = transport
         self._transport_num = sock.fileno()
+        self._tls_session_key = None
+
+    async def start_tls_async(self, object loop, object transport,
+                              object protocol, Address address):
+        """
+        Performs the TLS handshake with the given address on the transport
+        (using asyncio) and returns the new transport. The TLS session saved
+        for the address, if any, is resumed.
+        """
+        cdef tuple key
+        if DEBUG_PACKETS:
+            self._print_output(self._get_debugging_header("Negotiate TLS"))
+        key = self._get_tls_session_key(
+            address, transport.get_extra_info("peername")
+        )
+        token = _async_tls_session.set(self._get_tls_session(key))
+        try:
+            return await loop.start_tls(transport, protocol,
+                                        self._ssl_context,
+                                        server_hostname=self._ssl_sni_data)
+        finally:
+            _async_tls_session.reset(token)
+
+    cdef int save_tls_session(self) except -1:
+        """
+        Saves the TLS session negotiated on the transport so that subsequent
+        connections to the same host can resume it instead of performing a
+        full handshake. This is called after TLS has been negotiated and again
+        after the connection has been established since servers using TLS 1.3
+        only send the session ticket after the handshake has completed.
+        """
+        cdef:
+            object ssl_obj, session
+            dict sessions
+        if self._tls_session_key is None:
+            return 0
+        if self._is_async:
+            ssl_obj = self._transport.get_extra_info("ssl_object")
+        else:
+            ssl_obj = self._transport
+        session = ssl_obj.session
+        if session is None:
+            return 0
+        sessions = _tls_sessions.get(self._ssl_context)
+        if sessions is None:
+            sessions = _tls_sessions.setdefault(self._ssl_context, {})
+        sessions[self._tls_session_key] = session
 
     cdef Packet read_packet(self, bint raise_exc=True):
         """
         Reads a packet from the transport.
         """
         cdef:
+            ssize_t num_bytes
             Packet packet
-            bytes data
         packet = self.extract_packet()
         while packet is None:
+            self._reserve_recv_space(self._max_packet_size)
             try:
-                data = self._transport.recv(self._max_packet_size)
+                with memoryview(self._recv_buf)[self._recv_end:] as view:
+                    num_bytes = self._transport.recv_into(view)
             except ConnectionResetError as e:
                 self._transport = None
                 if not raise_exc:
                     return None
                 errors._raise_err(errors.ERR_CONNECTION_CLOSED, str(e),
                                   cause=e)
-            if len(data) == 0:
+            if num_bytes == 0:
                 self.disconnect()
                 if not raise_exc:
                     return None
                 errors._raise_err(errors.ERR_CONNECTION_CLOSED)
-            packet = self.extract_packet(data)
+            self._recv_end += num_bytes
+            packet = self.extract_packet()
         return packet
 
     cdef int set_timeout(self, double value) except -1:
@@ -363,18 +706,62 @@ cdef class Transport:
         """
         self._transport.settimeout(value or None)
 
+    cdef int start_write_batch(self) except -1:
+        """
+        Starts a write batch. Until end_write_batch() is called, packets are
+        queued instead of being written immediately so that many small
+        packets (such as those generated by a pipeline) can be sent to the
+        database with a single call.
+        """
+        self._write_batch = []
+        self._write_batch_size = 0
+
+    cdef object wrap_socket(self, object sock, Address address):
+        """
+        Wraps the connected socket so that TLS can be negotiated with the given
+        address and returns the wrapped socket. The TLS session saved for the
+        address, if any, is resumed. The TLS handshake is not performed; this
+        is left to the caller so that it can also be performed on a
+        non-blocking socket.
+        """
+        cdef tuple key
+        if DEBUG_PACKETS:
+            self._print_output(self._get_debugging_header("Negotiate TLS"))
+        key = self._get_tls_session_key(address, sock.getpeername())
+        return self._ssl_context.wrap_socket(
+            sock,
+            server_hostname=self._ssl_sni_data,
+            session=self._get_tls_session(key),
+            do_handshake_on_connect=False
+        )
+
     cdef int write_packet(self, WriteBuffer buf) except -1:
         """
-        Writes a packet on the transport.
+        Writes a packet on the transport. When a write batch is active or
+        asyncio is being used, the packet is copied since the write buffer is
+        reused for the next packet; otherwise, the packet is sent directly from
+        the write buffer without being copied.
         """
-        cdef bytes data = buf._data[:buf._pos]
+        cdef bytes data
         if DEBUG_PACKETS:
-            self._print_packet("Sending packet", data)
+            self._print_packet("Sending packet", buf._data_obj[:buf._pos])
+        self._num_bytes_sent += buf._pos
+        self._num_packets_sent += 1
+        if self._trace_packets and self._first_packet_time == 0:
+            self._last_send_time = time.monotonic()
+        if self._write_batch is not None:
+            self._write_batch.append(buf._data[:buf._pos])
+            self._write_batch_size += buf._pos
+            if self._write_batch_size >= MAX_WRITE_BATCH_SIZE:
+                self._send_write_batch()
+            return 0
         try:
             if self._is_async:
+                data = buf._data[:buf._pos]
                 self._transport.write(data)
             else:
-                self._transport.send(data)
+                with memoryview(buf._data_obj)[:buf._pos] as view:
+                    self._transport.sendall(view)
         except OSError as e:
             self.disconnect()
             errors._raise_err(errors.ERR_CONNECTION_CLOSED, cause=e)
@@ -92,6 +92,25 @@ cdef str _get_connect_data(Description description, str connection_id, ConnectPa
     return description.build_connect_string(cid)
 
 
+cdef bint _use_parallel_connect(AddressList address_list,
+                                Description description,
+                                ConnectParamsImpl params):
+    """
+    Returns whether TCP connections to the addresses in the address list should
+    be raced instead of being attempted one after the other. This is not
+    possible when using TCP fast open or a proxy.
+    """
+    cdef Address address
+    if params.parallel_connect_delay <= 0 \
+            or len(address_list.active_children) < 2 \
+            or description.use_tcp_fast_open:
+        return False
+    for address in address_list.active_children:
+        if address.https_proxy is not None:
+            return False
+    return True
+
+
 cdef int _check_cryptography() except -1:
     """
     Checks to see that the cryptography package was imported successfully.
@@ -29,12 +29,39 @@
 # thin_impl.pyx).
 #------------------------------------------------------------------------------
 
+cdef array.array row_block_states_template = array.array('B')
+cdef array.array row_block_values_template = array.array('q')
+
+
 cdef class ThinVarImpl(BaseVarImpl):
     cdef:
         object _last_raw_value
         ArrowArrayImpl _last_arrow_array
         ArrowArrayImpl _saved_arrow_array
         list _coroutine_indexes
+        uint8_t _row_block_kind
+        array.array _row_block_states
+        array.array _row_block_values
+
+    cdef int _append_row_block_value(self, RowBlockColumnImpl column,
+                                     uint32_t pos) except -1:
+        """
+        Appends the value at the given position to the row block column. Values
+        that were decoded into the typed buffer are appended without creating
+        a Python object.
+        """
+        cdef:
+            RowBlockValue *value
+            uint8_t state
+        if self._row_block_states is not None:
+            state = self._row_block_states.data.as_uchars[pos]
+            if state == ROW_BLOCK_VALUE_TYPED:
+                value = &(<RowBlockValue*>
+                          self._row_block_values.data.as_voidptr)[pos]
+                return column.append_typed_value(self._row_block_kind, value)
+            elif state == ROW_BLOCK_VALUE_NULL:
+                return column.append_null()
+        column.append_value(self._values[pos])
 
     cdef int _bind(self, object conn, BaseCursorImpl cursor_impl,
                    uint32_t num_execs, object name, uint32_t pos) except -1:
@@ -107,6 +134,19 @@ cdef class ThinVarImpl(BaseVarImpl):
             bind_info = bind_info_list[pos - 1]
             stmt._set_var(bind_info, self, thin_cursor_impl)
 
+    cdef int _copy_row_block_value(self, uint32_t from_pos,
+                                   uint32_t to_pos) except -1:
+        """
+        Copies the value in the typed buffer at one position to another
+        position. This is used when the database indicates that a column value
+        is a duplicate of the value in the previous row.
+        """
+        cdef RowBlockValue *values
+        values = <RowBlockValue*> self._row_block_values.data.as_voidptr
+        values[to_pos] = values[from_pos]
+        self._row_block_states.data.as_uchars[to_pos] = \
+                self._row_block_states.data.as_uchars[from_pos]
+
     cdef int _finalize_init(self) except -1:
         """
         Internal method that finalizes initialization of the variable.
@@ -136,8 +176,71 @@ cdef class ThinVarImpl(BaseVarImpl):
         Internal method to return the value of the variable at the given
         position.
         """
+        cdef:
+            RowBlockValue *value
+            uint8_t state
+        if self._row_block_states is not None:
+            state = self._row_block_states.data.as_uchars[pos]
+            if state == ROW_BLOCK_VALUE_NULL:
+                return None
+            elif state == ROW_BLOCK_VALUE_TYPED:
+                value = &(<RowBlockValue*>
+                          self._row_block_values.data.as_voidptr)[pos]
+                if self._row_block_kind == ROW_BLOCK_COLUMN_KIND_DOUBLE:
+                    return value.as_double
+                return value.as_int64
         return self._values[pos]
 
+    cdef int _prepare_row_block_values(self, bint fetching_block,
+                                       uint32_t last_row_index) except -1:
+        """
+        Called before the rows returned by a round trip are processed. When
+        the rows are being fetched into a row block, fixed width numeric
+        values are decoded into a typed buffer instead of being converted to
+        Python objects. The value of the last row of the previous round trip
+        is retained since the first row may be a duplicate of it.
+        """
+        cdef uint8_t kind = ROW_BLOCK_COLUMN_KIND_OBJECT
+        if fetching_block and self._fetch_metadata.buffer_size > 0:
+            kind = get_row_block_column_kind(self)
+        if self._row_block_states is not None \
+                and kind != self._row_block_kind:
+            if last_row_index < self.num_elements:
+                self._values[last_row_index] = \
+                        self._get_scalar_value(last_row_index)
+            self._row_block_states = self._row_block_values = None
+        if kind == ROW_BLOCK_COLUMN_KIND_OBJECT:
+            return 0
+        if self._row_block_states is None:
+            self._row_block_kind = kind
+            self._row_block_states = array.clone(row_block_states_template,
+                                                 self.num_elements, True)
+            self._row_block_values = array.clone(row_block_values_template,
+                                                 self.num_elements, False)
+        elif len(self._row_block_states) < self.num_elements:
+            array.resize(self._row_block_states, self.num_elements)
+            array.resize(self._row_block_values, self.num_elements)
+
+    cdef object _set_row_block_value(self, uint32_t pos,
+                                     OracleMetadata metadata,
+                                     OracleData* data):
+        """
+        Decodes the fetched value into the typed buffer at the given position.
+        If the value cannot be stored in the typed buffer, it is converted to
+        a Python object and returned instead; otherwise, None is returned.
+        """
+        cdef:
+            RowBlockValue *value
+            uint8_t state
+        value = &(<RowBlockValue*> self._row_block_values.data.as_voidptr)[pos]
+        state = convert_oracle_data_to_row_block(self._row_block_kind,
+                                                 metadata, data, value)
+        self._row_block_states.data.as_uchars[pos] = state
+        if state == ROW_BLOCK_VALUE_OBJECT:
+            return convert_oracle_data_to_python(metadata, self.metadata, data,
+                                                 self._encoding_errors,
+                                                 from_dbobject=False)
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     cdef int _set_scalar_value(self, uint32_t pos, object value) except -1:
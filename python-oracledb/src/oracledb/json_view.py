@@ -0,0 +1,193 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# json_view.py
+#
+# Contains the JsonObjectView and JsonArrayView classes which provide
+# read-only access to JSON values without decoding them in advance.
+# -----------------------------------------------------------------------------
+
+import collections.abc
+from typing import Any, Iterator, Union
+
+from .base import BaseMetaClass
+
+# placeholder stored in a JsonObjectView for values that have not been decoded
+_NOT_DECODED = object()
+
+
+class JsonObjectView(dict, metaclass=BaseMetaClass):
+    """
+    Identifies a read-only dictionary over a JSON object which decodes each of
+    its values only when it is accessed.
+    """
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, JsonObjectView):
+            other = other.asdict()
+        elif not isinstance(other, collections.abc.Mapping):
+            return NotImplemented
+        return self.asdict() == other
+
+    def __getitem__(self, name: str) -> Any:
+        """
+        Returns the value of the field with the given name. The value is
+        decoded the first time it is accessed.
+        """
+        value = dict.__getitem__(self, name)
+        if value is _NOT_DECODED:
+            value = self._impl.get_field_value(name)
+            dict.__setitem__(self, name, value)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Returns an iterator over the names of the fields in the object.
+        Defining it ensures that copying the object into another dictionary
+        accesses each value with __getitem__() instead of directly.
+        """
+        return dict.__iter__(self)
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __or__(self, other: Any) -> dict:
+        if not isinstance(other, collections.abc.Mapping):
+            return NotImplemented
+        return self.copy() | other
+
+    def __reduce__(self):
+        return (dict, (self.asdict(),))
+
+    def __repr__(self):
+        cls_name = self.__class__._public_name
+        return f"<{cls_name} with {len(self)} fields>"
+
+    def _raise_read_only(self, *args, **kwargs):
+        cls_name = self.__class__._public_name
+        raise TypeError(f"{cls_name} objects are read-only")
+
+    __delitem__ = __ior__ = __setitem__ = _raise_read_only
+    clear = pop = popitem = setdefault = update = _raise_read_only
+
+    @classmethod
+    def _from_impl(cls, impl, names):
+        view = cls.__new__(cls)
+        dict.update(view, dict.fromkeys(names, _NOT_DECODED))
+        view._impl = impl
+        return view
+
+    def asdict(self) -> dict:
+        """
+        Returns a dictionary containing all of the fields of the object. The
+        object and all of the objects and arrays nested within it are fully
+        decoded.
+        """
+        return self._impl.decode_all()
+
+    def copy(self) -> dict:
+        """
+        Returns a shallow copy of the object as a dictionary. Nested objects
+        and arrays are not decoded.
+        """
+        return dict(self.items())
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        Returns the value of the field with the given name, or the default
+        value if the object has no field with that name.
+        """
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def items(self) -> collections.abc.ItemsView:
+        """
+        Returns a view of the (name, value) pairs of the object.
+        """
+        return collections.abc.ItemsView(self)
+
+    def values(self) -> collections.abc.ValuesView:
+        """
+        Returns a view of the values of the fields of the object.
+        """
+        return collections.abc.ValuesView(self)
+
+
+class JsonArrayView(tuple, metaclass=BaseMetaClass):
+    """
+    Identifies a read-only sequence over a JSON array. The elements are
+    decoded when the array is first accessed but the objects within it are
+    returned as JsonObjectView objects whose values are only decoded when they
+    are accessed.
+    """
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, JsonArrayView):
+            other = other.aslist()
+        elif not isinstance(other, list):
+            return NotImplemented
+        return self.aslist() == other
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """
+        Returns the element at the given index, or a list of elements if a
+        slice is given.
+        """
+        if isinstance(index, slice):
+            return list(tuple.__getitem__(self, index))
+        return tuple.__getitem__(self, index)
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __reduce__(self):
+        return (list, (self.aslist(),))
+
+    def __repr__(self):
+        cls_name = self.__class__._public_name
+        return f"<{cls_name} with {len(self)} elements>"
+
+    __hash__ = None
+
+    @classmethod
+    def _from_impl(cls, impl, values):
+        view = tuple.__new__(cls, values)
+        view._impl = impl
+        return view
+
+    def aslist(self) -> list:
+        """
+        Returns a list containing all of the elements of the array. The array
+        and all of the objects and arrays nested within it are fully decoded.
+        """
+        return self._impl.decode_all()
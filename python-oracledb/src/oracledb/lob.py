@@ -28,7 +28,11 @@
 # Contains the LOB class for managing BLOB, CLOB, NCLOB and BFILE data.
 # -----------------------------------------------------------------------------
 
-from typing import Optional, Union
+import asyncio
+import concurrent.futures
+import inspect
+import threading
+from typing import Any, Optional, Union
 
 from .base import BaseMetaClass
 from .base_impl import DbType, DB_TYPE_BFILE, DB_TYPE_BLOB
@@ -48,6 +52,15 @@ class BaseLOB(metaclass=BaseMetaClass):
         if self._impl.dbtype is DB_TYPE_BFILE:
             errors._raise_err(errors.ERR_OPERATION_NOT_SUPPORTED_ON_BFILE)
 
+    def _check_stream_args(self, offset, chunk_size):
+        """
+        Checks the arguments passed to open_stream().
+        """
+        if offset <= 0:
+            errors._raise_err(errors.ERR_INVALID_LOB_OFFSET)
+        if chunk_size is not None and chunk_size <= 0:
+            errors._raise_err(errors.ERR_INVALID_LOB_AMOUNT)
+
     def _check_value_to_write(self, value):
         """
         Checks the value to write and returns the actual value to write.
@@ -149,6 +162,22 @@ class LOB(BaseLOB):
         """
         self._impl.open()
 
+    def open_stream(
+        self,
+        offset: int = 1,
+        chunk_size: Optional[int] = None,
+        read_ahead: bool = True,
+    ) -> "LOBStream":
+        """
+        Returns a file-like stream for reading and writing the LOB, starting
+        at the given offset. Data is transferred in chunks of chunk_size,
+        which is rounded up to a multiple of getchunksize(). If read_ahead is
+        True, the next chunk is requested from the database while the
+        current chunk is being consumed.
+        """
+        self._check_stream_args(offset, chunk_size)
+        return LOBStream(self, offset, chunk_size, read_ahead)
+
     def read(
         self, offset: int = 1, amount: Optional[int] = None
     ) -> Union[str, bytes]:
@@ -256,6 +285,22 @@ class AsyncLOB(BaseLOB):
         """
         await self._impl.open()
 
+    def open_stream(
+        self,
+        offset: int = 1,
+        chunk_size: Optional[int] = None,
+        read_ahead: bool = True,
+    ) -> "AsyncLOBStream":
+        """
+        Returns a file-like stream for reading and writing the LOB, starting
+        at the given offset. Data is transferred in chunks of chunk_size,
+        which is rounded up to a multiple of getchunksize(). If read_ahead is
+        True, the next chunk is requested from the database while the
+        current chunk is being consumed.
+        """
+        self._check_stream_args(offset, chunk_size)
+        return AsyncLOBStream(self, offset, chunk_size, read_ahead)
+
     async def read(
         self, offset: int = 1, amount: Optional[int] = None
     ) -> Union[str, bytes]:
@@ -316,3 +361,561 @@ class AsyncLOB(BaseLOB):
         """
         self._check_not_bfile()
         await self._impl.write(self._check_value_to_write(data), offset)
+
+
+# number of LOB chunks transferred in each round trip by LOB streams when no
+# chunk size is specified
+_STREAM_CHUNK_MULTIPLE = 16
+
+# chunk size used by LOB streams opened on BFILE LOBs when no chunk size is
+# specified (BFILE LOBs do not have a chunk size of their own)
+_STREAM_BFILE_CHUNK_SIZE = 131072
+
+# executor shared by all synchronous LOB streams for reading ahead; it is
+# created when it is first needed
+_read_ahead_executor = None
+_read_ahead_executor_lock = threading.Lock()
+
+
+def _get_read_ahead_executor():
+    """
+    Returns the executor used for reading ahead, creating it if needed.
+    """
+    global _read_ahead_executor
+    with _read_ahead_executor_lock:
+        if _read_ahead_executor is None:
+            _read_ahead_executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix="oracledb-lob-read-ahead"
+            )
+        return _read_ahead_executor
+
+
+class BaseLOBStream(metaclass=BaseMetaClass):
+
+    def __init__(self, lob, offset, chunk_size, read_ahead):
+        self._lob = lob
+        self._is_binary = lob.type in (DB_TYPE_BLOB, DB_TYPE_BFILE)
+        self._empty = b"" if self._is_binary else ""
+        self._requested_chunk_size = chunk_size
+        self._chunk_size = None
+        self._read_ahead = read_ahead
+        self._offset = offset
+        self._fetch_offset = offset
+        self._size = None
+        self._buffer = self._empty
+        self._buffer_pos = 0
+        self._pending = None
+        self._write_parts = []
+        self._write_len = 0
+        self._closed = False
+
+    def __repr__(self):
+        cls_name = self.__class__._public_name
+        return (
+            f"<{cls_name} for {self._lob.type.name} at offset {self.offset}>"
+        )
+
+    def _check_open(self):
+        """
+        Checks to see if the stream is open and raises an exception if it is
+        not.
+        """
+        if self._closed:
+            errors._raise_err(errors.ERR_LOB_STREAM_NOT_OPEN)
+
+    def _check_readinto(self):
+        """
+        Checks to see if readinto() can be called. Character LOBs return
+        strings which cannot be copied into a buffer.
+        """
+        self._check_open()
+        if not self._is_binary:
+            errors._raise_err(
+                errors.ERR_OPERATION_ONLY_SUPPORTED_ON_BINARY_LOB
+            )
+
+    def _consume(self, size):
+        """
+        Consumes up to the given number of characters or bytes from the
+        buffer (or all of them if the size is negative) and returns them.
+        """
+        start_pos = self._buffer_pos
+        end_pos = len(self._buffer)
+        if size >= 0 and start_pos + size < end_pos:
+            end_pos = start_pos + size
+        if start_pos == 0 and end_pos == len(self._buffer):
+            value = self._buffer
+        else:
+            value = self._buffer[start_pos:end_pos]
+        self._buffer_pos = end_pos
+        self._offset += self._get_num_units(value)
+        return value
+
+    def _consume_into(self, view, view_pos):
+        """
+        Copies as many bytes as possible from the buffer into the view,
+        starting at the given position, and returns the number of bytes
+        copied.
+        """
+        num_bytes = min(
+            len(self._buffer) - self._buffer_pos, len(view) - view_pos
+        )
+        end_pos = self._buffer_pos + num_bytes
+        view[view_pos : view_pos + num_bytes] = memoryview(self._buffer)[
+            self._buffer_pos : end_pos
+        ]
+        self._buffer_pos = end_pos
+        self._offset += num_bytes
+        return num_bytes
+
+    def _get_num_units(self, value):
+        """
+        Returns the number of units (bytes for binary LOBs and UCS-2 code
+        points for character LOBs) occupied by the value in the LOB.
+        """
+        if self._is_binary or value.isascii():
+            return len(value)
+        return len(value.encode("utf-16-le")) // 2
+
+    def _get_read_args(self):
+        """
+        Returns the offset and amount for the next read from the LOB, or None
+        if the end of the LOB has been reached.
+        """
+        offset = self._fetch_offset
+        if offset > self._size:
+            return None
+        amount = min(self._chunk_size, self._size - offset + 1)
+        self._fetch_offset += amount
+        return (offset, amount)
+
+    def _is_buffer_empty(self):
+        """
+        Returns whether all of the data in the buffer has been consumed.
+        """
+        return self._buffer_pos >= len(self._buffer)
+
+    def _reset_read(self):
+        """
+        Discards any data that has been read from the LOB but not yet consumed
+        so that the next read starts at the current offset. The size is
+        reacquired as well since writes may have changed it.
+        """
+        self._buffer = self._empty
+        self._buffer_pos = 0
+        self._fetch_offset = self._offset
+        self._size = None
+
+    def _set_chunk_size(self, lob_chunk_size):
+        """
+        Calculates the number of characters or bytes transferred in each
+        round trip, using the chunk size of the LOB (if it has one).
+        """
+        chunk_size = self._requested_chunk_size
+        if not lob_chunk_size:
+            if chunk_size is None:
+                chunk_size = _STREAM_BFILE_CHUNK_SIZE
+        elif chunk_size is None:
+            chunk_size = lob_chunk_size * _STREAM_CHUNK_MULTIPLE
+        else:
+            chunk_size = -(-chunk_size // lob_chunk_size) * lob_chunk_size
+        self._chunk_size = chunk_size
+
+    def _take_write_data(self, flush_all):
+        """
+        Returns the buffered data that should be written to the LOB now, or
+        None if no data should be written. Unless all data is being flushed,
+        only whole multiples of the chunk size are written.
+        """
+        if self._write_len == 0:
+            return None
+        num_to_write = self._write_len
+        if not flush_all:
+            num_to_write -= num_to_write % self._chunk_size
+            if num_to_write == 0:
+                return None
+        if len(self._write_parts) == 1:
+            data = self._write_parts[0]
+        else:
+            data = self._empty.join(self._write_parts)
+        if num_to_write < len(data):
+            self._write_parts = [data[num_to_write:]]
+            data = data[:num_to_write]
+        else:
+            self._write_parts = []
+        self._write_len -= num_to_write
+        return data
+
+    def _write_value(self, value):
+        """
+        Adds the value to the data waiting to be written to the LOB and
+        returns the number of units it occupies. Buffer objects such as
+        bytearray and memoryview are accepted in addition to strings and
+        bytes.
+        """
+        if isinstance(value, (bytearray, memoryview)):
+            value = bytes(value)
+        value = self._lob._check_value_to_write(value)
+        self._write_parts.append(value)
+        self._write_len += len(value)
+        return self._get_num_units(value)
+
+    @property
+    def closed(self) -> bool:
+        """
+        This read-only attribute returns whether the stream has been closed.
+        """
+        return self._closed
+
+    @property
+    def lob(self) -> BaseLOB:
+        """
+        This read-only attribute returns the LOB that the stream reads from
+        and writes to.
+        """
+        return self._lob
+
+    @property
+    def offset(self) -> int:
+        """
+        This read-only attribute returns the offset in the LOB at which the
+        next read or write will take place. The offset is in bytes for BLOB
+        and BFILE type LOBs and in UCS-2 code points for CLOB and NCLOB type
+        LOBs.
+        """
+        offset = self._offset
+        for value in self._write_parts:
+            offset += self._get_num_units(value)
+        return offset
+
+
+class LOBStream(BaseLOBStream):
+
+    def __enter__(self):
+        self._check_open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        self._check_open()
+        self._flush_writes(flush_all=True)
+        if self._is_buffer_empty() and not self._fill_buffer():
+            raise StopIteration
+        return self._consume(-1)
+
+    def _discard_read_ahead(self):
+        """
+        Waits for any read that is still in progress and discards all data
+        that has not yet been consumed.
+        """
+        if self._pending is not None:
+            concurrent.futures.wait([self._pending])
+            self._pending = None
+        self._reset_read()
+
+    def _ensure_chunk_size(self):
+        """
+        Ensures that the chunk size has been calculated.
+        """
+        if self._chunk_size is None:
+            lob_chunk_size = None
+            if self._lob.type is not DB_TYPE_BFILE:
+                lob_chunk_size = self._lob._impl.get_chunk_size()
+            self._set_chunk_size(lob_chunk_size)
+
+    def _fill_buffer(self):
+        """
+        Replaces the buffer with the next chunk read from the LOB and returns
+        whether any data was read. If read-ahead is enabled, the read of the
+        following chunk is started before returning.
+        """
+        impl = self._lob._impl
+        if self._pending is not None:
+            future = self._pending
+            self._pending = None
+            self._buffer = future.result()
+        else:
+            self._ensure_chunk_size()
+            if self._size is None:
+                self._size = impl.get_size()
+            args = self._get_read_args()
+            self._buffer = self._empty if args is None else impl.read(*args)
+        self._buffer_pos = 0
+        if self._buffer and self._read_ahead:
+            args = self._get_read_args()
+            if args is not None:
+                executor = _get_read_ahead_executor()
+                self._pending = executor.submit(impl.read, *args)
+        return len(self._buffer) > 0
+
+    def _flush_writes(self, flush_all):
+        """
+        Writes buffered data to the LOB.
+        """
+        data = self._take_write_data(flush_all)
+        if data is not None:
+            self._lob._impl.write(data, self._offset)
+            self._offset += self._get_num_units(data)
+            self._fetch_offset = self._offset
+
+    def close(self) -> None:
+        """
+        Writes any buffered data to the LOB and closes the stream. Any read
+        that is still in progress is waited for and its data discarded.
+        """
+        if self._closed:
+            return
+        try:
+            self._flush_writes(flush_all=True)
+        finally:
+            self._discard_read_ahead()
+            self._closed = True
+
+    def flush(self) -> None:
+        """
+        Writes any buffered data to the LOB.
+        """
+        self._check_open()
+        self._flush_writes(flush_all=True)
+
+    def read(self, size: Optional[int] = -1) -> Union[str, bytes]:
+        """
+        Reads up to the given number of bytes (for BLOB and BFILE type LOBs)
+        or characters (for CLOB and NCLOB type LOBs) from the stream and
+        returns them. If the size is negative or None, all of the remaining
+        data in the LOB is returned. An empty value is returned when the end
+        of the LOB has been reached.
+        """
+        self._check_open()
+        self._flush_writes(flush_all=True)
+        if size is None:
+            size = -1
+        parts = []
+        while size != 0:
+            if self._is_buffer_empty() and not self._fill_buffer():
+                break
+            value = self._consume(size)
+            parts.append(value)
+            if size > 0:
+                size -= len(value)
+        if len(parts) == 1:
+            return parts[0]
+        return self._empty.join(parts)
+
+    def readinto(self, buffer: Any) -> int:
+        """
+        Reads bytes from a BLOB or BFILE type LOB into the given writable
+        buffer and returns the number of bytes read. This avoids creating an
+        intermediate bytes object for each chunk. Fewer bytes than the size of
+        the buffer are only returned when the end of the LOB has been reached.
+        """
+        self._check_readinto()
+        self._flush_writes(flush_all=True)
+        view = memoryview(buffer).cast("B")
+        num_bytes = 0
+        while num_bytes < len(view):
+            if self._is_buffer_empty() and not self._fill_buffer():
+                break
+            num_bytes += self._consume_into(view, num_bytes)
+        return num_bytes
+
+    def write(self, data: Any) -> int:
+        """
+        Writes the data to the LOB at the current offset of the stream and
+        returns the number of bytes (for BLOB type LOBs) or UCS-2 code points
+        (for CLOB and NCLOB type LOBs) written. The data can be a string,
+        bytes or any object with a read() method, such as an open file, which
+        is read until it is exhausted. Data is buffered until at least a chunk
+        is available; call flush() or close() to write any remaining data.
+        """
+        self._check_open()
+        self._lob._check_not_bfile()
+        self._discard_read_ahead()
+        self._ensure_chunk_size()
+        if not hasattr(data, "read"):
+            num_units = self._write_value(data)
+            self._flush_writes(flush_all=False)
+            return num_units
+        num_units = 0
+        while True:
+            value = data.read(self._chunk_size)
+            if not value:
+                break
+            num_units += self._write_value(value)
+            self._flush_writes(flush_all=False)
+        return num_units
+
+
+class AsyncLOBStream(BaseLOBStream):
+
+    async def __aenter__(self):
+        self._check_open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        await self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        self._check_open()
+        await self._flush_writes(flush_all=True)
+        if self._is_buffer_empty() and not await self._fill_buffer():
+            raise StopAsyncIteration
+        return self._consume(-1)
+
+    async def _discard_read_ahead(self):
+        """
+        Waits for any read that is still in progress and discards all data
+        that has not yet been consumed.
+        """
+        if self._pending is not None:
+            task = self._pending
+            self._pending = None
+            await asyncio.wait([task])
+            if not task.cancelled():
+                task.exception()
+        self._reset_read()
+
+    async def _ensure_chunk_size(self):
+        """
+        Ensures that the chunk size has been calculated.
+        """
+        if self._chunk_size is None:
+            lob_chunk_size = None
+            if self._lob.type is not DB_TYPE_BFILE:
+                lob_chunk_size = await self._lob._impl.get_chunk_size()
+            self._set_chunk_size(lob_chunk_size)
+
+    async def _fill_buffer(self):
+        """
+        Replaces the buffer with the next chunk read from the LOB and returns
+        whether any data was read. If read-ahead is enabled, the read of the
+        following chunk is started before returning.
+        """
+        impl = self._lob._impl
+        if self._pending is not None:
+            task = self._pending
+            self._pending = None
+            self._buffer = await task
+        else:
+            await self._ensure_chunk_size()
+            if self._size is None:
+                self._size = await impl.get_size()
+            args = self._get_read_args()
+            if args is None:
+                self._buffer = self._empty
+            else:
+                self._buffer = await impl.read(*args)
+        self._buffer_pos = 0
+        if self._buffer and self._read_ahead:
+            args = self._get_read_args()
+            if args is not None:
+                self._pending = asyncio.ensure_future(impl.read(*args))
+        return len(self._buffer) > 0
+
+    async def _flush_writes(self, flush_all):
+        """
+        Writes buffered data to the LOB.
+        """
+        data = self._take_write_data(flush_all)
+        if data is not None:
+            await self._lob._impl.write(data, self._offset)
+            self._offset += self._get_num_units(data)
+            self._fetch_offset = self._offset
+
+    async def close(self) -> None:
+        """
+        Writes any buffered data to the LOB and closes the stream. Any read
+        that is still in progress is waited for and its data discarded.
+        """
+        if self._closed:
+            return
+        try:
+            await self._flush_writes(flush_all=True)
+        finally:
+            await self._discard_read_ahead()
+            self._closed = True
+
+    async def flush(self) -> None:
+        """
+        Writes any buffered data to the LOB.
+        """
+        self._check_open()
+        await self._flush_writes(flush_all=True)
+
+    async def read(self, size: Optional[int] = -1) -> Union[str, bytes]:
+        """
+        Reads up to the given number of bytes (for BLOB and BFILE type LOBs)
+        or characters (for CLOB and NCLOB type LOBs) from the stream and
+        returns them. If the size is negative or None, all of the remaining
+        data in the LOB is returned. An empty value is returned when the end
+        of the LOB has been reached.
+        """
+        self._check_open()
+        await self._flush_writes(flush_all=True)
+        if size is None:
+            size = -1
+        parts = []
+        while size != 0:
+            if self._is_buffer_empty() and not await self._fill_buffer():
+                break
+            value = self._consume(size)
+            parts.append(value)
+            if size > 0:
+                size -= len(value)
+        if len(parts) == 1:
+            return parts[0]
+        return self._empty.join(parts)
+
+    async def readinto(self, buffer: Any) -> int:
+        """
+        Reads bytes from a BLOB or BFILE type LOB into the given writable
+        buffer and returns the number of bytes read. This avoids creating an
+        intermediate bytes object for each chunk. Fewer bytes than the size of
+        the buffer are only returned when the end of the LOB has been reached.
+        """
+        self._check_readinto()
+        await self._flush_writes(flush_all=True)
+        view = memoryview(buffer).cast("B")
+        num_bytes = 0
+        while num_bytes < len(view):
+            if self._is_buffer_empty() and not await self._fill_buffer():
+                break
+            num_bytes += self._consume_into(view, num_bytes)
+        return num_bytes
+
+    async def write(self, data: Any) -> int:
+        """
+        Writes the data to the LOB at the current offset of the stream and
+        returns the number of bytes (for BLOB type LOBs) or UCS-2 code points
+        (for CLOB and NCLOB type LOBs) written. The data can be a string,
+        bytes or any object with a read() method, such as an open file, which
+        is read until it is exhausted; the read() method may be a coroutine.
+        Data is buffered until at least a chunk is available; call flush() or
+        close() to write any remaining data.
+        """
+        self._check_open()
+        self._lob._check_not_bfile()
+        await self._discard_read_ahead()
+        await self._ensure_chunk_size()
+        if not hasattr(data, "read"):
+            num_units = self._write_value(data)
+            await self._flush_writes(flush_all=False)
+            return num_units
+        num_units = 0
+        while True:
+            value = data.read(self._chunk_size)
+            if inspect.isawaitable(value):
+                value = await value
+            if not value:
+                break
+            num_units += self._write_value(value)
+            await self._flush_writes(flush_all=False)
+        return num_units
@@ -303,7 +303,7 @@ class Pipeline(metaclass=BaseMetaClass):
     def add_executemany(
         self,
         statement: str,
-        parameters: Union[list, int],
+        parameters: Any,
     ) -> PipelineOp:
         """
         Adds an operation that executes a SQL statement once using all bind
@@ -318,7 +318,13 @@ class Pipeline(metaclass=BaseMetaClass):
         also be a list of dictionaries, where the keys match the bind variable
         placeholder names in ``statement``. If there are no bind values, or
         values have previously been bound, the ``parameters`` value can be an
-        integer specifying the number of iterations.
+        integer specifying the number of iterations. The ``parameters``
+        parameter can also be a :ref:`DataFrame <oracledataframeobj>`, a
+        third-party data frame that supports the Apache Arrow PyCapsule
+        Interface, or any other iterable that returns tuples, dictionaries or
+        data frames which all have the same schema. Rows returned by an
+        iterable are all acquired when the pipeline is run, whereas each chunk
+        of a data frame is executed in turn.
         """
         op_impl = PipelineOpImpl(
             op_type=PipelineOpType.EXECUTE_MANY,
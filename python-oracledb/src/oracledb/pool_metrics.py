@@ -0,0 +1,172 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# pool_metrics.py
+#
+# Contains the PoolMetrics class which stores a snapshot of the metrics
+# recorded by a connection pool.
+# -----------------------------------------------------------------------------
+
+from .base import BaseMetaClass
+
+
+class PoolMetrics(metaclass=BaseMetaClass):
+    """
+    Identifies a snapshot of the metrics recorded by a connection pool.
+    """
+
+    @classmethod
+    def _from_impl(cls, impl):
+        metrics = cls.__new__(cls)
+        metrics._impl = impl
+        return metrics
+
+    @property
+    def acquire_count(self) -> int:
+        """
+        This read-only attribute returns the number of connections that have
+        been successfully acquired from the pool.
+        """
+        return self._impl.acquire_count
+
+    @property
+    def acquire_failure_count(self) -> int:
+        """
+        This read-only attribute returns the number of attempts to acquire a
+        connection from the pool that failed, for example because the wait
+        timeout expired.
+        """
+        return self._impl.acquire_failure_count
+
+    @property
+    def acquire_wait_time_buckets(self) -> dict:
+        """
+        This read-only attribute returns a histogram of the time in seconds
+        taken to acquire connections from the pool. It is a dictionary mapping
+        the upper bound of each bucket to the number of acquisitions that took
+        no longer than that bound. The final bucket has an upper bound of
+        *math.inf*.
+        """
+        return self._impl.acquire_wait_times.get_buckets()
+
+    @property
+    def acquire_wait_time_sum(self) -> float:
+        """
+        This read-only attribute returns the total time in seconds taken to
+        acquire connections from the pool.
+        """
+        return self._impl.acquire_wait_times.total
+
+    @property
+    def busy(self) -> int:
+        """
+        This read-only attribute returns the number of connections that were
+        in use when the snapshot was taken.
+        """
+        return self._impl.busy_count
+
+    @property
+    def close_counts(self) -> dict:
+        """
+        This read-only attribute returns a dictionary mapping the reason that
+        connections were closed by the pool to the number of connections
+        closed for that reason. The reasons are "dropped", "excess",
+        "max_lifetime", "ping_failure", "pool_closed", "replaced", "timeout"
+        and "unhealthy".
+        """
+        return dict(self._impl.close_counts)
+
+    @property
+    def create_count(self) -> int:
+        """
+        This read-only attribute returns the number of connections that have
+        been successfully created by the pool.
+        """
+        return self._impl.create_count
+
+    @property
+    def create_failure_count(self) -> int:
+        """
+        This read-only attribute returns the number of attempts by the pool to
+        create a connection that failed.
+        """
+        return self._impl.create_failure_count
+
+    @property
+    def create_time_buckets(self) -> dict:
+        """
+        This read-only attribute returns a histogram of the time in seconds
+        taken to create connections. It uses the same buckets as
+        :attr:`PoolMetrics.acquire_wait_time_buckets`.
+        """
+        return self._impl.create_times.get_buckets()
+
+    @property
+    def create_time_sum(self) -> float:
+        """
+        This read-only attribute returns the total time in seconds taken to
+        create connections.
+        """
+        return self._impl.create_times.total
+
+    @property
+    def max_waiting_count(self) -> int:
+        """
+        This read-only attribute returns the largest number of callers that
+        have been acquiring connections from the pool at the same time.
+        """
+        return self._impl.max_waiting_count
+
+    @property
+    def opened(self) -> int:
+        """
+        This read-only attribute returns the number of connections that were
+        open when the snapshot was taken.
+        """
+        return self._impl.open_count
+
+    @property
+    def ping_count(self) -> int:
+        """
+        This read-only attribute returns the number of times that the pool
+        has pinged a connection to check its health.
+        """
+        return self._impl.ping_count
+
+    @property
+    def ping_failure_count(self) -> int:
+        """
+        This read-only attribute returns the number of pings that failed. The
+        connections concerned are closed and replaced.
+        """
+        return self._impl.ping_failure_count
+
+    @property
+    def waiting_count(self) -> int:
+        """
+        This read-only attribute returns the number of callers that were
+        acquiring connections from the pool when the snapshot was taken.
+        """
+        return self._impl.waiting_count
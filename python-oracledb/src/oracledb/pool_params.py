@@ -69,6 +69,12 @@ class PoolParams(ConnectParams):
         soda_metadata_cache: Optional[bool] = None,
         ping_interval: Optional[int] = None,
         ping_timeout: Optional[int] = None,
+        result_cache_size: Optional[int] = None,
+        result_cache_ttl: Optional[int] = None,
+        shared_statement_cache: Optional[bool] = None,
+        warmup_statements: Optional[list] = None,
+        creation_concurrency: Optional[int] = None,
+        metrics_callback: Optional[Callable] = None,
         user: Optional[str] = None,
         proxy_user: Optional[str] = None,
         password: Optional[str] = None,
@@ -121,6 +127,7 @@ class PoolParams(ConnectParams):
         thick_mode_dsn_passthrough: Optional[bool] = None,
         extra_auth_params: Optional[dict] = None,
         pool_name: Optional[str] = None,
+        parallel_connect_delay: Optional[float] = None,
         handle: Optional[int] = None,
     ):
         """
@@ -195,6 +202,48 @@ class PoolParams(ConnectParams):
           acquire()
           (default: 5000)
 
+        - ``result_cache_size``: the maximum amount of memory (in bytes) that
+          may be used to cache the results of queries containing the
+          RESULT_CACHE hint that are executed with connections acquired from
+          the pool. If it is 0 then query results are not cached. This value is
+          only used in python-oracledb Thin mode
+          (default: 0)
+
+        - ``result_cache_ttl``: the length of time (in seconds) that results
+          remain valid after being stored in the pool's result cache. If it is
+          0 then cached results remain valid until they are evicted or
+          invalidated. This value is only used in python-oracledb Thin mode
+          (default: 0)
+
+        - ``shared_statement_cache``: a boolean indicating whether the results
+          of parsing SQL statements should be shared by all connections in the
+          pool so that new connections do not need to parse them again. The
+          number of statements retained is limited by stmtcachesize. This value
+          is only used in python-oracledb Thin mode
+          (default: False)
+
+        - ``warmup_statements``: a list of SQL statements that are prepared on
+          each new connection created by the pool in the background, before it
+          is handed out, so that their cursors are already open in the
+          connection's statement cache. Errors parsing the statements are
+          ignored. This value is only used in python-oracledb Thin mode
+          (default: None)
+
+        - ``creation_concurrency``: the maximum number of connections that the
+          pool creates concurrently when it grows, for example when it is first
+          created or after the database has restarted. Each connection creation
+          is a separate round-trip sequence, so creating several at once
+          shortens the time taken for the pool to reach its minimum size. This
+          value is only used in python-oracledb Thin mode
+          (default: 1)
+
+        - ``metrics_callback``: a callable that is invoked with the name of the
+          metric, its value and a dictionary of attributes each time the pool
+          acquires, creates, pings or closes a connection. It should complete
+          quickly and any exception that it raises is ignored. This value is
+          only used in python-oracledb Thin mode
+          (default: None)
+
         - ``user``: the name of the database user to connect to
           (default: None)
 
@@ -465,6 +514,15 @@ class PoolParams(ConnectParams):
           with Oracle Database 23.4, or higher
           (default: None)
 
+        - ``parallel_connect_delay``: the number of seconds to wait for a
+          connection to an address to be established (including the TLS
+          handshake for TCPS addresses) before a connection to the next address
+          in the same address list is also attempted. The first connection to
+          succeed is used and the others are closed. The default value of 0
+          attempts each address in turn. This value is only used in python-
+          oracledb Thin mode
+          (default: 0)
+
         - ``handle``: an integer representing a pointer to a valid service
           context handle. This value is only used in python-oracledb Thick
           mode. It should be used with extreme caution
@@ -489,6 +547,12 @@ class PoolParams(ConnectParams):
             f"soda_metadata_cache={self.soda_metadata_cache!r}, "
             f"ping_interval={self.ping_interval!r}, "
             f"ping_timeout={self.ping_timeout!r}, "
+            f"result_cache_size={self.result_cache_size!r}, "
+            f"result_cache_ttl={self.result_cache_ttl!r}, "
+            f"shared_statement_cache={self.shared_statement_cache!r}, "
+            f"warmup_statements={self.warmup_statements!r}, "
+            f"creation_concurrency={self.creation_concurrency!r}, "
+            f"metrics_callback={self.metrics_callback!r}, "
             f"user={self.user!r}, "
             f"proxy_user={self.proxy_user!r}, "
             f"host={self.host!r}, "
@@ -536,7 +600,8 @@ class PoolParams(ConnectParams):
             f"use_sni={self.use_sni!r}, "
             f"thick_mode_dsn_passthrough={self.thick_mode_dsn_passthrough!r}, "
             f"extra_auth_params={self.extra_auth_params!r}, "
-            f"pool_name={self.pool_name!r}"
+            f"pool_name={self.pool_name!r}, "
+            f"parallel_connect_delay={self.parallel_connect_delay!r}"
             ")"
         )
 
@@ -549,6 +614,18 @@ class PoolParams(ConnectParams):
         """
         return self._impl.connectiontype
 
+    @property
+    def creation_concurrency(self) -> int:
+        """
+        The maximum number of connections that the pool creates concurrently
+        when it grows, for example when it is first created or after the
+        database has restarted. Each connection creation is a separate round-
+        trip sequence, so creating several at once shortens the time taken for
+        the pool to reach its minimum size. This value is only used in python-
+        oracledb Thin mode.
+        """
+        return self._impl.creation_concurrency
+
     @property
     def getmode(self) -> oracledb.PoolGetMode:
         """
@@ -599,6 +676,17 @@ class PoolParams(ConnectParams):
         """
         return self._impl.max_sessions_per_shard
 
+    @property
+    def metrics_callback(self) -> Callable:
+        """
+        A callable that is invoked with the name of the metric, its value and a
+        dictionary of attributes each time the pool acquires, creates, pings or
+        closes a connection. It should complete quickly and any exception that
+        it raises is ignored. This value is only used in python-oracledb Thin
+        mode.
+        """
+        return self._impl.metrics_callback
+
     @property
     def min(self) -> int:
         """
@@ -627,6 +715,26 @@ class PoolParams(ConnectParams):
         """
         return self._impl.ping_timeout
 
+    @property
+    def result_cache_size(self) -> int:
+        """
+        The maximum amount of memory (in bytes) that may be used to cache the
+        results of queries containing the RESULT_CACHE hint that are executed
+        with connections acquired from the pool. If it is 0 then query results
+        are not cached. This value is only used in python-oracledb Thin mode.
+        """
+        return self._impl.result_cache_size
+
+    @property
+    def result_cache_ttl(self) -> int:
+        """
+        The length of time (in seconds) that results remain valid after being
+        stored in the pool's result cache. If it is 0 then cached results
+        remain valid until they are evicted or invalidated. This value is only
+        used in python-oracledb Thin mode.
+        """
+        return self._impl.result_cache_ttl
+
     @property
     def session_callback(self) -> Callable:
         """
@@ -636,6 +744,17 @@ class PoolParams(ConnectParams):
         """
         return self._impl.session_callback
 
+    @property
+    def shared_statement_cache(self) -> bool:
+        """
+        A boolean indicating whether the results of parsing SQL statements
+        should be shared by all connections in the pool so that new connections
+        do not need to parse them again. The number of statements retained is
+        limited by stmtcachesize. This value is only used in python-oracledb
+        Thin mode.
+        """
+        return self._impl.shared_statement_cache
+
     @property
     def soda_metadata_cache(self) -> bool:
         """
@@ -662,6 +781,17 @@ class PoolParams(ConnectParams):
         """
         return self._impl.wait_timeout
 
+    @property
+    def warmup_statements(self) -> list:
+        """
+        A list of SQL statements that are prepared on each new connection
+        created by the pool in the background, before it is handed out, so that
+        their cursors are already open in the connection's statement cache.
+        Errors parsing the statements are ignored. This value is only used in
+        python-oracledb Thin mode.
+        """
+        return self._impl.warmup_statements
+
     def copy(self) -> "PoolParams":
         """
         Creates a copy of the parameters and returns it.
@@ -688,6 +818,12 @@ class PoolParams(ConnectParams):
         soda_metadata_cache: Optional[bool] = None,
         ping_interval: Optional[int] = None,
         ping_timeout: Optional[int] = None,
+        result_cache_size: Optional[int] = None,
+        result_cache_ttl: Optional[int] = None,
+        shared_statement_cache: Optional[bool] = None,
+        warmup_statements: Optional[list] = None,
+        creation_concurrency: Optional[int] = None,
+        metrics_callback: Optional[Callable] = None,
         user: Optional[str] = None,
         proxy_user: Optional[str] = None,
         password: Optional[str] = None,
@@ -740,6 +876,7 @@ class PoolParams(ConnectParams):
         thick_mode_dsn_passthrough: Optional[bool] = None,
         extra_auth_params: Optional[dict] = None,
         pool_name: Optional[str] = None,
+        parallel_connect_delay: Optional[float] = None,
         handle: Optional[int] = None,
     ):
         """
@@ -800,6 +937,42 @@ class PoolParams(ConnectParams):
           the database before being discarded and replaced during a call to
           acquire()
 
+        - ``result_cache_size``: the maximum amount of memory (in bytes) that
+          may be used to cache the results of queries containing the
+          RESULT_CACHE hint that are executed with connections acquired from
+          the pool. If it is 0 then query results are not cached. This value is
+          only used in python-oracledb Thin mode
+
+        - ``result_cache_ttl``: the length of time (in seconds) that results
+          remain valid after being stored in the pool's result cache. If it is
+          0 then cached results remain valid until they are evicted or
+          invalidated. This value is only used in python-oracledb Thin mode
+
+        - ``shared_statement_cache``: a boolean indicating whether the results
+          of parsing SQL statements should be shared by all connections in the
+          pool so that new connections do not need to parse them again. The
+          number of statements retained is limited by stmtcachesize. This value
+          is only used in python-oracledb Thin mode
+
+        - ``warmup_statements``: a list of SQL statements that are prepared on
+          each new connection created by the pool in the background, before it
+          is handed out, so that their cursors are already open in the
+          connection's statement cache. Errors parsing the statements are
+          ignored. This value is only used in python-oracledb Thin mode
+
+        - ``creation_concurrency``: the maximum number of connections that the
+          pool creates concurrently when it grows, for example when it is first
+          created or after the database has restarted. Each connection creation
+          is a separate round-trip sequence, so creating several at once
+          shortens the time taken for the pool to reach its minimum size. This
+          value is only used in python-oracledb Thin mode
+
+        - ``metrics_callback``: a callable that is invoked with the name of the
+          metric, its value and a dictionary of attributes each time the pool
+          acquires, creates, pings or closes a connection. It should complete
+          quickly and any exception that it raises is ignored. This value is
+          only used in python-oracledb Thin mode
+
         - ``user``: the name of the database user to connect to
 
         - ``proxy_user``: the name of the proxy user to connect to. If this
@@ -1010,6 +1183,14 @@ class PoolParams(ConnectParams):
         - ``pool_name``: the name of the DRCP pool when using multi-pool DRCP
           with Oracle Database 23.4, or higher
 
+        - ``parallel_connect_delay``: the number of seconds to wait for a
+          connection to an address to be established (including the TLS
+          handshake for TCPS addresses) before a connection to the next address
+          in the same address list is also attempted. The first connection to
+          succeed is used and the others are closed. The default value of 0
+          attempts each address in turn. This value is only used in python-
+          oracledb Thin mode
+
         - ``handle``: an integer representing a pointer to a valid service
           context handle. This value is only used in python-oracledb Thick
           mode. It should be used with extreme caution
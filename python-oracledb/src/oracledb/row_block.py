@@ -0,0 +1,139 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2026, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# row_block.py
+#
+# Contains the RowBlock class which stores a block of fetched rows in
+# column-oriented form.
+# -----------------------------------------------------------------------------
+
+from typing import Any, Iterator, Union
+
+from .base import BaseMetaClass
+
+
+class RowBlock(metaclass=BaseMetaClass):
+    """
+    Identifies a block of rows fetched from a cursor, stored by column.
+    """
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Returns the row at the given index. The row is created when this
+        method is called and the cursor's row factory, if any, is applied to
+        it.
+        """
+        num_rows = self._impl.num_rows
+        if index < 0:
+            index += num_rows
+        if index < 0 or index >= num_rows:
+            raise IndexError("row block index out of range")
+        return self._impl.get_row(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Returns an iterator over the rows in the block. Each row is created
+        only as it is requested.
+        """
+        get_row = self._impl.get_row
+        for i in range(self._impl.num_rows):
+            yield get_row(i)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows in the block.
+        """
+        return self._impl.num_rows
+
+    def __repr__(self):
+        cls_name = self.__class__._public_name
+        return f"<{cls_name} with {self._impl.num_rows} rows>"
+
+    @classmethod
+    def _from_impl(cls, impl, column_names):
+        block = cls.__new__(cls)
+        block._impl = impl
+        block._column_names = column_names
+        return block
+
+    def _get_column_impl(self, index_or_name: Union[int, str]):
+        """
+        Returns the implementation of the column identified either by its
+        position or by its name.
+        """
+        if isinstance(index_or_name, str):
+            try:
+                index_or_name = self._column_names.index(index_or_name)
+            except ValueError:
+                raise KeyError(index_or_name) from None
+        return self._impl.columns[index_or_name]
+
+    def column(self, index_or_name: Union[int, str]) -> Any:
+        """
+        Returns the values of a single column in the block, identified either
+        by its position or by its name as found in the cursor's
+        :attr:`~Cursor.description`. Columns that are fetched as floats are
+        returned as an ``array.array`` of type code "d" and columns that are
+        fetched as integers are returned as an ``array.array`` of type code
+        "q". Null values in these arrays are stored as zero; use
+        :meth:`validity()` to identify them. All other columns, and integer
+        columns containing values that are not integers or that do not fit in
+        64 bits, are returned as a list. The returned object should not be
+        modified.
+        """
+        return self._get_column_impl(index_or_name).get_values()
+
+    def validity(self, index_or_name: Union[int, str]) -> Any:
+        """
+        Returns an ``array.array`` of type code "B" indicating which values of
+        the column returned by :meth:`column()` are not null: each element is
+        1 if the value at the same position is valid and 0 if it is null. If
+        none of the values are null, or if the column is returned as a list,
+        None is returned.
+        """
+        return self._get_column_impl(index_or_name).get_validity()
+
+    @property
+    def column_names(self) -> list:
+        """
+        This read-only attribute returns the names of the columns in the
+        block.
+        """
+        return list(self._column_names)
+
+    @property
+    def columns(self) -> list:
+        """
+        This read-only attribute returns a list containing the values of each
+        column in the block, as described for :meth:`column()`.
+        """
+        return [column.get_values() for column in self._impl.columns]
+
+    @property
+    def num_rows(self) -> int:
+        """
+        This read-only attribute returns the number of rows in the block.
+        """
+        return self._impl.num_rows
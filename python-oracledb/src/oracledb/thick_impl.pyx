@@ -68,6 +68,7 @@ from .base_impl cimport (
     ConnectParamsImpl,
     convert_arrow_to_oracle_data,
     convert_oracle_data_to_arrow,
+    convert_oracle_data_to_row_block,
     convert_vector_to_arrow,
     DbType,
     DB_TYPE_NUM_CURSOR,
@@ -75,6 +76,7 @@ from .base_impl cimport (
     DRIVER_VERSION,
     DRIVER_INSTALLATION_URL,
     ENCODING_UTF8,
+    get_row_block_column_kind,
     OracleData,
     OracleMetadata,
     OracleNumber,
@@ -96,6 +98,12 @@ from .base_impl cimport (
     PY_TYPE_NUM_FLOAT,
     PY_TYPE_NUM_INT,
     PY_TYPE_NUM_DECIMAL,
+    ROW_BLOCK_COLUMN_KIND_OBJECT,
+    ROW_BLOCK_VALUE_NULL,
+    ROW_BLOCK_VALUE_OBJECT,
+    ROW_BLOCK_VALUE_TYPED,
+    RowBlockColumnImpl,
+    RowBlockValue,
     SparseVectorImpl,
     VectorDecoder,
     VectorEncoder,
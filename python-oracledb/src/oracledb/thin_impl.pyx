@@ -38,30 +38,37 @@ cimport cpython.ref
 
 from libc.stdint cimport int8_t, int16_t, int32_t, int64_t
 from libc.stdint cimport uint8_t, uint16_t, uint32_t, uint64_t
-from libc.string cimport memcpy, memset
+from libc.string cimport memcpy, memmove, memset, strlen
 from cpython cimport array
+from cpython.conversion cimport PyOS_double_to_string, PyOS_snprintf
+from cpython.mem cimport PyMem_Free
 
 import array
 import asyncio
 import base64
 import collections
+import contextvars
 import datetime
 import decimal
 import getpass
 import hashlib
 import inspect
 import json
+import math
 import os
+import random
 import socket
 import re
 import secrets
 import select
+import selectors
 import ssl
 import subprocess
 import sys
 import threading
 import time
 import uuid
+import weakref
 
 try:
     import certifi
@@ -109,10 +116,12 @@ from .base_impl cimport (
     PIPELINE_OP_TYPE_FETCH_ONE,
     BindVar,
     Buffer,
+    C_DEFAULTS,
     ConnectParamsImpl,
     convert_arrow_to_oracle_data,
     convert_oracle_data_to_python,
     convert_oracle_data_to_arrow,
+    convert_oracle_data_to_row_block,
     convert_python_to_oracle_data,
     convert_vector_to_arrow,
     convert_date_to_python,
@@ -125,6 +134,7 @@ from .base_impl cimport (
     DRIVER_VERSION,
     ENCODING_UTF8,
     ENCODING_UTF16,
+    get_row_block_column_kind,
     GrowableBuffer,
     PY_TYPE_NUM_FLOAT,
     PY_TYPE_NUM_INT,
@@ -159,6 +169,7 @@ from .base_impl cimport (
     OracleData,
     OsonDecoder,
     OsonEncoder,
+    OsonFieldNamesCache,
     POOL_GETMODE_FORCEGET,
     POOL_GETMODE_NOWAIT,
     POOL_GETMODE_TIMEDWAIT,
@@ -175,6 +186,14 @@ from .base_impl cimport (
     PY_TYPE_INTERVAL_YM,
     PY_TYPE_LOB,
     PY_TYPE_TIMEDELTA,
+    ROW_BLOCK_COLUMN_KIND_DOUBLE,
+    ROW_BLOCK_COLUMN_KIND_OBJECT,
+    ROW_BLOCK_VALUE_NULL,
+    ROW_BLOCK_VALUE_OBJECT,
+    ROW_BLOCK_VALUE_TYPED,
+    RowBlockColumnImpl,
+    RowBlockImpl,
+    RowBlockValue,
     TNS_LONG_LENGTH_INDICATOR,
     TNS_NULL_LENGTH_INDICATOR,
     TPC_TXN_FLAGS_NEW,
@@ -197,9 +216,29 @@ from .base_impl import (
     DB_TYPE_NUMBER,
     DB_TYPE_OBJECT,
     DB_TYPE_XMLTYPE,
+    REGISTERED_ROUND_TRIP_HOOKS,
 )
 
-from .arrow_impl cimport ArrowArrayImpl, ArrowSchemaImpl, DataFrameImpl
+from .arrow_impl cimport (
+    ArrowArrayImpl,
+    ArrowSchemaImpl,
+    ArrowType,
+    DataFrameImpl,
+    NANOARROW_TYPE_DATE32,
+    NANOARROW_TYPE_DATE64,
+    NANOARROW_TYPE_DECIMAL128,
+    NANOARROW_TYPE_DOUBLE,
+    NANOARROW_TYPE_FLOAT,
+    NANOARROW_TYPE_INT8,
+    NANOARROW_TYPE_INT16,
+    NANOARROW_TYPE_INT32,
+    NANOARROW_TYPE_INT64,
+    NANOARROW_TYPE_TIMESTAMP,
+    NANOARROW_TYPE_UINT8,
+    NANOARROW_TYPE_UINT16,
+    NANOARROW_TYPE_UINT32,
+    NANOARROW_TYPE_UINT64,
+)
 
 ctypedef unsigned char char_type
 
@@ -236,14 +275,17 @@ include "impl/thin/messages/rollback.pyx"
 include "impl/thin/messages/session_release.pyx"
 include "impl/thin/messages/tpc_change_state.pyx"
 include "impl/thin/messages/tpc_switch.pyx"
+include "impl/thin/round_trip.pyx"
 include "impl/thin/protocol.pyx"
 include "impl/thin/queue.pyx"
 include "impl/thin/connection.pyx"
 include "impl/thin/statement.pyx"
 include "impl/thin/statement_cache.pyx"
+include "impl/thin/result_cache.pyx"
 include "impl/thin/cursor.pyx"
 include "impl/thin/var.pyx"
 include "impl/thin/dbobject.pyx"
 include "impl/thin/dbobject_cache.pyx"
 include "impl/thin/lob.pyx"
+include "impl/thin/pool_metrics.pyx"
 include "impl/thin/pool.pyx"
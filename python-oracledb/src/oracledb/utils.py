@@ -369,6 +369,40 @@ def register_protocol(protocol: str, hook_function: Callable) -> None:
         base_impl.REGISTERED_PROTOCOLS[protocol] = hook_function
 
 
+def register_round_trip_hook(
+    hook_function: Callable, sample_rate: float = 1.0
+) -> None:
+    """
+    Registers a user round trip hook function that will be called internally
+    by python-oracledb Thin mode after each round trip to the database. The
+    hook function is called with a single argument which contains information
+    about the round trip, such as the type of message sent, the text of the
+    SQL statement executed (if any), the number of bytes and packets sent and
+    received, and the time spent waiting for the database compared to the
+    time spent by python-oracledb encoding and decoding the data.
+
+    The ``sample_rate`` parameter is the fraction of round trips that are
+    passed to the hook function, from 0 to 1. Lower values reduce the overhead
+    of the hook when it is left enabled in production.
+
+    The hook function is called while the connection is in use and must not
+    use the connection itself. It should complete quickly. Any exception that
+    it raises is ignored.
+
+    Multiple hooks may be registered. They will be invoked in order of
+    registration.
+    """
+    if hook_function is None or not callable(hook_function):
+        raise TypeError("hook_function must be a callable and cannot be None")
+    if not isinstance(sample_rate, (int, float)):
+        raise TypeError("sample_rate must be a number")
+    if sample_rate < 0 or sample_rate > 1:
+        raise ValueError("sample_rate must be between 0 and 1")
+    base_impl.REGISTERED_ROUND_TRIP_HOOKS.append(
+        (hook_function, float(sample_rate))
+    )
+
+
 def unregister_params_hook(hook_function: Callable) -> None:
     """
     Unregisters a user parameter function that was earlier registered with a
@@ -377,6 +411,20 @@ def unregister_params_hook(hook_function: Callable) -> None:
     base_impl.REGISTERED_PARAMS_HOOKS.remove(hook_function)
 
 
+def unregister_round_trip_hook(hook_function: Callable) -> None:
+    """
+    Unregisters a user round trip hook function that was earlier registered
+    with a call to :meth:`oracledb.register_round_trip_hook()`.
+    """
+    hooks = base_impl.REGISTERED_ROUND_TRIP_HOOKS
+    for i, (registered_function, sample_rate) in enumerate(hooks):
+        if registered_function == hook_function:
+            hooks.pop(i)
+            break
+    else:
+        raise ValueError("hook_function is not registered")
+
+
 def verify_stored_proc_args(
     parameters: Union[list, tuple], keyword_parameters: dict
 ) -> None:
@@ -70,11 +70,15 @@
 # user for on premises databases is SYSTEM.
 # -----------------------------------------------------------------------------
 
+import datetime
 import importlib
 import os
 import platform
 import secrets
+import socket
+import ssl
 import string
+import threading
 
 import numpy
 import oracledb
@@ -182,6 +186,137 @@ class ParseCountInfo(SystemStatInfo):
     stat_name = "parse count (total)"
 
 
+class RefusingListener:
+    """
+    Local server which accepts each client that connects and then refuses its
+    connection request by sending a TNS refuse packet containing the error
+    ORA-12514 (service not registered with the listener).
+    """
+
+    def __init__(self):
+        message = b"(DESCRIPTION=(ERR=12514))"
+        self.refuse_packet = (
+            (12 + len(message)).to_bytes(2, "big")
+            + bytes([0, 0, 4, 0, 0, 0, 0, 0])
+            + len(message).to_bytes(2, "big")
+            + message
+        )
+        self.closing = False
+        self.sock = socket.create_server(("127.0.0.1", 0))
+        self.port = self.sock.getsockname()[1]
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _handle_client(self, client_sock):
+        client_sock.recv(1024)
+        client_sock.sendall(self.refuse_packet)
+
+    def _serve(self):
+        while True:
+            client_sock, _ = self.sock.accept()
+            if self.closing:
+                client_sock.close()
+                break
+            with client_sock:
+                try:
+                    self._handle_client(client_sock)
+                except OSError:
+                    pass
+
+    def close(self):
+        self.closing = True
+        socket.create_connection(("127.0.0.1", self.port)).close()
+        self.thread.join()
+        self.sock.close()
+
+
+class TLSServer(RefusingListener):
+    """
+    Refusing listener which negotiates TLS with each client before refusing
+    its connection request. Whether or not each TLS session was resumed is
+    recorded. The server uses a self-signed certificate which is written to a
+    wallet in the given directory so that clients are able to validate it.
+    """
+
+    def __init__(self, wallet_location):
+        x509 = pytest.importorskip("cryptography.x509")
+        hashes = pytest.importorskip("cryptography.hazmat.primitives.hashes")
+        serialization = pytest.importorskip(
+            "cryptography.hazmat.primitives.serialization"
+        )
+        ec = pytest.importorskip(
+            "cryptography.hazmat.primitives.asymmetric.ec"
+        )
+        key = ec.generate_private_key(ec.SECP256R1())
+        name = x509.Name(
+            [x509.NameAttribute(x509.oid.NameOID.COMMON_NAME, "localhost")]
+        )
+        now = datetime.datetime.now(datetime.timezone.utc)
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=1))
+            .add_extension(
+                x509.BasicConstraints(ca=True, path_length=None),
+                critical=True,
+            )
+            .sign(key, hashes.SHA256())
+        )
+        cert_pem = cert.public_bytes(serialization.Encoding.PEM)
+        key_pem = key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        self.wallet_location = str(wallet_location)
+        self.wallet_file_name = os.path.join(
+            self.wallet_location, "ewallet.pem"
+        )
+        with open(self.wallet_file_name, "wb") as f:
+            f.write(cert_pem)
+        server_file_name = os.path.join(self.wallet_location, "server.pem")
+        with open(server_file_name, "wb") as f:
+            f.write(key_pem + cert_pem)
+
+        # TLS 1.2 is used so that sessions are resumed using the session
+        # cache of the server context
+        self.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self.ssl_context.maximum_version = ssl.TLSVersion.TLSv1_2
+        self.ssl_context.load_cert_chain(server_file_name)
+        self.sessions_reused = []
+        super().__init__()
+
+    def _handle_client(self, client_sock):
+        try:
+            with self.ssl_context.wrap_socket(
+                client_sock, server_side=True
+            ) as tls_sock:
+                self.sessions_reused.append(tls_sock.session_reused)
+                super()._handle_client(tls_sock)
+        except ssl.SSLError:
+            self.sessions_reused.append(None)
+
+    def get_connect_params(self):
+        """
+        Returns connection parameters for connecting to the server.
+        """
+        return oracledb.ConnectParams(
+            user="tls_user",
+            password="tls_password",
+            host="127.0.0.1",
+            port=self.port,
+            protocol="tcps",
+            service_name="tls_service",
+            wallet_location=self.wallet_location,
+            ssl_server_dn_match=False,
+            retry_count=0,
+        )
+
+
 class TestEnv:
 
     def _convert_df_value(self, df_val):
@@ -820,6 +955,16 @@ def pytest_addoption(parser):
     parser.addoption("--use-thick-mode", action="store_true")
 
 
+@pytest.fixture
+def refusing_listener():
+    """
+    Returns a local server which refuses each connection request.
+    """
+    server = RefusingListener()
+    yield server
+    server.close()
+
+
 @pytest.fixture
 def round_trip_checker(conn, admin_conn, test_env):
     """
@@ -1049,3 +1194,14 @@ def test_env(pytestconfig):
     )
     env.initialized = False
     return env
+
+
+@pytest.fixture
+def tls_server(tmp_path):
+    """
+    Returns a local server which negotiates TLS and then refuses each
+    connection request.
+    """
+    server = TLSServer(tmp_path)
+    yield server
+    server.close()
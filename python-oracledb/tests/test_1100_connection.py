@@ -26,7 +26,9 @@
 1100 - Module for testing connections
 """
 
+import os
 import random
+import socket
 import string
 import threading
 import time
@@ -925,3 +927,119 @@ def test_1158(conn, test_env):
             """
         )
         cursor.fetchall()
+
+
+def test_1159(skip_unless_thin_mode, conn, admin_conn, test_env):
+    "1159 - test round trip hooks"
+    infos = []
+    sql = "select user from dual"
+    cursor = conn.cursor()
+    oracledb.register_round_trip_hook(infos.append)
+    try:
+        cursor.execute(sql)
+        (user,) = cursor.fetchone()
+    finally:
+        oracledb.unregister_round_trip_hook(infos.append)
+    assert user == test_env.main_user.upper()
+    (info,) = infos
+    assert info.message_type == "ExecuteMessage"
+    assert info.sql == sql
+    with admin_conn.cursor() as admin_cursor:
+        admin_cursor.execute(
+            "select sql_id from v$sql where sql_text = :1 and rownum = 1",
+            [sql],
+        )
+        (sql_id,) = admin_cursor.fetchone()
+    assert info.sql_id == sql_id
+    assert info.bytes_sent > 0
+    assert info.bytes_received > 0
+    assert info.packets_sent >= 1
+    assert info.packets_received >= 1
+    assert info.elapsed_time >= info.server_time >= 0
+    assert info.client_time >= 0
+    assert info.exception is None
+    conn.ping()
+    assert len(infos) == 1
+
+
+def test_1160(skip_unless_thin_mode, conn, test_env):
+    "1160 - test round trip hooks with errors and sample rates"
+    infos = []
+    cursor = conn.cursor()
+    oracledb.register_round_trip_hook(infos.append)
+    oracledb.register_round_trip_hook(infos.append, sample_rate=0)
+    try:
+        with test_env.assert_raises_full_code("ORA-00942"):
+            cursor.execute("select * from TestMissingTable")
+    finally:
+        oracledb.unregister_round_trip_hook(infos.append)
+        oracledb.unregister_round_trip_hook(infos.append)
+    (info,) = infos
+    assert isinstance(info.exception, oracledb.DatabaseError)
+    with pytest.raises(ValueError):
+        oracledb.unregister_round_trip_hook(infos.append)
+    with pytest.raises(ValueError):
+        oracledb.register_round_trip_hook(infos.append, sample_rate=1.5)
+    with pytest.raises(TypeError):
+        oracledb.register_round_trip_hook(None)
+
+
+def test_1161(skip_unless_thin_mode, tls_server):
+    "1161 - test reuse of TLS contexts and resumption of TLS sessions"
+    params = tls_server.get_connect_params()
+    for i in range(2):
+        with pytest.raises(oracledb.OperationalError):
+            oracledb.connect(params=params)
+
+    # a wallet which has been modified requires a new TLS context
+    mtime = os.path.getmtime(tls_server.wallet_file_name) + 10
+    os.utime(tls_server.wallet_file_name, (mtime, mtime))
+    for i in range(2):
+        with pytest.raises(oracledb.OperationalError):
+            oracledb.connect(params=params)
+    assert tls_server.sessions_reused == [False, True, False, True]
+
+
+def test_1162(skip_unless_thin_mode, refusing_listener, test_env):
+    "1162 - test the error raised when racing connections to addresses"
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        addresses = [
+            "(ADDRESS=(PROTOCOL=tcp)(HOST=127.0.0.1)"
+            f"(PORT={sock.getsockname()[1]}))",
+            "(ADDRESS=(PROTOCOL=tcp)(HOST=127.0.0.1)"
+            f"(PORT={refusing_listener.port}))",
+        ]
+        dsn = (
+            f"(DESCRIPTION=(ADDRESS_LIST={''.join(addresses)})"
+            "(CONNECT_DATA=(SERVICE_NAME=test_1162)))"
+        )
+        with test_env.assert_raises_full_code("DPY-6005") as cm:
+            oracledb.connect(user="test_user", password="test", dsn=dsn)
+        assert "DPY-6001" in cm.error_obj.message
+
+
+def test_1163(skip_unless_thin_mode, tls_server):
+    "1163 - test TLS handshakes are raced along with TCP connections"
+    with socket.create_server(("127.0.0.1", 0)) as sock:
+        addresses = [
+            "(ADDRESS=(PROTOCOL=tcps)(HOST=127.0.0.1)"
+            f"(PORT={sock.getsockname()[1]}))",
+            "(ADDRESS=(PROTOCOL=tcps)(HOST=127.0.0.1)"
+            f"(PORT={tls_server.port}))",
+        ]
+        dsn = (
+            "(DESCRIPTION=(TRANSPORT_CONNECT_TIMEOUT=2)"
+            f"(ADDRESS_LIST={''.join(addresses)})"
+            "(CONNECT_DATA=(SERVICE_NAME=test_1163))"
+            "(SECURITY=(SSL_SERVER_DN_MATCH=OFF)"
+            f"(MY_WALLET_DIRECTORY={tls_server.wallet_location})))"
+        )
+
+        # the first address accepts the TCP connection but never completes
+        # the TLS handshake, so the second address wins the race
+        with pytest.raises(oracledb.OperationalError):
+            oracledb.connect(
+                user="x", password="x", dsn=dsn, parallel_connect_delay=0.1
+            )
+    assert tls_server.sessions_reused == [False]
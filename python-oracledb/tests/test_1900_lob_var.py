@@ -26,7 +26,9 @@
 1900 - Module for testing LOB (CLOB and BLOB) variables
 """
 
+import io
 import pickle
+import threading
 
 import oracledb
 import pytest
@@ -672,3 +674,129 @@ def test_1940(cursor):
         "pkg_TestLOBs.TestInOut", [var, search_value, replace_value]
     )
     assert var.getvalue().read() == final_value
+
+
+def test_1941(conn):
+    "1941 - test iterating over a LOB stream in chunks"
+    value = bytes(range(256)) * 1000
+    lob = conn.createlob(oracledb.DB_TYPE_BLOB, value)
+    chunk_size = lob.getchunksize()
+    with lob.open_stream(chunk_size=chunk_size + 1) as stream:
+        chunks = list(stream)
+    assert b"".join(chunks) == value
+    for chunk in chunks[:-1]:
+        assert len(chunk) == chunk_size * 2
+    with lob.open_stream(offset=11, read_ahead=False) as stream:
+        assert stream.read(5) == value[10:15]
+        assert stream.offset == 16
+        assert stream.read() == value[15:]
+        assert stream.read() == b""
+
+
+def test_1942(conn, test_env):
+    "1942 - test readinto() with a LOB stream"
+    value = bytes(range(256)) * 500
+    lob = conn.createlob(oracledb.DB_TYPE_BLOB, value)
+    buf = bytearray(10000)
+    parts = []
+    with lob.open_stream() as stream:
+        while True:
+            num_bytes = stream.readinto(buf)
+            if num_bytes == 0:
+                break
+            parts.append(bytes(buf[:num_bytes]))
+    assert b"".join(parts) == value
+    clob = conn.createlob(oracledb.DB_TYPE_CLOB, "test_1942")
+    with clob.open_stream() as stream:
+        with test_env.assert_raises_full_code("DPY-3041"):
+            stream.readinto(buf)
+
+
+def test_1943(conn):
+    "1943 - test writing to a LOB stream from a readable object"
+    value = "A string for test 1943 € \U0001f600. " * 5000
+    lob = conn.createlob(oracledb.DB_TYPE_CLOB)
+    with lob.open_stream() as stream:
+        num_units = stream.write(io.StringIO(value))
+        num_units += stream.write("end")
+    assert num_units == lob.size()
+    assert lob.read() == value + "end"
+    blob = conn.createlob(oracledb.DB_TYPE_BLOB, b"x" * 100)
+    with blob.open_stream() as stream:
+        assert stream.read(10) == b"x" * 10
+        stream.write(io.BytesIO(b"y" * 10))
+        assert stream.read(5) == b"x" * 5
+    assert blob.read() == b"x" * 10 + b"y" * 10 + b"x" * 80
+
+
+def test_1944(conn, test_env):
+    "1944 - test LOB stream errors"
+    lob = conn.createlob(oracledb.DB_TYPE_BLOB, b"test_1944")
+    with test_env.assert_raises_full_code("DPY-2030"):
+        lob.open_stream(offset=0)
+    with test_env.assert_raises_full_code("DPY-2047"):
+        lob.open_stream(chunk_size=0)
+    stream = lob.open_stream()
+    stream.close()
+    assert stream.closed
+    with test_env.assert_raises_full_code("DPY-1007"):
+        stream.read()
+    with test_env.assert_raises_full_code("DPY-1007"):
+        stream.write(b"x")
+
+
+def test_1945(conn, cursor, test_env):
+    "1945 - test reading the data of multiple LOBs at once"
+    cursor.execute("delete from TestCLOBs")
+    values = [f"CLOB value {i} for test 1945 " * (i + 1) for i in range(50)]
+    cursor.executemany(
+        "insert into TestCLOBs (IntCol, CLOBCol) values (:1, :2)",
+        list(enumerate(values)),
+    )
+    conn.commit()
+    cursor.execute("select CLOBCol from TestCLOBs order by IntCol")
+    lobs = [lob for lob, in cursor]
+    assert conn.read_lobs(lobs) == values
+    blob = conn.createlob(oracledb.DB_TYPE_BLOB, b"test_1945")
+    empty_clob = conn.createlob(oracledb.DB_TYPE_CLOB)
+    assert conn.read_lobs([blob, empty_clob, lobs[0]]) == [
+        b"test_1945",
+        "",
+        values[0],
+    ]
+    assert conn.read_lobs([]) == []
+    with test_env.assert_raises_full_code("DPY-2073"):
+        conn.read_lobs(["not a LOB"])
+    with test_env.get_connection() as other_conn:
+        with test_env.assert_raises_full_code("DPY-2074"):
+            other_conn.read_lobs([lobs[0]])
+
+
+def test_1946(skip_unless_thin_mode, conn, round_trip_checker, test_env):
+    "1946 - test reading multiple LOBs requires only one round trip"
+    test_env.skip_unless_server_version(23)
+    lobs = [
+        conn.createlob(oracledb.DB_TYPE_CLOB, f"test_1946 {i}")
+        for i in range(10)
+    ]
+    round_trip_checker.get_value()
+    values = conn.read_lobs(lobs)
+    assert round_trip_checker.get_value() == 1
+    assert values == [f"test_1946 {i}" for i in range(10)]
+
+
+def test_1947(conn):
+    "1947 - test read-ahead of LOB streams does not start a thread per stream"
+    value = bytes(range(256)) * 1000
+    lob = conn.createlob(oracledb.DB_TYPE_BLOB, value)
+    chunk_size = lob.getchunksize()
+    threads = set(threading.enumerate())
+    for i in range(5):
+        stream = lob.open_stream(chunk_size=chunk_size)
+        assert stream.read(10) == value[:10]
+        del stream
+    with lob.open_stream(chunk_size=chunk_size) as stream:
+        assert stream.read() == value
+    new_threads = set(threading.enumerate()) - threads
+    for thread in new_threads:
+        assert thread.name.startswith("oracledb-lob-read-ahead")
@@ -26,10 +26,13 @@
 2400 - Module for testing pools
 """
 
+import math
 import re
 import threading
+import time
 
 import oracledb
+import pyarrow
 import pytest
 
 
@@ -1068,3 +1071,524 @@ def test_2458(test_env):
     with test_env.assert_raises_full_code("ORA-01017"):
         pool = test_env.get_pool(password=test_env.main_password + "X")
         pool.acquire()
+
+
+def test_2459(skip_unless_thin_mode, conn, test_env):
+    "2459 - test results are cached by the pool until invalidated"
+    with conn.cursor() as cursor:
+        cursor.execute("truncate table TestTempTable")
+        cursor.execute(
+            "insert into TestTempTable (IntCol, StringCol1) values (1, 'A')"
+        )
+        conn.commit()
+    sql = """
+        select /*+ result_cache */ StringCol1
+        from TestTempTable
+        where IntCol = :1
+        """
+    pool = test_env.get_pool(result_cache_size=1024 * 1024)
+    with pool.acquire() as pooled_conn:
+        with pooled_conn.cursor() as cursor:
+            cursor.execute(sql, [1])
+            assert cursor.fetchall() == [("A",)]
+    with conn.cursor() as cursor:
+        cursor.execute("update TestTempTable set StringCol1 = 'B'")
+        conn.commit()
+    with pool.acquire() as pooled_conn:
+        with pooled_conn.cursor() as cursor:
+            cursor.execute(sql, [1])
+            assert [i.name for i in cursor.description] == ["STRINGCOL1"]
+            assert cursor.fetchall() == [("A",)]
+            cursor.execute(sql, [2])
+            assert cursor.fetchall() == []
+            pool.invalidate_result_cache(["TestTempTable"])
+            cursor.execute(sql, [1])
+            assert cursor.fetchall() == [("B",)]
+    pool.close()
+
+
+def test_2460(skip_unless_thin_mode, conn, test_env):
+    "2460 - test cached results are not used within a transaction"
+    with conn.cursor() as cursor:
+        cursor.execute("truncate table TestTempTable")
+        cursor.execute(
+            "insert into TestTempTable (IntCol, StringCol1) values (1, 'A')"
+        )
+        conn.commit()
+    sql = """
+        select /*+ result_cache */ StringCol1
+        from TestTempTable
+        where IntCol = :1
+        """
+    pool = test_env.get_pool(result_cache_size=1024 * 1024)
+    with pool.acquire() as pooled_conn:
+        with pooled_conn.cursor() as cursor:
+            cursor.execute(sql, [1])
+            assert cursor.fetchall() == [("A",)]
+            cursor.execute("update TestTempTable set StringCol1 = 'C'")
+            cursor.execute(sql, [1])
+            assert cursor.fetchall() == [("C",)]
+            pooled_conn.rollback()
+            cursor.execute(sql, [1])
+            assert cursor.fetchall() == [("A",)]
+    pool.close()
+
+
+def test_2461(skip_unless_thin_mode, test_env):
+    "2461 - test statements are shared between connections in a pool"
+    pool = test_env.get_pool(min=2, max=2, shared_statement_cache=True)
+    sql = "select :val from dual"
+    with pool.acquire() as conn1, pool.acquire() as conn2:
+        for conn, value in ((conn1, 1), (conn2, 2)):
+            with conn.cursor() as cursor:
+                cursor.execute(sql, val=value)
+                assert cursor.bindnames() == ["VAL"]
+                assert cursor.fetchall() == [(value,)]
+    pool.close()
+
+
+def test_2462(skip_unless_thin_mode, skip_if_drcp, admin_conn, test_env):
+    "2462 - test statements are prepared on new pooled connections"
+    sql = "select 'test_2462' from dual"
+    pool = test_env.get_pool(
+        min=1, max=1, warmup_statements=[sql, "select bad_column from dual"]
+    )
+
+    # wait for the background task to create (and warm up) the connection so
+    # that it is not created by the request to acquire a connection instead
+    for i in range(50):
+        if pool.opened == 1:
+            break
+        time.sleep(0.1)
+    assert pool.opened == 1
+    with pool.acquire() as conn:
+        sid, serial = test_env.get_sid_serial(conn)
+        with admin_conn.cursor() as admin_cursor:
+            admin_cursor.execute(
+                """
+                select count(*)
+                from v$open_cursor
+                where sid = :sid
+                  and sql_text = :sql_text
+                """,
+                sid=sid,
+                sql_text=sql,
+            )
+            (num_open,) = admin_cursor.fetchone()
+        assert num_open == 1
+        with conn.cursor() as cursor:
+            cursor.execute(sql)
+            assert cursor.fetchall() == [("test_2462",)]
+    pool.close()
+
+
+def test_2463(test_env):
+    "2463 - test fetching a data frame in parallel"
+    pool = test_env.get_pool(min=0, max=4)
+    df = pool.fetch_df_parallel(
+        """
+        select level as id, 'Row ' || level as name
+        from dual
+        connect by level <= :num_rows
+        """,
+        split_by="id",
+        parameters=dict(num_rows=1000),
+    )
+    assert df.column_names() == ["ID", "NAME"]
+    assert df.num_rows() == 1000
+    rows = sorted(pyarrow.table(df).to_pylist(), key=lambda r: r["ID"])
+    assert rows == [dict(ID=i, NAME=f"Row {i}") for i in range(1, 1001)]
+    pool.close()
+
+
+def test_2464(test_env):
+    "2464 - test fetching a data frame in parallel with positional binds"
+    pool = test_env.get_pool(min=0, max=2)
+    df = pool.fetch_df_parallel(
+        "select level as id from dual connect by level <= :1",
+        split_by="id",
+        parameters=[100],
+        num_splits=3,
+    )
+    ids = pyarrow.table(df)["ID"].to_pylist()
+    assert sorted(ids) == list(range(1, 101))
+    pool.close()
+
+
+def test_2465(skip_unless_thin_mode, test_env):
+    "2465 - test creating pool connections concurrently"
+    intervals = []
+
+    def callback(name, value, attributes):
+        if name == "connection_created":
+            end_time = time.monotonic()
+            intervals.append((end_time - value, end_time))
+
+    pool = test_env.get_pool(
+        min=4, max=4, creation_concurrency=4, metrics_callback=callback
+    )
+    conns = [pool.acquire() for _ in range(4)]
+    sids = set(test_env.get_sid_serial(conn) for conn in conns)
+    assert len(sids) == 4
+    assert pool.opened == 4
+
+    # all connections must have been in the process of being created at the
+    # same time
+    assert len(intervals) == 4
+    assert max(s for s, _ in intervals) < min(e for _, e in intervals)
+    for conn in conns:
+        conn.close()
+    pool.close()
+
+
+def test_2466(skip_unless_thin_mode, test_env):
+    "2466 - test pool metrics and the metrics callback"
+    events = []
+
+    def callback(name, value, attributes):
+        events.append((name, attributes))
+
+    pool = test_env.get_pool(
+        min=1, max=2, increment=1, metrics_callback=callback
+    )
+    with pool.acquire():
+        metrics = pool.get_metrics()
+        assert metrics.busy == 1
+        assert metrics.waiting_count == 0
+    conn = pool.acquire()
+    pool.drop(conn)
+    metrics = pool.get_metrics()
+    assert metrics.acquire_count == 2
+    assert metrics.acquire_failure_count == 0
+    assert metrics.max_waiting_count == 1
+    assert metrics.acquire_wait_time_buckets[math.inf] == 2
+    assert metrics.acquire_wait_time_sum >= 0
+    assert metrics.create_count >= 1
+    assert metrics.create_time_buckets[math.inf] == metrics.create_count
+    assert metrics.close_counts == dict(dropped=1)
+    assert metrics.busy == 0
+    assert ("acquire", dict(success=True)) in events
+    assert ("connection_created", dict(success=True)) in events
+    assert ("connection_closed", dict(reason="dropped")) in events
+    pool.close()
+    with test_env.assert_raises_full_code("DPY-1002"):
+        pool.get_metrics()
+
+
+def test_2467(skip_unless_thin_mode, conn, test_env):
+    "2467 - test cached results are returned to a different connection"
+    with conn.cursor() as cursor:
+        cursor.execute("truncate table TestTempTable")
+        cursor.execute(
+            "insert into TestTempTable (IntCol, StringCol1) values (1, 'A')"
+        )
+        conn.commit()
+    sql = """
+        select /*+ result_cache */ IntCol, StringCol1
+        from TestTempTable
+        where IntCol = :1
+        """
+    pool = test_env.get_pool(min=2, max=2, result_cache_size=1024 * 1024)
+    conn1 = pool.acquire()
+    conn2 = pool.acquire()
+    assert test_env.get_sid_serial(conn1) != test_env.get_sid_serial(conn2)
+    with conn1.cursor() as cursor:
+        cursor.execute(sql, [1])
+        assert cursor.fetchall() == [(1, "A")]
+    with conn.cursor() as cursor:
+        cursor.execute("update TestTempTable set StringCol1 = 'B'")
+        conn.commit()
+    with conn2.cursor() as cursor:
+        cursor.execute(sql, [1])
+        assert [i.name for i in cursor.description] == [
+            "INTCOL",
+            "STRINGCOL1",
+        ]
+        assert cursor.fetchall() == [(1, "A")]
+        cursor.execute(sql, [1])
+        assert cursor.fetchone() == (1, "A")
+        assert cursor.fetchone() is None
+    conn1.close()
+    conn2.close()
+    pool.close()
+
+
+def test_2468(skip_unless_thin_mode, test_env):
+    "2468 - test cached results depend on the session state"
+    sql = "select /*+ result_cache */ to_char(date '2025-03-04') from dual"
+    pool = test_env.get_pool(min=2, max=2, result_cache_size=1024 * 1024)
+    conn1 = pool.acquire()
+    conn2 = pool.acquire()
+    for conn in (conn1, conn2):
+        with conn.cursor() as cursor:
+            cursor.execute("alter session set nls_date_format = 'YYYY-MM-DD'")
+    with conn2.cursor() as cursor:
+        cursor.execute("alter session set nls_date_format = 'DD/MM/YYYY'")
+    with conn1.cursor() as cursor:
+        cursor.execute(sql)
+        assert cursor.fetchall() == [("2025-03-04",)]
+    with conn2.cursor() as cursor:
+        cursor.execute(sql)
+        assert cursor.fetchall() == [("04/03/2025",)]
+        cursor.callproc("dbms_output.enable")
+        cursor.execute("alter session set nls_date_format = 'YYYY-MM-DD'")
+        cursor.execute(sql)
+        assert cursor.fetchall() == [("2025-03-04",)]
+    conn1.close()
+    conn2.close()
+    pool.close()
+
+
+def test_2469(skip_unless_thin_mode, conn, test_env):
+    "2469 - test invalidating results of queries that use a view by name"
+    with conn.cursor() as cursor:
+        cursor.execute("truncate table TestTempTable")
+        cursor.execute(
+            "insert into TestTempTable (IntCol, StringCol1) values (1, 'A')"
+        )
+        cursor.execute(
+            """
+            create or replace view TestResultCacheView as
+            select IntCol, StringCol1 from TestTempTable
+            """
+        )
+        conn.commit()
+    sql = """
+        select /*+ result_cache */ StringCol1
+        from TestResultCacheView
+        where IntCol = :1
+        """
+    pool = test_env.get_pool(result_cache_size=1024 * 1024)
+    try:
+        with pool.acquire() as pooled_conn:
+            with pooled_conn.cursor() as cursor:
+                cursor.execute(sql, [1])
+                assert cursor.fetchall() == [("A",)]
+        with conn.cursor() as cursor:
+            cursor.execute("update TestTempTable set StringCol1 = 'B'")
+            conn.commit()
+        pool.invalidate_result_cache(["TestTempTable"])
+        with pool.acquire() as pooled_conn:
+            with pooled_conn.cursor() as cursor:
+                cursor.execute(sql, [1])
+                assert cursor.fetchall() == [("A",)]
+        pool.invalidate_result_cache(["TestResultCacheView"])
+        with pool.acquire() as pooled_conn:
+            with pooled_conn.cursor() as cursor:
+                cursor.execute(sql, [1])
+                assert cursor.fetchall() == [("B",)]
+    finally:
+        pool.close()
+        with conn.cursor() as cursor:
+            cursor.execute("drop view TestResultCacheView")
+
+
+def test_2470(test_env):
+    "2470 - test fetching a data frame in parallel with invalid num_splits"
+    pool = test_env.get_pool(min=0, max=2)
+    sql = "select level as id from dual connect by level <= 10"
+    for num_splits in (0, -1, 1.5, True):
+        with test_env.assert_raises_full_code("DPY-2072"):
+            pool.fetch_df_parallel(sql, split_by="id", num_splits=num_splits)
+    pool.close()
+
+
+def test_2471(skip_unless_thin_mode, test_env):
+    "2471 - test the metrics callback is called without the pool lock held"
+    threads = []
+
+    def acquire_and_release():
+        with pool.acquire():
+            pass
+
+    def callback(name, value, attributes):
+        if name == "connection_closed":
+            thread = threading.Thread(target=acquire_and_release)
+            thread.start()
+            thread.join(5)
+            threads.append(thread)
+
+    pool = test_env.get_pool(
+        min=2, max=2, increment=1, metrics_callback=callback
+    )
+    conn = pool.acquire()
+    pool.drop(conn)
+    assert len(threads) == 1
+    assert not threads[0].is_alive()
+    pool.close()
+
+
+def test_2472(skip_unless_thin_mode, conn, test_env):
+    "2472 - test only queries with the RESULT_CACHE hint are cached"
+    with conn.cursor() as cursor:
+        cursor.execute("truncate table TestTempTable")
+        cursor.execute(
+            "insert into TestTempTable (IntCol, StringCol1) values (1, 'A')"
+        )
+        conn.commit()
+    pool = test_env.get_pool(result_cache_size=1024 * 1024)
+    with pool.acquire() as pooled_conn:
+        with pooled_conn.cursor() as cursor:
+            cursor.execute("select StringCol1 from TestTempTable")
+            assert cursor.fetchall() == [("A",)]
+            cursor.execute("select /*+ result_cache */ sys_guid() from dual")
+            (guid,) = cursor.fetchone()
+    with conn.cursor() as cursor:
+        cursor.execute("update TestTempTable set StringCol1 = 'B'")
+        conn.commit()
+    with pool.acquire() as pooled_conn:
+        with pooled_conn.cursor() as cursor:
+            cursor.execute("select StringCol1 from TestTempTable")
+            assert cursor.fetchall() == [("B",)]
+            cursor.execute("select /*+ result_cache */ sys_guid() from dual")
+            assert cursor.fetchone() != (guid,)
+    pool.close()
+
+
+def test_2473(skip_unless_thin_mode, conn, test_env):
+    "2473 - test results fetched during an invalidation are not cached"
+    with conn.cursor() as cursor:
+        cursor.execute("truncate table TestTempTable")
+        cursor.executemany(
+            "insert into TestTempTable (IntCol, StringCol1) values (:1, 'A')",
+            [(i,) for i in range(1, 11)],
+        )
+        conn.commit()
+    sql = """
+        select /*+ result_cache */ IntCol, StringCol1
+        from TestTempTable
+        order by IntCol
+        """
+    pool = test_env.get_pool(result_cache_size=1024 * 1024)
+    with pool.acquire() as pooled_conn:
+        with pooled_conn.cursor() as cursor:
+            cursor.arraysize = 2
+            cursor.prefetchrows = 2
+            cursor.execute(sql)
+            assert cursor.fetchone() == (1, "A")
+            pool.invalidate_result_cache(["TestTempTable"])
+            assert len(cursor.fetchall()) == 9
+    with conn.cursor() as cursor:
+        cursor.execute("update TestTempTable set StringCol1 = 'B'")
+        conn.commit()
+    with pool.acquire() as pooled_conn:
+        with pooled_conn.cursor() as cursor:
+            cursor.execute(sql)
+            assert cursor.fetchall() == [(i, "B") for i in range(1, 11)]
+    pool.close()
+
+
+def test_2474(skip_unless_thin_mode, test_env):
+    "2474 - test pool metrics are consistent when acquired from many threads"
+    num_threads = 8
+    num_iters = 25
+
+    def acquire_and_release():
+        for i in range(num_iters):
+            with pool.acquire():
+                pool.get_metrics()
+
+    pool = test_env.get_pool(min=0, max=2, increment=1)
+    threads = [
+        threading.Thread(target=acquire_and_release)
+        for i in range(num_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    metrics = pool.get_metrics()
+    assert metrics.acquire_count == num_threads * num_iters
+    assert metrics.acquire_failure_count == 0
+    assert metrics.acquire_wait_time_buckets[math.inf] == metrics.acquire_count
+    assert metrics.waiting_count == 0
+    assert 1 <= metrics.max_waiting_count <= num_threads
+    pool.close()
+
+
+def test_2475(test_env):
+    "2475 - test fetching a data frame in parallel with invalid split_by"
+    pool = test_env.get_pool(min=0, max=2)
+    sql = "select level as id from dual connect by level <= 10"
+    for split_by in ("id) + 1 from dual --", "id, id", "", '"id', 5):
+        with test_env.assert_raises_full_code("DPY-2075"):
+            pool.fetch_df_parallel(sql, split_by=split_by, num_splits=2)
+    pool.close()
+
+
+def test_2476(test_env):
+    "2476 - test fetching a data frame in parallel with null split values"
+    pool = test_env.get_pool(min=0, max=4)
+    df = pool.fetch_df_parallel(
+        """
+        select level as id, nullif(mod(level, 3), 0) as split_value
+        from dual
+        connect by level <= 300
+        """,
+        split_by="split_value",
+        num_splits=4,
+    )
+    assert df.num_rows() == 300
+    ids = pyarrow.table(df)["ID"].to_pylist()
+    assert sorted(ids) == list(range(1, 301))
+    pool.close()
+
+
+def test_2477(test_env):
+    "2477 - test a failed parallel fetch releases all of its connections"
+    pool = test_env.get_pool(min=0, max=4)
+    sql = """
+        select level as id, 1 / (:split_num - 1) as value
+        from dual
+        connect by level <= 100"""
+    with test_env.assert_raises_full_code("ORA-01476"):
+        pool.fetch_df_parallel(sql, split_by="id", num_splits=4)
+    assert pool.busy == 0
+    df = pool.fetch_df_parallel(
+        "select level as id from dual connect by level <= 100",
+        split_by="id",
+        num_splits=4,
+    )
+    assert df.num_rows() == 100
+    pool.close()
+
+
+def test_2478(test_env):
+    "2478 - test fetching a data frame stream in parallel"
+    pool = test_env.get_pool(min=0, max=4)
+    stream = pool.fetch_df_stream_parallel(
+        """
+        select level as id, 'Row ' || level as name
+        from dual
+        connect by level <= :num_rows
+        """,
+        split_by="id",
+        parameters=dict(num_rows=1000),
+        num_splits=4,
+        size=100,
+    )
+    reader = pyarrow.RecordBatchReader.from_stream(stream)
+    assert reader.schema.names == ["ID", "NAME"]
+    batches = list(reader)
+    assert all(b.num_rows <= 100 for b in batches)
+    rows = pyarrow.Table.from_batches(batches).to_pylist()
+    rows.sort(key=lambda r: r["ID"])
+    assert rows == [dict(ID=i, NAME=f"Row {i}") for i in range(1, 1001)]
+    assert pool.busy == 0
+    pool.close()
+
+
+def test_2479(test_env):
+    "2479 - test a failed parallel data frame stream"
+    pool = test_env.get_pool(min=0, max=4)
+    sql = """
+        select level as id, 1 / (:split_num - 1) as value
+        from dual
+        connect by level <= 1000"""
+    with test_env.assert_raises_full_code("ORA-01476"):
+        stream = pool.fetch_df_stream_parallel(
+            sql, split_by="id", num_splits=4, size=10
+        )
+        oracledb.from_arrow(stream)
+    assert pool.busy == 0
+    pool.close()
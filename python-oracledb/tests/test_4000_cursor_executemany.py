@@ -491,3 +491,47 @@ def test_4031(batch_size, conn, cursor, empty_tab, round_trip_checker):
         "select IntCol, StringCol1 from TestTempTable order by IntCol"
     )
     assert cursor.fetchall() == rows
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 200, 250])
+def test_4032(batch_size, conn, cursor, empty_tab, round_trip_checker):
+    "4032 - test executemany with a generator and various batch sizes"
+    rows = [(i + 1, f"String for row {i + 1}") for i in range(200)]
+    cursor.executemany(
+        "insert into TestTempTable (IntCol, StringCol1) values (:1, :2)",
+        (row for row in rows),
+        batch_size=batch_size,
+    )
+    expected_round_trips = len(rows) // batch_size
+    if len(rows) % batch_size:
+        expected_round_trips += 1
+    assert round_trip_checker.get_value() == expected_round_trips
+    conn.commit()
+    cursor.execute(
+        "select IntCol, StringCol1 from TestTempTable order by IntCol"
+    )
+    assert cursor.fetchall() == rows
+
+
+def test_4033(conn, cursor, empty_tab):
+    "4033 - test executemany with an iterator of dictionaries and nulls"
+    rows = [(1, None), (2, "Second"), (3, None), (4, "Fourth")]
+    cursor.executemany(
+        "insert into TestTempTable (IntCol, StringCol1) values (:a, :b)",
+        iter([dict(a=i, b=s) for i, s in rows]),
+        batch_size=1,
+    )
+    conn.commit()
+    cursor.execute(
+        "select IntCol, StringCol1 from TestTempTable order by IntCol"
+    )
+    assert cursor.fetchall() == rows
+
+
+def test_4034(cursor, round_trip_checker):
+    "4034 - test executemany with an empty generator"
+    cursor.executemany(
+        "insert into TestTempTable (IntCol) values (:1)",
+        (i for i in range(0)),
+    )
+    assert round_trip_checker.get_value() == 0
@@ -26,9 +26,11 @@
 4300 - Module for testing other cursor methods and attributes.
 """
 
+import array
 import decimal
 
 import oracledb
+import pytest
 
 
 def test_4300(cursor):
@@ -1066,3 +1068,101 @@ def test_4372(cursor):
     cursor.parse("select to_clob('some_value') from dual")
     fetch_info = cursor.description[0]
     assert fetch_info.type is oracledb.DB_TYPE_CLOB
+
+
+def test_4373(cursor):
+    "4373 - test fetchblock() returns column-oriented blocks"
+    cursor.arraysize = 4
+    cursor.execute(
+        """
+        select
+            level as IntCol,
+            to_binary_double(level) + 0.5 as FloatCol,
+            'String ' || level as StringCol
+        from dual
+        connect by level <= 10
+        """
+    )
+    block = cursor.fetchblock()
+    assert len(block) == 4
+    assert block.num_rows == 4
+    assert block.column_names == ["INTCOL", "FLOATCOL", "STRINGCOL"]
+    int_col = block.column(0)
+    assert isinstance(int_col, array.array)
+    assert int_col.typecode == "q"
+    assert list(int_col) == [1, 2, 3, 4]
+    float_col = block.column("FLOATCOL")
+    assert isinstance(float_col, array.array)
+    assert float_col.typecode == "d"
+    assert list(float_col) == [1.5, 2.5, 3.5, 4.5]
+    assert block.column(2) == [f"String {i}" for i in range(1, 5)]
+    assert block[0] == (1, 1.5, "String 1")
+    assert block[-1] == (4, 4.5, "String 4")
+    block = cursor.fetchblock(size=5)
+    assert list(block) == [(i, i + 0.5, f"String {i}") for i in range(5, 10)]
+    block = cursor.fetchblock()
+    assert len(block) == 1
+    assert cursor.rowcount == 10
+    block = cursor.fetchblock()
+    assert len(block) == 0
+    assert block.columns == [[], [], []]
+    with pytest.raises(KeyError):
+        block.column("MISSING_COL")
+    with pytest.raises(IndexError):
+        block[0]
+
+
+def test_4374(cursor):
+    "4374 - test fetchblock() with nulls and a row factory"
+    cursor.execute(
+        """
+        select
+            level as IntCol,
+            case when level = 2 then null else level end as NullableCol
+        from dual
+        connect by level <= 3
+        """
+    )
+    cursor.rowfactory = lambda *row: list(row)
+    block = cursor.fetchblock(10)
+    assert isinstance(block.column(0), array.array)
+    assert block.validity(0) is None
+    assert block.column(1) == array.array("q", [1, 0, 3])
+    assert block.validity("NULLABLECOL") == array.array("B", [1, 0, 1])
+    assert list(block) == [[1, 1], [2, None], [3, 3]]
+
+
+def test_4375(cursor, test_env):
+    "4375 - test fetchblock() with a statement that is not a query"
+    cursor.execute("begin null; end;")
+    with test_env.assert_raises_full_code("DPY-1003"):
+        cursor.fetchblock()
+
+
+def test_4376(cursor):
+    "4376 - test fetchblock() across round trips with duplicates and nulls"
+    sql = """
+        select
+            level as IntCol,
+            trunc(level / 5) as DuplicateCol,
+            case when mod(level, 3) = 0 then null else level / 4 end
+                as MixedCol,
+            to_binary_double(trunc(level / 4)) as DoubleCol
+        from dual
+        connect by level <= 40
+        """
+    cursor.execute(sql)
+    expected = cursor.fetchall()
+    cursor.arraysize = 7
+    cursor.prefetchrows = 2
+    cursor.execute(sql)
+    rows = list(cursor.fetchblock(5))
+    block = cursor.fetchblock(10)
+    assert block.column("DUPLICATECOL").typecode == "q"
+    assert block.column("DOUBLECOL").typecode == "d"
+    assert isinstance(block.column("MIXEDCOL"), list)
+    assert block.validity("INTCOL") is None
+    rows.extend(block)
+    rows.append(cursor.fetchone())
+    rows.extend(cursor.fetchblock(30))
+    assert rows == expected
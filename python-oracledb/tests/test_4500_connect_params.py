@@ -728,6 +728,7 @@ def test_4539():
         ("thick_mode_dsn_passthrough", True),
         ("extra_auth_params", dict(extra1="A", extra2="B")),
         ("pool_name", "my_pool"),
+        ("parallel_connect_delay", 0.25),
     ]
     params = oracledb.ConnectParams(**dict(values))
     parts = [f"{name}={value!r}" for name, value in values]
@@ -784,6 +785,7 @@ def test_4539():
         ("thick_mode_dsn_passthrough", False),
         ("extra_auth_params", dict(extra1="X", extra2="Y")),
         ("pool_name", "my_second_pool"),
+        ("parallel_connect_delay", 0.5),
     ]
     params.set(**dict(new_values))
     parts = [f"{name}={value!r}" for name, value in new_values]
@@ -1150,6 +1152,8 @@ def test_4564():
         ("machine", "test_machine", "test_machine"),
         ("mode", "SYSDBA", oracledb.AUTH_MODE_SYSDBA),
         ("osuser", "test_osuser", "test_osuser"),
+        ("parallel_connect_delay", "0.25", 0.25),
+        ("parallel_connect_delay", "100ms", 0.1),
         ("pool_boundary", "statement", "statement"),
         ("program", "test_program", "test_program"),
         ("purity", "NEW", oracledb.PURITY_NEW),
@@ -66,6 +66,12 @@ def test_4700():
     _test_writable_parameter("soda_metadata_cache", True)
     _test_writable_parameter("ping_interval", 20)
     _test_writable_parameter("ping_timeout", 3000)
+    _test_writable_parameter("result_cache_size", 1048576)
+    _test_writable_parameter("result_cache_ttl", 30)
+    _test_writable_parameter("shared_statement_cache", True)
+    _test_writable_parameter("warmup_statements", ["select 1 from dual"])
+    _test_writable_parameter("creation_concurrency", 4)
+    _test_writable_parameter("metrics_callback", lambda n, v, a: None)
 
 
 def test_4701(test_env):
@@ -85,6 +91,12 @@ def test_4701(test_env):
         ("soda_metadata_cache", False),
         ("ping_interval", 50),
         ("ping_timeout", 2500),
+        ("result_cache_size", 65536),
+        ("result_cache_ttl", 15),
+        ("shared_statement_cache", True),
+        ("warmup_statements", ["select user from dual"]),
+        ("creation_concurrency", 3),
+        ("metrics_callback", lambda n, v, a: None),
         ("user", test_env.main_user),
         ("proxy_user", test_env.proxy_user),
         ("host", "my_host1"),
@@ -133,6 +145,7 @@ def test_4701(test_env):
         ("thick_mode_dsn_passthrough", True),
         ("extra_auth_params", dict(extra1="A", extra2="B")),
         ("pool_name", "my_pool"),
+        ("parallel_connect_delay", 0.25),
     ]
     params = oracledb.PoolParams(**dict(values))
     parts = [f"{name}={value!r}" for name, value in values]
@@ -144,6 +157,7 @@ def test_4701(test_env):
 def test_4702():
     "4702 - test extended connect strings for ConnectParams"
     test_scenarios = [
+        ("creation_concurrency", "4", 4),
         ("getmode", "NOWAIT", oracledb.POOL_GETMODE_NOWAIT),
         ("homogeneous", "true", True),
         ("homogeneous", "false", False),
@@ -154,6 +168,9 @@ def test_4702():
         ("min", "3", 3),
         ("ping_interval", "-1", -1),
         ("ping_timeout", "2500", 2500),
+        ("result_cache_size", "1048576", 1048576),
+        ("result_cache_ttl", "60", 60),
+        ("shared_statement_cache", "true", True),
         ("homogeneous", "on", True),
         ("homogeneous", "off", False),
         ("timeout", "3000", 3000),
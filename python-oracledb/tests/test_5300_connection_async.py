@@ -27,6 +27,7 @@
 """
 
 import asyncio
+import socket
 
 import oracledb
 import pytest
@@ -694,3 +695,125 @@ async def test_5356(test_env):
             """
         )
         await cursor.fetchall()
+
+
+async def test_5357(async_conn, test_env):
+    "5357 - test round trip hooks"
+    infos = []
+    sql = "select user from dual"
+    cursor = async_conn.cursor()
+    oracledb.register_round_trip_hook(infos.append)
+    try:
+        await cursor.execute(sql)
+        (user,) = await cursor.fetchone()
+    finally:
+        oracledb.unregister_round_trip_hook(infos.append)
+    assert user == test_env.main_user.upper()
+    (info,) = infos
+    assert info.message_type == "ExecuteMessage"
+    assert info.sql == sql
+    assert info.bytes_sent > 0
+    assert info.bytes_received > 0
+    assert info.elapsed_time >= info.server_time >= 0
+    assert info.exception is None
+    await async_conn.ping()
+    assert len(infos) == 1
+
+
+async def test_5358(tls_server):
+    "5358 - test resumption of TLS sessions with asyncio"
+    params = tls_server.get_connect_params()
+    for i in range(2):
+        with pytest.raises(oracledb.OperationalError):
+            await oracledb.connect_async(params=params)
+    assert tls_server.sessions_reused == [False, True]
+
+
+async def test_5359(refusing_listener, test_env):
+    "5359 - test the error raised when racing connections to addresses"
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        addresses = [
+            "(ADDRESS=(PROTOCOL=tcp)(HOST=127.0.0.1)"
+            f"(PORT={sock.getsockname()[1]}))",
+            "(ADDRESS=(PROTOCOL=tcp)(HOST=127.0.0.1)"
+            f"(PORT={refusing_listener.port}))",
+        ]
+        dsn = (
+            f"(DESCRIPTION=(ADDRESS_LIST={''.join(addresses)})"
+            "(CONNECT_DATA=(SERVICE_NAME=test_5359)))"
+        )
+        with test_env.assert_raises_full_code("DPY-6005") as cm:
+            await oracledb.connect_async(
+                user="test_user", password="test", dsn=dsn
+            )
+        assert "DPY-6001" in cm.error_obj.message
+
+
+async def test_5360(refusing_listener, test_env, monkeypatch):
+    "5360 - test host names are resolved by the event loop and cached"
+    host = "dns-cache-5360.example.com"
+    port = refusing_listener.port
+    addr_info = socket.getaddrinfo(
+        "127.0.0.1", port, proto=socket.IPPROTO_TCP, type=socket.SOCK_STREAM
+    )
+    lookups = []
+    loop = asyncio.get_running_loop()
+    orig_loop_getaddrinfo = loop.getaddrinfo
+    orig_getaddrinfo = socket.getaddrinfo
+
+    async def loop_getaddrinfo(lookup_host, *args, **kwargs):
+        if lookup_host != host:
+            return await orig_loop_getaddrinfo(lookup_host, *args, **kwargs)
+        lookups.append(lookup_host)
+        return addr_info
+
+    def getaddrinfo(lookup_host, *args, **kwargs):
+        assert lookup_host != host, "event loop blocked by name resolution"
+        return orig_getaddrinfo(lookup_host, *args, **kwargs)
+
+    monkeypatch.setattr(loop, "getaddrinfo", loop_getaddrinfo)
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+    params = oracledb.ConnectParams(
+        host=host, port=port, service_name="test_5360"
+    )
+    with test_env.defaults_context_manager("dns_cache_ttl", 0):
+        for i in range(2):
+            with pytest.raises(oracledb.OperationalError):
+                await oracledb.connect_async(
+                    user="x", password="x", params=params
+                )
+        assert len(lookups) == 2
+    with test_env.defaults_context_manager("dns_cache_ttl", 60):
+        for i in range(2):
+            with pytest.raises(oracledb.OperationalError):
+                await oracledb.connect_async(
+                    user="x", password="x", params=params
+                )
+        assert len(lookups) == 3
+
+
+async def test_5361(tls_server):
+    "5361 - test TLS handshakes are raced along with TCP connections"
+    with socket.create_server(("127.0.0.1", 0)) as sock:
+        addresses = [
+            "(ADDRESS=(PROTOCOL=tcps)(HOST=127.0.0.1)"
+            f"(PORT={sock.getsockname()[1]}))",
+            "(ADDRESS=(PROTOCOL=tcps)(HOST=127.0.0.1)"
+            f"(PORT={tls_server.port}))",
+        ]
+        dsn = (
+            "(DESCRIPTION=(TRANSPORT_CONNECT_TIMEOUT=2)"
+            f"(ADDRESS_LIST={''.join(addresses)})"
+            "(CONNECT_DATA=(SERVICE_NAME=test_5361))"
+            "(SECURITY=(SSL_SERVER_DN_MATCH=OFF)"
+            f"(MY_WALLET_DIRECTORY={tls_server.wallet_location})))"
+        )
+
+        # the first address accepts the TCP connection but never completes
+        # the TLS handshake, so the second address wins the race
+        with pytest.raises(oracledb.OperationalError):
+            await oracledb.connect_async(
+                user="x", password="x", dsn=dsn, parallel_connect_delay=0.1
+            )
+    assert tls_server.sessions_reused == [False]
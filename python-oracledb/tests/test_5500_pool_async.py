@@ -27,8 +27,11 @@
 """
 
 import asyncio
+import math
+import time
 
 import oracledb
+import pyarrow
 import pytest
 
 
@@ -684,3 +687,155 @@ async def test_5544(test_env):
     pool = test_env.get_pool_async(password=test_env.main_password + "X")
     with test_env.assert_raises_full_code("ORA-01017"):
         await pool.acquire()
+
+
+async def test_5545(test_env):
+    "5545 - test fetching a data frame in parallel"
+    pool = test_env.get_pool_async(min=0, max=4)
+    df = await pool.fetch_df_parallel(
+        """
+        select level as id, 'Row ' || level as name
+        from dual
+        connect by level <= :num_rows
+        """,
+        split_by="id",
+        parameters=dict(num_rows=1000),
+    )
+    assert df.column_names() == ["ID", "NAME"]
+    assert df.num_rows() == 1000
+    rows = sorted(pyarrow.table(df).to_pylist(), key=lambda r: r["ID"])
+    assert rows == [dict(ID=i, NAME=f"Row {i}") for i in range(1, 1001)]
+    await pool.close()
+
+
+async def test_5546(test_env):
+    "5546 - test fetching a data frame in parallel with positional binds"
+    pool = test_env.get_pool_async(min=0, max=2)
+    df = await pool.fetch_df_parallel(
+        "select level as id from dual connect by level <= :1",
+        split_by="id",
+        parameters=[100],
+        num_splits=3,
+    )
+    ids = pyarrow.table(df)["ID"].to_pylist()
+    assert sorted(ids) == list(range(1, 101))
+    await pool.close()
+
+
+async def test_5547(test_env):
+    "5547 - test creating pool connections concurrently"
+    intervals = []
+
+    def callback(name, value, attributes):
+        if name == "connection_created":
+            end_time = time.monotonic()
+            intervals.append((end_time - value, end_time))
+
+    pool = test_env.get_pool_async(
+        min=4, max=4, creation_concurrency=4, metrics_callback=callback
+    )
+    conns = [await pool.acquire() for _ in range(4)]
+    sids = set((conn.session_id, conn.serial_num) for conn in conns)
+    assert len(sids) == 4
+    assert pool.opened == 4
+
+    # all connections must have been in the process of being created at the
+    # same time
+    assert len(intervals) == 4
+    assert max(s for s, _ in intervals) < min(e for _, e in intervals)
+    for conn in conns:
+        await conn.close()
+    await pool.close()
+
+
+async def test_5548(test_env):
+    "5548 - test pool metrics and the metrics callback"
+    events = []
+
+    def callback(name, value, attributes):
+        events.append((name, attributes))
+
+    pool = test_env.get_pool_async(
+        min=1, max=2, increment=1, metrics_callback=callback
+    )
+    async with pool.acquire():
+        metrics = pool.get_metrics()
+        assert metrics.busy == 1
+        assert metrics.waiting_count == 0
+    conn = await pool.acquire()
+    await pool.drop(conn)
+    metrics = pool.get_metrics()
+    assert metrics.acquire_count == 2
+    assert metrics.acquire_failure_count == 0
+    assert metrics.max_waiting_count == 1
+    assert metrics.acquire_wait_time_buckets[math.inf] == 2
+    assert metrics.acquire_wait_time_sum >= 0
+    assert metrics.create_count >= 1
+    assert metrics.create_time_buckets[math.inf] == metrics.create_count
+    assert metrics.close_counts == dict(dropped=1)
+    assert metrics.busy == 0
+    assert ("acquire", dict(success=True)) in events
+    assert ("connection_created", dict(success=True)) in events
+    assert ("connection_closed", dict(reason="dropped")) in events
+    await pool.close()
+    with test_env.assert_raises_full_code("DPY-1002"):
+        pool.get_metrics()
+
+
+async def test_5549(test_env):
+    "5549 - test fetching a data frame in parallel with invalid num_splits"
+    pool = test_env.get_pool_async(min=0, max=2)
+    sql = "select level as id from dual connect by level <= 10"
+    for num_splits in (0, -1, 1.5, True):
+        with test_env.assert_raises_full_code("DPY-2072"):
+            await pool.fetch_df_parallel(
+                sql, split_by="id", num_splits=num_splits
+            )
+    await pool.close()
+
+
+async def test_5550(test_env):
+    "5550 - test fetching a data frame in parallel with invalid split_by"
+    pool = test_env.get_pool_async(min=0, max=2)
+    sql = "select level as id from dual connect by level <= 10"
+    for split_by in ("id) + 1 from dual --", "id, id", "", '"id', 5):
+        with test_env.assert_raises_full_code("DPY-2075"):
+            await pool.fetch_df_parallel(sql, split_by=split_by, num_splits=2)
+    await pool.close()
+
+
+async def test_5551(test_env):
+    "5551 - test a failed parallel fetch releases all of its connections"
+    pool = test_env.get_pool_async(min=0, max=4)
+    sql = """
+        select level as id, 1 / (:split_num - 1) as value
+        from dual
+        connect by level <= 100"""
+    with test_env.assert_raises_full_code("ORA-01476"):
+        await pool.fetch_df_parallel(sql, split_by="id", num_splits=4)
+    assert pool.busy == 0
+    df = await pool.fetch_df_parallel(
+        "select level as id from dual connect by level <= 100",
+        split_by="id",
+        num_splits=4,
+    )
+    assert df.num_rows() == 100
+    await pool.close()
+
+
+async def test_5552(test_env):
+    "5552 - test fetching a data frame in parallel with null split values"
+    pool = test_env.get_pool_async(min=0, max=4)
+    df = await pool.fetch_df_parallel(
+        """
+        select level as id, nullif(mod(level, 3), 0) as split_value
+        from dual
+        connect by level <= 300
+        """,
+        split_by="split_value",
+        num_splits=4,
+    )
+    assert df.num_rows() == 300
+    ids = pyarrow.table(df)["ID"].to_pylist()
+    assert sorted(ids) == list(range(1, 301))
+    await pool.close()
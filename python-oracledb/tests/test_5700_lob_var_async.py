@@ -26,6 +26,8 @@
 5700 - Module for testing LOB (CLOB and BLOB) variables with asyncio
 """
 
+import io
+
 import oracledb
 import pytest
 
@@ -532,3 +534,83 @@ async def test_5727(async_conn, test_env):
             lob.setfilename("not_relevant", "not_relevant")
         with test_env.assert_raises_full_code("DPY-3026"):
             await lob.fileexists()
+
+
+async def test_5728(async_conn):
+    "5728 - test iterating over a LOB stream in chunks"
+    value = bytes(range(256)) * 1000
+    lob = await async_conn.createlob(oracledb.DB_TYPE_BLOB, value)
+    chunk_size = await lob.getchunksize()
+    async with lob.open_stream(chunk_size=chunk_size + 1) as stream:
+        chunks = [chunk async for chunk in stream]
+    assert b"".join(chunks) == value
+    for chunk in chunks[:-1]:
+        assert len(chunk) == chunk_size * 2
+    async with lob.open_stream(offset=11, read_ahead=False) as stream:
+        assert await stream.read(5) == value[10:15]
+        assert stream.offset == 16
+        assert await stream.read() == value[15:]
+        assert await stream.read() == b""
+
+
+async def test_5729(async_conn, test_env):
+    "5729 - test readinto() with a LOB stream"
+    value = bytes(range(256)) * 500
+    lob = await async_conn.createlob(oracledb.DB_TYPE_BLOB, value)
+    buf = bytearray(10000)
+    parts = []
+    async with lob.open_stream() as stream:
+        while True:
+            num_bytes = await stream.readinto(buf)
+            if num_bytes == 0:
+                break
+            parts.append(bytes(buf[:num_bytes]))
+    assert b"".join(parts) == value
+    clob = await async_conn.createlob(oracledb.DB_TYPE_CLOB, "test_5729")
+    async with clob.open_stream() as stream:
+        with test_env.assert_raises_full_code("DPY-3041"):
+            await stream.readinto(buf)
+
+
+async def test_5730(async_conn):
+    "5730 - test writing to a LOB stream from a readable object"
+    value = "A string for test 5730 € \U0001f600. " * 5000
+    lob = await async_conn.createlob(oracledb.DB_TYPE_CLOB)
+    async with lob.open_stream() as stream:
+        num_units = await stream.write(io.StringIO(value))
+        num_units += await stream.write("end")
+    assert num_units == await lob.size()
+    assert await lob.read() == value + "end"
+    blob = await async_conn.createlob(oracledb.DB_TYPE_BLOB, b"x" * 100)
+    async with blob.open_stream() as stream:
+        assert await stream.read(10) == b"x" * 10
+        await stream.write(io.BytesIO(b"y" * 10))
+        assert await stream.read(5) == b"x" * 5
+    assert await blob.read() == b"x" * 10 + b"y" * 10 + b"x" * 80
+
+
+async def test_5731(async_conn, async_cursor, test_env):
+    "5731 - test reading the data of multiple LOBs at once"
+    await async_cursor.execute("delete from TestCLOBs")
+    values = [f"CLOB value {i} for test 5731 " * (i + 1) for i in range(50)]
+    await async_cursor.executemany(
+        "insert into TestCLOBs (IntCol, CLOBCol) values (:1, :2)",
+        list(enumerate(values)),
+    )
+    await async_conn.commit()
+    await async_cursor.execute("select CLOBCol from TestCLOBs order by IntCol")
+    lobs = [lob async for lob, in async_cursor]
+    assert await async_conn.read_lobs(lobs) == values
+    blob = await async_conn.createlob(oracledb.DB_TYPE_BLOB, b"test_5731")
+    empty_clob = await async_conn.createlob(oracledb.DB_TYPE_CLOB)
+    assert await async_conn.read_lobs([blob, empty_clob, lobs[0]]) == [
+        b"test_5731",
+        "",
+        values[0],
+    ]
+    assert await async_conn.read_lobs([]) == []
+    with test_env.assert_raises_full_code("DPY-2073"):
+        await async_conn.read_lobs(["not a LOB"])
+    async with test_env.get_connection_async() as other_conn:
+        with test_env.assert_raises_full_code("DPY-2074"):
+            await other_conn.read_lobs([lobs[0]])
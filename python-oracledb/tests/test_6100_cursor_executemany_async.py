@@ -436,3 +436,40 @@ async def test_6127(
         "select IntCol, StringCol1 from TestTempTable order by IntCol"
     )
     assert await async_cursor.fetchall() == rows
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 200, 250])
+async def test_6128(
+    batch_size, async_conn, async_cursor, empty_tab, round_trip_checker_async
+):
+    "6128 - test executemany with a generator and various batch sizes"
+    rows = [(i + 1, f"String for row {i + 1}") for i in range(200)]
+    await async_cursor.executemany(
+        "insert into TestTempTable (IntCol, StringCol1) values (:1, :2)",
+        (row for row in rows),
+        batch_size=batch_size,
+    )
+    num_round_trips = len(rows) // batch_size
+    if len(rows) % batch_size:
+        num_round_trips += 1
+    assert await round_trip_checker_async.get_value_async() == num_round_trips
+    await async_conn.commit()
+    await async_cursor.execute(
+        "select IntCol, StringCol1 from TestTempTable order by IntCol"
+    )
+    assert await async_cursor.fetchall() == rows
+
+
+async def test_6129(async_conn, async_cursor, empty_tab):
+    "6129 - test executemany with an iterator of dictionaries and nulls"
+    rows = [(1, None), (2, "Second"), (3, None), (4, "Fourth")]
+    await async_cursor.executemany(
+        "insert into TestTempTable (IntCol, StringCol1) values (:a, :b)",
+        iter([dict(a=i, b=s) for i, s in rows]),
+        batch_size=1,
+    )
+    await async_conn.commit()
+    await async_cursor.execute(
+        "select IntCol, StringCol1 from TestTempTable order by IntCol"
+    )
+    assert await async_cursor.fetchall() == rows
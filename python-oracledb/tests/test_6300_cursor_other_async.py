@@ -26,6 +26,7 @@
 6300 - Module for testing other cursor methods and attributes with asyncio.
 """
 
+import array
 import decimal
 
 import oracledb
@@ -968,3 +969,75 @@ async def test_6356(async_cursor):
     await async_cursor.parse("select to_clob('some_value') from dual")
     fetch_info = async_cursor.description[0]
     assert fetch_info.type is oracledb.DB_TYPE_CLOB
+
+
+async def test_6357(async_cursor):
+    "6357 - test fetchblock() returns column-oriented blocks"
+    async_cursor.arraysize = 4
+    await async_cursor.execute(
+        """
+        select
+            level as IntCol,
+            to_binary_double(level) + 0.5 as FloatCol,
+            'String ' || level as StringCol
+        from dual
+        connect by level <= 10
+        """
+    )
+    block = await async_cursor.fetchblock()
+    assert len(block) == 4
+    assert block.column_names == ["INTCOL", "FLOATCOL", "STRINGCOL"]
+    assert isinstance(block.column(0), array.array)
+    assert list(block.column("FLOATCOL")) == [1.5, 2.5, 3.5, 4.5]
+    assert block.column(2) == [f"String {i}" for i in range(1, 5)]
+    assert block[1] == (2, 2.5, "String 2")
+    block = await async_cursor.fetchblock(size=10)
+    assert list(block) == [(i, i + 0.5, f"String {i}") for i in range(5, 11)]
+    block = await async_cursor.fetchblock()
+    assert len(block) == 0
+
+
+async def test_6358(async_cursor):
+    "6358 - test fetchblock() with nulls and a row factory"
+    await async_cursor.execute(
+        """
+        select
+            level as IntCol,
+            case when level = 2 then null else level end as NullableCol
+        from dual
+        connect by level <= 3
+        """
+    )
+    async_cursor.rowfactory = lambda *row: list(row)
+    block = await async_cursor.fetchblock(10)
+    assert block.column(1) == array.array("q", [1, 0, 3])
+    assert block.validity(1) == array.array("B", [1, 0, 1])
+    assert list(block) == [[1, 1], [2, None], [3, 3]]
+
+
+async def test_6359(async_cursor):
+    "6359 - test fetchblock() across round trips with duplicates and nulls"
+    sql = """
+        select
+            level as IntCol,
+            trunc(level / 5) as DuplicateCol,
+            case when mod(level, 3) = 0 then null else level / 4 end
+                as MixedCol,
+            to_binary_double(trunc(level / 4)) as DoubleCol
+        from dual
+        connect by level <= 40
+        """
+    await async_cursor.execute(sql)
+    expected = await async_cursor.fetchall()
+    async_cursor.arraysize = 7
+    async_cursor.prefetchrows = 2
+    await async_cursor.execute(sql)
+    rows = list(await async_cursor.fetchblock(5))
+    block = await async_cursor.fetchblock(10)
+    assert block.column("DUPLICATECOL").typecode == "q"
+    assert block.column("DOUBLECOL").typecode == "d"
+    assert isinstance(block.column("MIXEDCOL"), list)
+    rows.extend(block)
+    rows.append(await async_cursor.fetchone())
+    rows.extend(await async_cursor.fetchblock(30))
+    assert rows == expected
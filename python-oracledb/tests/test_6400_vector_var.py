@@ -29,6 +29,7 @@
 import array
 import json
 
+import numpy
 import oracledb
 import pytest
 
@@ -747,3 +748,65 @@ def test_6447(cursor):
     vec3 = array.array("b", [3] * 65535)
     vec4 = array.array("b", [2] * 65535)
     _test_plsql_insert_and_fetch(cursor, vec3, vec4, 256)
+
+
+def test_6448(cursor):
+    "6448 - test binding in vectors from NumPy arrays"
+    for dtype, typecode in (
+        (numpy.float32, "f"),
+        (numpy.float64, "d"),
+        (numpy.int8, "b"),
+    ):
+        value = numpy.array([1, 2, 3, 4], dtype=dtype)
+        cursor.execute("select :1 from dual", [value])
+        (fetched_value,) = cursor.fetchone()
+        assert isinstance(fetched_value, array.array)
+        assert fetched_value.typecode == typecode
+        assert fetched_value.tolist() == value.tolist()
+
+
+def test_6449(cursor):
+    "6449 - test executemany() with the rows of NumPy matrices"
+    vectors_32 = numpy.arange(160, dtype=numpy.float32).reshape(10, 16)
+    vectors_8 = numpy.arange(160, dtype=numpy.int8).reshape(10, 16)
+    cursor.execute("delete from TestVectors")
+    cursor.executemany(
+        """
+        insert into TestVectors (IntCol, Vector32Col, Vector8Col)
+        values (:1, :2, :3)
+        """,
+        list(zip(range(10), vectors_32, vectors_8[:, ::-1])),
+    )
+    cursor.connection.commit()
+    cursor.execute(
+        "select Vector32Col, Vector8Col from TestVectors order by IntCol"
+    )
+    rows = cursor.fetchall()
+    assert [r[0].tolist() for r in rows] == vectors_32.tolist()
+    assert [r[1].tolist() for r in rows] == vectors_8[:, ::-1].tolist()
+
+
+def test_6450(cursor, test_env):
+    "6450 - test binding a two-dimensional NumPy array as a vector"
+    value = numpy.zeros((2, 2), dtype=numpy.float32)
+    with test_env.assert_raises_full_code("DPY-3002"):
+        cursor.execute("select :1 from dual", [value])
+
+
+def test_6451(cursor):
+    "6451 - test executemany() with a NumPy matrix as the parameters"
+    vectors = numpy.arange(160, dtype=numpy.float32).reshape(10, 16)
+    cursor.execute("delete from TestVectors")
+    cursor.executemany(
+        "insert into TestVectors (IntCol, Vector32Col) values (0, :1)",
+        vectors[:, ::-1],
+    )
+    cursor.execute("select Vector32Col from TestVectors")
+    rows = sorted(r[0].tolist() for r in cursor)
+    assert rows == sorted(vectors[:, ::-1].tolist())
+    cursor.executemany(
+        "insert into TestVectors (IntCol, Vector32Col) values (1, :1)",
+        vectors[:0],
+    )
+    cursor.execute("select count(*) from TestVectors where IntCol = 1")
+    assert cursor.fetchone() == (0,)
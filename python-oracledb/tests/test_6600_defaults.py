@@ -27,10 +27,13 @@
 """
 
 import decimal
+import itertools
 import os
+import socket
 import tempfile
 
 import oracledb
+import pytest
 
 
 def _verify_network_name_attr(test_env, name):
@@ -228,3 +231,217 @@ def test_6615(skip_unless_thin_mode, test_env):
                 (fetched_value,) = cursor.fetchone()
                 assert fetched_value == new_value
         pool.close()
+
+
+def _count_lookups(monkeypatch, host, addr_info):
+    """
+    Replaces socket.getaddrinfo() so that the given host name resolves to the
+    given results (or raises the given exception) and returns the list to
+    which each lookup of that host name is appended.
+    """
+    lookups = []
+    orig_getaddrinfo = socket.getaddrinfo
+
+    def getaddrinfo(lookup_host, *args, **kwargs):
+        if lookup_host != host:
+            return orig_getaddrinfo(lookup_host, *args, **kwargs)
+        lookups.append(lookup_host)
+        if isinstance(addr_info, Exception):
+            raise addr_info
+        return addr_info
+
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+    return lookups
+
+
+def test_6616(skip_unless_thin_mode, test_env, monkeypatch):
+    "6616 - test defaults.dns_cache_ttl caches host name resolution"
+    host = "dns-cache-6616.example.com"
+    addr_info = socket.getaddrinfo(
+        "127.0.0.1", 1, proto=socket.IPPROTO_TCP, type=socket.SOCK_STREAM
+    )
+    lookups = _count_lookups(monkeypatch, host, addr_info)
+    params = oracledb.ConnectParams(host=host, port=1, service_name="x")
+    with test_env.defaults_context_manager("dns_cache_ttl", 0):
+        for i in range(2):
+            with pytest.raises(oracledb.OperationalError):
+                oracledb.connect(user="x", password="x", params=params)
+        assert len(lookups) == 2
+    with test_env.defaults_context_manager("dns_cache_ttl", 60):
+        for i in range(2):
+            with pytest.raises(oracledb.OperationalError):
+                oracledb.connect(user="x", password="x", params=params)
+        assert len(lookups) == 3
+
+
+def test_6617(skip_unless_thin_mode, test_env, monkeypatch):
+    "6617 - test defaults.dns_cache_negative_ttl caches failed lookups"
+    host = "dns-cache-6617.example.com"
+    error = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+    lookups = _count_lookups(monkeypatch, host, error)
+    params = oracledb.ConnectParams(host=host, port=1, service_name="x")
+    with test_env.defaults_context_manager("dns_cache_negative_ttl", 60):
+        for i in range(2):
+            with pytest.raises(socket.gaierror):
+                oracledb.connect(user="x", password="x", params=params)
+        assert len(lookups) == 1
+    with test_env.defaults_context_manager("dns_cache_negative_ttl", 0):
+        with pytest.raises(socket.gaierror):
+            oracledb.connect(user="x", password="x", params=params)
+        assert len(lookups) == 2
+
+
+def _replace_adaptive_arraysize_clock(monkeypatch, elapsed_time):
+    """
+    Replaces the clock used to time round trips when adapting the number of
+    rows fetched so that the n-th round trip that is timed appears to take
+    elapsed_time(n) seconds.
+    """
+
+    def times():
+        now = 0.0
+        for n in itertools.count():
+            yield now
+            now += elapsed_time(n)
+            yield now
+
+    clock = times()
+    monkeypatch.setattr(
+        oracledb.thin_impl, "_adaptive_arraysize_clock", lambda: next(clock)
+    )
+
+
+def _get_adaptive_fetch_sizes(test_env, conn, sql, max_bytes=1048576):
+    """
+    Fetches all of the rows of the query with arraysize set to 10 and
+    prefetching disabled and returns the number of rows fetched by each
+    fetch round trip.
+    """
+    row_counts = []
+
+    def hook(info):
+        if info.message_type == "FetchMessage":
+            row_counts.append(cursor.rowcount)
+
+    with test_env.defaults_context_manager("adaptive_arraysize", True):
+        with test_env.defaults_context_manager(
+            "adaptive_arraysize_max_bytes", max_bytes
+        ):
+            cursor = conn.cursor()
+            cursor.arraysize = 10
+            cursor.prefetchrows = 0
+            oracledb.register_round_trip_hook(hook)
+            try:
+                cursor.execute(sql)
+                cursor.fetchall()
+            finally:
+                oracledb.unregister_round_trip_hook(hook)
+
+    # each round trip starts once the rows of the previous one are consumed
+    row_counts.append(cursor.rowcount)
+    return [b - a for a, b in zip(row_counts, row_counts[1:])]
+
+
+def test_6618(skip_unless_thin_mode, test_env, conn, monkeypatch):
+    "6618 - test defaults.adaptive_arraysize grows and shrinks fetches"
+    sql = """
+        select rpad('x', case when level <= 3000 then 10 else 2000 end, 'x')
+            as test_6618
+        from dual
+        connect by level <= 5000"""
+
+    # every round trip takes the same time, so the time taken per row keeps
+    # falling as more rows are fetched
+    _replace_adaptive_arraysize_clock(monkeypatch, lambda n: 1.0)
+    sizes = _get_adaptive_fetch_sizes(test_env, conn, sql, max_bytes=100000)
+    assert sum(sizes) == 5000
+    end_rows = itertools.accumulate(sizes)
+    small_sizes = [
+        size for size, end_row in zip(sizes, end_rows) if end_row <= 3000
+    ]
+    large_sizes = sizes[len(small_sizes) + 1 : -1]
+
+    # while the rows are small, the size starts at arraysize and doubles
+    # after each full batch
+    assert small_sizes == [10 * 2**i for i in range(len(small_sizes))]
+    assert len(small_sizes) >= 5
+
+    # once the rows are large, the size shrinks to fit within the limit
+    assert max(small_sizes) > 100000 // 2000
+    assert len(large_sizes) > 5
+    assert all(size <= 100000 // 2000 for size in large_sizes[-5:])
+
+
+def test_6619(skip_unless_thin_mode, test_env, conn, round_trip_checker):
+    "6619 - test defaults.adaptive_arraysize_max_bytes limits fetches"
+    sql = "select rpad('x', 1000, 'x') from dual connect by level <= 2000"
+    with test_env.defaults_context_manager("adaptive_arraysize", True):
+        with test_env.defaults_context_manager(
+            "adaptive_arraysize_max_bytes", 10000
+        ):
+            cursor = conn.cursor()
+            cursor.arraysize = 500
+            cursor.prefetchrows = 0
+            round_trip_checker.get_value()
+            cursor.execute(sql)
+            assert len(cursor.fetchall()) == 2000
+            assert round_trip_checker.get_value() > 20
+
+
+def test_6620(
+    skip_unless_thin_mode, skip_unless_json_supported, test_env, cursor
+):
+    "6620 - test defaults.fetch_lazy_json returns JSON views"
+    assert not oracledb.defaults.fetch_lazy_json
+    cursor.execute("select json('{\"a\": [1, 2]}') from dual")
+    (value,) = cursor.fetchone()
+    assert isinstance(value, dict)
+    with test_env.defaults_context_manager("fetch_lazy_json", True):
+        cursor.execute("select json('{\"a\": [1, 2]}') from dual")
+        (value,) = cursor.fetchone()
+    assert isinstance(value, oracledb.JsonObjectView)
+    assert isinstance(value["a"], oracledb.JsonArrayView)
+    assert value == {"a": [1, 2]}
+
+
+def test_6621(skip_unless_thin_mode, test_env, conn, monkeypatch):
+    "6621 - test defaults.adaptive_arraysize stops growing with no gain"
+    sql = "select 'x' as test_6621 from dual connect by level <= 500"
+
+    # each round trip takes twice as long as the previous one, so doubling
+    # the number of rows no longer reduces the time taken per row
+    _replace_adaptive_arraysize_clock(monkeypatch, lambda n: 2.0**n)
+    sizes = _get_adaptive_fetch_sizes(test_env, conn, sql)
+    assert sum(sizes) == 500
+    assert sizes[:2] == [10, 20]
+    assert set(sizes[1:-1]) == {20}
+
+
+def test_6622(skip_unless_thin_mode, test_env, conn, monkeypatch):
+    "6622 - test defaults.adaptive_arraysize adapts prefetchrows"
+    sql = "select 'x' as test_6622 from dual connect by level <= 1000"
+    prefetched_rows = []
+
+    def hook(info):
+        if info.message_type == "FetchMessage" and not fetched:
+            prefetched_rows.append(cursor.rowcount)
+            fetched.append(True)
+
+    _replace_adaptive_arraysize_clock(monkeypatch, lambda n: 1.0)
+    with test_env.defaults_context_manager("adaptive_arraysize", True):
+        cursor = conn.cursor()
+        cursor.arraysize = 10
+        cursor.prefetchrows = 10
+        oracledb.register_round_trip_hook(hook)
+        try:
+            for i in range(4):
+                fetched = []
+                cursor.execute(sql)
+                assert len(cursor.fetchall()) == 1000
+        finally:
+            oracledb.unregister_round_trip_hook(hook)
+
+    # the rows returned by the execute round trip are consumed before the
+    # first fetch round trip takes place
+    assert prefetched_rows == [10, 20, 40, 80]
+    assert cursor.prefetchrows == 10
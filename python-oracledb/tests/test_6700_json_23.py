@@ -27,6 +27,7 @@
 """
 
 import json
+import threading
 
 import oracledb
 import pytest
@@ -191,3 +192,95 @@ def test_6712(cursor):
     for i in range(15):
         value.append(dict(a=6711 + i, b=f"String Value {i}"))
     _test_fetch_json(cursor, value, "TestCompressedJson")
+
+
+def test_6713(cursor, test_env):
+    "6713 - fetch JSON lazily and compare with the decoded value"
+    value = dict(
+        name="Lazy",
+        items=[dict(id=i, tags=["x", "y"], price=i * 1.5) for i in range(40)],
+        nested=dict(inner=dict(flag=True, empty=[], missing=None)),
+    )
+    value["D" * 300] = "long field name"
+    cursor.execute("delete from TestJson")
+    cursor.setinputsizes(oracledb.DB_TYPE_JSON)
+    cursor.execute("insert into TestJson values (1, :1)", [value])
+    with test_env.defaults_context_manager("fetch_lazy_json", True):
+        cursor.execute("select JsonCol from TestJson")
+        (fetched_value,) = cursor.fetchone()
+    assert isinstance(fetched_value, oracledb.JsonObjectView)
+    assert list(fetched_value) == list(value)
+    assert fetched_value["items"][3]["tags"][1] == "y"
+    assert fetched_value["items"] is fetched_value["items"]
+    assert fetched_value["nested"]["inner"]["missing"] is None
+    assert "unknown" not in fetched_value
+    assert fetched_value.get("unknown") is None
+    assert fetched_value.asdict() == value
+    assert fetched_value == value
+
+
+def test_6714(cursor, test_env):
+    "6714 - fetch JSON lazily with relative offsets and shared fields"
+    value = [dict(a=6714 + i, b=f"String Value {i}") for i in range(15)]
+    cursor.execute("delete from TestCompressedJson")
+    cursor.execute(
+        "insert into TestCompressedJson values (1, :1)", [json.dumps(value)]
+    )
+    with test_env.defaults_context_manager("fetch_lazy_json", True):
+        cursor.execute("select JsonCol from TestCompressedJson")
+        (fetched_value,) = cursor.fetchone()
+    assert isinstance(fetched_value, oracledb.JsonArrayView)
+    assert len(fetched_value) == len(value)
+    assert fetched_value[-1]["b"] == value[-1]["b"]
+    assert fetched_value[2:5] == value[2:5]
+    assert fetched_value.aslist() == value
+
+
+def test_6715(cursor, test_env):
+    "6715 - access the same lazy JSON view from multiple threads"
+    value = [dict(id=i, name=f"Name {i}", tags=[i, i + 1]) for i in range(200)]
+    cursor.execute("delete from TestJson")
+    cursor.setinputsizes(oracledb.DB_TYPE_JSON)
+    cursor.execute("insert into TestJson values (1, :1)", [value])
+    with test_env.defaults_context_manager("fetch_lazy_json", True):
+        cursor.execute("select JsonCol from TestJson")
+        (fetched_value,) = cursor.fetchone()
+    results = []
+
+    def read_all():
+        results.append(
+            [(d["id"], d["name"], d["tags"][1]) for d in fetched_value]
+        )
+
+    threads = [threading.Thread(target=read_all) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    expected = [(d["id"], d["name"], d["tags"][1]) for d in value]
+    assert results == [expected] * len(threads)
+
+
+def test_6716(cursor, test_env):
+    "6716 - bind lazy JSON views and serialize them with json.dumps()"
+    value = dict(
+        name="Round Trip",
+        items=[dict(id=i, tags=["x", "y"]) for i in range(10)],
+        nested=dict(inner=dict(flag=True, missing=None)),
+    )
+    cursor.execute("delete from TestJson")
+    cursor.setinputsizes(oracledb.DB_TYPE_JSON)
+    cursor.execute("insert into TestJson values (1, :1)", [value])
+    with test_env.defaults_context_manager("fetch_lazy_json", True):
+        cursor.execute("select JsonCol from TestJson")
+        (fetched_value,) = cursor.fetchone()
+        assert json.loads(json.dumps(fetched_value)) == value
+        cursor.setinputsizes(oracledb.DB_TYPE_JSON)
+        cursor.execute("insert into TestJson values (2, :1)", [fetched_value])
+        cursor.setinputsizes(oracledb.DB_TYPE_JSON)
+        cursor.execute(
+            "insert into TestJson values (3, :1)",
+            [dict(wrapped=fetched_value["items"])],
+        )
+    cursor.execute("select JsonCol from TestJson where IntCol > 1 order by 1")
+    assert cursor.fetchall() == [(value,), (dict(wrapped=value["items"]),)]
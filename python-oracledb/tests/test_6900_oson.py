@@ -111,3 +111,33 @@ def test_6906(conn, cursor):
     (oson_val,) = cursor.fetchone()
     oson_val = conn.decode_oson(oson_val)
     assert oson_val == value
+
+
+def test_6907(conn):
+    "6907 - test encoding values with the same field names repeatedly"
+    values = [
+        dict(id=i, name=f"Name {i}", nested=dict(id=i, tags=["a", "b"]))
+        for i in range(25)
+    ]
+    values.append(dict(nested=dict(tags=[]), name="Reordered", id=25))
+    values.append(dict(id=26, other="different field names"))
+    values.append(dict(id=27, name="Name 27", nested=dict(id=27, tags=[])))
+    for value in values:
+        assert conn.decode_oson(conn.encode_oson(value)) == value
+
+
+def test_6908(conn, cursor):
+    "6908 - test executemany() with JSON values sharing field names"
+    cursor.execute("delete from TestJson")
+    values = [
+        dict(id=i, value=f"string {i}", items=[dict(seq=i, flag=i % 2 == 0)])
+        for i in range(100)
+    ]
+    cursor.setinputsizes(None, oracledb.DB_TYPE_JSON)
+    cursor.executemany(
+        "insert into TestJson values (:1, :2)",
+        [(i, v) for i, v in enumerate(values)],
+    )
+    conn.commit()
+    cursor.execute("select JsonCol from TestJson order by IntCol")
+    assert [v for (v,) in cursor] == values
@@ -30,6 +30,7 @@ import datetime
 import decimal
 
 import oracledb
+import pyarrow
 import pytest
 
 
@@ -1026,3 +1027,33 @@ async def test_7649(async_conn, test_env):
     for result, num in zip(res, num_values):
         expected_value = clob_format.replace("{}", str(num))
         assert await result.return_value.read() == expected_value
+
+
+async def test_7650(async_conn):
+    "7650 - test executemany() with iterables and multi-chunk data frames"
+    frames = [
+        pyarrow.table({"IntCol": pyarrow.array([i, i + 1], pyarrow.int64())})
+        for i in range(1, 7, 2)
+    ]
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_executemany(
+        "insert into TestTempTable (IntCol) values (:1)", iter(frames)
+    )
+    pipeline.add_executemany(
+        "insert into TestTempTable (IntCol) values (:1)",
+        pyarrow.concat_tables(
+            [
+                pyarrow.table({"IntCol": pyarrow.array([i], pyarrow.int64())})
+                for i in range(7, 10)
+            ]
+        ),
+    )
+    pipeline.add_executemany(
+        "insert into TestTempTable (IntCol) values (:1)",
+        ((i,) for i in range(10, 13)),
+    )
+    pipeline.add_commit()
+    pipeline.add_fetchall("select IntCol from TestTempTable order by IntCol")
+    results = await async_conn.run_pipeline(pipeline)
+    assert results[-1].rows == [(i,) for i in range(1, 13)]
@@ -30,6 +30,7 @@ import array
 import datetime
 import decimal
 
+import numpy
 import oracledb
 import pyarrow
 import pytest
@@ -245,6 +246,41 @@ QUERY_SQL_WITH_WHERE_CLAUSE = """
 QUERY_SQL = QUERY_SQL_WITH_WHERE_CLAUSE.format(where_clause="")
 
 
+NUMPY_SQL = """
+    select
+        cast(level as number(9)) as int_col,
+        case when mod(level, 2) = 0 then level / 4 end as num_col,
+        cast(level * 1.5 as binary_double) as dbl_col,
+        date '2025-01-01' + level as date_col
+    from dual
+    connect by level <= :1
+    """
+
+
+def _check_numpy_arrays(result, num_rows):
+    """
+    Checks the NumPy arrays returned for NUMPY_SQL.
+    """
+    rows = range(1, num_rows + 1)
+    values, nulls = result["INT_COL"]
+    assert values.dtype == numpy.int64
+    assert values.tolist() == list(rows)
+    assert not nulls.any()
+    values, nulls = result["NUM_COL"]
+    assert values.dtype == numpy.float64
+    assert nulls.tolist() == [i % 2 != 0 for i in rows]
+    assert values[~nulls].tolist() == [i / 4 for i in rows if i % 2 == 0]
+    values, nulls = result["DBL_COL"]
+    assert values.dtype == numpy.float64
+    assert values.tolist() == [i * 1.5 for i in rows]
+    values, nulls = result["DATE_COL"]
+    assert values.dtype == numpy.dtype("datetime64[s]")
+    start = numpy.datetime64("2025-01-01T00:00:00", "s")
+    assert values.tolist() == [
+        (start + numpy.timedelta64(i, "D")).tolist() for i in rows
+    ]
+
+
 def _convert_date(typ, value):
     """
     Converts a date to the format required by Arrow.
@@ -1937,3 +1973,153 @@ def test_8078(conn, test_env):
     )
     fetched_df = pyarrow.table(ora_df).to_pandas()
     assert test_env.get_data_from_df(fetched_df) == [(value, value)]
+
+
+def test_8079(conn):
+    "8079 - test fetching NumPy arrays"
+    result = conn.fetch_numpy(NUMPY_SQL, [5])
+    assert list(result) == ["INT_COL", "NUM_COL", "DBL_COL", "DATE_COL"]
+    _check_numpy_arrays(result, 5)
+
+
+def test_8080(conn):
+    "8080 - test fetching NumPy arrays in batches"
+    batches = list(conn.fetch_numpy_batches(NUMPY_SQL, [5], size=2))
+    assert [len(b["INT_COL"][0]) for b in batches] == [2, 2, 1]
+    result = {}
+    for name in batches[0]:
+        result[name] = tuple(
+            numpy.concatenate([b[name][i] for b in batches]) for i in range(2)
+        )
+    _check_numpy_arrays(result, 5)
+
+
+def test_8081(conn, test_env):
+    "8081 - test fetching unsupported data types as NumPy arrays"
+    with test_env.assert_raises_full_code("DPY-3040"):
+        conn.fetch_numpy("select 'test_8081' as str_col from dual")
+
+
+def test_8082(conn):
+    "8082 - test fetching a data frame stream"
+    stream = conn.fetch_df_stream(NUMPY_SQL, [5], size=2)
+    reader = pyarrow.RecordBatchReader.from_stream(stream)
+    assert reader.schema.names == ["INT_COL", "NUM_COL", "DBL_COL", "DATE_COL"]
+    batches = list(reader)
+    assert [b.num_rows for b in batches] == [2, 2, 1]
+    table = pyarrow.Table.from_batches(batches)
+    assert table["INT_COL"].to_pylist() == [1, 2, 3, 4, 5]
+
+
+def test_8083(conn, test_env):
+    "8083 - test consuming a data frame stream twice"
+    stream = conn.fetch_df_stream("select user from dual")
+    table = pyarrow.table(stream)
+    assert table.num_rows == 1
+    with test_env.assert_raises_full_code("DPY-2070"):
+        pyarrow.table(stream)
+
+
+def test_8084(conn):
+    "8084 - test fetching a data frame stream with no rows"
+    stream = conn.fetch_df_stream("select user from dual where 1 = 0")
+    table = pyarrow.table(stream)
+    assert table.num_rows == 0
+    assert table.schema.names == ["USER"]
+
+
+def test_8085(skip_unless_vectors_supported, conn):
+    "8085 - test fetching VECTOR columns as NumPy matrices"
+    result = conn.fetch_numpy(
+        """
+        select
+            to_vector('[1.5, 2.5, 3.5]', 3, float32) as v32,
+            to_vector('[1, 2, 3]', 3, int8) as v8
+        from dual
+        union all
+        select
+            to_vector('[4.5, 5.5, 6.5]', 3, float32),
+            null
+        from dual
+        """
+    )
+    values, is_null = result["V32"]
+    assert values.dtype == numpy.float32
+    assert values.tolist() == [[1.5, 2.5, 3.5], [4.5, 5.5, 6.5]]
+    assert is_null.tolist() == [False, False]
+    values, is_null = result["V8"]
+    assert values.dtype == numpy.int8
+    assert values.tolist() == [[1, 2, 3], [0, 0, 0]]
+    assert is_null.tolist() == [False, True]
+
+
+def test_8086(skip_unless_vectors_supported, conn, test_env):
+    "8086 - test fetching vectors with different dimensions as NumPy arrays"
+    with test_env.assert_raises_full_code("DPY-3042"):
+        conn.fetch_numpy(
+            """
+            select to_vector('[1.5, 2.5]', *, float32) from dual
+            union all
+            select to_vector('[1.5, 2.5, 3.5]', *, float32) from dual
+            """
+        )
+
+
+def test_8087():
+    "8087 - test converting sliced Arrow arrays to NumPy arrays"
+    table = pyarrow.table(
+        {
+            "INT_COL": pyarrow.array(
+                [1, None, 3, None, 5, 6], pyarrow.int64()
+            ),
+            "DBL_COL": pyarrow.array([1.5, 2.5, None, 4.5, 5.5, 6.5]),
+        }
+    ).slice(3)
+    result = oracledb.from_arrow(table)._to_numpy()
+    values, is_null = result["INT_COL"]
+    assert values.tolist()[1:] == [5, 6]
+    assert is_null.tolist() == [True, False, False]
+    values, is_null = result["DBL_COL"]
+    assert values.tolist() == [4.5, 5.5, 6.5]
+    assert is_null.tolist() == [False, False, False]
+
+
+def test_8088():
+    "8088 - test converting sliced Arrow vector arrays to NumPy matrices"
+    ragged_values = [
+        [1.5, 2.5],
+        [3.5, 4.5, 5.5],
+        None,
+        [7.5, 8.5],
+        [9.5, 10.5],
+    ]
+    fixed_values = [[1.5, 2.5], [3.5, 4.5], None, [7.5, 8.5], [9.5, 10.5]]
+    for values, arrow_type in (
+        (ragged_values, pyarrow.list_(pyarrow.float32())),
+        (fixed_values, pyarrow.list_(pyarrow.float32(), 2)),
+    ):
+        table = pyarrow.table({"V": pyarrow.array(values, arrow_type)})
+        result = oracledb.from_arrow(table.slice(2))._to_numpy()
+        matrix, is_null = result["V"]
+        assert matrix.dtype == numpy.float32
+        assert matrix.tolist() == [[0, 0], [7.5, 8.5], [9.5, 10.5]]
+        assert is_null.tolist() == [True, False, False]
+        result = oracledb.from_arrow(table.slice(3))._to_numpy()
+        matrix, is_null = result["V"]
+        assert matrix.tolist() == [[7.5, 8.5], [9.5, 10.5]]
+        assert is_null.tolist() == [False, False]
+
+
+def test_8089(conn, test_env):
+    "8089 - test an error raised while consuming a data frame stream"
+    sql = """
+        select 1 / (50 - level) as value
+        from dual
+        connect by level <= 100"""
+    stream = conn.fetch_df_stream(sql, size=5)
+    with test_env.assert_raises_full_code("ORA-01476"):
+        oracledb.from_arrow(stream)
+    stream = conn.fetch_df_stream(sql, size=5)
+    reader = pyarrow.RecordBatchReader.from_stream(stream)
+    with pytest.raises(OSError, match="ORA-01476"):
+        reader.read_all()
@@ -30,6 +30,7 @@ import array
 import datetime
 import decimal
 
+import numpy
 import oracledb
 import pyarrow
 import pytest
@@ -250,6 +251,41 @@ def module_checks(anyio_backend, skip_unless_thin_mode):
     pass
 
 
+NUMPY_SQL = """
+    select
+        cast(level as number(9)) as int_col,
+        case when mod(level, 2) = 0 then level / 4 end as num_col,
+        cast(level * 1.5 as binary_double) as dbl_col,
+        date '2025-01-01' + level as date_col
+    from dual
+    connect by level <= :1
+    """
+
+
+def _check_numpy_arrays(result, num_rows):
+    """
+    Checks the NumPy arrays returned for NUMPY_SQL.
+    """
+    rows = range(1, num_rows + 1)
+    values, nulls = result["INT_COL"]
+    assert values.dtype == numpy.int64
+    assert values.tolist() == list(rows)
+    assert not nulls.any()
+    values, nulls = result["NUM_COL"]
+    assert values.dtype == numpy.float64
+    assert nulls.tolist() == [i % 2 != 0 for i in rows]
+    assert values[~nulls].tolist() == [i / 4 for i in rows if i % 2 == 0]
+    values, nulls = result["DBL_COL"]
+    assert values.dtype == numpy.float64
+    assert values.tolist() == [i * 1.5 for i in rows]
+    values, nulls = result["DATE_COL"]
+    assert values.dtype == numpy.dtype("datetime64[s]")
+    start = numpy.datetime64("2025-01-01T00:00:00", "s")
+    assert values.tolist() == [
+        (start + numpy.timedelta64(i, "D")).tolist() for i in rows
+    ]
+
+
 def _convert_date(typ, value):
     """
     Converts a date to the format required by Arrow.
@@ -1712,3 +1748,67 @@ async def test_8167(conn, test_env):
     )
     fetched_df = pyarrow.table(ora_df).to_pandas()
     assert test_env.get_data_from_df(fetched_df) == [(value, value)]
+
+
+async def test_8168(async_conn):
+    "8168 - test fetching NumPy arrays"
+    result = await async_conn.fetch_numpy(NUMPY_SQL, [5])
+    assert list(result) == ["INT_COL", "NUM_COL", "DBL_COL", "DATE_COL"]
+    _check_numpy_arrays(result, 5)
+
+
+async def test_8169(async_conn):
+    "8169 - test fetching NumPy arrays in batches"
+    batches = [
+        b async for b in async_conn.fetch_numpy_batches(NUMPY_SQL, [5], size=2)
+    ]
+    assert [len(b["INT_COL"][0]) for b in batches] == [2, 2, 1]
+    result = {}
+    for name in batches[0]:
+        result[name] = tuple(
+            numpy.concatenate([b[name][i] for b in batches]) for i in range(2)
+        )
+    _check_numpy_arrays(result, 5)
+
+
+async def test_8170(async_conn, test_env):
+    "8170 - test fetching unsupported data types as NumPy arrays"
+    with test_env.assert_raises_full_code("DPY-3040"):
+        await async_conn.fetch_numpy("select 'test_8170' as str_col from dual")
+
+
+async def test_8171(skip_unless_vectors_supported, async_conn):
+    "8171 - test fetching VECTOR columns as NumPy matrices"
+    result = await async_conn.fetch_numpy(
+        """
+        select
+            to_vector('[1.5, 2.5, 3.5]', 3, float32) as v32,
+            to_vector('[1, 2, 3]', 3, int8) as v8
+        from dual
+        union all
+        select
+            to_vector('[4.5, 5.5, 6.5]', 3, float32),
+            null
+        from dual
+        """
+    )
+    values, is_null = result["V32"]
+    assert values.dtype == numpy.float32
+    assert values.tolist() == [[1.5, 2.5, 3.5], [4.5, 5.5, 6.5]]
+    assert is_null.tolist() == [False, False]
+    values, is_null = result["V8"]
+    assert values.dtype == numpy.int8
+    assert values.tolist() == [[1, 2, 3], [0, 0, 0]]
+    assert is_null.tolist() == [False, True]
+
+
+async def test_8172(skip_unless_vectors_supported, async_conn, test_env):
+    "8172 - test fetching vectors with different dimensions as NumPy arrays"
+    with test_env.assert_raises_full_code("DPY-3042"):
+        await async_conn.fetch_numpy(
+            """
+            select to_vector('[1.5, 2.5]', *, float32) from dual
+            union all
+            select to_vector('[1.5, 2.5, 3.5]', *, float32) from dual
+            """
+        )
@@ -1001,3 +1001,71 @@ def test_8922(batch_size, conn, cursor, empty_tab, round_trip_checker):
     conn.commit()
     cursor.execute("select Id, FirstName from TestDataFrame order by Id")
     assert cursor.fetchall() == rows
+
+
+@pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+def test_8923(unit, conn, cursor, empty_tab):
+    "8923 - test ingestion of timestamps with various units"
+    values = [
+        datetime.datetime(1969, 12, 31, 23, 59, 59),
+        datetime.datetime(1970, 1, 1),
+        datetime.datetime(1900, 2, 28, 13, 14, 15),
+        datetime.datetime(2024, 2, 29, 8, 30, 0),
+        None,
+    ]
+    if unit != "s":
+        values[0] = values[0].replace(microsecond=500000)
+        values[3] = values[3].replace(microsecond=123000)
+    names = ["Id", "LastUpdated"]
+    arrays = [
+        pyarrow.array(range(1, len(values) + 1), pyarrow.int16()),
+        pyarrow.array(values, pyarrow.timestamp(unit)),
+    ]
+    df = pyarrow.table(arrays, names)
+    cursor.executemany(
+        "insert into TestDataFrame (Id, LastUpdated) values (:1, :2)", df
+    )
+    conn.commit()
+    cursor.execute("select LastUpdated from TestDataFrame order by Id")
+    assert [d for d, in cursor] == values
+
+
+def test_8924(conn, cursor, empty_tab, round_trip_checker):
+    "8924 - test ingestion from an iterator of record batches"
+    rows = [(i + 1, f"Name {i + 1}") for i in range(50)]
+    schema = pyarrow.schema(
+        [("Id", pyarrow.int64()), ("FirstName", pyarrow.string())]
+    )
+
+    def batches():
+        for start in range(0, len(rows), 20):
+            chunk = rows[start : start + 20]
+            yield pyarrow.record_batch(
+                [
+                    pyarrow.array([i for i, _ in chunk], pyarrow.int64()),
+                    pyarrow.array([s for _, s in chunk], pyarrow.string()),
+                ],
+                schema=schema,
+            )
+
+    cursor.executemany(
+        "insert into TestDataFrame (Id, FirstName) values (:1, :2)",
+        batches(),
+        batch_size=15,
+    )
+    assert round_trip_checker.get_value() == 5
+    conn.commit()
+    cursor.execute("select Id, FirstName from TestDataFrame order by Id")
+    assert cursor.fetchall() == rows
+
+
+def test_8925(cursor, test_env):
+    "8925 - test ingestion from data frames with different schemas"
+    data_frames = [
+        pyarrow.table([pyarrow.array([1, 2], pyarrow.int64())], ["Id"]),
+        pyarrow.table([pyarrow.array(["3", "4"], pyarrow.string())], ["Id"]),
+    ]
+    with test_env.assert_raises_full_code("DPY-2071"):
+        cursor.executemany(
+            "insert into TestDataFrame (Id) values (:1)", iter(data_frames)
+        )
@@ -1019,3 +1019,32 @@ async def test_9022(
         "select Id, FirstName from TestDataFrame order by Id"
     )
     assert await async_cursor.fetchall() == rows
+
+
+@pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+async def test_9023(unit, async_conn, async_cursor, empty_tab):
+    "9023 - test ingestion of timestamps with various units"
+    values = [
+        datetime.datetime(1969, 12, 31, 23, 59, 59),
+        datetime.datetime(1970, 1, 1),
+        datetime.datetime(1900, 2, 28, 13, 14, 15),
+        datetime.datetime(2024, 2, 29, 8, 30, 0),
+        None,
+    ]
+    if unit != "s":
+        values[0] = values[0].replace(microsecond=500000)
+        values[3] = values[3].replace(microsecond=123000)
+    names = ["Id", "LastUpdated"]
+    arrays = [
+        pyarrow.array(range(1, len(values) + 1), pyarrow.int16()),
+        pyarrow.array(values, pyarrow.timestamp(unit)),
+    ]
+    df = pyarrow.table(arrays, names)
+    await async_cursor.executemany(
+        "insert into TestDataFrame (Id, LastUpdated) values (:1, :2)", df
+    )
+    await async_conn.commit()
+    await async_cursor.execute(
+        "select LastUpdated from TestDataFrame order by Id"
+    )
+    assert [d for d, in await async_cursor.fetchall()] == values
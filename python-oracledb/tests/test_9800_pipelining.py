@@ -0,0 +1,218 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025, Oracle and/or its affiliates.
+#
+# This software is dual-licensed to you under the Universal Permissive License
+# (UPL) 1.0 as shown at https://oss.oracle.com/licenses/upl and Apache License
+# 2.0 as shown at http://www.apache.org/licenses/LICENSE-2.0. You may choose
+# either license.
+#
+# If you elect to accept the software under the Apache License, Version 2.0,
+# the following applies:
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+
+"""
+9800 - Module for testing pipelining without asyncio.
+"""
+
+import oracledb
+import pyarrow
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def module_checks(skip_unless_thin_mode):
+    pass
+
+
+def test_9800(conn):
+    "9800 - test execute() and fetchall()."
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_execute("insert into TestTempTable (IntCol) values (:1)", [1])
+    pipeline.add_execute(
+        "insert into TestTempTable (IntCol) values (:val)", dict(val=2)
+    )
+    pipeline.add_commit()
+    pipeline.add_fetchall("select IntCol from TestTempTable order by IntCol")
+    results = conn.run_pipeline(pipeline)
+    assert results[-1].rows == [(1,), (2,)]
+
+
+def test_9801(conn):
+    "9801 - test executemany()"
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_executemany(
+        "insert into TestTempTable (IntCol) values (:1)", [(2,), (3,)]
+    )
+    pipeline.add_executemany(
+        "insert into TestTempTable (IntCol) values (:data)",
+        [{"data": 4}, {"data": 5}],
+    )
+    pipeline.add_commit()
+    pipeline.add_fetchall("select IntCol from TestTempTable order by IntCol")
+    results = conn.run_pipeline(pipeline)
+    assert results[-1].rows == [(2,), (3,), (4,), (5,)]
+
+
+def test_9802(conn):
+    "9802 - test fetchall() with arraysize requiring multiple round trips"
+    data = [(i,) for i in range(10)]
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_executemany(
+        "insert into TestTempTable (IntCol) values (:1)", data
+    )
+    pipeline.add_commit()
+    pipeline.add_fetchall(
+        "select IntCol from TestTempTable order by IntCol", arraysize=3
+    )
+    results = conn.run_pipeline(pipeline)
+    assert results[-1].rows == data
+
+
+def test_9803(conn):
+    "9803 - test fetchone() and fetchmany()"
+    data = [(i,) for i in range(10)]
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_executemany(
+        "insert into TestTempTable (IntCol) values (:1)", data
+    )
+    pipeline.add_commit()
+    pipeline.add_fetchone("select IntCol from TestTempTable order by IntCol")
+    pipeline.add_fetchmany(
+        "select IntCol from TestTempTable order by IntCol", num_rows=7
+    )
+    results = conn.run_pipeline(pipeline)
+    assert results[-2].rows == data[:1]
+    assert results[-1].rows == data[:7]
+
+
+def test_9804(conn):
+    "9804 - test callfunc() and callproc()"
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_callfunc("func_Test", oracledb.DB_TYPE_NUMBER, ("Yes", 7))
+    pipeline.add_callproc("proc_Test", ("hi", 5, None))
+    results = conn.run_pipeline(pipeline)
+    assert results[0].return_value == 10
+    assert results[1].error is None
+
+
+def test_9805(conn):
+    "9805 - test getting an error in the middle of a pipeline"
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_execute("insert into TestTempTable (IntCol) values (:1)", [5])
+    pipeline.add_commit()
+    pipeline.add_fetchall("select IntCol from TestTempTable order by IntCol")
+    pipeline.add_execute(
+        "insert into TestTempTable (IntCol) values (9, 'too many values')"
+    )
+    pipeline.add_fetchall("select IntCol from TestTempTable order by IntCol")
+    results = conn.run_pipeline(pipeline, continue_on_error=True)
+    expected_value = [(5,)]
+    assert results[-3].rows == expected_value
+    assert results[-2].error.full_code == "ORA-00913"
+    assert results[-1].rows == expected_value
+
+
+def test_9806(conn, test_env):
+    "9806 - test an error raises an exception without continue_on_error"
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table NonExistentTable")
+    pipeline.add_fetchone("select user from dual")
+    with test_env.assert_raises_full_code("ORA-00942"):
+        conn.run_pipeline(pipeline)
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_fetchone("select 1 from dual")
+    (result,) = conn.run_pipeline(pipeline)
+    assert result.rows == [(1,)]
+
+
+def test_9807(conn):
+    "9807 - test empty pipeline"
+    pipeline = oracledb.create_pipeline()
+    assert conn.run_pipeline(pipeline) == []
+
+
+def test_9808(conn, round_trip_checker, test_env):
+    "9808 - test that a pipeline requires a single round trip"
+    test_env.skip_unless_server_version(23)
+    pipeline = oracledb.create_pipeline()
+    for i in range(5):
+        pipeline.add_fetchone("select :1 from dual", [i])
+    results = conn.run_pipeline(pipeline)
+    assert [r.rows for r in results] == [[(i,)] for i in range(5)]
+    assert round_trip_checker.get_value() == 1
+
+
+def test_9809(conn):
+    "9809 - test executemany() with iterables and multi-chunk data frames"
+    frames = [
+        pyarrow.table({"IntCol": pyarrow.array([i, i + 1], pyarrow.int64())})
+        for i in range(1, 7, 2)
+    ]
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    pipeline.add_executemany(
+        "insert into TestTempTable (IntCol) values (:1)", iter(frames)
+    )
+    pipeline.add_executemany(
+        "insert into TestTempTable (IntCol) values (:1)",
+        pyarrow.concat_tables(
+            [
+                pyarrow.table({"IntCol": pyarrow.array([i], pyarrow.int64())})
+                for i in range(7, 10)
+            ]
+        ),
+    )
+    pipeline.add_executemany(
+        "insert into TestTempTable (IntCol) values (:1)",
+        ((i,) for i in range(10, 13)),
+    )
+    pipeline.add_commit()
+    pipeline.add_fetchall("select IntCol from TestTempTable order by IntCol")
+    results = conn.run_pipeline(pipeline)
+    assert results[-1].rows == [(i,) for i in range(1, 13)]
+
+
+def test_9810(conn):
+    "9810 - test a pipeline with large requests and large responses"
+    value = "X" * 400
+    num_rows = 2500
+    pipeline = oracledb.create_pipeline()
+    pipeline.add_execute("truncate table TestTempTable")
+    for i in range(8):
+        rows = [
+            (i * num_rows + j, value, value) for j in range(1, num_rows + 1)
+        ]
+        pipeline.add_executemany(
+            """
+            insert into TestTempTable (IntCol, StringCol1, StringCol2)
+            values (:1, :2, :3)
+            """,
+            rows,
+        )
+        pipeline.add_fetchall(
+            "select rpad('Y', 4000, 'Y') from dual connect by level <= 500"
+        )
+    pipeline.add_fetchone("select count(*) from TestTempTable")
+    results = conn.run_pipeline(pipeline)
+    conn.rollback()
+    for result in results[2:-1:2]:
+        assert len(result.rows) == 500
+        assert result.rows[0] == ("Y" * 4000,)
+    assert results[-1].rows == [(8 * num_rows,)]
@@ -31,7 +31,11 @@
 # # {{ generated_notice }}
 # -----------------------------------------------------------------------------
 
+import asyncio
+import concurrent.futures
 import functools
+import queue
+import re
 import ssl
 import threading
 from typing import Callable, Type, Union, Any, Optional
@@ -43,8 +47,14 @@ from . import connection as connection_module
 from . import driver_mode
 from . import errors
 from .base import BaseMetaClass
+from .dataframe import DataFrame, DataFrameStream
+from .pool_metrics import PoolMetrics
 from .pool_params import PoolParams
 
+# the split_by parameter of fetch_df_parallel() is placed directly in the SQL
+# statement so only a simple or double quoted column name is accepted
+_SPLIT_BY_PATTERN = re.compile(r'[^\W\d_][\w$#]*|"[^"\x00]+"')
+
 
 class BaseConnectionPool(metaclass=BaseMetaClass):
     _impl = None
@@ -89,6 +99,47 @@ class BaseConnectionPool(metaclass=BaseMetaClass):
                     del named_pools.pools[cache_name]
                 raise
 
+    def _get_split_fetch_args(
+        self,
+        statement: str,
+        parameters: Optional[Union[list, tuple, dict]],
+        split_by: str,
+        num_splits: Optional[int],
+    ) -> tuple:
+        """
+        Returns the statement and the list of parameters (one entry for each
+        split) used to fetch the rows of a query in parallel. Each split
+        fetches the rows for which ORA_HASH() of the split_by column returns a
+        particular bucket number. Rows for which the split_by column is null
+        have no bucket number and are fetched by the first split.
+        """
+        if not isinstance(split_by, str) or not _SPLIT_BY_PATTERN.fullmatch(
+            split_by
+        ):
+            errors._raise_err(errors.ERR_INVALID_SPLIT_BY, split_by=split_by)
+        if num_splits is None:
+            num_splits = self.max
+        elif (
+            not isinstance(num_splits, int)
+            or isinstance(num_splits, bool)
+            or num_splits < 1
+        ):
+            errors._raise_err(errors.ERR_INVALID_NUM_SPLITS)
+        split_statement = (
+            f"select * from ({statement}) "
+            f"where nvl(ora_hash({split_by}, {num_splits - 1}), 0) "
+            "= :split_num"
+        )
+        split_parameters = []
+        for split_num in range(num_splits):
+            if parameters is None:
+                split_parameters.append(dict(split_num=split_num))
+            elif isinstance(parameters, dict):
+                split_parameters.append(dict(parameters, split_num=split_num))
+            else:
+                split_parameters.append(list(parameters) + [split_num])
+        return split_statement, split_parameters
+
     def _verify_open(self) -> None:
         """
         Verifies that the pool is open and able to perform its work.
@@ -114,6 +165,16 @@ class BaseConnectionPool(metaclass=BaseMetaClass):
         self._verify_open()
         return self._impl.dsn
 
+    def get_metrics(self) -> PoolMetrics:
+        """
+        Returns a :ref:`PoolMetrics object <poolmetricsobj>` containing a
+        snapshot of the metrics recorded by the pool, such as the number of
+        connections acquired and created and the time taken to do so. This
+        method is only supported in python-oracledb Thin mode.
+        """
+        self._verify_open()
+        return PoolMetrics._from_impl(self._impl.get_metrics())
+
     @property
     def getmode(self) -> oracledb.PoolGetMode:
         """
@@ -463,6 +524,220 @@ class ConnectionPool(BaseConnectionPool):
         self._impl.drop(connection._impl)
         connection._impl = None
 
+    def fetch_df_parallel(
+        self,
+        statement: str,
+        split_by: str,
+        parameters: Optional[Union[list, tuple, dict]] = None,
+        num_splits: Optional[int] = None,
+        *,
+        arraysize: Optional[int] = None,
+        fetch_decimals: Optional[bool] = None,
+        requested_schema: Optional[Any] = None,
+    ) -> DataFrame:
+        """
+        Fetches all rows of the SQL query ``statement`` in parallel, using
+        up to ``num_splits`` connections acquired from the pool, and returns
+        them in a single :ref:`DataFrame <oracledataframeobj>` object.
+
+        The rows are divided into ``num_splits`` sets using the value of
+        ``ORA_HASH(split_by, num_splits - 1)``, where ``split_by`` is the name
+        of a column returned by the query. The name may be enclosed in double
+        quotes. Rows for which this column is null are placed in the first
+        set. Each set is fetched by its own connection. The default value of
+        ``num_splits`` is the maximum size of the pool. The rows of each set
+        are returned together, so the order of the rows in the query is not
+        retained.
+
+        Each set is fetched by a separate query in its own session, so the
+        sets are not read-consistent with one another. If a consistent result
+        is required, include a flashback query clause such as ``AS OF SCN
+        :scn`` in the statement and bind the same system change number for
+        all sets.
+
+        The ``parameters`` parameter is used in the same way as for
+        :meth:`Connection.fetch_df_all()`. A bind variable named
+        ``split_num`` is added to the statement executed by each connection.
+
+        The ``arraysize``, ``fetch_decimals`` and ``requested_schema``
+        parameters are passed to :meth:`Connection.fetch_df_all()` for each
+        set of rows.
+
+        Each set of rows is fetched in its own thread. If fetching any set
+        fails, the sets that have not started are not fetched, the fetches in
+        progress are cancelled with :meth:`Connection.cancel()` and their
+        connections are dropped from the pool before the exception is raised.
+
+        To process the rows of each set as they are fetched instead of holding
+        all of them in memory, use
+        :meth:`~ConnectionPool.fetch_df_stream_parallel()`.
+        """
+        self._verify_open()
+        split_statement, split_parameters = self._get_split_fetch_args(
+            statement, parameters, split_by, num_splits
+        )
+        lock = threading.Lock()
+        stopped = threading.Event()
+        busy_connections = set()
+        cancelled_connections = set()
+
+        def fetch_split(parameters):
+            conn = self.acquire()
+            with lock:
+                if stopped.is_set():
+                    self.release(conn)
+                    return None
+                busy_connections.add(conn)
+            try:
+                return conn.fetch_df_all(
+                    split_statement,
+                    parameters,
+                    arraysize,
+                    fetch_decimals=fetch_decimals,
+                    requested_schema=requested_schema,
+                )
+            finally:
+                with lock:
+                    busy_connections.discard(conn)
+                    cancelled = conn in cancelled_connections
+                # the state of a connection interrupted during a round-trip
+                # is unknown so it is dropped instead of being released
+                if cancelled:
+                    self.drop(conn)
+                else:
+                    self.release(conn)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            len(split_parameters)
+        ) as executor:
+            futures = [
+                executor.submit(fetch_split, p) for p in split_parameters
+            ]
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+            except BaseException:
+                with lock:
+                    stopped.set()
+                    for future in futures:
+                        future.cancel()
+                    for conn in busy_connections:
+                        cancelled_connections.add(conn)
+                        conn.cancel()
+                raise
+        return DataFrame._concat([f.result() for f in futures])
+
+    def fetch_df_stream_parallel(
+        self,
+        statement: str,
+        split_by: str,
+        parameters: Optional[Union[list, tuple, dict]] = None,
+        num_splits: Optional[int] = None,
+        size: Optional[int] = None,
+        *,
+        fetch_decimals: Optional[bool] = None,
+        requested_schema: Optional[Any] = None,
+    ) -> DataFrameStream:
+        """
+        Fetches the rows of the SQL query ``statement`` in parallel in the
+        same way as :meth:`~ConnectionPool.fetch_df_parallel()` but returns a
+        :ref:`DataFrameStream <oracledataframestreamobj>` object that
+        implements the Apache Arrow PyCapsule stream interface. Each set of
+        rows is fetched in batches of ``size`` rows with
+        :meth:`Connection.fetch_df_batches()` and each batch is returned by
+        the stream as soon as it has been fetched, so the batches of the sets
+        are interleaved. The default value of ``size`` is
+        :attr:`oracledb.defaults.arraysize <Defaults.arraysize>`.
+
+        At most one batch for each set is held while waiting for the consumer
+        of the stream, so the memory used does not depend on the number of
+        rows in the query. The ``split_by``, ``parameters``, ``num_splits``,
+        ``fetch_decimals`` and ``requested_schema`` parameters are used in the
+        same way as for :meth:`~ConnectionPool.fetch_df_parallel()`.
+
+        The stream can only be consumed once. If fetching any set fails, the
+        exception is raised by the stream and the remaining sets are not
+        fetched. The connections are released to the pool when the stream has
+        been consumed or is discarded.
+        """
+        self._verify_open()
+        split_statement, split_parameters = self._get_split_fetch_args(
+            statement, parameters, split_by, num_splits
+        )
+        if size is None:
+            size = base_impl.DEFAULTS.arraysize
+        results = queue.Queue(len(split_parameters))
+        stopped = threading.Event()
+
+        def fetch_split(parameters):
+            try:
+                if not stopped.is_set():
+                    with self.acquire() as conn:
+                        for data_frame in conn.fetch_df_batches(
+                            split_statement,
+                            parameters,
+                            size,
+                            fetch_decimals=fetch_decimals,
+                            requested_schema=requested_schema,
+                        ):
+                            results.put(data_frame)
+                            if stopped.is_set():
+                                break
+            except BaseException as e:
+                results.put(e)
+            else:
+                results.put(None)
+
+        def fetch_data_frames(executor, futures):
+            num_running = len(futures)
+            try:
+                while num_running > 0:
+                    result = results.get()
+                    if isinstance(result, DataFrame):
+                        yield result
+                        continue
+                    num_running -= 1
+                    if result is not None:
+                        raise result
+            finally:
+                stopped.set()
+                for future in futures:
+                    if future.cancel():
+                        num_running -= 1
+                while num_running > 0:
+                    if not isinstance(results.get(), DataFrame):
+                        num_running -= 1
+                executor.shutdown()
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            len(split_parameters)
+        )
+        futures = [executor.submit(fetch_split, p) for p in split_parameters]
+        data_frames = fetch_data_frames(executor, futures)
+        return DataFrameStream._from_data_frames(data_frames)
+
+    def invalidate_result_cache(self, tables: Optional[list] = None) -> None:
+        """
+        Removes query results from the pool's result cache which is enabled by
+        setting the ``result_cache_size`` parameter when the pool is created.
+
+        The cache does not detect changes made to the data in the database,
+        so the application must call this method after changing data whose
+        query results may have been cached. Until then, and until the
+        ``result_cache_ttl`` period has elapsed, stale results may be
+        returned.
+
+        The ``tables`` parameter is a list of object names, optionally
+        prefixed by the schema name. Only the cached results of queries whose
+        text contains one of these names are removed; the names are not
+        resolved in the database, so the names of any views or synonyms used
+        by the cached queries must be included as well. If the parameter is
+        not specified, all cached results are removed. Results that are being
+        fetched when this method is called are not added to the cache.
+        """
+        self._verify_open()
+        self._impl.invalidate_result_cache(tables)
+
     def reconfigure(
         self,
         min: Optional[int] = None,
@@ -757,6 +1032,109 @@ class AsyncConnectionPool(BaseConnectionPool):
         await self._impl.drop(connection._impl)
         connection._impl = None
 
+    async def fetch_df_parallel(
+        self,
+        statement: str,
+        split_by: str,
+        parameters: Optional[Union[list, tuple, dict]] = None,
+        num_splits: Optional[int] = None,
+        *,
+        arraysize: Optional[int] = None,
+        fetch_decimals: Optional[bool] = None,
+        requested_schema: Optional[Any] = None,
+    ) -> DataFrame:
+        """
+        Fetches all rows of the SQL query ``statement`` in parallel, using
+        up to ``num_splits`` connections acquired from the pool, and returns
+        them in a single :ref:`DataFrame <oracledataframeobj>` object.
+
+        The rows are divided into ``num_splits`` sets using the value of
+        ``ORA_HASH(split_by, num_splits - 1)``, where ``split_by`` is the name
+        of a column returned by the query. The name may be enclosed in double
+        quotes. Rows for which this column is null are placed in the first
+        set. Each set is fetched by its own connection. The default value of
+        ``num_splits`` is the maximum size of the pool. The rows of each set
+        are returned together, so the order of the rows in the query is not
+        retained.
+
+        Each set is fetched by a separate query in its own session, so the
+        sets are not read-consistent with one another. If a consistent result
+        is required, include a flashback query clause such as ``AS OF SCN
+        :scn`` in the statement and bind the same system change number for
+        all sets.
+
+        The ``parameters`` parameter is used in the same way as for
+        :meth:`AsyncConnection.fetch_df_all()`. A bind variable named
+        ``split_num`` is added to the statement executed by each connection.
+
+        The ``arraysize``, ``fetch_decimals`` and ``requested_schema``
+        parameters are passed to :meth:`AsyncConnection.fetch_df_all()` for
+        each set of rows.
+
+        Each set of rows is fetched in its own task. If fetching any set fails,
+        the remaining tasks are cancelled and their connections are dropped
+        from the pool before the exception is raised.
+        """
+        self._verify_open()
+        split_statement, split_parameters = self._get_split_fetch_args(
+            statement, parameters, split_by, num_splits
+        )
+
+        async def fetch_split(parameters):
+            conn = await self.acquire()
+            try:
+                data_frame = await conn.fetch_df_all(
+                    split_statement,
+                    parameters,
+                    arraysize,
+                    fetch_decimals=fetch_decimals,
+                    requested_schema=requested_schema,
+                )
+            except asyncio.CancelledError:
+                # the state of a connection interrupted during a round-trip
+                # is unknown so it is dropped instead of being released
+                await self.drop(conn)
+                raise
+            except BaseException:
+                await self.release(conn)
+                raise
+            await self.release(conn)
+            return data_frame
+
+        tasks = [asyncio.create_task(fetch_split(p)) for p in split_parameters]
+        try:
+            data_frames = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return DataFrame._concat(data_frames)
+
+    async def invalidate_result_cache(
+        self, tables: Optional[list] = None
+    ) -> None:
+        """
+        Removes query results from the pool's result cache which is enabled by
+        setting the ``result_cache_size`` parameter when the pool is created.
+
+        The cache does not detect changes made to the data in the database,
+        so the application must call this method after changing data whose
+        query results may have been cached. Until then, and until the
+        ``result_cache_ttl`` period has elapsed, stale results may be
+        returned.
+
+        The ``tables`` parameter is a list of object names, optionally
+        prefixed by the schema name. Only the cached results of queries whose
+        text contains one of these names are removed; the names are not
+        resolved in the database, so the names of any views or synonyms used
+        by the cached queries must be included as well. If the parameter is
+        not specified, all cached results are removed. Results that are being
+        fetched when this method is called are not added to the cache.
+        """
+        self._verify_open()
+        self._impl.invalidate_result_cache(tables)
+
     async def release(
         self,
         connection: "connection_module.AsyncConnection",